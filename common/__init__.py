@@ -16,6 +16,7 @@ from common.utils import (
     normalize_skill,
     normalize_skills,
     get_unique_skills,
+    clear_skill_cache,
     SKILL_NORMALIZATION_MAP
 )
 from common.dynamodb_client import DynamoDBClient, DynamoDBClientError
@@ -34,7 +35,7 @@ __all__ = [
     'MessengerCommunication', 'CompanyEvents', 'PersonalCloseness',
     'Recommendation', 'RecommendationResult',
     # Utils
-    'normalize_skill', 'normalize_skills', 'get_unique_skills',
+    'normalize_skill', 'normalize_skills', 'get_unique_skills', 'clear_skill_cache',
     'SKILL_NORMALIZATION_MAP',
     # DynamoDB Client
     'DynamoDBClient', 'DynamoDBClientError',
@@ -7,8 +7,11 @@ Requirements: 7.1
 
 import boto3
 import logging
+import queue
+import threading
 import time
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterator
 from botocore.exceptions import ClientError, BotoCoreError
 from decimal import Decimal
 
@@ -17,6 +20,12 @@ from decimal import Decimal
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# BatchWriteItem 요청당 최대 아이템 수
+BATCH_WRITE_MAX_ITEMS = 25
+
+# BatchGetItem 요청당 최대 키 수
+BATCH_GET_MAX_KEYS = 100
+
 
 class DynamoDBClientError(Exception):
     """DynamoDB 클라이언트 커스텀 예외"""
@@ -35,7 +44,9 @@ class DynamoDBClient:
         region_name: str = 'us-east-2',
         max_retries: int = 3,
         retry_delay: float = 1.0,
-        endpoint_url: Optional[str] = None
+        endpoint_url: Optional[str] = None,
+        scan_segments: int = 1,
+        query_workers: int = 4
     ):
         """
         DynamoDB 클라이언트 초기화
@@ -45,10 +56,20 @@ class DynamoDBClient:
             max_retries: 최대 재시도 횟수 (기본값: 3)
             retry_delay: 재시도 간 대기 시간 (초, 기본값: 1.0)
             endpoint_url: 테스트용 엔드포인트 URL (선택사항)
+            scan_segments: 스캔 시 기본 병렬 세그먼트 수 (기본값: 1 - 순차 스캔)
+            query_workers: 병렬 쿼리 스레드 수 (기본값: 4)
         """
         self.region_name = region_name
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.endpoint_url = endpoint_url
+        self.scan_segments = max(1, scan_segments)
+        # 병렬 스캔 워커별 리소스 (boto3 리소스는 스레드 안전하지 않음)
+        self._worker_local = threading.local()
+        # 병렬 쿼리 스레드 풀 (처음 사용할 때 생성)
+        self.query_workers = max(1, query_workers)
+        self._query_executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
         
         try:
             # DynamoDB 리소스 및 클라이언트 생성
@@ -305,42 +326,204 @@ class DynamoDBClient:
             DynamoDBClientError: 쿼리 실패 시
         """
         def _query():
-            table = self.get_table(table_name)
+            items = self._query_table(
+                self.get_table(table_name),
+                key_condition_expression,
+                filter_expression,
+                index_name,
+                limit,
+                scan_index_forward
+            )
+            logger.info(f"쿼리 완료 (테이블: {table_name}, 결과: {len(items)}개)")
+            return items
+        
+        return self._execute_with_retry(_query)
+    
+    def query_parallel(
+        self,
+        table_name: str,
+        queries: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        여러 쿼리를 동시에 실행
+        
+        쿼리마다 스레드 풀 워커를 두고 워커 전용 리소스로 실행합니다.
+        
+        Args:
+            table_name: 테이블 이름
+            queries: query()의 키워드 인자 딕셔너리 리스트
+                (key_condition_expression, filter_expression, index_name, limit,
+                scan_index_forward)
             
-            kwargs = {
-                'KeyConditionExpression': key_condition_expression,
-                'ScanIndexForward': scan_index_forward
-            }
+        Returns:
+            쿼리 순서대로의 아이템 리스트
             
-            if filter_expression:
-                kwargs['FilterExpression'] = filter_expression
-            if index_name:
-                kwargs['IndexName'] = index_name
-            if limit:
-                kwargs['Limit'] = limit
+        Raises:
+            DynamoDBClientError: 쿼리 실패 시
+        """
+        if len(queries) <= 1:
+            return [self.query(table_name, **query) for query in queries]
+        
+        def _worker(query: Dict[str, Any]) -> List[Dict[str, Any]]:
+            return self._execute_with_retry(
+                self._query_table,
+                self._get_worker_table(table_name),
+                query['key_condition_expression'],
+                query.get('filter_expression'),
+                query.get('index_name'),
+                query.get('limit'),
+                query.get('scan_index_forward', True)
+            )
+        
+        try:
+            results = list(self._get_query_executor().map(_worker, queries))
+        except DynamoDBClientError:
+            raise
+        except Exception as e:
+            logger.error(f"병렬 쿼리 실패 (테이블: {table_name}): {str(e)}")
+            raise DynamoDBClientError(f"병렬 쿼리 실패: {str(e)}")
+        
+        logger.info(
+            f"병렬 쿼리 완료 (테이블: {table_name}, 쿼리: {len(queries)}개, "
+            f"결과: {sum(len(items) for items in results)}개)"
+        )
+        return results
+    
+    def _get_query_executor(self) -> ThreadPoolExecutor:
+        """
+        병렬 쿼리용 스레드 풀 반환
+        
+        워커 스레드와 스레드별 리소스를 호출 간에 재사용하도록 한 번만 생성합니다.
+        
+        Returns:
+            병렬 쿼리용 ThreadPoolExecutor
+        """
+        with self._executor_lock:
+            if self._query_executor is None:
+                self._query_executor = ThreadPoolExecutor(
+                    max_workers=self.query_workers,
+                    thread_name_prefix='dynamodb-query'
+                )
+            return self._query_executor
+    
+    def _query_table(
+        self,
+        table,
+        key_condition_expression,
+        filter_expression,
+        index_name: Optional[str],
+        limit: Optional[int],
+        scan_index_forward: bool
+    ) -> List[Dict[str, Any]]:
+        """
+        LastEvaluatedKey를 따라 쿼리 결과 전체 조회
+        
+        Args:
+            table: DynamoDB 테이블 객체
+            key_condition_expression: 키 조건 표현식
+            filter_expression: 필터 표현식
+            index_name: 인덱스 이름
+            limit: 최대 결과 수
+            scan_index_forward: 정렬 순서
             
+        Returns:
+            조회된 아이템 리스트
+        """
+        kwargs = {
+            'KeyConditionExpression': key_condition_expression,
+            'ScanIndexForward': scan_index_forward
+        }
+        
+        if filter_expression:
+            kwargs['FilterExpression'] = filter_expression
+        if index_name:
+            kwargs['IndexName'] = index_name
+        if limit:
+            kwargs['Limit'] = limit
+        
+        items = []
+        while True:
             response = table.query(**kwargs)
-            items = response.get('Items', [])
             # Decimal을 float로 변환
-            items = [self._convert_decimals_to_float(item) for item in items]
-            logger.info(f"쿼리 완료 (테이블: {table_name}, 결과: {len(items)}개)")
-            return items
+            items.extend(self._convert_decimals_to_float(item) for item in response.get('Items', []))
+            
+            last_evaluated_key = response.get('LastEvaluatedKey')
+            if not last_evaluated_key or (limit and len(items) >= limit):
+                break
+            kwargs['ExclusiveStartKey'] = last_evaluated_key
         
-        return self._execute_with_retry(_query)
+        return items[:limit] if limit else items
+    
+    def query_pages(
+        self,
+        table_name: str,
+        key_condition_expression,
+        filter_expression=None,
+        index_name: Optional[str] = None,
+        page_size: Optional[int] = None,
+        scan_index_forward: bool = True
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        쿼리 (페이지 단위 스트리밍)
+        
+        다음 페이지는 호출자가 현재 페이지를 모두 소비한 뒤에 요청하므로
+        전체 결과를 메모리에 올리지 않습니다.
+        
+        Args:
+            table_name: 테이블 이름
+            key_condition_expression: 키 조건 표현식
+            filter_expression: 필터 표현식 (선택사항)
+            index_name: 인덱스 이름 (선택사항)
+            page_size: 페이지당 평가 아이템 수 (선택사항)
+            scan_index_forward: 정렬 순서 (기본값: True - 오름차순)
+        
+        Yields:
+            페이지별 아이템 리스트
+        
+        Raises:
+            DynamoDBClientError: 쿼리 실패 시
+        """
+        table = self.get_table(table_name)
+        kwargs = {
+            'KeyConditionExpression': key_condition_expression,
+            'ScanIndexForward': scan_index_forward
+        }
+        
+        if filter_expression:
+            kwargs['FilterExpression'] = filter_expression
+        if index_name:
+            kwargs['IndexName'] = index_name
+        if page_size:
+            kwargs['Limit'] = page_size
+        
+        while True:
+            response = self._execute_with_retry(table.query, **kwargs)
+            # Decimal을 float로 변환
+            yield [self._convert_decimals_to_float(item) for item in response.get('Items', [])]
+            
+            last_evaluated_key = response.get('LastEvaluatedKey')
+            if not last_evaluated_key:
+                break
+            kwargs['ExclusiveStartKey'] = last_evaluated_key
     
     def scan(
         self,
         table_name: str,
         filter_expression=None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        segments: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         테이블 스캔
         
+        LastEvaluatedKey를 따라 모든 페이지를 읽으며, segments가 2 이상이면
+        Segment/TotalSegments 병렬 스캔을 수행합니다.
+        
         Args:
             table_name: 테이블 이름
             filter_expression: 필터 표현식 (선택사항)
             limit: 최대 결과 수 (선택사항)
+            segments: 병렬 세그먼트 수 (선택사항, 기본값: 클라이언트 설정값)
             
         Returns:
             조회된 아이템 리스트
@@ -348,23 +531,208 @@ class DynamoDBClient:
         Raises:
             DynamoDBClientError: 스캔 실패 시
         """
-        def _scan():
-            table = self.get_table(table_name)
+        items: List[Dict[str, Any]] = []
+        
+        for page in self.scan_pages(
+            table_name,
+            filter_expression=filter_expression,
+            page_size=limit,
+            segments=segments
+        ):
+            items.extend(page)
+            if limit and len(items) >= limit:
+                items = items[:limit]
+                break
+        
+        logger.info(f"스캔 완료 (테이블: {table_name}, 결과: {len(items)}개)")
+        return items
+    
+    def scan_pages(
+        self,
+        table_name: str,
+        filter_expression=None,
+        page_size: Optional[int] = None,
+        segments: Optional[int] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        테이블 스캔 (페이지 단위 스트리밍)
+        
+        페이지가 도착하는 대로 반환하므로 호출자는 전체 테이블을 메모리에
+        올리지 않고 처리할 수 있습니다. 병렬 스캔 시 페이지 순서는 보장되지 않습니다.
+        
+        Args:
+            table_name: 테이블 이름
+            filter_expression: 필터 표현식 (선택사항)
+            page_size: 페이지당 평가 아이템 수 (선택사항)
+            segments: 병렬 세그먼트 수 (선택사항, 기본값: 클라이언트 설정값)
             
-            kwargs = {}
-            if filter_expression:
-                kwargs['FilterExpression'] = filter_expression
-            if limit:
-                kwargs['Limit'] = limit
+        Yields:
+            페이지별 아이템 리스트
             
-            response = table.scan(**kwargs)
-            items = response.get('Items', [])
+        Raises:
+            DynamoDBClientError: 스캔 실패 시
+        """
+        total_segments = max(1, segments or self.scan_segments)
+        
+        if total_segments == 1:
+            yield from self._scan_segment_pages(
+                self.get_table(table_name),
+                filter_expression,
+                page_size
+            )
+            return
+        
+        yield from self._parallel_scan_pages(
+            table_name,
+            filter_expression,
+            page_size,
+            total_segments
+        )
+    
+    def _scan_segment_pages(
+        self,
+        table,
+        filter_expression=None,
+        page_size: Optional[int] = None,
+        segment: Optional[int] = None,
+        total_segments: Optional[int] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        단일 세그먼트의 모든 페이지 순회
+        
+        Args:
+            table: DynamoDB 테이블 객체
+            filter_expression: 필터 표현식 (선택사항)
+            page_size: 페이지당 평가 아이템 수 (선택사항)
+            segment: 세그먼트 번호 (병렬 스캔 시)
+            total_segments: 전체 세그먼트 수 (병렬 스캔 시)
+            
+        Yields:
+            페이지별 아이템 리스트
+        """
+        kwargs = {}
+        if filter_expression:
+            kwargs['FilterExpression'] = filter_expression
+        if page_size:
+            kwargs['Limit'] = page_size
+        if total_segments:
+            kwargs['Segment'] = segment
+            kwargs['TotalSegments'] = total_segments
+        
+        while True:
+            response = self._execute_with_retry(table.scan, **kwargs)
             # Decimal을 float로 변환
-            items = [self._convert_decimals_to_float(item) for item in items]
-            logger.info(f"스캔 완료 (테이블: {table_name}, 결과: {len(items)}개)")
-            return items
+            yield [self._convert_decimals_to_float(item) for item in response.get('Items', [])]
+            
+            last_evaluated_key = response.get('LastEvaluatedKey')
+            if not last_evaluated_key:
+                break
+            kwargs['ExclusiveStartKey'] = last_evaluated_key
+    
+    def _parallel_scan_pages(
+        self,
+        table_name: str,
+        filter_expression,
+        page_size: Optional[int],
+        total_segments: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Segment/TotalSegments 병렬 스캔
+        
+        세그먼트마다 스레드 풀 워커를 두고, 워커가 읽은 페이지를 크기가 제한된
+        큐로 전달합니다. 소비자가 중단하면 워커도 다음 페이지에서 멈춥니다.
+        
+        Args:
+            table_name: 테이블 이름
+            filter_expression: 필터 표현식
+            page_size: 페이지당 평가 아이템 수
+            total_segments: 전체 세그먼트 수
+            
+        Yields:
+            페이지별 아이템 리스트
+        """
+        pages: queue.Queue = queue.Queue(maxsize=total_segments * 2)
+        stop_event = threading.Event()
+        done = object()
+        
+        def _put(entry) -> bool:
+            while not stop_event.is_set():
+                try:
+                    pages.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def _worker(segment: int) -> None:
+            try:
+                table = self._get_worker_table(table_name)
+                for page in self._scan_segment_pages(
+                    table,
+                    filter_expression,
+                    page_size,
+                    segment,
+                    total_segments
+                ):
+                    if not _put(page):
+                        return
+            except Exception as e:
+                logger.error(f"병렬 스캔 실패 (테이블: {table_name}, 세그먼트: {segment}): {str(e)}")
+                _put(e)
+            finally:
+                _put(done)
+        
+        executor = ThreadPoolExecutor(
+            max_workers=total_segments,
+            thread_name_prefix=f"scan-{table_name}"
+        )
+        try:
+            for segment in range(total_segments):
+                executor.submit(_worker, segment)
+            
+            remaining = total_segments
+            while remaining:
+                entry = pages.get()
+                if entry is done:
+                    remaining -= 1
+                elif isinstance(entry, Exception):
+                    if isinstance(entry, DynamoDBClientError):
+                        raise entry
+                    raise DynamoDBClientError(f"병렬 스캔 실패: {str(entry)}")
+                else:
+                    yield entry
+        finally:
+            stop_event.set()
+            executor.shutdown(wait=False)
+    
+    def _get_worker_table(self, table_name: str):
+        """
+        병렬 스캔 워커 스레드 전용 테이블 객체 반환
         
-        return self._execute_with_retry(_scan)
+        Args:
+            table_name: 테이블 이름
+            
+        Returns:
+            현재 스레드 전용 DynamoDB 테이블 객체
+        """
+        return self._get_worker_resource().Table(table_name)
+    
+    def _get_worker_resource(self):
+        """
+        워커 스레드 전용 DynamoDB 리소스 반환
+        
+        Returns:
+            현재 스레드 전용 DynamoDB 리소스
+        """
+        resource = getattr(self._worker_local, 'dynamodb', None)
+        if resource is None:
+            resource = boto3.session.Session().resource(
+                'dynamodb',
+                region_name=self.region_name,
+                endpoint_url=self.endpoint_url
+            )
+            self._worker_local.dynamodb = resource
+        return resource
     
     def batch_write(
         self,
@@ -398,6 +766,205 @@ class DynamoDBClient:
         
         return self._execute_with_retry(_batch_write)
     
+    def batch_put_items(
+        self,
+        table_name: str,
+        items: List[Dict[str, Any]],
+        max_workers: int = 1
+    ) -> int:
+        """
+        BatchWriteItem으로 아이템 일괄 저장
+        
+        아이템을 25개 단위 요청으로 나누고, 응답의 UnprocessedItems만 지수 백오프로
+        다시 요청합니다. max_workers가 2 이상이면 여러 요청을 동시에 보냅니다.
+        같은 요청 안에 키가 중복되면 DynamoDB가 거부하므로 호출자가 중복을 제거해야 합니다.
+        
+        Args:
+            table_name: 테이블 이름
+            items: 저장할 아이템 리스트
+            max_workers: 동시 요청 수 (기본값: 1 - 순차 요청)
+            
+        Returns:
+            저장된 아이템 수
+            
+        Raises:
+            DynamoDBClientError: 재시도 후에도 저장하지 못한 아이템이 있을 때
+        """
+        count = self._batch_write_requests(
+            table_name,
+            [{'PutRequest': {'Item': self._convert_floats_to_decimal(item)}} for item in items],
+            max_workers
+        )
+        if count:
+            logger.info(f"배치 저장 완료 (테이블: {table_name}, 아이템: {count}개)")
+        return count
+    
+    def batch_delete_items(
+        self,
+        table_name: str,
+        keys: List[Dict[str, Any]],
+        max_workers: int = 1
+    ) -> int:
+        """
+        BatchWriteItem으로 아이템 일괄 삭제
+        
+        batch_put_items와 같이 25개 단위 요청으로 나누고 미처리 요청만 다시 보냅니다.
+        없는 키를 삭제해도 오류가 아니며, 키 중복은 호출자가 제거해야 합니다.
+        
+        Args:
+            table_name: 테이블 이름
+            keys: 삭제할 키 리스트
+            max_workers: 동시 요청 수 (기본값: 1 - 순차 요청)
+            
+        Returns:
+            삭제 요청한 키 수
+            
+        Raises:
+            DynamoDBClientError: 재시도 후에도 처리하지 못한 요청이 있을 때
+        """
+        count = self._batch_write_requests(
+            table_name,
+            [{'DeleteRequest': {'Key': key}} for key in keys],
+            max_workers
+        )
+        if count:
+            logger.info(f"배치 삭제 완료 (테이블: {table_name}, 키: {count}개)")
+        return count
+    
+    def _batch_write_requests(
+        self,
+        table_name: str,
+        requests: List[Dict[str, Any]],
+        max_workers: int
+    ) -> int:
+        """
+        쓰기 요청(PutRequest/DeleteRequest)을 25개 단위 BatchWriteItem으로 전송
+        
+        Args:
+            table_name: 테이블 이름
+            requests: BatchWriteItem 쓰기 요청 리스트
+            max_workers: 동시 요청 수
+            
+        Returns:
+            전송한 쓰기 요청 수
+        """
+        chunks = [
+            requests[start:start + BATCH_WRITE_MAX_ITEMS]
+            for start in range(0, len(requests), BATCH_WRITE_MAX_ITEMS)
+        ]
+        if not chunks:
+            return 0
+        
+        if max_workers <= 1 or len(chunks) == 1:
+            for chunk in chunks:
+                self._batch_write_chunk(self.dynamodb, table_name, chunk)
+        else:
+            def _worker(chunk: List[Dict[str, Any]]) -> None:
+                self._batch_write_chunk(self._get_worker_resource(), table_name, chunk)
+            
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(chunks)),
+                thread_name_prefix=f"batch-write-{table_name}"
+            ) as executor:
+                # 실패한 요청의 예외를 그대로 전파
+                for _ in executor.map(_worker, chunks):
+                    pass
+        
+        return len(requests)
+    
+    def _batch_write_chunk(
+        self,
+        resource,
+        table_name: str,
+        chunk: List[Dict[str, Any]]
+    ) -> None:
+        """
+        최대 25개 쓰기 요청에 대한 BatchWriteItem 요청 및 미처리 요청 재시도
+        
+        Args:
+            resource: 요청에 사용할 DynamoDB 리소스
+            table_name: 테이블 이름
+            chunk: 쓰기 요청 리스트 (최대 25개)
+            
+        Raises:
+            DynamoDBClientError: 재시도 후에도 미처리 요청이 남았을 때
+        """
+        request_items = {table_name: chunk}
+        
+        for attempt in range(self.max_retries + 1):
+            response = self._execute_with_retry(
+                resource.batch_write_item,
+                RequestItems=request_items
+            )
+            request_items = response.get('UnprocessedItems') or {}
+            if not request_items:
+                return
+            
+            if attempt < self.max_retries:
+                wait_time = self.retry_delay * (2 ** attempt)
+                unprocessed = sum(len(requests) for requests in request_items.values())
+                logger.warning(
+                    f"미처리 아이템 {unprocessed}개. {wait_time}초 후 재시도 "
+                    f"({attempt + 1}/{self.max_retries})"
+                )
+                time.sleep(wait_time)
+        
+        unprocessed = sum(len(requests) for requests in request_items.values())
+        logger.error(f"배치 쓰기 미처리 아이템 남음 (테이블: {table_name}, 아이템: {unprocessed}개)")
+        raise DynamoDBClientError(f"배치 쓰기 실패: 미처리 아이템 {unprocessed}개")
+    
+    def batch_get_items(
+        self,
+        table_name: str,
+        keys: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        BatchGetItem으로 아이템 일괄 조회
+        
+        키를 100개 단위 요청으로 나누고, 응답의 UnprocessedKeys만 지수 백오프로
+        다시 요청합니다. 반환 순서는 요청한 키 순서와 다를 수 있고, 없는 아이템은 제외됩니다.
+        
+        Args:
+            table_name: 테이블 이름
+            keys: 조회할 키 리스트 (중복 없이)
+            
+        Returns:
+            조회된 아이템 리스트
+            
+        Raises:
+            DynamoDBClientError: 재시도 후에도 조회하지 못한 키가 있을 때
+        """
+        items: List[Dict[str, Any]] = []
+        
+        for start in range(0, len(keys), BATCH_GET_MAX_KEYS):
+            request_items = {table_name: {'Keys': keys[start:start + BATCH_GET_MAX_KEYS]}}
+            
+            for attempt in range(self.max_retries + 1):
+                response = self._execute_with_retry(
+                    self.dynamodb.batch_get_item,
+                    RequestItems=request_items
+                )
+                items.extend(response.get('Responses', {}).get(table_name, []))
+                request_items = response.get('UnprocessedKeys') or {}
+                if not request_items:
+                    break
+                
+                if attempt < self.max_retries:
+                    wait_time = self.retry_delay * (2 ** attempt)
+                    logger.warning(
+                        f"미처리 키 {len(request_items[table_name]['Keys'])}개. {wait_time}초 후 재시도 "
+                        f"({attempt + 1}/{self.max_retries})"
+                    )
+                    time.sleep(wait_time)
+            
+            if request_items:
+                unprocessed = len(request_items[table_name]['Keys'])
+                logger.error(f"배치 조회 미처리 키 남음 (테이블: {table_name}, 키: {unprocessed}개)")
+                raise DynamoDBClientError(f"배치 조회 실패: 미처리 키 {unprocessed}개")
+        
+        logger.info(f"배치 조회 완료 (테이블: {table_name}, 아이템: {len(items)}개)")
+        return [self._convert_decimals_to_float(item) for item in items]
+    
     @staticmethod
     def _convert_floats_to_decimal(obj: Any) -> Any:
         """
@@ -162,16 +162,42 @@ class Affinity(BaseModel):
     company_events: CompanyEvents = Field(..., description="회사 행사 참여")
     personal_closeness: PersonalCloseness = Field(..., description="개인적 친밀도")
     overall_affinity_score: float = Field(..., ge=0, le=100, description="종합 친밀도 점수")
+    calculated_at: Optional[str] = Field(None, description="점수를 계산한 실행 ID (실행 시작 시각)")
 
     def to_dynamodb(self) -> Dict[str, Any]:
-        """DynamoDB 저장용 딕셔너리로 변환"""
-        return self.model_dump(mode='json', exclude_none=True)
+        """DynamoDB 저장용 딕셔너리로 변환 (Employee1Index/Employee2Index 키 포함)"""
+        item = self.model_dump(mode='json', exclude_none=True)
+        item['employee_1'] = self.employee_pair.employee_1
+        item['employee_2'] = self.employee_pair.employee_2
+        return item
 
     @classmethod
     def from_dynamodb(cls, data: Dict[str, Any]) -> 'Affinity':
         """DynamoDB 데이터에서 Affinity 객체 생성"""
+        data = {k: v for k, v in data.items() if k not in ('employee_1', 'employee_2')}
         return cls(**data)
 
+    @classmethod
+    def default_for_pair(cls, employee_1: str, employee_2: str, score: float = 0.0) -> 'Affinity':
+        """저장되지 않은 직원 쌍(sparse 저장)에 대한 기본 점수 친밀도 객체 생성"""
+        return cls(
+            affinity_id=f"AFF_{employee_1}_{employee_2}",
+            employee_pair=EmployeePair(employee_1=employee_1, employee_2=employee_2),
+            project_collaboration=ProjectCollaboration(collaboration_score=0.0),
+            messenger_communication=MessengerCommunication(
+                total_messages_exchanged=0,
+                avg_response_time_minutes=0.0,
+                communication_score=0.0
+            ),
+            company_events=CompanyEvents(social_score=0.0),
+            personal_closeness=PersonalCloseness(
+                payday_contact_frequency=0,
+                vacation_day_contact_frequency=0,
+                personal_score=0.0
+            ),
+            overall_affinity_score=score
+        )
+
 
 class Recommendation(BaseModel):
     """추천 결과 모델"""
@@ -0,0 +1,205 @@
+"""
+Pagination
+
+목록 API의 커서 페이지네이션 유틸리티입니다. DynamoDB LastEvaluatedKey를 불투명한
+next_token 문자열로 인코딩하고, limit/필터/필드 선택 쿼리 파라미터를 검증하며,
+FilterExpression과 ProjectionExpression을 적용한 스캔으로 한 페이지를 읽습니다.
+"""
+
+import base64
+import binascii
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# 페이지당 최대 항목 수
+MAX_PAGE_LIMIT = 100
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def get_query_params(event: Dict[str, Any]) -> Dict[str, str]:
+    """API Gateway 이벤트의 쿼리 파라미터 (없으면 빈 딕셔너리)"""
+    return dict(event.get('queryStringParameters') or {})
+
+
+def encode_next_token(last_evaluated_key: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    LastEvaluatedKey를 next_token으로 인코딩
+
+    DynamoDB 타입 표기({'S': ...}, {'N': ...})로 직렬화하므로 숫자 키도 정확히 복원됩니다.
+
+    Args:
+        last_evaluated_key: 스캔 응답의 LastEvaluatedKey
+
+    Returns:
+        URL-safe base64 토큰 (다음 페이지가 없으면 None)
+    """
+    if not last_evaluated_key:
+        return None
+
+    typed_key = {name: _serializer.serialize(value) for name, value in last_evaluated_key.items()}
+    raw = json.dumps(typed_key, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_next_token(token: Optional[str], key_attributes: Iterable[str]) -> Optional[Dict[str, Any]]:
+    """
+    next_token을 ExclusiveStartKey로 디코딩
+
+    Args:
+        token: 이전 응답의 next_token
+        key_attributes: 테이블 기본 키 속성 이름
+
+    Returns:
+        ExclusiveStartKey (토큰이 없으면 None)
+
+    Raises:
+        ValueError: 토큰 형식이 올바르지 않거나 테이블 키와 맞지 않는 경우
+    """
+    if not token:
+        return None
+
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        typed_key = json.loads(raw.decode('utf-8'))
+        key = {name: _deserializer.deserialize(value) for name, value in typed_key.items()}
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid next_token: {str(e)}")
+
+    if set(key) != set(key_attributes):
+        raise ValueError("Invalid next_token: key does not match table")
+    return key
+
+
+def parse_limit(value: Optional[str], max_limit: int = MAX_PAGE_LIMIT) -> Optional[int]:
+    """
+    limit 쿼리 파라미터 검증
+
+    Args:
+        value: limit 파라미터 값
+        max_limit: 허용하는 최대값
+
+    Returns:
+        페이지 크기 (없으면 None, 전체 조회)
+
+    Raises:
+        ValueError: 정수가 아니거나 1~max_limit 범위를 벗어난 경우
+    """
+    if value is None or value == '':
+        return None
+
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"limit must be an integer: {value}")
+
+    if limit < 1 or limit > max_limit:
+        raise ValueError(f"limit must be between 1 and {max_limit}")
+    return limit
+
+
+def parse_fields(value: Optional[str], allowed: Iterable[str]) -> Optional[List[str]]:
+    """
+    fields 쿼리 파라미터(쉼표 구분) 검증
+
+    Args:
+        value: fields 파라미터 값
+        allowed: 선택할 수 있는 응답 필드
+
+    Returns:
+        선택한 필드 목록 (없으면 None, 전체 필드)
+
+    Raises:
+        ValueError: 알 수 없는 필드가 있는 경우
+    """
+    if not value:
+        return None
+
+    allowed = list(allowed)
+    fields = []
+    for name in value.split(','):
+        name = name.strip()
+        if name and name not in fields:
+            fields.append(name)
+
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields or None
+
+
+def projection_kwargs(attributes: Optional[Iterable[str]]) -> Dict[str, Any]:
+    """
+    최상위 속성 목록으로 ProjectionExpression 인자 생성
+
+    예약어(status, name 등)와 충돌하지 않도록 모든 속성을 이름 placeholder로 지정합니다.
+
+    Args:
+        attributes: 읽을 최상위 속성 (None이면 전체 속성)
+
+    Returns:
+        scan/query에 전달할 키워드 인자
+    """
+    if attributes is None:
+        return {}
+
+    names = {f"#p{i}": name for i, name in enumerate(sorted(set(attributes)))}
+    return {
+        'ProjectionExpression': ', '.join(names),
+        'ExpressionAttributeNames': names
+    }
+
+
+def scan_page(
+    table,
+    limit: Optional[int] = None,
+    start_key: Optional[Dict[str, Any]] = None,
+    filter_expression=None,
+    attributes: Optional[Iterable[str]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    필터와 프로젝션을 적용해 한 페이지 스캔
+
+    DynamoDB의 Limit은 필터 적용 전 평가 항목 수이므로, 남은 개수만큼 Limit을 줄여 가며
+    limit개가 모일 때까지 이어서 읽습니다. 이렇게 하면 limit을 넘겨 읽은 항목이 없어
+    LastEvaluatedKey를 그대로 다음 페이지 시작점으로 쓸 수 있습니다.
+
+    Args:
+        table: DynamoDB 테이블 리소스
+        limit: 페이지 크기 (None이면 테이블 끝까지 조회)
+        start_key: 이어서 읽을 ExclusiveStartKey
+        filter_expression: 필터 표현식 (선택사항)
+        attributes: 읽을 최상위 속성 (선택사항)
+
+    Returns:
+        tuple: (항목 목록, 다음 페이지 LastEvaluatedKey 또는 None)
+    """
+    scan_kwargs = projection_kwargs(attributes)
+    if filter_expression is not None:
+        scan_kwargs['FilterExpression'] = filter_expression
+
+    items: List[Dict[str, Any]] = []
+    last_key = start_key
+    while True:
+        if last_key:
+            scan_kwargs['ExclusiveStartKey'] = last_key
+        if limit is not None:
+            scan_kwargs['Limit'] = limit - len(items)
+
+        response = table.scan(**scan_kwargs)
+        items.extend(response.get('Items', []))
+        last_key = response.get('LastEvaluatedKey')
+
+        if not last_key or (limit is not None and len(items) >= limit):
+            break
+
+    return items, last_key
@@ -6,17 +6,31 @@ Requirements: 1.1, 1.2, 2.1, 2.3, 2-1.7
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from boto3.dynamodb.conditions import Key, Attr
 from common.dynamodb_client import DynamoDBClient, DynamoDBClientError
 from common.models import Employee, Project, Affinity
-from common.utils import normalize_skill
+from common.skill_index import SkillIndex
+from common.utils import normalize_skills
 
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# sparse 저장 시 저장되지 않은 직원 쌍의 기본 친밀도 점수
+# 협업/메신저 기록이 없는 쌍의 점수(회사 행사 40점 × 0.20 + 개인적 친밀도 85점 × 0.15)로,
+# 저장되는 점수의 최저값입니다. affinity_calculator가 계산한 값을 AffinityJobState에 저장하면
+# 조회 시 그 값을 우선 사용합니다.
+DEFAULT_AFFINITY_SCORE = 20.75
+
+# AffinityJobState의 sparse 기본 점수 항목 키
+AFFINITY_DEFAULT_SCORE_KEY = 'affinity_calculator#default_score'
+
+# EmployeeAffinity 테이블의 직원별 GSI
+EMPLOYEE_1_INDEX = 'Employee1Index'
+EMPLOYEE_2_INDEX = 'Employee2Index'
+
 
 class EmployeeRepository:
     """
@@ -26,16 +40,24 @@ class EmployeeRepository:
     Requirements: 1.1, 1.2
     """
     
-    def __init__(self, dynamodb_client: DynamoDBClient, table_name: str = 'Employees'):
+    def __init__(
+        self,
+        dynamodb_client: DynamoDBClient,
+        table_name: str = 'Employees',
+        skill_index: Optional[SkillIndex] = None
+    ):
         """
         Employee Repository 초기화
         
         Args:
             dynamodb_client: DynamoDB 클라이언트
             table_name: 테이블 이름 (기본값: Employees)
+            skill_index: 기술 역색인 (선택사항, 있으면 기술 기반 조회에 사용.
+                색인은 Employees Streams를 받는 skill_index_updater만 갱신)
         """
         self.client = dynamodb_client
         self.table_name = table_name
+        self.skill_index = skill_index
         logger.info(f"EmployeeRepository 초기화 완료 (테이블: {table_name})")
     
     def create(self, employee: Employee) -> Employee:
@@ -158,6 +180,30 @@ class EmployeeRepository:
             logger.error(f"전체 직원 조회 실패: {str(e)}")
             raise DynamoDBClientError(f"전체 직원 조회 실패: {str(e)}")
     
+    def iter_all(self, page_size: Optional[int] = None) -> Iterator[Employee]:
+        """
+        모든 직원 프로필 순회
+        
+        스캔 페이지가 도착하는 대로 Employee 객체를 하나씩 반환하므로
+        전체 직원 목록을 메모리에 올리지 않습니다.
+        
+        Args:
+            page_size: 스캔 페이지 크기 (선택사항)
+            
+        Yields:
+            직원 객체
+            
+        Raises:
+            DynamoDBClientError: 조회 실패 시
+        """
+        try:
+            for items in self.client.scan_pages(self.table_name, page_size=page_size):
+                for item in items:
+                    yield Employee.from_dynamodb(item)
+        except Exception as e:
+            logger.error(f"전체 직원 순회 실패: {str(e)}")
+            raise DynamoDBClientError(f"전체 직원 순회 실패: {str(e)}")
+    
     def find_by_skills(self, required_skills: List[str]) -> List[Employee]:
         """
         특정 기술을 보유한 직원 조회
@@ -175,15 +221,24 @@ class EmployeeRepository:
         """
         try:
             # 기술 이름 정규화
-            normalized_skills = [normalize_skill(skill) for skill in required_skills]
+            normalized_skills = normalize_skills(required_skills)
             
-            # 모든 직원 조회 (실제 환경에서는 GSI 사용 권장)
-            all_employees = self.list_all()
+            if self.skill_index is not None and normalized_skills:
+                # 기술 역색인 posting list 교집합으로 후보만 조회
+                user_ids = self.skill_index.find_employee_ids(normalized_skills)
+                items = self.client.batch_get_items(
+                    self.table_name,
+                    [{'user_id': user_id} for user_id in sorted(user_ids)]
+                )
+                candidates = (Employee.from_dynamodb(item) for item in items)
+            else:
+                # 색인이 없으면 모든 직원 순회
+                candidates = self.iter_all()
             
-            # 요구 기술을 모두 보유한 직원 필터링
+            # 요구 기술을 모두 보유한 직원 필터링 (색인이 늦게 갱신된 경우도 재확인)
             matching_employees = []
-            for employee in all_employees:
-                employee_skills = {normalize_skill(skill.name) for skill in employee.skills}
+            for employee in candidates:
+                employee_skills = set(normalize_skills(skill.name for skill in employee.skills))
                 
                 # 모든 요구 기술을 보유했는지 확인
                 if all(req_skill in employee_skills for req_skill in normalized_skills):
@@ -395,6 +450,29 @@ class ProjectRepository:
             logger.error(f"전체 프로젝트 조회 실패: {str(e)}")
             raise DynamoDBClientError(f"전체 프로젝트 조회 실패: {str(e)}")
     
+    def iter_all(self, page_size: Optional[int] = None) -> Iterator[Project]:
+        """
+        모든 프로젝트 순회
+        
+        스캔 페이지가 도착하는 대로 Project 객체를 하나씩 반환합니다.
+        
+        Args:
+            page_size: 스캔 페이지 크기 (선택사항)
+            
+        Yields:
+            프로젝트 객체
+            
+        Raises:
+            DynamoDBClientError: 조회 실패 시
+        """
+        try:
+            for items in self.client.scan_pages(self.table_name, page_size=page_size):
+                for item in items:
+                    yield Project.from_dynamodb(item)
+        except Exception as e:
+            logger.error(f"전체 프로젝트 순회 실패: {str(e)}")
+            raise DynamoDBClientError(f"전체 프로젝트 순회 실패: {str(e)}")
+    
     def get_all_projects(self, limit: Optional[int] = None) -> List[Project]:
         """
         모든 프로젝트 조회 (list_all의 별칭)
@@ -505,6 +583,85 @@ class AffinityRepository:
             )
             raise DynamoDBClientError(f"친밀도 점수 생성 실패: {str(e)}")
     
+    def create_many(self, affinities: List[Affinity], max_workers: int = 1) -> int:
+        """
+        친밀도 점수 일괄 생성
+        
+        Args:
+            affinities: 생성할 친밀도 객체 리스트
+            max_workers: 동시 BatchWriteItem 요청 수 (기본값: 1)
+            
+        Returns:
+            저장된 친밀도 점수 수
+            
+        Raises:
+            DynamoDBClientError: 생성 실패 시
+        """
+        return self.upsert_many(affinities, max_workers=max_workers)
+    
+    def upsert_many(self, affinities: List[Affinity], max_workers: int = 1) -> int:
+        """
+        친밀도 점수 일괄 저장 (기존 항목은 덮어씀)
+        
+        Requirements: 2-1.7 - 친밀도 점수 주기적 업데이트
+        
+        25개 단위 BatchWriteItem 요청으로 저장하며, 같은 affinity_id가 여러 번
+        포함되면 마지막 항목만 저장합니다.
+        
+        Args:
+            affinities: 저장할 친밀도 객체 리스트
+            max_workers: 동시 BatchWriteItem 요청 수 (기본값: 1)
+            
+        Returns:
+            저장된 친밀도 점수 수
+            
+        Raises:
+            DynamoDBClientError: 저장 실패 시
+        """
+        try:
+            items = {
+                affinity.affinity_id: affinity.to_dynamodb()
+                for affinity in affinities
+            }
+            count = self.client.batch_put_items(
+                self.table_name,
+                list(items.values()),
+                max_workers=max_workers
+            )
+            logger.info(f"친밀도 점수 일괄 저장 완료 (결과: {count}개)")
+            return count
+        except Exception as e:
+            logger.error(f"친밀도 점수 일괄 저장 실패: {str(e)}")
+            raise DynamoDBClientError(f"친밀도 점수 일괄 저장 실패: {str(e)}")
+    
+    def delete_many(self, affinity_ids: List[str], max_workers: int = 1) -> int:
+        """
+        친밀도 점수 일괄 삭제
+        
+        25개 단위 BatchWriteItem 요청으로 삭제하며, 중복된 affinity_id는 한 번만 요청합니다.
+        
+        Args:
+            affinity_ids: 삭제할 친밀도 ID 리스트
+            max_workers: 동시 BatchWriteItem 요청 수 (기본값: 1)
+            
+        Returns:
+            삭제 요청한 친밀도 점수 수
+            
+        Raises:
+            DynamoDBClientError: 삭제 실패 시
+        """
+        try:
+            count = self.client.batch_delete_items(
+                self.table_name,
+                [{'affinity_id': affinity_id} for affinity_id in dict.fromkeys(affinity_ids)],
+                max_workers=max_workers
+            )
+            logger.info(f"친밀도 점수 일괄 삭제 완료 (결과: {count}개)")
+            return count
+        except Exception as e:
+            logger.error(f"친밀도 점수 일괄 삭제 실패: {str(e)}")
+            raise DynamoDBClientError(f"친밀도 점수 일괄 삭제 실패: {str(e)}")
+    
     def get(self, affinity_id: str) -> Optional[Affinity]:
         """
         친밀도 점수 조회
@@ -607,10 +764,34 @@ class AffinityRepository:
             logger.error(f"전체 친밀도 점수 조회 실패: {str(e)}")
             raise DynamoDBClientError(f"전체 친밀도 점수 조회 실패: {str(e)}")
     
+    def iter_all(self, page_size: Optional[int] = None) -> Iterator[Affinity]:
+        """
+        모든 친밀도 점수 순회
+        
+        스캔 페이지가 도착하는 대로 Affinity 객체를 하나씩 반환합니다.
+        
+        Args:
+            page_size: 스캔 페이지 크기 (선택사항)
+            
+        Yields:
+            친밀도 객체
+            
+        Raises:
+            DynamoDBClientError: 조회 실패 시
+        """
+        try:
+            for items in self.client.scan_pages(self.table_name, page_size=page_size):
+                for item in items:
+                    yield Affinity.from_dynamodb(item)
+        except Exception as e:
+            logger.error(f"전체 친밀도 점수 순회 실패: {str(e)}")
+            raise DynamoDBClientError(f"전체 친밀도 점수 순회 실패: {str(e)}")
+    
     def find_by_employee_pair(
         self,
         employee_1: str,
-        employee_2: str
+        employee_2: str,
+        default_score: Optional[float] = None
     ) -> Optional[Affinity]:
         """
         특정 직원 쌍의 친밀도 점수 조회
@@ -620,9 +801,11 @@ class AffinityRepository:
         Args:
             employee_1: 첫 번째 직원 ID
             employee_2: 두 번째 직원 ID
+            default_score: 저장되지 않은 쌍에 사용할 기본 점수 (선택사항, sparse 저장용)
             
         Returns:
             해당 직원 쌍의 친밀도 객체 또는 None
+            (default_score가 있으면 저장되지 않은 쌍은 기본 점수 친밀도 객체)
             
         Raises:
             DynamoDBClientError: 조회 실패 시
@@ -648,57 +831,32 @@ class AffinityRepository:
                 )
                 return affinity
             
-            # affinity_id로 찾지 못한 경우 GSI 사용
-            try:
-                # Employee1Index GSI 사용
-                items = self.client.query(
-                    self.table_name,
-                    key_condition_expression=Key('employee_1').eq(employee_1),
-                    index_name='Employee1Index'
-                )
-                
-                # employee_2와 매칭되는 항목 찾기
-                for item in items:
-                    affinity = Affinity.from_dynamodb(item)
-                    if affinity.employee_pair.employee_2 == employee_2:
-                        logger.info(
-                            f"직원 쌍 친밀도 조회 완료 (GSI 사용, "
-                            f"{employee_1} - {employee_2})"
-                        )
-                        return affinity
-                
-                # 역순으로도 확인 (employee_1과 employee_2가 바뀐 경우)
-                items = self.client.query(
-                    self.table_name,
-                    key_condition_expression=Key('employee_1').eq(employee_2),
-                    index_name='Employee1Index'
+            # affinity_id로 찾지 못한 경우 양방향 GSI 쿼리를 동시에 실행
+            forward_items, reverse_items = self.client.query_parallel(
+                self.table_name,
+                [
+                    {
+                        'key_condition_expression': Key('employee_1').eq(employee_1),
+                        'filter_expression': Attr('employee_2').eq(employee_2),
+                        'index_name': EMPLOYEE_1_INDEX
+                    },
+                    {
+                        'key_condition_expression': Key('employee_1').eq(employee_2),
+                        'filter_expression': Attr('employee_2').eq(employee_1),
+                        'index_name': EMPLOYEE_1_INDEX
+                    }
+                ]
+            )
+            for item in forward_items + reverse_items:
+                logger.info(
+                    f"직원 쌍 친밀도 조회 완료 (GSI 사용, "
+                    f"{employee_1} - {employee_2})"
                 )
-                
-                for item in items:
-                    affinity = Affinity.from_dynamodb(item)
-                    if affinity.employee_pair.employee_2 == employee_1:
-                        logger.info(
-                            f"직원 쌍 친밀도 조회 완료 (GSI 역순, "
-                            f"{employee_2} - {employee_1})"
-                        )
-                        return affinity
-            except Exception as gsi_error:
-                logger.warning(f"GSI 조회 실패, 스캔으로 대체: {str(gsi_error)}")
-            
-            # GSI가 없거나 실패한 경우 스캔으로 대체
-            items = self.client.scan(self.table_name)
-            for item in items:
-                affinity = Affinity.from_dynamodb(item)
-                pair = affinity.employee_pair
-                if ((pair.employee_1 == employee_1 and pair.employee_2 == employee_2) or
-                    (pair.employee_1 == employee_2 and pair.employee_2 == employee_1)):
-                    logger.info(
-                        f"직원 쌍 친밀도 조회 완료 (스캔 사용, "
-                        f"{employee_1} - {employee_2})"
-                    )
-                    return affinity
+                return Affinity.from_dynamodb(item)
             
             logger.info(f"직원 쌍 친밀도 없음 ({employee_1} - {employee_2})")
+            if default_score is not None:
+                return Affinity.default_for_pair(employee_1, employee_2, default_score)
             return None
         except Exception as e:
             logger.error(
@@ -708,42 +866,92 @@ class AffinityRepository:
                 f"직원 쌍 친밀도 조회 실패: {str(e)}"
             )
     
-    def find_by_employee(self, employee_id: str) -> List[Affinity]:
+    def find_by_employee(
+        self,
+        employee_id: str,
+        other_employee_ids: Optional[List[str]] = None,
+        default_score: float = DEFAULT_AFFINITY_SCORE
+    ) -> List[Affinity]:
         """
         특정 직원과 관련된 모든 친밀도 점수 조회
         
+        sparse 저장에서는 점수가 낮은 직원 쌍이 저장되지 않으므로, other_employee_ids를
+        주면 저장되지 않은 상대 직원에 대해 기본 점수 친밀도 객체를 채워 반환합니다.
+        
         Args:
             employee_id: 직원 ID
+            other_employee_ids: 결과에 포함할 상대 직원 ID 목록 (선택사항)
+            default_score: 저장되지 않은 쌍의 기본 점수 (기본값: DEFAULT_AFFINITY_SCORE)
             
         Returns:
             해당 직원과 관련된 친밀도 객체 리스트
+            (other_employee_ids가 있으면 해당 순서의 직원별 친밀도 객체)
             
         Raises:
             DynamoDBClientError: 조회 실패 시
         """
         try:
-            # Employee1Index GSI 사용
-            items = self.client.query(
-                self.table_name,
-                key_condition_expression=Key('employee_1').eq(employee_id),
-                index_name='Employee1Index'
-            )
-            
-            affinities = [Affinity.from_dynamodb(item) for item in items]
+            # employee_1/employee_2 양쪽 GSI를 동시에 쿼리 (O(degree))
+            results = self.client.query_parallel(self.table_name, self._employee_queries(employee_id))
+        except Exception as e:
+            logger.error(f"직원 관련 친밀도 조회 실패 (employee_id: {employee_id}): {str(e)}")
+            raise DynamoDBClientError(f"직원 관련 친밀도 조회 실패: {str(e)}")
+        affinities = [Affinity.from_dynamodb(item) for items in results for item in items]
+        
+        if other_employee_ids is not None:
+            stored = {}
+            for affinity in affinities:
+                pair = affinity.employee_pair
+                other_id = pair.employee_2 if pair.employee_1 == employee_id else pair.employee_1
+                stored[other_id] = affinity
+            affinities = [
+                stored.get(other_id) or Affinity.default_for_pair(employee_id, other_id, default_score)
+                for other_id in other_employee_ids
+                if other_id != employee_id
+            ]
+        
+        logger.info(
+            f"직원 관련 친밀도 조회 완료 "
+            f"(employee_id: {employee_id}, 결과: {len(affinities)}개)"
+        )
+        return affinities
+    
+    def iter_by_employee(self, employee_id: str) -> Iterator[Affinity]:
+        """
+        특정 직원과 관련된 모든 친밀도 점수 순회
+        
+        employee_1/employee_2 GSI 쿼리를 차례로 페이지 단위로 읽으므로 한 페이지만 메모리에 둡니다.
+        전체 목록이 필요하면 두 쿼리를 동시에 실행하는 find_by_employee를 사용합니다.
+        
+        Args:
+            employee_id: 직원 ID
             
-            # employee_2로도 검색 (스캔 필요)
-            all_items = self.client.scan(self.table_name)
-            for item in all_items:
-                affinity = Affinity.from_dynamodb(item)
-                if (affinity.employee_pair.employee_2 == employee_id and
-                    affinity.employee_pair.employee_1 != employee_id):
-                    affinities.append(affinity)
+        Yields:
+            해당 직원과 관련된 친밀도 객체
             
-            logger.info(
-                f"직원 관련 친밀도 조회 완료 "
-                f"(employee_id: {employee_id}, 결과: {len(affinities)}개)"
-            )
-            return affinities
+        Raises:
+            DynamoDBClientError: 조회 실패 시
+        """
+        try:
+            for query in self._employee_queries(employee_id):
+                for items in self.client.query_pages(self.table_name, **query):
+                    for item in items:
+                        yield Affinity.from_dynamodb(item)
         except Exception as e:
             logger.error(f"직원 관련 친밀도 조회 실패 (employee_id: {employee_id}): {str(e)}")
             raise DynamoDBClientError(f"직원 관련 친밀도 조회 실패: {str(e)}")
+    
+    @staticmethod
+    def _employee_queries(employee_id: str) -> List[Dict[str, Any]]:
+        """직원이 employee_1/employee_2인 친밀도 GSI 쿼리 인자 (자기 자신 쌍은 한 번만)"""
+        return [
+            {
+                'key_condition_expression': Key('employee_1').eq(employee_id),
+                'index_name': EMPLOYEE_1_INDEX
+            },
+            {
+                'key_condition_expression': Key('employee_2').eq(employee_id),
+                'filter_expression': Attr('employee_1').ne(employee_id),
+                'index_name': EMPLOYEE_2_INDEX
+            }
+        ]
@@ -0,0 +1,452 @@
+"""
+Response Cache
+
+조회 API 응답 캐시입니다. Lambda 컨테이너가 재사용되는 동안 유지되는 LRU 캐시에
+TTL을 두고, 선택적으로 DynamoDB 테이블 또는 파일 디렉터리를 공유 계층으로 사용합니다.
+
+공유 계층에는 데이터 네임스페이스(employees, projects, ...)별 세대(generation) 번호와
+응답 본문을 저장합니다. 쓰기 Lambda가 invalidate()로 세대를 올리면 다른 Lambda의
+캐시 항목도 세대가 달라져 다음 요청에서 다시 만들어집니다.
+
+응답에는 본문 해시로 만든 ETag를 붙이고, If-None-Match가 일치하면 304를 반환합니다.
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import boto3
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# 기본 TTL(초)과 컨테이너별 최대 캐시 항목 수
+DEFAULT_TTL_SECONDS = 60
+DEFAULT_MAX_ENTRIES = 128
+
+# 공유 계층에 저장할 최대 본문 크기 (DynamoDB 항목 크기 제한 400KB)
+SHARED_BODY_MAX_BYTES = 350 * 1024
+
+# 세대 번호 BatchGetItem의 UnprocessedKeys 재시도 횟수와 첫 대기 시간(초, 재시도마다 두 배)
+GENERATION_MAX_RETRIES = 3
+GENERATION_RETRY_DELAY = 0.05
+
+
+def compute_etag(body: str) -> str:
+    """응답 본문으로 강한 ETag 생성"""
+    return '"' + hashlib.sha256(body.encode('utf-8')).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 ETag와 일치하는지 확인
+
+    Args:
+        if_none_match: If-None-Match 헤더 값 (쉼표로 구분한 ETag 목록 또는 *)
+        etag: 현재 응답의 ETag
+
+    Returns:
+        일치 여부 (약한 비교, W/ 접두사 무시)
+    """
+    if not if_none_match:
+        return False
+
+    candidates = [value.strip() for value in if_none_match.split(',')]
+    if '*' in candidates:
+        return True
+    return any(candidate.replace('W/', '', 1) == etag for candidate in candidates)
+
+
+def get_header(event: Dict[str, Any], name: str) -> Optional[str]:
+    """API Gateway 이벤트에서 헤더 값 조회 (대소문자 무시)"""
+    headers = event.get('headers') or {}
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+class CachedResponse:
+    """
+    캐시된 응답 본문
+
+    Attributes:
+        body: JSON 응답 본문
+        etag: 본문 ETag
+        generations: 만들 당시 의존 네임스페이스별 세대 번호
+        expires_at: 만료 시각 (epoch 초)
+    """
+
+    def __init__(self, body: str, etag: str, generations: Dict[str, int], expires_at: float):
+        self.body = body
+        self.etag = etag
+        self.generations = generations
+        self.expires_at = expires_at
+
+    def is_valid(self, generations: Dict[str, int], now: float) -> bool:
+        """만료되지 않았고 의존 네임스페이스 세대가 같은지 확인"""
+        return now < self.expires_at and self.generations == generations
+
+
+class DynamoDBCacheBackend:
+    """
+    DynamoDB 공유 캐시 계층
+
+    cache_key 하나를 해시 키로 쓰는 테이블에 세대 번호(generation#<네임스페이스>)와
+    응답 본문(body#<캐시 이름>#<키>)을 저장합니다. 본문 항목의 expires_at은
+    DynamoDB TTL 속성으로 사용합니다.
+    """
+
+    def __init__(self, table_name: str, region_name: str = 'us-east-2'):
+        self.table_name = table_name
+        self.dynamodb = boto3.resource('dynamodb', region_name=region_name)
+        self.table = self.dynamodb.Table(table_name)
+
+    def get_generations(self, namespaces: Iterable[str]) -> Optional[Dict[str, int]]:
+        """
+        네임스페이스별 현재 세대 번호 (기록이 없으면 0)
+
+        UnprocessedKeys는 지수 백오프로 다시 요청합니다. 재시도 후에도 남은 키가 있으면
+        세대를 0으로 간주하지 않고 None을 반환해 호출자가 캐시를 건너뛰게 합니다.
+        """
+        namespaces = list(namespaces)
+        if not namespaces:
+            return {}
+
+        request = {
+            self.table_name: {
+                'Keys': [{'cache_key': f"generation#{namespace}"} for namespace in namespaces],
+                'ConsistentRead': True
+            }
+        }
+        generations = {namespace: 0 for namespace in namespaces}
+        for attempt in range(GENERATION_MAX_RETRIES + 1):
+            if attempt:
+                time.sleep(GENERATION_RETRY_DELAY * (2 ** (attempt - 1)))
+            response = self.dynamodb.batch_get_item(RequestItems=request)
+            for item in response.get('Responses', {}).get(self.table_name, []):
+                namespace = item['cache_key'].split('#', 1)[1]
+                generations[namespace] = int(item.get('generation', 0))
+            request = response.get('UnprocessedKeys') or {}
+            if not request:
+                return generations
+
+        logger.warning(
+            f"캐시 세대 일부 미조회 (UnprocessedKeys: {len(request[self.table_name]['Keys'])}건)"
+        )
+        return None
+
+    def bump_generations(self, namespaces: Iterable[str]) -> None:
+        """네임스페이스 세대 번호 증가"""
+        for namespace in namespaces:
+            self.table.update_item(
+                Key={'cache_key': f"generation#{namespace}"},
+                UpdateExpression='ADD generation :one',
+                ExpressionAttributeValues={':one': 1}
+            )
+
+    def get_entry(self, key: str) -> Optional[CachedResponse]:
+        """저장된 응답 본문 조회"""
+        item = self.table.get_item(Key={'cache_key': f"body#{key}"}).get('Item')
+        if not item:
+            return None
+        return CachedResponse(
+            item['body'],
+            item['etag'],
+            {name: int(value) for name, value in json.loads(item['generations']).items()},
+            float(item['expires_at'])
+        )
+
+    def put_entry(self, key: str, entry: CachedResponse) -> None:
+        """응답 본문 저장"""
+        self.table.put_item(Item={
+            'cache_key': f"body#{key}",
+            'body': entry.body,
+            'etag': entry.etag,
+            'generations': json.dumps(entry.generations, sort_keys=True),
+            'expires_at': Decimal(int(entry.expires_at))
+        })
+
+
+class FileCacheBackend:
+    """
+    파일 디렉터리 공유 캐시 계층
+
+    같은 디렉터리(EFS 마운트 등)를 보는 Lambda끼리 세대 번호와 응답 본문을 공유합니다.
+    세대 증가는 파일 잠금으로 직렬화하고, 파일은 임시 파일 교체로 원자적으로 씁니다.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, name: str) -> str:
+        """캐시 키를 파일 경로로 변환"""
+        return os.path.join(self.directory, hashlib.sha256(name.encode('utf-8')).hexdigest() + '.json')
+
+    def _read(self, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(name), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _write(self, name: str, data: Dict[str, Any]) -> None:
+        path = self._path(name)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def get_generations(self, namespaces: Iterable[str]) -> Dict[str, int]:
+        """네임스페이스별 현재 세대 번호 (기록이 없으면 0)"""
+        generations = {}
+        for namespace in namespaces:
+            data = self._read(f"generation#{namespace}")
+            generations[namespace] = int(data['generation']) if data else 0
+        return generations
+
+    def bump_generations(self, namespaces: Iterable[str]) -> None:
+        """네임스페이스 세대 번호 증가"""
+        with open(os.path.join(self.directory, 'generation.lock'), 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                for namespace in namespaces:
+                    name = f"generation#{namespace}"
+                    data = self._read(name) or {'generation': 0}
+                    self._write(name, {'generation': int(data['generation']) + 1})
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def get_entry(self, key: str) -> Optional[CachedResponse]:
+        """저장된 응답 본문 조회"""
+        data = self._read(f"body#{key}")
+        if not data:
+            return None
+        return CachedResponse(data['body'], data['etag'], data['generations'], data['expires_at'])
+
+    def put_entry(self, key: str, entry: CachedResponse) -> None:
+        """응답 본문 저장"""
+        self._write(f"body#{key}", {
+            'body': entry.body,
+            'etag': entry.etag,
+            'generations': entry.generations,
+            'expires_at': entry.expires_at
+        })
+
+
+# 환경 변수로 설정한 공유 계층 (처음 사용할 때 생성)
+_default_backend = None
+_default_backend_loaded = False
+_backend_lock = threading.Lock()
+
+# 생성된 캐시 (같은 컨테이너 안에서 무효화할 때 사용)
+_caches: 'weakref.WeakSet[ResponseCache]' = weakref.WeakSet()
+
+
+def get_default_backend():
+    """
+    환경 변수로 설정한 공유 계층 반환
+
+    RESPONSE_CACHE_TABLE이 있으면 DynamoDB, RESPONSE_CACHE_DIR이 있으면 파일 계층을
+    사용하고, 둘 다 없으면 None(컨테이너 캐시만 사용)을 반환합니다.
+    """
+    global _default_backend, _default_backend_loaded
+    with _backend_lock:
+        if not _default_backend_loaded:
+            table_name = os.environ.get('RESPONSE_CACHE_TABLE')
+            directory = os.environ.get('RESPONSE_CACHE_DIR')
+            if table_name:
+                _default_backend = DynamoDBCacheBackend(table_name, os.environ.get('AWS_REGION', 'us-east-2'))
+            elif directory:
+                _default_backend = FileCacheBackend(directory)
+            _default_backend_loaded = True
+        return _default_backend
+
+
+def invalidate(*namespaces: str, backend=None) -> None:
+    """
+    데이터 네임스페이스가 바뀌었음을 알려 관련 캐시를 무효화
+
+    쓰기 Lambda에서 저장이 끝난 뒤 호출합니다. 공유 계층 갱신에 실패해도 예외를
+    전파하지 않고 로그만 남깁니다 (캐시 항목은 TTL이 지나면 만료됨).
+
+    Args:
+        namespaces: 바뀐 데이터 네임스페이스 (employees, projects, evaluations, pending_candidates)
+        backend: 공유 계층 (없으면 환경 변수 설정)
+    """
+    for cache in list(_caches):
+        if set(cache.depends_on) & set(namespaces):
+            cache.clear()
+
+    try:
+        backend = backend or get_default_backend()
+        if backend is not None:
+            backend.bump_generations(namespaces)
+    except Exception as e:
+        logger.error(f"캐시 무효화 실패 (네임스페이스: {', '.join(namespaces)}): {str(e)}")
+
+
+class ResponseCache:
+    """
+    TTL/LRU 응답 캐시
+
+    캐시 항목은 의존 네임스페이스의 세대 번호와 함께 저장되며, 세대가 바뀌었거나
+    TTL이 지나면 다시 만듭니다. 공유 계층이 있으면 요청마다 세대 번호만 조회하고
+    (테이블 전체 조회 대신 항목 몇 개), 컨테이너 캐시에 없으면 공유 계층의 본문을 사용합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        depends_on: Iterable[str],
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        backend=None
+    ):
+        """
+        응답 캐시 초기화
+
+        Args:
+            name: 캐시 이름 (공유 계층 키 접두사)
+            depends_on: 응답이 의존하는 데이터 네임스페이스
+            ttl_seconds: 캐시 유지 시간 (기본값: RESPONSE_CACHE_TTL 또는 60초)
+            max_entries: 컨테이너별 최대 항목 수 (기본값: RESPONSE_CACHE_MAX_ENTRIES 또는 128)
+            backend: 공유 계층 (없으면 환경 변수 설정)
+        """
+        self.name = name
+        self.depends_on = tuple(depends_on)
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.environ.get('RESPONSE_CACHE_TTL', DEFAULT_TTL_SECONDS)
+        )
+        self.max_entries = max_entries if max_entries is not None else int(
+            os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES)
+        )
+        self._backend = backend
+        self._entries: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    @property
+    def backend(self):
+        """공유 계층 (지정하지 않았으면 환경 변수 설정)"""
+        return self._backend if self._backend is not None else get_default_backend()
+
+    def clear(self) -> None:
+        """컨테이너 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def _current_generations(self) -> Optional[Dict[str, int]]:
+        """의존 네임스페이스 세대 번호 (공유 계층 조회 실패나 일부 미조회 시 None)"""
+        backend = self.backend
+        if backend is None:
+            return {}
+        try:
+            return backend.get_generations(self.depends_on)
+        except Exception as e:
+            logger.error(f"캐시 세대 조회 실패 ({self.name}): {str(e)}")
+            return None
+
+    def _store_local(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_build(
+        self,
+        key: str,
+        build: Callable[[], str],
+        cacheable: Optional[Callable[[str], bool]] = None
+    ) -> Tuple[CachedResponse, bool]:
+        """
+        캐시된 응답을 반환하거나 새로 만들어 저장
+
+        Args:
+            key: 요청 파라미터로 만든 캐시 키
+            build: 응답 본문(JSON 문자열)을 만드는 함수
+            cacheable: 새로 만든 본문을 저장할지 판단하는 함수 (없으면 항상 저장)
+
+        Returns:
+            tuple: (응답, 캐시 적중 여부)
+        """
+        now = time.time()
+        generations = self._current_generations()
+        if generations is None:
+            # 세대를 확인할 수 없으면 오래된 응답을 주지 않도록 캐시를 건너뜀
+            body = build()
+            return CachedResponse(body, compute_etag(body), {}, now), False
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.is_valid(generations, now):
+                self._entries.move_to_end(key)
+                return entry, True
+
+        backend = self.backend
+        shared_key = f"{self.name}#{key}"
+        if backend is not None:
+            try:
+                entry = backend.get_entry(shared_key)
+                if entry is not None and entry.is_valid(generations, now):
+                    self._store_local(key, entry)
+                    return entry, True
+            except Exception as e:
+                logger.error(f"공유 캐시 조회 실패 ({shared_key}): {str(e)}")
+
+        body = build()
+        entry = CachedResponse(body, compute_etag(body), generations, now + self.ttl_seconds)
+        if cacheable is not None and not cacheable(body):
+            return entry, False
+        self._store_local(key, entry)
+
+        if backend is not None and len(body.encode('utf-8')) <= SHARED_BODY_MAX_BYTES:
+            try:
+                backend.put_entry(shared_key, entry)
+            except Exception as e:
+                logger.error(f"공유 캐시 저장 실패 ({shared_key}): {str(e)}")
+
+        return entry, False
+
+
+def conditional_response(
+    event: Dict[str, Any],
+    cached: CachedResponse,
+    headers: Dict[str, str],
+    status_code: int = 200
+) -> Dict[str, Any]:
+    """
+    ETag를 붙인 API Gateway 응답 생성 (If-None-Match가 일치하면 304)
+
+    Args:
+        event: API Gateway 이벤트
+        cached: 캐시된 응답
+        headers: 기본 응답 헤더 (CORS 등)
+        status_code: 본문을 보낼 때의 상태 코드
+
+    Returns:
+        dict: API Gateway 응답
+    """
+    response_headers = dict(headers)
+    response_headers['ETag'] = cached.etag
+    # 브라우저가 매번 ETag로 재검증하도록 지정
+    response_headers['Cache-Control'] = 'no-cache'
+    response_headers['Access-Control-Expose-Headers'] = 'ETag'
+
+    if etag_matches(get_header(event, 'If-None-Match'), cached.etag):
+        return {'statusCode': 304, 'headers': response_headers, 'body': ''}
+
+    return {'statusCode': status_code, 'headers': response_headers, 'body': cached.body}
@@ -0,0 +1,301 @@
+"""
+Skill Inverted Index
+
+정규화된 기술 이름 → 보유 직원(숙련도, 경력 연수) posting list를 DynamoDB에 유지합니다.
+SkillIndex 테이블은 skill(해시 키) + user_id(정렬 키) 항목 하나가 posting 하나이므로,
+기술 하나의 보유 직원은 Query 한 번으로 읽고 직원 변경 시에는 바뀐 posting만 씁니다.
+
+요구 기술 검색은 전체 직원 스캔 대신 요구 기술 수만큼의 posting list를 읽어
+교집합/합집합을 계산합니다. 읽은 posting list는 컨테이너 안에서 TTL 동안 재사용합니다.
+"""
+
+import logging
+import os
+import threading
+import time
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import boto3
+from boto3.dynamodb.conditions import Key
+
+from common.utils import normalize_skill
+
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# posting list 캐시 기본 TTL(초)
+DEFAULT_CACHE_TTL_SECONDS = 60
+
+
+def parse_years(years: Any) -> Decimal:
+    """
+    기술 경력 연수를 Decimal로 변환
+
+    Args:
+        years: 경력 연수 (Decimal, 숫자, 숫자 문자열)
+
+    Returns:
+        경력 연수 (비어 있거나 숫자가 아니면 0)
+    """
+    if isinstance(years, bool):
+        return Decimal(0)
+    try:
+        value = years if isinstance(years, Decimal) else Decimal(str(years).strip())
+    except (InvalidOperation, ValueError):
+        return Decimal(0)
+    return value if value.is_finite() else Decimal(0)
+
+
+def employee_postings(item: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    직원 항목의 기술별 posting
+
+    같은 기술이 정규화 후 중복되면 마지막 항목을 사용합니다.
+
+    Args:
+        item: 직원 항목 (Employees 테이블 형식, 없으면 None)
+
+    Returns:
+        정규화된 기술 이름별 {'level', 'years'}
+    """
+    postings: Dict[str, Dict[str, Any]] = {}
+    if not item:
+        return postings
+
+    for skill in item.get('skills') or []:
+        if not isinstance(skill, dict):
+            continue
+        name = normalize_skill(str(skill.get('name', '')))
+        if not name:
+            continue
+        postings[name] = {
+            'level': str(skill.get('level') or ''),
+            'years': parse_years(skill.get('years') or 0)
+        }
+    return postings
+
+
+class SkillIndex:
+    """
+    DynamoDB 기반 기술 역색인
+
+    posting list는 기술별로 캐시하며, 이 인스턴스를 통한 변경은 캐시에도 바로 반영합니다.
+    다른 컨테이너의 변경은 TTL이 지나면 반영됩니다.
+    """
+
+    def __init__(
+        self,
+        table_name: str = 'SkillIndex',
+        region_name: str = 'us-east-2',
+        cache_ttl_seconds: Optional[float] = None,
+        dynamodb=None
+    ):
+        """
+        기술 역색인 초기화
+
+        Args:
+            table_name: 테이블 이름 (기본값: SkillIndex)
+            region_name: AWS 리전 (기본값: us-east-2)
+            cache_ttl_seconds: posting list 캐시 유지 시간 (기본값: SKILL_INDEX_CACHE_TTL 또는 60초)
+            dynamodb: DynamoDB 리소스 (테스트용, 선택사항)
+        """
+        self.table_name = table_name
+        self.dynamodb = dynamodb or boto3.resource('dynamodb', region_name=region_name)
+        self.table = self.dynamodb.Table(table_name)
+        self.cache_ttl_seconds = cache_ttl_seconds if cache_ttl_seconds is not None else float(
+            os.environ.get('SKILL_INDEX_CACHE_TTL', DEFAULT_CACHE_TTL_SECONDS)
+        )
+        self._cache: Dict[str, Tuple[float, Dict[str, Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def clear_cache(self) -> None:
+        """posting list 캐시 비우기"""
+        with self._lock:
+            self._cache.clear()
+
+    def postings(self, skill: str) -> Dict[str, Dict[str, Any]]:
+        """
+        기술 하나의 posting list 조회
+
+        Args:
+            skill: 기술 이름 (정규화 전 이름도 허용)
+
+        Returns:
+            직원 ID별 {'level', 'years'}
+        """
+        skill = normalize_skill(skill)
+        now = time.time()
+        with self._lock:
+            cached = self._cache.get(skill)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
+        postings: Dict[str, Dict[str, Any]] = {}
+        query_kwargs = {'KeyConditionExpression': Key('skill').eq(skill)}
+        while True:
+            response = self.table.query(**query_kwargs)
+            for item in response.get('Items', []):
+                postings[item['user_id']] = {'level': item.get('level', ''), 'years': item.get('years', 0)}
+            if 'LastEvaluatedKey' not in response:
+                break
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+        with self._lock:
+            self._cache[skill] = (now + self.cache_ttl_seconds, postings)
+        return postings
+
+    def match_counts(self, skills: Iterable[str]) -> Dict[str, int]:
+        """
+        직원별 보유한 요구 기술 수
+
+        Args:
+            skills: 요구 기술 목록
+
+        Returns:
+            요구 기술을 하나 이상 보유한 직원 ID별 보유 개수
+        """
+        counts: Dict[str, int] = {}
+        for skill in {normalize_skill(skill) for skill in skills if skill}:
+            for user_id in self.postings(skill):
+                counts[user_id] = counts.get(user_id, 0) + 1
+        return counts
+
+    def find_employee_ids(self, skills: Iterable[str], match_all: bool = True) -> Set[str]:
+        """
+        요구 기술을 보유한 직원 ID 조회
+
+        match_all이면 짧은 posting list부터 교집합을 계산하고, 결과가 비면 남은 기술은 읽지 않습니다.
+
+        Args:
+            skills: 요구 기술 목록
+            match_all: True면 모든 기술 보유(교집합), False면 하나 이상 보유(합집합)
+
+        Returns:
+            직원 ID 집합
+        """
+        normalized = sorted({normalize_skill(skill) for skill in skills if skill})
+        if not normalized:
+            return set()
+
+        if not match_all:
+            return set(self.match_counts(normalized))
+
+        result: Optional[Set[str]] = None
+        for postings in sorted((self.postings(skill) for skill in normalized), key=len):
+            result = set(postings) if result is None else result & set(postings)
+            if not result:
+                break
+        return result or set()
+
+    def index_employee(self, old_item: Optional[Dict[str, Any]], new_item: Optional[Dict[str, Any]]) -> int:
+        """
+        직원 변경분을 색인에 반영
+
+        생성은 old_item=None, 삭제는 new_item=None으로 호출합니다. 바뀐 posting만 씁니다.
+
+        Args:
+            old_item: 변경 전 직원 항목
+            new_item: 변경 후 직원 항목
+
+        Returns:
+            쓰거나 삭제한 posting 수
+        """
+        user_id = (new_item or old_item or {}).get('user_id')
+        if not user_id:
+            return 0
+
+        old_postings = employee_postings(old_item)
+        new_postings = employee_postings(new_item)
+        removed = [skill for skill in old_postings if skill not in new_postings]
+        changed = {
+            skill: posting for skill, posting in new_postings.items()
+            if old_postings.get(skill) != posting
+        }
+        if not removed and not changed:
+            return 0
+
+        with self.table.batch_writer() as batch:
+            for skill in removed:
+                batch.delete_item(Key={'skill': skill, 'user_id': user_id})
+            for skill, posting in changed.items():
+                batch.put_item(Item={'skill': skill, 'user_id': user_id, **posting})
+
+        # 이 컨테이너의 캐시에 바로 반영 (read-your-writes)
+        with self._lock:
+            for skill in removed:
+                if skill in self._cache:
+                    self._cache[skill][1].pop(user_id, None)
+            for skill, posting in changed.items():
+                if skill in self._cache:
+                    self._cache[skill][1][user_id] = posting
+
+        logger.info(f"기술 색인 갱신 (user_id: {user_id}, 삭제: {len(removed)}개, 저장: {len(changed)}개)")
+        return len(removed) + len(changed)
+
+    def rebuild(self, employees: Iterable[Dict[str, Any]]) -> int:
+        """
+        전체 직원으로 색인 재구성 (초기 적재/복구용)
+
+        현재 직원에게 없는 posting은 삭제합니다.
+
+        Args:
+            employees: 전체 직원 항목
+
+        Returns:
+            저장한 posting 수
+        """
+        postings: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for employee in employees:
+            user_id = employee.get('user_id')
+            if not user_id:
+                continue
+            for skill, posting in employee_postings(employee).items():
+                postings[(skill, user_id)] = posting
+
+        stale: List[Tuple[str, str]] = []
+        scan_kwargs = {'ProjectionExpression': 'skill, user_id'}
+        while True:
+            response = self.table.scan(**scan_kwargs)
+            stale.extend(
+                (item['skill'], item['user_id']) for item in response.get('Items', [])
+                if (item['skill'], item['user_id']) not in postings
+            )
+            if 'LastEvaluatedKey' not in response:
+                break
+            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+        with self.table.batch_writer() as batch:
+            for skill, user_id in stale:
+                batch.delete_item(Key={'skill': skill, 'user_id': user_id})
+            for (skill, user_id), posting in postings.items():
+                batch.put_item(Item={'skill': skill, 'user_id': user_id, **posting})
+
+        self.clear_cache()
+        logger.info(f"기술 색인 재구성 완료 (posting: {len(postings)}개, 삭제: {len(stale)}개)")
+        return len(postings)
+
+
+# 환경 변수로 설정한 기술 색인 (처음 사용할 때 생성)
+_default_index: Optional[SkillIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_default_index() -> Optional[SkillIndex]:
+    """
+    SKILL_INDEX_TABLE 환경 변수로 설정한 기술 색인 반환
+
+    컨테이너가 재사용되는 동안 같은 인스턴스(posting list 캐시)를 공유합니다.
+    설정이 없으면 None을 반환하며, 호출자는 기존 전체 스캔 경로를 사용합니다.
+    """
+    global _default_index
+    table_name = os.environ.get('SKILL_INDEX_TABLE')
+    if not table_name:
+        return None
+
+    with _default_index_lock:
+        if _default_index is None or _default_index.table_name != table_name:
+            _default_index = SkillIndex(table_name, os.environ.get('AWS_REGION', 'us-east-2'))
+        return _default_index
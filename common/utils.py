@@ -6,7 +6,8 @@ HR System 유틸리티 함수
 
 import re
 import logging
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List
 
 
 # 기술 이름 정규화 매핑 딕셔너리
@@ -133,6 +134,43 @@ SKILL_NORMALIZATION_MAP: Dict[str, str] = {
 }
 
 
+# 이미 정규화된 기술 이름 집합 (멱등성 확인용 역방향 조회, import 시 한 번 생성)
+NORMALIZED_SKILL_NAMES: FrozenSet[str] = frozenset(SKILL_NORMALIZATION_MAP.values())
+
+# 정규화 결과 캐시 크기 (직원/프로젝트에 나오는 서로 다른 기술 이름 수보다 충분히 크게)
+SKILL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=SKILL_CACHE_SIZE)
+def _normalize_skill_cached(skill_name: str) -> str:
+    """캐시된 기술 이름 정규화 (빈 문자열이 아닌 문자열만 전달)"""
+    # 공백 제거
+    cleaned = skill_name.strip()
+    
+    # 소문자 변환하여 매핑 딕셔너리에서 찾기
+    normalized = SKILL_NORMALIZATION_MAP.get(cleaned.lower())
+    if normalized is not None:
+        return normalized
+    
+    # 매핑에 없는 경우: 이미 정규화된 값이면 그대로 반환 (멱등성 보장)
+    if cleaned in NORMALIZED_SKILL_NAMES:
+        return cleaned
+    
+    # 완전히 새로운 스킬인 경우에만 title case 적용
+    return cleaned.title()
+
+
+def clear_skill_cache() -> None:
+    """
+    정규화 캐시와 역방향 조회 집합을 다시 만듭니다.
+    
+    SKILL_NORMALIZATION_MAP을 런타임에 변경한 경우에만 호출하면 됩니다.
+    """
+    global NORMALIZED_SKILL_NAMES
+    NORMALIZED_SKILL_NAMES = frozenset(SKILL_NORMALIZATION_MAP.values())
+    _normalize_skill_cached.cache_clear()
+
+
 def normalize_skill(skill_name: str) -> str:
     """
     기술 이름을 표준 형식으로 정규화합니다.
@@ -140,6 +178,9 @@ def normalize_skill(skill_name: str) -> str:
     이 함수는 다양한 형태로 입력된 기술 이름을 일관된 표준 형식으로 변환합니다.
     예: "javascript", "JAVASCRIPT", "Java Script" -> "JavaScript"
     
+    같은 이름은 LRU 캐시에서 바로 반환하고, 매핑에 없는 이름도 정규화된 값 집합으로
+    한 번에 확인하므로 전체 매핑 값을 순회하지 않습니다.
+    
     Args:
         skill_name: 정규화할 기술 이름
         
@@ -157,29 +198,15 @@ def normalize_skill(skill_name: str) -> str:
     if not skill_name:
         return ""
     
-    # 공백 제거
-    cleaned = skill_name.strip()
-    
-    # 소문자 변환하여 매핑 딕셔너리에서 찾기
-    normalized_key = cleaned.lower()
-    
-    if normalized_key in SKILL_NORMALIZATION_MAP:
-        return SKILL_NORMALIZATION_MAP[normalized_key]
-    
-    # 매핑에 없는 경우: 이미 정규화된 값인지 확인 (멱등성 보장)
-    # 정규화된 값들 중에 일치하는 것이 있으면 그대로 반환
-    for normalized_value in SKILL_NORMALIZATION_MAP.values():
-        if cleaned == normalized_value:
-            return normalized_value
-    
-    # 완전히 새로운 스킬인 경우에만 title case 적용
-    return cleaned.title()
+    return _normalize_skill_cached(skill_name)
 
 
-def normalize_skills(skill_names: List[str]) -> List[str]:
+def normalize_skills(skill_names: Iterable[str]) -> List[str]:
     """
     여러 기술 이름을 한 번에 정규화합니다.
     
+    같은 목록 안에서 반복되는 이름은 한 번만 정규화합니다.
+    
     Args:
         skill_names: 정규화할 기술 이름 리스트
         
@@ -190,7 +217,14 @@ def normalize_skills(skill_names: List[str]) -> List[str]:
         >>> normalize_skills(["python", "JAVA", "react"])
         ['Python', 'Java', 'React']
     """
-    return [normalize_skill(skill) for skill in skill_names]
+    resolved: Dict[str, str] = {}
+    result = []
+    for skill in skill_names:
+        normalized = resolved.get(skill) if skill else ""
+        if normalized is None:
+            normalized = resolved[skill] = _normalize_skill_cached(skill)
+        result.append(normalized)
+    return result
 
 
 def get_unique_skills(skill_names: List[str]) -> List[str]:
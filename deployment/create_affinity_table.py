@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+EmployeeAffinity DynamoDB 테이블 생성
+
+직원별 친밀도 조회를 위해 employee_1, employee_2 양쪽 GSI를 만듭니다.
+테이블이 이미 있으면 없는 GSI만 추가하고, GSI 키가 없는 기존 항목에
+employee_1/employee_2 속성을 채웁니다.
+"""
+import boto3
+
+TABLE_NAME = 'EmployeeAffinity'
+
+EMPLOYEE_INDEXES = {
+    'Employee1Index': 'employee_1',
+    'Employee2Index': 'employee_2'
+}
+
+
+def _index_definition(index_name, attribute_name):
+    return {
+        'IndexName': index_name,
+        'KeySchema': [
+            {
+                'AttributeName': attribute_name,
+                'KeyType': 'HASH'
+            }
+        ],
+        'Projection': {
+            'ProjectionType': 'ALL'
+        }
+    }
+
+
+def create_affinity_table():
+    """EmployeeAffinity 테이블 생성"""
+    dynamodb = boto3.client('dynamodb', region_name='us-east-2')
+
+    print("=" * 60)
+    print(f"{TABLE_NAME} 테이블 생성")
+    print("=" * 60)
+
+    try:
+        # 테이블이 이미 존재하는지 확인
+        try:
+            description = dynamodb.describe_table(TableName=TABLE_NAME)['Table']
+            print(f"✓ {TABLE_NAME} 테이블이 이미 존재합니다")
+            return add_missing_indexes(dynamodb, description)
+        except dynamodb.exceptions.ResourceNotFoundException:
+            pass
+
+        # 테이블 생성
+        print(f"\n{TABLE_NAME} 테이블 생성 중...")
+        response = dynamodb.create_table(
+            TableName=TABLE_NAME,
+            KeySchema=[
+                {
+                    'AttributeName': 'affinity_id',
+                    'KeyType': 'HASH'  # Partition key
+                }
+            ],
+            AttributeDefinitions=[
+                {
+                    'AttributeName': 'affinity_id',
+                    'AttributeType': 'S'
+                },
+                {
+                    'AttributeName': 'employee_1',
+                    'AttributeType': 'S'
+                },
+                {
+                    'AttributeName': 'employee_2',
+                    'AttributeType': 'S'
+                }
+            ],
+            GlobalSecondaryIndexes=[
+                _index_definition(index_name, attribute_name)
+                for index_name, attribute_name in EMPLOYEE_INDEXES.items()
+            ],
+            BillingMode='PAY_PER_REQUEST',
+            Tags=[
+                {
+                    'Key': 'Environment',
+                    'Value': 'Production'
+                },
+                {
+                    'Key': 'Project',
+                    'Value': 'HR-Resource-Optimization'
+                }
+            ]
+        )
+
+        print(f"✓ {TABLE_NAME} 테이블 생성 요청 완료")
+        print(f"  상태: {response['TableDescription']['TableStatus']}")
+
+        # 테이블이 활성화될 때까지 대기
+        print("\n테이블 활성화 대기 중...")
+        waiter = dynamodb.get_waiter('table_exists')
+        waiter.wait(TableName=TABLE_NAME)
+
+        print(f"✅ {TABLE_NAME} 테이블이 성공적으로 생성되었습니다!")
+        return True
+
+    except Exception as e:
+        print(f"❌ 테이블 생성 실패: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def add_missing_indexes(dynamodb, description):
+    """기존 테이블에 없는 직원 GSI 추가 및 GSI 키 속성 채우기"""
+    existing = {
+        index['IndexName']
+        for index in description.get('GlobalSecondaryIndexes', [])
+    }
+
+    # GSI는 한 번에 하나씩만 추가할 수 있음
+    for index_name, attribute_name in EMPLOYEE_INDEXES.items():
+        if index_name in existing:
+            print(f"✓ {index_name} GSI가 이미 존재합니다")
+            continue
+
+        print(f"\n{index_name} GSI 추가 중...")
+        dynamodb.update_table(
+            TableName=TABLE_NAME,
+            AttributeDefinitions=[
+                {
+                    'AttributeName': attribute_name,
+                    'AttributeType': 'S'
+                }
+            ],
+            GlobalSecondaryIndexUpdates=[
+                {'Create': _index_definition(index_name, attribute_name)}
+            ]
+        )
+
+        print("GSI 활성화 대기 중...")
+        waiter = dynamodb.get_waiter('table_exists')
+        waiter.wait(TableName=TABLE_NAME)
+        _wait_for_index(dynamodb, index_name)
+        print(f"✓ {index_name} GSI 추가 완료")
+
+    backfill_index_keys()
+    return True
+
+
+def _wait_for_index(dynamodb, index_name):
+    """GSI 생성(백필) 완료 대기"""
+    import time
+
+    while True:
+        description = dynamodb.describe_table(TableName=TABLE_NAME)['Table']
+        statuses = {
+            index['IndexName']: index['IndexStatus']
+            for index in description.get('GlobalSecondaryIndexes', [])
+        }
+        if statuses.get(index_name) == 'ACTIVE':
+            return
+        print(f"  {index_name} 상태: {statuses.get(index_name)}")
+        time.sleep(10)
+
+
+def backfill_index_keys():
+    """employee_pair만 있는 기존 항목에 GSI 키 속성(employee_1, employee_2) 추가"""
+    table = boto3.resource('dynamodb', region_name='us-east-2').Table(TABLE_NAME)
+
+    print("\nGSI 키 속성 채우는 중...")
+    updated = 0
+    scan_kwargs = {}
+
+    while True:
+        response = table.scan(**scan_kwargs)
+
+        for item in response.get('Items', []):
+            pair = item.get('employee_pair') or {}
+            if item.get('employee_1') and item.get('employee_2'):
+                continue
+            if not pair.get('employee_1') or not pair.get('employee_2'):
+                continue
+
+            table.update_item(
+                Key={'affinity_id': item['affinity_id']},
+                UpdateExpression='SET employee_1 = :employee_1, employee_2 = :employee_2',
+                ExpressionAttributeValues={
+                    ':employee_1': pair['employee_1'],
+                    ':employee_2': pair['employee_2']
+                }
+            )
+            updated += 1
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    print(f"✓ {updated}개 항목 업데이트 완료")
+
+
+if __name__ == '__main__':
+    create_affinity_table()
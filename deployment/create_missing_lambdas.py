@@ -15,14 +15,16 @@ LAYER_ARN = "arn:aws:lambda:us-east-2:412677576136:layer:boto3-layer-team2:1"
 
 lambda_client = boto3.client('lambda', region_name=REGION)
 
-def create_zip_from_file(file_path):
-    """파일을 ZIP으로 압축"""
+def create_zip_from_file(file_path, modules=None):
+    """파일을 ZIP으로 압축 (modules: index.py와 같은 디렉토리에서 함께 넣을 모듈 파일 이름)"""
     zip_buffer = io.BytesIO()
     with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
         zip_file.write(file_path, 'index.py')
+        for module in modules or []:
+            zip_file.write(os.path.join(os.path.dirname(file_path), module), module)
     return zip_buffer.getvalue()
 
-def create_lambda_function(function_name, handler, code_path, memory=512, timeout=30, layers=None):
+def create_lambda_function(function_name, handler, code_path, memory=512, timeout=30, layers=None, modules=None):
     """Lambda 함수 생성"""
     try:
         # 기존 함수 확인
@@ -35,7 +37,7 @@ def create_lambda_function(function_name, handler, code_path, memory=512, timeou
         
         # ZIP 파일 생성
         print(f"  {function_name} ZIP 생성 중...")
-        zip_content = create_zip_from_file(code_path)
+        zip_content = create_zip_from_file(code_path, modules)
         
         # Lambda 함수 생성 (환경 변수 없이)
         print(f"  {function_name} 생성 중...")
@@ -76,6 +78,7 @@ def main():
             'name': 'DashboardMetrics',
             'handler': 'index.lambda_handler',
             'code': '../lambda_functions/dashboard_metrics/index.py',
+            'modules': ['accumulators.py', 'view.py'],
             'memory': 512,
             'timeout': 30,
             'layers': [LAYER_ARN]
@@ -123,7 +126,8 @@ def main():
             func['code'],
             func['memory'],
             func['timeout'],
-            func['layers']
+            func['layers'],
+            func.get('modules')
         ):
             success_count += 1
     
@@ -12,6 +12,15 @@ REGION = "us-east-2"
 ROLE_ARN = "arn:aws:iam::412677576136:role/LambdaExecutionRole-Team2"
 LAYER_ARN = "arn:aws:lambda:us-east-2:412677576136:layer:boto3-layer-team2:1"
 
+# Lambda 환경 변수 (Terraform의 평가 Lambda들과 같은 테이블 사용)
+ENVIRONMENT_VARIABLES = {
+    'EMPLOYEES_TABLE': 'Employees',
+    'PROJECTS_TABLE': 'Projects',
+    'EVALUATIONS_TABLE': 'EmployeeEvaluations',
+    'COHORT_STATS_TABLE': 'EvaluationCohortStats',
+    'COHORT_STATS_UPDATER_FUNCTION': 'EvaluationCohortStatsUpdater'
+}
+
 lambda_client = boto3.client('lambda', region_name=REGION)
 api_gateway = boto3.client('apigateway', region_name=REGION)
 
@@ -37,6 +46,14 @@ def create_lambda():
                 ZipFile=zip_content
             )
             print("✓ Lambda 함수 코드 업데이트 완료")
+            
+            # 코드 업데이트가 끝난 뒤 환경 변수 갱신
+            lambda_client.get_waiter('function_updated').wait(FunctionName='EmployeeEvaluation')
+            lambda_client.update_function_configuration(
+                FunctionName='EmployeeEvaluation',
+                Environment={'Variables': ENVIRONMENT_VARIABLES}
+            )
+            print("✓ Lambda 함수 환경 변수 업데이트 완료")
             return True
             
         except lambda_client.exceptions.ResourceNotFoundException:
@@ -52,6 +69,7 @@ def create_lambda():
                 Timeout=60,
                 MemorySize=512,
                 Layers=[LAYER_ARN],
+                Environment={'Variables': ENVIRONMENT_VARIABLES},
                 Tags={
                     'Team': 'Team2',
                     'EmployeeID': '524956',
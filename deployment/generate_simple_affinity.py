@@ -75,6 +75,9 @@ def generate_affinity_data():
             
             record = {
                 'affinity_id': f"AFF_{emp1_id}_{emp2_id}",
+                # Employee1Index/Employee2Index GSI 키
+                'employee_1': emp1_id,
+                'employee_2': emp2_id,
                 'employee_pair': {
                     'employee_1': emp1_id,
                     'employee_2': emp2_id
@@ -1,5 +1,6 @@
 import json
 import boto3
+from datetime import datetime
 from decimal import Decimal
 
 def convert_to_decimal(obj):
@@ -19,8 +20,10 @@ try:
     with open('../test_data/company_events.json', 'r', encoding='utf-8') as f:
         events = json.load(f)
     table = dynamodb.Table('CompanyEvents')
+    # 친밀도 증분 계산은 등록 시각(created_at)으로 새 행사를 찾음
+    created_at = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
     for event in events:
-        table.put_item(Item=convert_to_decimal(event))
+        table.put_item(Item=convert_to_decimal({'created_at': created_at, **event}))
     print(f"✓ {len(events)}개 이벤트 로드 완료")
 except Exception as e:
     print(f"✗ 이벤트 로드 실패: {e}")
@@ -14,7 +14,10 @@ $lambdaFunctions = @(
     "employees_list",
     "employee_create",
     "projects_list",
-    "dashboard_metrics"
+    "dashboard_metrics",
+    "employee_evaluation",
+    "skill_index_updater",
+    "employees_stream_dispatcher"
 )
 
 foreach ($func in $lambdaFunctions) {
@@ -14,14 +14,17 @@ def main():
     # 경로 설정
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(script_dir)
-    lambda_file = os.path.join(project_root, 'lambda_functions', 'dashboard_metrics', 'index.py')
+    lambda_dir = os.path.join(project_root, 'lambda_functions', 'dashboard_metrics')
+    # index.py와 함께 임포트하는 모듈(accumulators.py 등)도 포함
+    lambda_files = ['index.py', 'accumulators.py', 'view.py']
     zip_file = os.path.join(project_root, 'dashboard_metrics.zip')
     
     try:
         # 1. Lambda 패키지 생성
         print("\nLambda 배포 패키지 생성 중...")
         with zipfile.ZipFile(zip_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            zipf.write(lambda_file, 'index.py')
+            for file_name in lambda_files:
+                zipf.write(os.path.join(lambda_dir, file_name), file_name)
         print(f"✓ {zip_file} 생성 완료")
         
         # 2. Lambda 함수 업데이트
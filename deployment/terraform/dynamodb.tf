@@ -53,6 +53,9 @@ resource "aws_dynamodb_table" "projects" {
     projection_type = "ALL"
   }
   
+  stream_enabled   = true
+  stream_view_type = "NEW_AND_OLD_IMAGES"
+  
   tags = {
     Team        = "Team2"
     EmployeeID  = "524956"
@@ -76,12 +79,23 @@ resource "aws_dynamodb_table" "employee_affinity" {
     type = "S"
   }
   
+  attribute {
+    name = "employee_2"
+    type = "S"
+  }
+  
   global_secondary_index {
     name            = "Employee1Index"
     hash_key        = "employee_1"
     projection_type = "ALL"
   }
   
+  global_secondary_index {
+    name            = "Employee2Index"
+    hash_key        = "employee_2"
+    projection_type = "ALL"
+  }
+  
   tags = {
     Team        = "Team2"
     EmployeeID  = "524956"
@@ -200,6 +214,9 @@ resource "aws_dynamodb_table" "employee_evaluations" {
     projection_type = "ALL"
   }
   
+  stream_enabled   = true
+  stream_view_type = "NEW_AND_OLD_IMAGES"
+  
   tags = {
     Team        = "Team2"
     EmployeeID  = "524956"
@@ -230,6 +247,122 @@ resource "aws_dynamodb_table" "pending_candidates" {
     projection_type = "ALL"
   }
   
+  stream_enabled   = true
+  stream_view_type = "NEW_AND_OLD_IMAGES"
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# Affinity Job State Table (증분 친밀도 계산 워터마크)
+resource "aws_dynamodb_table" "affinity_job_state" {
+  name           = "AffinityJobState"
+  billing_mode   = "PAY_PER_REQUEST"
+  hash_key       = "job_name"
+  
+  attribute {
+    name = "job_name"
+    type = "S"
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# Dashboard Snapshot Table (대시보드 materialized view)
+resource "aws_dynamodb_table" "dashboard_snapshot" {
+  name           = "DashboardSnapshot"
+  billing_mode   = "PAY_PER_REQUEST"
+  hash_key       = "snapshot_id"
+  
+  attribute {
+    name = "snapshot_id"
+    type = "S"
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# Response Cache Table (조회 API 응답 캐시 공유 계층)
+resource "aws_dynamodb_table" "response_cache" {
+  name           = "ResponseCache"
+  billing_mode   = "PAY_PER_REQUEST"
+  hash_key       = "cache_key"
+  
+  attribute {
+    name = "cache_key"
+    type = "S"
+  }
+  
+  # 응답 본문 항목은 expires_at이 지나면 자동 삭제 (세대 번호 항목에는 없음)
+  ttl {
+    attribute_name = "expires_at"
+    enabled        = true
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# Skill Index Table (기술 → 보유 직원 역색인, 항목 하나가 posting 하나)
+resource "aws_dynamodb_table" "skill_index" {
+  name           = "SkillIndex"
+  billing_mode   = "PAY_PER_REQUEST"
+  hash_key       = "skill"
+  range_key      = "user_id"
+  
+  attribute {
+    name = "skill"
+    type = "S"
+  }
+  
+  attribute {
+    name = "user_id"
+    type = "S"
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# Evaluation Cohort Stats Table (직원 평가 상대 평가용 임시 점수/항목별 최고점·백분위)
+resource "aws_dynamodb_table" "evaluation_cohort_stats" {
+  name           = "EvaluationCohortStats"
+  billing_mode   = "PAY_PER_REQUEST"
+  hash_key       = "cohort"
+  range_key      = "member_id"
+  
+  attribute {
+    name = "cohort"
+    type = "S"
+  }
+  
+  attribute {
+    name = "member_id"
+    type = "S"
+  }
+  
   tags = {
     Team        = "Team2"
     EmployeeID  = "524956"
@@ -50,8 +50,11 @@ resource "aws_iam_role_policy" "lambda_dynamodb_access" {
           "dynamodb:PutItem",
           "dynamodb:UpdateItem",
           "dynamodb:DeleteItem",
+          "dynamodb:BatchGetItem",
+          "dynamodb:BatchWriteItem",
           "dynamodb:Query",
           "dynamodb:Scan",
+          "dynamodb:DescribeTable",
           "dynamodb:DescribeStream",
           "dynamodb:GetRecords",
           "dynamodb:GetShardIterator",
@@ -68,6 +71,45 @@ resource "aws_iam_role_policy" "lambda_dynamodb_access" {
   })
 }
 
+# Lambda Invoke Policy (스트림 dispatcher, 친밀도 샤드 워커 호출)
+resource "aws_iam_role_policy" "lambda_invoke_access" {
+  name = "Team2-Lambda-Invoke-From-Lambda"
+  role = aws_iam_role.lambda_execution_team2.id
+  
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Allow"
+        Action = "lambda:InvokeFunction"
+        Resource = "arn:aws:lambda:${var.aws_region}:*:function:*"
+        Condition = {
+          StringEquals = {
+            "aws:ResourceTag/Team" = "Team2"
+          }
+        }
+      }
+    ]
+  })
+}
+
+# SQS Send Policy (DynamoDB Stream 처리 실패 레코드 전송)
+resource "aws_iam_role_policy" "lambda_stream_failures_access" {
+  name = "Team2-Stream-Failures-Send"
+  role = aws_iam_role.lambda_execution_team2.id
+  
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Allow"
+        Action = "sqs:SendMessage"
+        Resource = aws_sqs_queue.stream_failures.arn
+      }
+    ]
+  })
+}
+
 # S3 Access Policy
 resource "aws_iam_role_policy" "lambda_s3_access" {
   name = "Team2-S3-Access"
@@ -77,6 +77,11 @@ resource "aws_cloudwatch_event_target" "affinity_calculator_target" {
   rule      = aws_cloudwatch_event_rule.daily_affinity_calculation.name
   target_id = "AffinityCalculatorTarget"
   arn       = aws_lambda_function.affinity_calculator.arn
+  
+  # 워터마크 이후 변경된 직원 쌍만 재계산 (워터마크가 없으면 전체 계산)
+  input = jsonencode({
+    mode = "incremental"
+  })
 }
 
 resource "aws_lambda_permission" "allow_eventbridge_affinity" {
@@ -99,6 +104,13 @@ resource "aws_lambda_function" "recommendation_engine" {
   
   layers = [aws_lambda_layer_version.boto3_layer.arn]
   
+  environment {
+    variables = {
+      SKILL_INDEX_TABLE    = aws_dynamodb_table.skill_index.name
+      AFFINITY_STATE_TABLE = aws_dynamodb_table.affinity_job_state.name
+    }
+  }
+  
   tags = {
     Team        = "Team2"
     EmployeeID  = "524956"
@@ -119,6 +131,12 @@ resource "aws_lambda_function" "domain_analysis" {
   
   layers = [aws_lambda_layer_version.boto3_layer.arn]
   
+  environment {
+    variables = {
+      SKILL_INDEX_TABLE = aws_dynamodb_table.skill_index.name
+    }
+  }
+  
   tags = {
     Team        = "Team2"
     EmployeeID  = "524956"
@@ -234,11 +252,34 @@ resource "aws_lambda_function" "vector_embedding" {
   }
 }
 
+# DynamoDB Stream 처리 실패 레코드 위치 (event source mapping의 on-failure destination)
+resource "aws_sqs_queue" "stream_failures" {
+  name                      = "Team2-Stream-Failures"
+  message_retention_seconds = 1209600
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
 # DynamoDB Stream event source mapping
 resource "aws_lambda_event_source_mapping" "employees_stream" {
   event_source_arn  = aws_dynamodb_table.employees.stream_arn
   function_name     = aws_lambda_function.vector_embedding.arn
   starting_position = "LATEST"
+  
+  # 실패한 배치는 무한 재시도하지 않고, 나눠 재시도한 뒤 실패 레코드 위치를 SQS로 보냄
+  maximum_retry_attempts         = 3
+  bisect_batch_on_function_error = true
+  
+  destination_config {
+    on_failure {
+      destination_arn = aws_sqs_queue.stream_failures.arn
+    }
+  }
 }
 
 # Variable for external API key
@@ -262,6 +303,12 @@ resource "aws_lambda_function" "employees_list" {
   
   layers = [aws_lambda_layer_version.boto3_layer.arn]
   
+  environment {
+    variables = {
+      RESPONSE_CACHE_TABLE = aws_dynamodb_table.response_cache.name
+    }
+  }
+  
   tags = {
     Team        = "Team2"
     EmployeeID  = "524956"
@@ -284,7 +331,8 @@ resource "aws_lambda_function" "employee_create" {
   
   environment {
     variables = {
-      EMPLOYEES_TABLE = aws_dynamodb_table.employees.name
+      EMPLOYEES_TABLE      = aws_dynamodb_table.employees.name
+      RESPONSE_CACHE_TABLE = aws_dynamodb_table.response_cache.name
     }
   }
   
@@ -308,6 +356,12 @@ resource "aws_lambda_function" "projects_list" {
   
   layers = [aws_lambda_layer_version.boto3_layer.arn]
   
+  environment {
+    variables = {
+      RESPONSE_CACHE_TABLE = aws_dynamodb_table.response_cache.name
+    }
+  }
+  
   tags = {
     Team        = "Team2"
     EmployeeID  = "524956"
@@ -330,7 +384,8 @@ resource "aws_lambda_function" "project_create" {
   
   environment {
     variables = {
-      PROJECTS_TABLE = aws_dynamodb_table.projects.name
+      PROJECTS_TABLE       = aws_dynamodb_table.projects.name
+      RESPONSE_CACHE_TABLE = aws_dynamodb_table.response_cache.name
     }
   }
   
@@ -354,11 +409,233 @@ resource "aws_lambda_function" "dashboard_metrics" {
   
   layers = [aws_lambda_layer_version.boto3_layer.arn]
   
+  environment {
+    variables = {
+      EMPLOYEES_TABLE          = aws_dynamodb_table.employees.name
+      PROJECTS_TABLE           = aws_dynamodb_table.projects.name
+      EVALUATIONS_TABLE        = aws_dynamodb_table.employee_evaluations.name
+      PENDING_CANDIDATES_TABLE = aws_dynamodb_table.pending_candidates.name
+      DASHBOARD_VIEW_TABLE     = aws_dynamodb_table.dashboard_snapshot.name
+      RESPONSE_CACHE_TABLE     = aws_dynamodb_table.response_cache.name
+    }
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# Dashboard View Updater Lambda (DynamoDB Streams 변경분으로 대시보드 view 갱신)
+resource "aws_lambda_function" "dashboard_view_updater" {
+  filename      = "../../lambda_functions/dashboard_metrics.zip"
+  function_name = "DashboardViewUpdater"
+  role          = aws_iam_role.lambda_execution_team2.arn
+  handler       = "index.stream_handler"
+  runtime       = "python3.11"
+  timeout       = 120
+  memory_size   = 512
+  
+  # view 항목 하나를 갱신하므로 동시 실행을 제한해 조건부 쓰기 충돌을 줄임
+  reserved_concurrent_executions = 1
+  
+  layers = [aws_lambda_layer_version.boto3_layer.arn]
+  
+  environment {
+    variables = {
+      EMPLOYEES_TABLE          = aws_dynamodb_table.employees.name
+      PROJECTS_TABLE           = aws_dynamodb_table.projects.name
+      EVALUATIONS_TABLE        = aws_dynamodb_table.employee_evaluations.name
+      PENDING_CANDIDATES_TABLE = aws_dynamodb_table.pending_candidates.name
+      DASHBOARD_VIEW_TABLE     = aws_dynamodb_table.dashboard_snapshot.name
+      RESPONSE_CACHE_TABLE     = aws_dynamodb_table.response_cache.name
+    }
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# 대시보드 view 갱신용 DynamoDB Stream event source mapping
+# (Employees 변경분은 employees_stream_dispatcher가 전달)
+resource "aws_lambda_event_source_mapping" "dashboard_projects_stream" {
+  event_source_arn  = aws_dynamodb_table.projects.stream_arn
+  function_name     = aws_lambda_function.dashboard_view_updater.arn
+  starting_position = "LATEST"
+  batch_size        = 100
+  
+  # 실패한 배치는 무한 재시도하지 않고, 나눠 재시도한 뒤 실패 레코드 위치를 SQS로 보냄
+  maximum_retry_attempts         = 3
+  bisect_batch_on_function_error = true
+  
+  destination_config {
+    on_failure {
+      destination_arn = aws_sqs_queue.stream_failures.arn
+    }
+  }
+}
+
+resource "aws_lambda_event_source_mapping" "dashboard_evaluations_stream" {
+  event_source_arn  = aws_dynamodb_table.employee_evaluations.stream_arn
+  function_name     = aws_lambda_function.dashboard_view_updater.arn
+  starting_position = "LATEST"
+  batch_size        = 100
+  
+  # 실패한 배치는 무한 재시도하지 않고, 나눠 재시도한 뒤 실패 레코드 위치를 SQS로 보냄
+  maximum_retry_attempts         = 3
+  bisect_batch_on_function_error = true
+  
+  destination_config {
+    on_failure {
+      destination_arn = aws_sqs_queue.stream_failures.arn
+    }
+  }
+}
+
+resource "aws_lambda_event_source_mapping" "dashboard_pending_candidates_stream" {
+  event_source_arn  = aws_dynamodb_table.pending_candidates.stream_arn
+  function_name     = aws_lambda_function.dashboard_view_updater.arn
+  starting_position = "LATEST"
+  batch_size        = 100
+  
+  # 실패한 배치는 무한 재시도하지 않고, 나눠 재시도한 뒤 실패 레코드 위치를 SQS로 보냄
+  maximum_retry_attempts         = 3
+  bisect_batch_on_function_error = true
+  
+  destination_config {
+    on_failure {
+      destination_arn = aws_sqs_queue.stream_failures.arn
+    }
+  }
+}
+
+# Skill Index Updater Lambda (Employees 변경분으로 기술 역색인 갱신)
+resource "aws_lambda_function" "skill_index_updater" {
+  filename      = "../../lambda_functions/skill_index_updater.zip"
+  function_name = "SkillIndexUpdater"
+  role          = aws_iam_role.lambda_execution_team2.arn
+  handler       = "index.handler"
+  runtime       = "python3.11"
+  timeout       = 300
+  memory_size   = 256
+  
+  layers = [aws_lambda_layer_version.boto3_layer.arn]
+  
   environment {
     variables = {
       EMPLOYEES_TABLE   = aws_dynamodb_table.employees.name
-      PROJECTS_TABLE    = aws_dynamodb_table.projects.name
-      EVALUATIONS_TABLE = "EmployeeEvaluations"
+      SKILL_INDEX_TABLE = aws_dynamodb_table.skill_index.name
+    }
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# Employees Stream Dispatcher Lambda
+# Employees 스트림은 샤드당 reader를 2개 이하로 유지하기 위해 vector_embedding과 이 Lambda만 읽고,
+# 나머지 변경분 처리 Lambda는 이 Lambda가 순서대로 동기 호출 (변경분을 누적하는 대시보드 view는 마지막)
+resource "aws_lambda_function" "employees_stream_dispatcher" {
+  filename      = "../../lambda_functions/employees_stream_dispatcher.zip"
+  function_name = "EmployeesStreamDispatcher"
+  role          = aws_iam_role.lambda_execution_team2.arn
+  handler       = "index.handler"
+  runtime       = "python3.11"
+  timeout       = 900
+  memory_size   = 256
+  
+  environment {
+    variables = {
+      STREAM_TARGETS = join(",", [
+        aws_lambda_function.skill_index_updater.function_name,
+        aws_lambda_function.evaluation_cohort_stats_updater.function_name,
+        aws_lambda_function.dashboard_view_updater.function_name
+      ])
+      INVOKE_READ_TIMEOUT_SECONDS = "310"
+    }
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+resource "aws_lambda_event_source_mapping" "employees_dispatcher_stream" {
+  event_source_arn  = aws_dynamodb_table.employees.stream_arn
+  function_name     = aws_lambda_function.employees_stream_dispatcher.arn
+  starting_position = "LATEST"
+  batch_size        = 100
+  
+  # 실패한 배치는 무한 재시도하지 않고, 나눠 재시도한 뒤 실패 레코드 위치를 SQS로 보냄
+  maximum_retry_attempts         = 3
+  bisect_batch_on_function_error = true
+  
+  destination_config {
+    on_failure {
+      destination_arn = aws_sqs_queue.stream_failures.arn
+    }
+  }
+}
+
+# Evaluation Cohort Stats Updater Lambda (Employees 변경분으로 상대 평가 코호트 통계 갱신)
+# Employees 변경분은 employees_stream_dispatcher가 전달
+resource "aws_lambda_function" "evaluation_cohort_stats_updater" {
+  filename      = "../../lambda_functions/employee_evaluation.zip"
+  function_name = "EvaluationCohortStatsUpdater"
+  role          = aws_iam_role.lambda_execution_team2.arn
+  handler       = "index.stream_handler"
+  runtime       = "python3.11"
+  timeout       = 300
+  memory_size   = 512
+  
+  # 요약 항목 하나를 다시 집계하므로 동시 실행을 제한
+  reserved_concurrent_executions = 1
+  
+  environment {
+    variables = {
+      EMPLOYEES_TABLE    = aws_dynamodb_table.employees.name
+      PROJECTS_TABLE     = aws_dynamodb_table.projects.name
+      COHORT_STATS_TABLE = aws_dynamodb_table.evaluation_cohort_stats.name
+    }
+  }
+  
+  tags = {
+    Team        = "Team2"
+    EmployeeID  = "524956"
+    Project     = "HR-Resource-Optimization"
+    Environment = var.environment
+  }
+}
+
+# Employee Evaluation Batch Lambda (분기별 전사 평가 등 여러 직원 일괄 평가)
+resource "aws_lambda_function" "employee_evaluation_batch" {
+  filename      = "../../lambda_functions/employee_evaluation.zip"
+  function_name = "EmployeeEvaluationBatch"
+  role          = aws_iam_role.lambda_execution_team2.arn
+  handler       = "index.batch_handler"
+  runtime       = "python3.11"
+  timeout       = 900
+  memory_size   = 1024
+  
+  environment {
+    variables = {
+      EMPLOYEES_TABLE    = aws_dynamodb_table.employees.name
+      PROJECTS_TABLE     = aws_dynamodb_table.projects.name
+      EVALUATIONS_TABLE  = aws_dynamodb_table.employee_evaluations.name
+      COHORT_STATS_TABLE = aws_dynamodb_table.evaluation_cohort_stats.name
     }
   }
   
@@ -384,8 +661,9 @@ resource "aws_lambda_function" "project_assign" {
   
   environment {
     variables = {
-      EMPLOYEES_TABLE = aws_dynamodb_table.employees.name
-      PROJECTS_TABLE  = aws_dynamodb_table.projects.name
+      EMPLOYEES_TABLE      = aws_dynamodb_table.employees.name
+      PROJECTS_TABLE       = aws_dynamodb_table.projects.name
+      RESPONSE_CACHE_TABLE = aws_dynamodb_table.response_cache.name
     }
   }
   
@@ -431,6 +709,8 @@ resource "aws_lambda_function" "evaluations_list" {
   timeout       = 30
   memory_size   = 256
   
+  layers = [aws_lambda_layer_version.boto3_layer.arn]
+  
   tags = {
     Team        = "Team2"
     EmployeeID  = "524956"
@@ -8,11 +8,14 @@ print("=" * 60)
 
 # ZIP 파일 생성
 zip_path = 'dashboard_metrics.zip'
-lambda_file = 'lambda_functions/dashboard_metrics/index.py'
+lambda_dir = 'lambda_functions/dashboard_metrics'
+# index.py와 함께 임포트하는 모듈(accumulators.py, view.py)도 포함
+lambda_files = ['index.py', 'accumulators.py', 'view.py']
 
 print(f"\n1. ZIP 파일 생성 중...")
 with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-    zipf.write(lambda_file, 'index.py')
+    for file_name in lambda_files:
+        zipf.write(os.path.join(lambda_dir, file_name), file_name)
 print(f"  ✓ {zip_path} 생성 완료")
 
 # Lambda 업데이트
@@ -13,8 +13,10 @@ def update_dashboard_lambda():
     # Lambda 함수 코드 압축
     zip_buffer = io.BytesIO()
     with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        lambda_path = 'lambda_functions/dashboard_metrics/index.py'
-        zip_file.write(lambda_path, 'index.py')
+        # index.py와 함께 임포트하는 모듈(accumulators.py, view.py)도 포함
+        lambda_dir = 'lambda_functions/dashboard_metrics'
+        for file_name in ('index.py', 'accumulators.py', 'view.py'):
+            zip_file.write(os.path.join(lambda_dir, file_name), file_name)
     
     zip_buffer.seek(0)
     
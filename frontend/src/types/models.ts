@@ -159,15 +159,23 @@ export interface QuantitativeAnalysisResponse {
     project_count: number;
     skill_diversity: number;
   };
+  // 일괄 평가(status: 'batch') 결과에는 종합 점수만 있음
   tech_stack_evaluation: {
-    recency_score: number;
-    demand_score: number;
+    recency_score?: number;
+    demand_score?: number;
     overall_score: number;
   };
   project_experience_scores: {
-    scale_score: number;
-    role_score: number;
-    performance_score: number;
+    scale_score?: number;
+    role_score?: number;
+    performance_score?: number;
+    overall_score: number;
+  };
+  relative_scores?: {
+    technical_skills: number;
+    project_experience: number;
+    resume_credibility: number;
+    cultural_fit: number;
     overall_score: number;
   };
 }
@@ -198,7 +206,7 @@ export interface PersonnelEvaluation {
   user_id: string;
   name: string;
   type: 'career' | 'freelancer';
-  status: 'pending' | 'approved' | 'rejected' | 'review';
+  status: 'pending' | 'approved' | 'rejected' | 'review' | 'batch';
   overall_score: number;
   submitted_at: string;
   quantitative_analysis?: QuantitativeAnalysisResponse;
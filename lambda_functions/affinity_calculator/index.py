@@ -5,17 +5,37 @@ Affinity Score Calculator Lambda Function
 Requirements: 2-1.1, 2-1.2, 2-1.3, 2-1.4, 2-1.5, 2-1.6, 2-1.7
 """
 
+import hashlib
+import heapq
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Tuple
-from common.dynamodb_client import DynamoDBClient
-from common.repositories import AffinityRepository, EmployeeRepository
+import math
+import os
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from itertools import combinations, islice
+from typing import Dict, Any, List, Tuple, Optional, Set
+import boto3
+from boto3.dynamodb.conditions import Attr
+from common.dynamodb_client import DynamoDBClient, DynamoDBClientError
+from common.repositories import AFFINITY_DEFAULT_SCORE_KEY, AffinityRepository, EmployeeRepository
 from common.models import (
     Affinity, EmployeePair, ProjectCollaboration, SharedProject,
     MessengerCommunication, CompanyEvents, PersonalCloseness
 )
 
+# 배치 점수 계산 커널 임포트
+try:
+    from scoring_kernel import (
+        AFFINITY_WEIGHTS, NUMPY_AVAILABLE, score_messenger_index, weighted_average_kernel
+    )
+except ImportError:
+    from lambda_functions.affinity_calculator.scoring_kernel import (
+        AFFINITY_WEIGHTS, NUMPY_AVAILABLE, score_messenger_index, weighted_average_kernel
+    )
+
 # 로깅 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -25,6 +45,46 @@ dynamodb_client = DynamoDBClient()
 affinity_repo = AffinityRepository(dynamodb_client)
 employee_repo = EmployeeRepository(dynamodb_client)
 
+# 샤드 워커 비동기 호출용 Lambda 클라이언트
+lambda_client = boto3.client('lambda', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
+
+# 증분 계산 워터마크 저장 테이블
+AFFINITY_STATE_TABLE = os.environ.get('AFFINITY_STATE_TABLE', 'AffinityJobState')
+AFFINITY_JOB_NAME = 'affinity_calculator'
+
+# 실행 모드: full (전체 직원 쌍) 또는 incremental (변경된 직원 쌍만)
+DEFAULT_CALC_MODE = os.environ.get('AFFINITY_CALC_MODE', 'full')
+
+# 배치 점수 계산 시 한 번에 처리할 직원 쌍 수
+AFFINITY_BATCH_SIZE = int(os.environ.get('AFFINITY_BATCH_SIZE', '1000'))
+
+# 친밀도 점수 저장 시 동시 BatchWriteItem 요청 수
+AFFINITY_WRITE_WORKERS = int(os.environ.get('AFFINITY_WRITE_WORKERS', '4'))
+
+# 전체 계산 샤드 설정 (샤드 수 1이면 샤드 없이 실행)
+AFFINITY_SHARD_COUNT = int(os.environ.get('AFFINITY_SHARD_COUNT', '1'))
+AFFINITY_SHARD_EXECUTOR = os.environ.get('AFFINITY_SHARD_EXECUTOR', 'inline')
+AFFINITY_SHARD_WORKERS = int(os.environ.get('AFFINITY_SHARD_WORKERS', str(os.cpu_count() or 1)))
+AFFINITY_FUNCTION_NAME = os.environ.get('AFFINITY_FUNCTION_NAME')
+AFFINITY_SHARD_STATE_KEY = f"{AFFINITY_JOB_NAME}#shards"
+
+# 실행 중 샤드의 리스 유지 시간(초): 비동기 호출 대기/재시도와 워커 실행 시간을 포함
+AFFINITY_SHARD_LEASE_SECONDS = int(os.environ.get('AFFINITY_SHARD_LEASE_SECONDS', '1800'))
+
+# 직원별 프로젝트 이력 해시 항목 키 접두사 (직원 하나당 항목 하나)
+AFFINITY_DIGEST_KEY_PREFIX = f"{AFFINITY_JOB_NAME}#digest#"
+
+# 친밀도 저장 방식: dense (모든 직원 쌍) 또는 sparse (임계값 이상 또는 직원별 상위 K개)
+AFFINITY_STORAGE_MODE = os.environ.get('AFFINITY_STORAGE_MODE', 'dense')
+AFFINITY_MIN_SCORE = float(os.environ.get('AFFINITY_MIN_SCORE', '50'))
+AFFINITY_TOP_K = int(os.environ.get('AFFINITY_TOP_K', '20'))
+
+# 샤드 상태
+SHARD_PENDING = 'pending'
+SHARD_RUNNING = 'running'
+SHARD_COMPLETED = 'completed'
+SHARD_FAILED = 'failed'
+
 
 def handler(event, context):
     """
@@ -32,35 +92,81 @@ def handler(event, context):
     
     Requirements: 2-1.7 - 일일 친밀도 점수 계산
     
+    event의 mode가 incremental이고 저장된 워터마크가 있으면, 워터마크 이후
+    새 메신저 로그/회사 행사/프로젝트 이력 변경의 영향을 받은 직원 쌍만
+    다시 계산합니다. 그 외에는 모든 직원 쌍을 계산합니다.
+    
+    전체 계산에서 shard_count가 2 이상이면 직원 쌍 공간을 샤드로 나누어
+    코디네이터로 실행합니다. event에 shard가 있으면 해당 샤드만 계산하는
+    워커 호출로 처리합니다.
+    
     Args:
-        event: EventBridge 이벤트
+        event: EventBridge 이벤트 (선택: {"mode": "full" | "incremental",
+            "shard_count": int, "executor": "inline" | "process" | "lambda",
+            "resume": bool})
         context: Lambda 컨텍스트
         
     Returns:
         dict: 처리 결과
     """
     try:
-        logger.info("친밀도 점수 계산 시작")
+        event = event or {}
+        
+        # 샤드 워커 호출
+        if event.get('shard'):
+            return run_shard_invocation(event)
         
-        # 모든 직원 조회
-        employees = get_all_employees()
+        mode = event.get('mode') or DEFAULT_CALC_MODE
+        run_started_at = get_utc_timestamp()
+        logger.info(f"친밀도 점수 계산 시작 (모드: {mode})")
+        
+        # 모든 직원 조회 (직원 ID 순으로 정렬하여 직원 쌍 순서를 고정)
+        employees = get_sorted_employees()
         logger.info(f"총 {len(employees)} 명의 직원 조회")
         
-        # 직원 쌍 생성 및 친밀도 점수 계산
-        processed_pairs = 0
+        watermark = load_watermark(employees) if mode == 'incremental' else None
         
-        for i in range(len(employees)):
-            for j in range(i + 1, len(employees)):
-                employee_1 = employees[i]
-                employee_2 = employees[j]
-                
-                # 친밀도 점수 계산
-                affinity = calculate_affinity_score(employee_1, employee_2)
-                
-                # DynamoDB에 저장
-                affinity_repo.create(affinity)
-                
-                processed_pairs += 1
+        if watermark:
+            employee_pairs = collect_changed_pairs(employees, watermark)
+            logger.info(
+                f"증분 계산 대상: {len(employee_pairs)} pairs "
+                f"(워터마크: {watermark.get('last_run_at')})"
+            )
+        else:
+            if mode == 'incremental':
+                logger.info("저장된 워터마크가 없어 전체 계산으로 대체")
+            mode = 'full'
+            
+            shard_count = int(event.get('shard_count') or AFFINITY_SHARD_COUNT)
+            if shard_count > 1 or event.get('resume'):
+                return coordinate_sharded_run(
+                    employees,
+                    run_started_at,
+                    shard_count=shard_count,
+                    executor=event.get('executor') or AFFINITY_SHARD_EXECUTOR,
+                    resume=bool(event.get('resume')),
+                    context=context
+                )
+            employee_pairs = combinations(employees, 2)
+        
+        # 직원 쌍별 친밀도 점수 계산 및 저장
+        # sparse 증분 계산은 바뀐 쌍을 모두 다시 저장한 뒤 저장된 항목 기준으로 정리
+        selector = create_affinity_selector()
+        processed_pairs = process_employee_pairs(
+            employee_pairs,
+            *load_scoring_inputs(),
+            selector=selector if mode == 'full' else None,
+            calculated_at=run_started_at
+        )
+        if selector is not None:
+            compact_sparse_affinities(run_started_at if mode == 'full' else None)
+        
+        # 다음 증분 계산을 위한 워터마크 저장
+        save_watermark(
+            run_started_at,
+            employees,
+            previous_digests=watermark.get('project_history_digests') if watermark else None
+        )
         
         logger.info(f"친밀도 점수 계산 완료: {processed_pairs} pairs")
         
@@ -68,6 +174,7 @@ def handler(event, context):
             'statusCode': 200,
             'body': json.dumps({
                 'message': '친밀도 점수 계산 완료',
+                'mode': mode,
                 'processed_pairs': processed_pairs
             })
         }
@@ -82,6 +189,1122 @@ def handler(event, context):
         }
 
 
+def get_sorted_employees() -> List[Dict[str, Any]]:
+    """
+    직원 ID 순으로 정렬된 전체 직원 목록 조회
+    
+    코디네이터와 샤드 워커가 같은 직원 쌍 순서를 사용하도록 정렬합니다.
+    
+    Returns:
+        list: 정렬된 직원 데이터 리스트
+    """
+    employees = get_all_employees()
+    employees.sort(key=lambda employee: get_employee_id(employee) or '')
+    return employees
+
+
+def load_scoring_inputs() -> Tuple[
+    Dict[Tuple[str, str], List[Dict[str, Any]]],
+    Set[str],
+    Optional[Dict[Tuple[str, str], Tuple[int, float, float]]]
+]:
+    """
+    점수 계산에 필요한 메신저 로그 인덱스, 행사 날짜, 메신저 점수 준비
+    
+    메신저 로그와 회사 행사는 한 번만 읽어 메모리 인덱스로 사용하고,
+    NumPy가 있으면 모든 직원 쌍의 메신저 점수를 한 번에 계산합니다.
+    
+    Returns:
+        tuple: (메신저 로그 인덱스, 행사 날짜 집합, 메신저 점수 또는 None)
+    """
+    messenger_index = load_messenger_index()
+    event_dates = load_company_event_dates()
+    
+    messenger_scores = None
+    if NUMPY_AVAILABLE:
+        messenger_scores = score_messenger_index(messenger_index, event_dates)
+        logger.info(f"메신저 점수 배치 계산 완료: {len(messenger_scores)} pairs")
+    
+    return messenger_index, event_dates, messenger_scores
+
+
+class SparseAffinitySelector:
+    """
+    sparse 저장 대상 친밀도 선택기
+    
+    종합 점수가 임계값 이상인 직원 쌍은 바로 저장 대상으로 반환하고,
+    그 외 직원 쌍은 양쪽 직원별 상위 K개 최소 힙에 보관했다가 flush 시 반환합니다.
+    저장되는 직원 쌍 수는 임계값 이상 쌍 + 최대 N×K개로 제한됩니다.
+    
+    샤드별 flush 결과를 다시 select로 넣으면 샤드 간 힙이 병합되어 전체 상위 K개가 됩니다.
+    """
+    
+    def __init__(self, top_k: int, min_score: float):
+        self.top_k = max(0, top_k)
+        self.min_score = min_score
+        self._heaps: Dict[str, List[Tuple[float, str, Affinity]]] = {}
+    
+    def select(self, affinities: List[Affinity]) -> List[Affinity]:
+        """
+        배치에서 바로 저장할 친밀도 선택
+        
+        Args:
+            affinities: 계산된 친밀도 객체 리스트
+            
+        Returns:
+            list: 임계값 이상인 친밀도 객체 리스트
+        """
+        selected = []
+        for affinity in affinities:
+            if affinity.overall_affinity_score >= self.min_score:
+                selected.append(affinity)
+                continue
+            pair = affinity.employee_pair
+            self.offer(
+                pair.employee_1,
+                pair.employee_2,
+                affinity.overall_affinity_score,
+                affinity.affinity_id,
+                affinity
+            )
+        return selected
+    
+    def offer(self, employee_1: str, employee_2: str, score: float, affinity_id: str, value: Any) -> None:
+        """
+        임계값 미만 직원 쌍을 양쪽 직원의 상위 K개 후보로 등록
+        
+        Args:
+            employee_1: 직원 1 ID
+            employee_2: 직원 2 ID
+            score: 종합 친밀도 점수
+            affinity_id: 친밀도 ID (동점 정렬 및 중복 제거 기준)
+            value: flush 시 반환할 값
+        """
+        self._offer(employee_1, (score, affinity_id, value))
+        self._offer(employee_2, (score, affinity_id, value))
+    
+    def _offer(self, employee_id: str, entry: Tuple[float, str, Any]) -> None:
+        if self.top_k == 0:
+            return
+        heap = self._heaps.setdefault(employee_id, [])
+        if len(heap) < self.top_k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+    
+    def flush(self) -> List[Any]:
+        """
+        직원별 상위 K개에 남은 친밀도 반환 (중복 제거)
+        
+        Returns:
+            list: 저장할 친밀도 객체 리스트 (offer로 등록한 경우 등록한 값)
+        """
+        selected = {}
+        for heap in self._heaps.values():
+            for _, affinity_id, affinity in heap:
+                selected[affinity_id] = affinity
+        self._heaps = {}
+        return list(selected.values())
+
+
+def create_affinity_selector() -> Optional[SparseAffinitySelector]:
+    """
+    저장 방식 설정에 따른 sparse 선택기 생성
+    
+    Returns:
+        SparseAffinitySelector: sparse 모드일 때 선택기, dense 모드이면 None
+    """
+    if AFFINITY_STORAGE_MODE != 'sparse':
+        return None
+    return SparseAffinitySelector(top_k=AFFINITY_TOP_K, min_score=AFFINITY_MIN_SCORE)
+
+
+def process_employee_pairs(
+    employee_pairs,
+    messenger_index: Dict[Tuple[str, str], List[Dict[str, Any]]],
+    event_dates: Set[str],
+    messenger_scores: Optional[Dict[Tuple[str, str], Tuple[int, float, float]]] = None,
+    selector: Optional[SparseAffinitySelector] = None,
+    calculated_at: Optional[str] = None,
+    flush: bool = True
+) -> int:
+    """
+    직원 쌍의 친밀도 점수를 배치 단위로 계산하여 저장
+    
+    selector가 있으면 임계값 이상 쌍은 바로 저장하고, 직원별 상위 K개 후보는
+    flush가 True일 때 마지막에 저장합니다. 여러 샤드가 selector를 공유하거나
+    호출자가 샤드 결과를 병합하는 경우 flush=False로 호출하고 호출자가 flush합니다.
+    
+    Args:
+        employee_pairs: (직원 1, 직원 2) 이터러블
+        messenger_index: 직원 쌍별 메시지 인덱스
+        event_dates: 회사 행사 날짜 집합
+        messenger_scores: score_messenger_index 결과 (선택사항)
+        selector: sparse 저장 선택기 (선택사항, 없으면 모든 직원 쌍 저장)
+        calculated_at: 저장 항목에 기록할 실행 ID (선택사항, sparse 정리 시 이전 실행 항목 판별용)
+        flush: selector의 상위 K개 후보를 여기서 저장할지 여부 (기본값: True)
+        
+    Returns:
+        int: 처리한 직원 쌍 수
+    """
+    processed_pairs = 0
+    stored_pairs = 0
+    
+    for batch in iter_pair_batches(employee_pairs, AFFINITY_BATCH_SIZE):
+        affinities = calculate_affinity_scores_batch(
+            batch,
+            messenger_index=messenger_index,
+            event_dates=event_dates,
+            messenger_scores=messenger_scores
+        )
+        processed_pairs += len(affinities)
+        for affinity in affinities:
+            affinity.calculated_at = calculated_at
+        
+        if selector is not None:
+            affinities = selector.select(affinities)
+        
+        # BatchWriteItem으로 일괄 저장
+        if affinities:
+            stored_pairs += affinity_repo.upsert_many(
+                affinities,
+                max_workers=AFFINITY_WRITE_WORKERS
+            )
+    
+    if selector is not None and flush:
+        stored_pairs += save_selected_candidates(selector)
+        logger.info(f"sparse 저장: {processed_pairs} pairs 중 {stored_pairs} pairs 저장")
+    
+    return processed_pairs
+
+
+def save_selected_candidates(selector: SparseAffinitySelector) -> int:
+    """
+    selector에 남은 직원별 상위 K개 후보 저장
+    
+    Args:
+        selector: sparse 저장 선택기
+        
+    Returns:
+        int: 저장한 직원 쌍 수
+    """
+    remaining = selector.flush()
+    if not remaining:
+        return 0
+    return affinity_repo.upsert_many(remaining, max_workers=AFFINITY_WRITE_WORKERS)
+
+
+def compact_sparse_affinities(calculated_at: Optional[str] = None) -> int:
+    """
+    sparse 저장 정리: 선택되지 않은 직원 쌍 삭제
+    
+    저장된 항목 전체를 기준으로 직원별 상위 K개를 다시 선택하고, 임계값 미만이면서
+    어느 쪽 직원의 상위 K개에도 들지 않는 항목을 삭제합니다. 삭제된 직원 쌍은 조회 시
+    기본 점수로 간주됩니다. 샤드마다 저장한 상위 K개도 여기서 전체 상위 K개로 병합됩니다.
+    
+    calculated_at이 있으면(전체 계산) 이번 실행에서 저장하지 않은 항목은 이전 점수이므로
+    모두 삭제합니다. 증분 계산은 바뀐 직원 쌍만 다시 저장하므로 calculated_at 없이 호출합니다.
+    
+    테이블을 두 번 스캔합니다: 첫 번째는 이전 실행 항목 삭제와 직원별 힙 구성,
+    두 번째는 선택되지 않은 항목 삭제. 메모리에는 직원별 상위 K개 ID만 둡니다.
+    
+    Args:
+        calculated_at: 이번 전체 계산의 실행 ID (선택사항)
+        
+    Returns:
+        int: 삭제한 직원 쌍 수
+    """
+    selector = SparseAffinitySelector(top_k=AFFINITY_TOP_K, min_score=AFFINITY_MIN_SCORE)
+    pending_deletes: List[str] = []
+    deleted = 0
+    
+    def _delete(affinity_ids: List[str]) -> int:
+        if not affinity_ids:
+            return 0
+        return affinity_repo.delete_many(affinity_ids, max_workers=AFFINITY_WRITE_WORKERS)
+    
+    def _is_stale(item: Dict[str, Any]) -> bool:
+        return calculated_at is not None and item.get('calculated_at') != calculated_at
+    
+    # 1. 이전 실행 항목 삭제 및 직원별 상위 K개 선택
+    for page in dynamodb_client.scan_pages(affinity_repo.table_name):
+        for item in page:
+            if _is_stale(item):
+                pending_deletes.append(item['affinity_id'])
+                continue
+            score = float(item.get('overall_affinity_score', 0))
+            if score >= selector.min_score:
+                continue
+            pair = item.get('employee_pair') or {}
+            selector.offer(
+                item.get('employee_1') or pair.get('employee_1'),
+                item.get('employee_2') or pair.get('employee_2'),
+                score,
+                item['affinity_id'],
+                item['affinity_id']
+            )
+        if len(pending_deletes) >= AFFINITY_BATCH_SIZE:
+            deleted += _delete(pending_deletes)
+            pending_deletes = []
+    deleted += _delete(pending_deletes)
+    pending_deletes = []
+    
+    # 2. 어느 직원의 상위 K개에도 들지 않은 임계값 미만 항목 삭제
+    keep_ids = set(selector.flush())
+    for page in dynamodb_client.scan_pages(affinity_repo.table_name):
+        for item in page:
+            if _is_stale(item) or item['affinity_id'] in keep_ids:
+                continue
+            if float(item.get('overall_affinity_score', 0)) < selector.min_score:
+                pending_deletes.append(item['affinity_id'])
+        if len(pending_deletes) >= AFFINITY_BATCH_SIZE:
+            deleted += _delete(pending_deletes)
+            pending_deletes = []
+    deleted += _delete(pending_deletes)
+    
+    save_default_affinity_score()
+    logger.info(f"sparse 저장 정리 완료: {deleted} pairs 삭제 (상위 K개 유지 {len(keep_ids)} pairs)")
+    return deleted
+
+
+def baseline_affinity_score() -> float:
+    """
+    협업/메신저 기록이 없는 직원 쌍의 친밀도 점수
+    
+    회사 행사/개인적 친밀도 점수는 직원 쌍과 무관하게 계산되므로 저장되는 점수의 최저값이며,
+    sparse 저장에서 삭제된 대부분의 쌍(교류가 없는 쌍)의 실제 점수입니다.
+    
+    Returns:
+        float: 기본 친밀도 점수
+    """
+    return calculate_weighted_average(
+        0.0,
+        0.0,
+        analyze_company_events('', '').social_score,
+        analyze_personal_closeness('', '').personal_score
+    )
+
+
+def save_default_affinity_score() -> None:
+    """sparse 저장의 저장되지 않은 쌍 기본 점수를 AffinityJobState에 저장 (조회 Lambda가 사용)"""
+    try:
+        dynamodb_client.put_item(AFFINITY_STATE_TABLE, {
+            'job_name': AFFINITY_DEFAULT_SCORE_KEY,
+            'score': baseline_affinity_score()
+        })
+    except DynamoDBClientError as e:
+        logger.warning(f"기본 친밀도 점수 저장 실패: {str(e)}")
+
+
+def plan_pair_shards(employees: List[Dict[str, Any]], shard_count: int) -> List[Dict[str, Any]]:
+    """
+    상삼각 직원 쌍 행렬을 행 블록 단위 샤드로 분할
+    
+    정렬된 직원 목록의 i번째 행은 (i, j > i) 쌍을 가지므로 앞쪽 행일수록
+    쌍이 많습니다. 샤드별 쌍 수가 비슷하도록 행 경계를 정하고, 경계는
+    직원 ID로 기록하여 워커 실행 시점에 직원이 추가되어도 누락이 없도록 합니다.
+    
+    Args:
+        employees: 직원 ID 순으로 정렬된 직원 목록
+        shard_count: 목표 샤드 수
+        
+    Returns:
+        list: 샤드 정보 리스트
+            - shard_id: 샤드 ID
+            - start_id: 첫 행 직원 ID (포함, None이면 처음부터)
+            - end_id: 다음 샤드의 첫 행 직원 ID (미포함, None이면 끝까지)
+            - pair_count: 계획 시점의 직원 쌍 수
+    """
+    employee_count = len(employees)
+    total_pairs = employee_count * (employee_count - 1) // 2
+    shard_count = max(1, min(shard_count, max(1, employee_count - 1)))
+    
+    # cumulative[r]: 0 ~ r-1 행까지의 누적 쌍 수
+    cumulative = [0]
+    for row in range(employee_count):
+        cumulative.append(cumulative[-1] + employee_count - 1 - row)
+    
+    # 목표 누적 쌍 수에 가장 가까운 행을 샤드 경계로 사용
+    boundaries = [0]
+    for shard_index in range(1, shard_count):
+        target = total_pairs * shard_index / shard_count
+        row = bisect_left(cumulative, target)
+        if row > 0 and target - cumulative[row - 1] < cumulative[row] - target:
+            row -= 1
+        if boundaries[-1] < row < employee_count - 1:
+            boundaries.append(row)
+    boundaries.append(employee_count)
+    
+    shards = []
+    for index, (row_start, row_end) in enumerate(zip(boundaries, boundaries[1:])):
+        shards.append({
+            'shard_id': f"shard-{index:04d}",
+            'start_id': get_employee_id(employees[row_start]) if index > 0 else None,
+            'end_id': get_employee_id(employees[row_end]) if row_end < employee_count else None,
+            'pair_count': sum(employee_count - 1 - row for row in range(row_start, row_end))
+        })
+    return shards
+
+
+def iter_shard_pairs(employees: List[Dict[str, Any]], shard: Dict[str, Any]):
+    """
+    샤드에 속한 직원 쌍 순회
+    
+    Args:
+        employees: 직원 ID 순으로 정렬된 직원 목록
+        shard: plan_pair_shards가 만든 샤드 정보
+        
+    Yields:
+        tuple: (직원 1, 직원 2)
+    """
+    start_id = shard.get('start_id')
+    end_id = shard.get('end_id')
+    
+    for row, employee_1 in enumerate(employees):
+        employee_1_id = get_employee_id(employee_1) or ''
+        if start_id is not None and employee_1_id < start_id:
+            continue
+        if end_id is not None and employee_1_id >= end_id:
+            break
+        for employee_2 in employees[row + 1:]:
+            yield employee_1, employee_2
+
+
+def load_shard_state() -> Optional[Dict[str, Any]]:
+    """
+    샤드 실행 상태 조회
+    
+    Returns:
+        dict: 샤드 실행 상태 (run_id, shards) 또는 None
+    """
+    try:
+        return dynamodb_client.get_item(
+            AFFINITY_STATE_TABLE,
+            key={'job_name': AFFINITY_SHARD_STATE_KEY}
+        )
+    except DynamoDBClientError as e:
+        logger.warning(f"샤드 상태 조회 실패: {str(e)}")
+        return None
+
+
+def save_shard_state(run_id: str, shards: List[Dict[str, Any]]) -> None:
+    """
+    새 샤드 실행 계획 저장 (모든 샤드는 pending 상태로 시작)
+    
+    Args:
+        run_id: 실행 ID (코디네이터 시작 시각)
+        shards: 샤드 정보 리스트
+    """
+    dynamodb_client.put_item(AFFINITY_STATE_TABLE, {
+        'job_name': AFFINITY_SHARD_STATE_KEY,
+        'run_id': run_id,
+        'shards': {
+            shard['shard_id']: {**shard, 'status': SHARD_PENDING, 'processed_pairs': 0}
+            for shard in shards
+        }
+    })
+
+
+def update_shard_status(
+    run_id: str,
+    shard_id: str,
+    status: str,
+    processed_pairs: int = 0,
+    error: Optional[str] = None,
+    lease_expires_at: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    샤드 상태 갱신
+    
+    샤드별 중첩 속성만 갱신하므로 여러 워커가 동시에 호출해도 서로 덮어쓰지 않습니다.
+    
+    Args:
+        run_id: 실행 ID
+        shard_id: 샤드 ID
+        status: 샤드 상태 (pending, running, completed, failed)
+        processed_pairs: 처리한 직원 쌍 수
+        error: 실패 사유 (선택사항)
+        lease_expires_at: 실행 중 샤드의 리스 만료 시각 (선택사항, running일 때 사용)
+        
+    Returns:
+        dict: 갱신 후 샤드 실행 상태
+    """
+    return dynamodb_client.update_item(
+        AFFINITY_STATE_TABLE,
+        key={'job_name': AFFINITY_SHARD_STATE_KEY},
+        update_expression=(
+            'SET shards.#shard.#status = :status, '
+            'shards.#shard.processed_pairs = :processed_pairs, '
+            'shards.#shard.#error = :error, '
+            'shards.#shard.lease_expires_at = :lease_expires_at, '
+            'shards.#shard.updated_at = :updated_at'
+        ),
+        expression_attribute_values={
+            ':status': status,
+            ':processed_pairs': processed_pairs,
+            ':error': error or '',
+            ':lease_expires_at': lease_expires_at or '',
+            ':updated_at': get_utc_timestamp()
+        },
+        expression_attribute_names={
+            '#shard': shard_id,
+            '#status': 'status',
+            '#error': 'error'
+        }
+    )
+
+
+def get_pending_shards(state: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    완료되지 않은 샤드 목록 반환
+    
+    Args:
+        state: 샤드 실행 상태
+        
+    Returns:
+        list: 완료되지 않은 샤드 정보 리스트 (샤드 ID 순)
+    """
+    if not state:
+        return []
+    shards = state.get('shards', {})
+    return [
+        shards[shard_id]
+        for shard_id in sorted(shards)
+        if shards[shard_id].get('status') != SHARD_COMPLETED
+    ]
+
+
+def get_lease_expiry(lease_seconds: int = AFFINITY_SHARD_LEASE_SECONDS) -> str:
+    """
+    지금부터 lease_seconds 뒤의 리스 만료 시각
+    
+    Args:
+        lease_seconds: 리스 유지 시간(초)
+        
+    Returns:
+        str: get_utc_timestamp와 같은 형식의 만료 시각
+    """
+    return (datetime.utcnow() + timedelta(seconds=lease_seconds)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def is_shard_leased(shard: Dict[str, Any], now: str) -> bool:
+    """
+    다른 실행이 아직 처리 중인 샤드인지 확인
+    
+    running 상태이고 리스가 만료되지 않은 샤드는 워커가 살아 있을 수 있으므로
+    다시 실행하면 같은 직원 쌍을 두 호출이 동시에 저장하게 됩니다.
+    
+    Args:
+        shard: 샤드 상태
+        now: 현재 시각 (get_utc_timestamp 형식)
+        
+    Returns:
+        bool: 리스가 유효한 실행 중 샤드이면 True
+    """
+    return shard.get('status') == SHARD_RUNNING and (shard.get('lease_expires_at') or '') > now
+
+
+def run_affinity_shard(
+    employees: List[Dict[str, Any]],
+    shard: Dict[str, Any],
+    messenger_index: Dict[Tuple[str, str], List[Dict[str, Any]]],
+    event_dates: Set[str],
+    messenger_scores: Optional[Dict[Tuple[str, str], Tuple[int, float, float]]] = None,
+    run_id: Optional[str] = None,
+    selector: Optional[SparseAffinitySelector] = None
+) -> int:
+    """
+    샤드 하나의 친밀도 점수 계산 및 저장
+    
+    selector를 주면 상위 K개 후보를 저장하지 않고 selector에 남겨 호출자가 샤드 간
+    병합 후 저장합니다. 없으면(Lambda 워커) 샤드의 상위 K개를 저장하고, 전체 병합은
+    마지막 샤드 완료 후 compact_sparse_affinities에서 이루어집니다.
+    
+    Args:
+        employees: 직원 ID 순으로 정렬된 직원 목록
+        shard: 샤드 정보
+        messenger_index: 직원 쌍별 메시지 인덱스
+        event_dates: 회사 행사 날짜 집합
+        messenger_scores: score_messenger_index 결과 (선택사항)
+        run_id: 실행 ID (선택사항, 저장 항목의 calculated_at)
+        selector: 샤드 간 공유 sparse 선택기 (선택사항)
+        
+    Returns:
+        int: 처리한 직원 쌍 수
+    """
+    logger.info(f"샤드 계산 시작: {shard['shard_id']}")
+    processed_pairs = process_employee_pairs(
+        iter_shard_pairs(employees, shard),
+        messenger_index,
+        event_dates,
+        messenger_scores,
+        selector=selector or create_affinity_selector(),
+        calculated_at=run_id,
+        flush=selector is None
+    )
+    logger.info(f"샤드 계산 완료: {shard['shard_id']} ({processed_pairs} pairs)")
+    return processed_pairs
+
+
+# 프로세스 풀 워커별 점수 계산 입력 (initializer에서 한 번만 전달)
+_shard_worker_inputs: Optional[Tuple[Any, ...]] = None
+
+
+def _init_shard_worker(employees, messenger_index, event_dates, messenger_scores) -> None:
+    """
+    프로세스 풀 워커 초기화
+    
+    부모 프로세스의 boto3 리소스를 공유하지 않도록 워커마다 클라이언트를 새로 만들고,
+    점수 계산 입력은 워커당 한 번만 전달받습니다.
+    """
+    global dynamodb_client, affinity_repo, _shard_worker_inputs
+    dynamodb_client = DynamoDBClient()
+    affinity_repo = AffinityRepository(dynamodb_client)
+    _shard_worker_inputs = (employees, messenger_index, event_dates, messenger_scores)
+
+
+def _run_shard_in_worker(shard: Dict[str, Any], run_id: str) -> Tuple[int, List[Affinity]]:
+    """프로세스 풀 워커에서 샤드 실행 (sparse 모드면 저장하지 않은 상위 K개 후보를 함께 반환)"""
+    employees, messenger_index, event_dates, messenger_scores = _shard_worker_inputs
+    selector = create_affinity_selector()
+    processed_pairs = run_affinity_shard(
+        employees, shard, messenger_index, event_dates, messenger_scores,
+        run_id=run_id,
+        selector=selector
+    )
+    return processed_pairs, selector.flush() if selector is not None else []
+
+
+def coordinate_sharded_run(
+    employees: List[Dict[str, Any]],
+    run_started_at: str,
+    shard_count: int,
+    executor: str = 'inline',
+    resume: bool = False,
+    context=None
+) -> Dict[str, Any]:
+    """
+    샤드 단위 전체 친밀도 계산 코디네이터
+    
+    샤드 계획을 AffinityJobState에 저장하고 샤드별 완료 상태를 추적합니다.
+    resume이면 직전 실행에서 완료되지 않은 샤드만 다시 실행하되, 리스가 만료되지 않은
+    실행 중 샤드는 이전 워커가 처리 중일 수 있으므로 건너뜁니다. 실행하는 샤드는
+    running으로 표시할 때 리스 만료 시각을 함께 기록합니다.
+    
+    실행 방식:
+    - inline: 현재 프로세스에서 순차 실행
+    - process: ProcessPoolExecutor로 CPU 코어별 병렬 실행
+      (/dev/shm이 없는 Lambda 런타임에서는 사용할 수 없으므로 배치 서버/컨테이너용)
+    - lambda: 샤드마다 이 함수를 비동기 호출하고 워커가 상태를 갱신
+    
+    Args:
+        employees: 직원 ID 순으로 정렬된 직원 목록
+        run_started_at: 코디네이터 시작 시각
+        shard_count: 샤드 수
+        executor: 실행 방식 (inline, process, lambda)
+        resume: 미완료 샤드 재실행 여부
+        context: Lambda 컨텍스트 (lambda 실행 시 함수 이름 확인용)
+        
+    Returns:
+        dict: 처리 결과
+    """
+    state = load_shard_state() if resume else None
+    pending_shards = get_pending_shards(state)
+    now = get_utc_timestamp()
+    leased_shards = [shard['shard_id'] for shard in pending_shards if is_shard_leased(shard, now)]
+    shards = [shard for shard in pending_shards if not is_shard_leased(shard, now)]
+    
+    if pending_shards:
+        run_id = state['run_id']
+        logger.info(
+            f"미완료 샤드 재실행: {len(shards)}개, 실행 중이라 건너뛴 샤드: {len(leased_shards)}개 "
+            f"(실행 ID: {run_id})"
+        )
+        if not shards:
+            return {
+                'statusCode': 202,
+                'body': json.dumps({
+                    'message': '실행 중인 샤드 완료 대기',
+                    'mode': 'full',
+                    'run_id': run_id,
+                    'leased_shards': leased_shards
+                })
+            }
+    else:
+        if resume:
+            logger.info("재실행할 샤드가 없어 새 샤드 계획 생성")
+        run_id = run_started_at
+        shards = plan_pair_shards(employees, shard_count)
+        save_shard_state(run_id, shards)
+        logger.info(f"샤드 계획 생성: {len(shards)}개 (실행 ID: {run_id})")
+    
+    if executor == 'lambda':
+        function_name = AFFINITY_FUNCTION_NAME or getattr(context, 'function_name', None)
+        if not function_name:
+            raise ValueError("샤드 워커를 호출할 Lambda 함수 이름이 없습니다")
+        
+        for shard in shards:
+            update_shard_status(run_id, shard['shard_id'], SHARD_RUNNING, lease_expires_at=get_lease_expiry())
+            lambda_client.invoke(
+                FunctionName=function_name,
+                InvocationType='Event',
+                Payload=json.dumps({'run_id': run_id, 'shard': shard})
+            )
+        
+        logger.info(f"샤드 워커 호출 완료: {len(shards)}개")
+        return {
+            'statusCode': 202,
+            'body': json.dumps({
+                'message': '친밀도 점수 샤드 계산 시작',
+                'mode': 'full',
+                'run_id': run_id,
+                'dispatched_shards': [shard['shard_id'] for shard in shards],
+                'leased_shards': leased_shards
+            })
+        }
+    
+    scoring_inputs = load_scoring_inputs()
+    results: Dict[str, Any] = {}
+    # sparse 모드: 샤드별 상위 K개 후보를 병합한 뒤 한 번에 저장
+    selector = create_affinity_selector()
+    
+    if executor == 'process':
+        with ProcessPoolExecutor(
+            max_workers=min(AFFINITY_SHARD_WORKERS, len(shards)),
+            initializer=_init_shard_worker,
+            initargs=(employees, *scoring_inputs)
+        ) as pool:
+            futures = {}
+            for shard in shards:
+                update_shard_status(run_id, shard['shard_id'], SHARD_RUNNING, lease_expires_at=get_lease_expiry())
+                futures[pool.submit(_run_shard_in_worker, shard, run_id)] = shard
+            for future in as_completed(futures):
+                shard = futures[future]
+                try:
+                    results[shard['shard_id']], candidates = future.result()
+                    if selector is not None:
+                        selector.select(candidates)
+                except Exception as e:
+                    results[shard['shard_id']] = e
+    else:
+        for shard in shards:
+            update_shard_status(run_id, shard['shard_id'], SHARD_RUNNING, lease_expires_at=get_lease_expiry())
+            try:
+                results[shard['shard_id']] = run_affinity_shard(
+                    employees, shard, *scoring_inputs,
+                    run_id=run_id,
+                    selector=selector
+                )
+            except Exception as e:
+                results[shard['shard_id']] = e
+    
+    if selector is not None:
+        stored_pairs = save_selected_candidates(selector)
+        logger.info(f"sparse 저장: 샤드 병합 상위 K개 {stored_pairs} pairs 저장")
+    
+    processed_pairs = 0
+    failed_shards = []
+    for shard_id in sorted(results):
+        result = results[shard_id]
+        if isinstance(result, Exception):
+            logger.error(f"샤드 계산 실패: {shard_id}: {str(result)}")
+            update_shard_status(run_id, shard_id, SHARD_FAILED, error=str(result))
+            failed_shards.append(shard_id)
+        else:
+            update_shard_status(run_id, shard_id, SHARD_COMPLETED, processed_pairs=result)
+            processed_pairs += result
+    
+    # 모든 샤드가 완료되었을 때만 sparse 정리 및 워터마크 갱신 (건너뛴 실행 중 샤드는 해당 워커가 갱신)
+    if not failed_shards and not leased_shards:
+        if selector is not None:
+            compact_sparse_affinities(run_id)
+        save_watermark(run_id, employees)
+    
+    logger.info(
+        f"샤드 친밀도 계산 완료: {processed_pairs} pairs, 실패 샤드: {len(failed_shards)}개"
+    )
+    
+    return {
+        'statusCode': 200 if not failed_shards else 500,
+        'body': json.dumps({
+            'message': '친밀도 점수 계산 완료' if not failed_shards else '일부 샤드 계산 실패',
+            'mode': 'full',
+            'run_id': run_id,
+            'processed_pairs': processed_pairs,
+            'failed_shards': failed_shards,
+            'leased_shards': leased_shards
+        })
+    }
+
+
+def run_shard_invocation(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Lambda 샤드 워커 호출 처리
+    
+    샤드 하나를 계산하여 상태를 갱신하고, 마지막으로 완료된 샤드이면
+    sparse 저장 정리(샤드 간 상위 K개 병합)를 수행하고 워터마크를 저장합니다.
+    
+    Args:
+        event: {"run_id": str, "shard": 샤드 정보}
+        
+    Returns:
+        dict: 처리 결과
+    """
+    run_id = event['run_id']
+    shard = event['shard']
+    
+    try:
+        employees = get_sorted_employees()
+        processed_pairs = run_affinity_shard(employees, shard, *load_scoring_inputs(), run_id=run_id)
+    except Exception as e:
+        logger.error(f"샤드 계산 실패: {shard['shard_id']}: {str(e)}", exc_info=True)
+        update_shard_status(run_id, shard['shard_id'], SHARD_FAILED, error=str(e))
+        raise
+    
+    state = update_shard_status(run_id, shard['shard_id'], SHARD_COMPLETED, processed_pairs=processed_pairs)
+    if state.get('run_id') == run_id and not get_pending_shards(state):
+        logger.info(f"모든 샤드 완료 (실행 ID: {run_id})")
+        if AFFINITY_STORAGE_MODE == 'sparse':
+            compact_sparse_affinities(run_id)
+        save_watermark(run_id, employees)
+    
+    return {
+        'statusCode': 200,
+        'body': json.dumps({
+            'message': '친밀도 점수 샤드 계산 완료',
+            'run_id': run_id,
+            'shard_id': shard['shard_id'],
+            'processed_pairs': processed_pairs
+        })
+    }
+
+
+def get_utc_timestamp() -> str:
+    """
+    현재 UTC 시각을 메신저 로그와 같은 ISO 형식으로 반환
+    
+    Returns:
+        str: 예) 2024-11-15T09:23:45Z
+    """
+    return datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def get_employee_id(employee: Dict[str, Any]) -> Optional[str]:
+    """
+    직원 데이터에서 직원 ID 추출
+    
+    Args:
+        employee: 직원 데이터
+        
+    Returns:
+        str: 직원 ID (employee_id 또는 user_id)
+    """
+    return employee.get('employee_id') or employee.get('user_id')
+
+
+def get_pair_key(employee_1_id: str, employee_2_id: str) -> Tuple[str, str]:
+    """
+    순서와 무관한 직원 쌍 키 생성
+    
+    Args:
+        employee_1_id: 직원 1 ID
+        employee_2_id: 직원 2 ID
+        
+    Returns:
+        tuple: 정렬된 (직원 ID, 직원 ID)
+    """
+    return tuple(sorted((employee_1_id, employee_2_id)))
+
+
+def load_messenger_index() -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+    """
+    MessengerLogs 테이블을 한 번 스캔하여 직원 쌍별로 메시지 그룹화
+    
+    점수 계산에 필요한 필드만 보관하여 메모리 사용량을 줄입니다.
+    
+    Returns:
+        dict: 직원 쌍 키별 메시지 목록
+        
+    Raises:
+        DynamoDBClientError: 메신저 로그 조회 실패 시
+    """
+    messenger_index = defaultdict(list)
+    
+    try:
+        for page in dynamodb_client.scan_pages('MessengerLogs'):
+            for message in page:
+                sender_id = message.get('sender_id')
+                receiver_id = message.get('receiver_id')
+                if not sender_id or not receiver_id:
+                    continue
+                
+                messenger_index[get_pair_key(sender_id, receiver_id)].append({
+                    'timestamp': message.get('timestamp', ''),
+                    'is_vacation_period': message.get('is_vacation_period', False),
+                    'response_time_minutes': message.get('response_time_minutes')
+                })
+    except DynamoDBClientError as e:
+        # 빈 인덱스로 계속하면 모든 쌍의 메신저 점수가 0으로 덮어써지므로 실행 중단
+        logger.error(f"메신저 로그 조회 실패: {str(e)}")
+        raise
+    
+    logger.info(f"메신저 로그 인덱스 생성 완료: {len(messenger_index)} pairs")
+    return dict(messenger_index)
+
+
+def load_company_event_dates() -> Set[str]:
+    """
+    CompanyEvents 테이블을 한 번 스캔하여 행사 날짜 집합 생성
+    
+    Returns:
+        set: 행사 날짜 집합 (YYYY-MM-DD)
+        
+    Raises:
+        DynamoDBClientError: 회사 행사 조회 실패 시
+    """
+    try:
+        return {
+            event['event_date']
+            for page in dynamodb_client.scan_pages('CompanyEvents')
+            for event in page
+            if event.get('event_date')
+        }
+    except DynamoDBClientError as e:
+        # 빈 집합으로 계속하면 행사 가중치 없이 점수가 덮어써지므로 실행 중단
+        logger.error(f"회사 행사 조회 실패: {str(e)}")
+        raise
+
+
+def get_project_history_digest(employee: Dict[str, Any]) -> str:
+    """
+    직원 프로젝트 이력의 변경 감지용 해시 계산
+    
+    Args:
+        employee: 직원 데이터
+        
+    Returns:
+        str: 프로젝트 이력 해시
+    """
+    project_history = employee.get('project_history', [])
+    serialized = json.dumps(project_history, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+
+
+def get_digest_key(employee_id: str) -> str:
+    """
+    직원별 프로젝트 이력 해시 항목의 job_name
+    
+    Args:
+        employee_id: 직원 ID
+        
+    Returns:
+        str: 예) affinity_calculator#digest#U_001
+    """
+    return f"{AFFINITY_DIGEST_KEY_PREFIX}{employee_id}"
+
+
+def load_watermark(employees: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    마지막 친밀도 계산 워터마크 조회
+    
+    실행 시각은 job_name 항목 하나에, 프로젝트 이력 해시는 직원별 항목에 저장되어 있으므로
+    현재 직원의 해시 항목만 BatchGetItem으로 읽습니다. 해시 항목이 없는 직원은
+    변경된 직원으로 간주되어 모든 쌍이 다시 계산됩니다.
+    
+    Args:
+        employees: 현재 직원 목록
+        
+    Returns:
+        dict: 워터마크 (last_run_at, project_history_digests) 또는 None
+    """
+    try:
+        watermark = dynamodb_client.get_item(
+            AFFINITY_STATE_TABLE,
+            key={'job_name': AFFINITY_JOB_NAME}
+        )
+        if not watermark:
+            return None
+        
+        # 이전 형식(한 항목에 전체 해시 맵)으로 저장된 해시는 기본값으로 사용
+        digests = dict(watermark.get('project_history_digests') or {})
+        employee_ids = sorted({
+            get_employee_id(employee) for employee in employees if get_employee_id(employee)
+        })
+        for item in dynamodb_client.batch_get_items(
+            AFFINITY_STATE_TABLE,
+            [{'job_name': get_digest_key(employee_id)} for employee_id in employee_ids]
+        ):
+            digests[item['job_name'][len(AFFINITY_DIGEST_KEY_PREFIX):]] = item.get('digest')
+    except DynamoDBClientError as e:
+        logger.warning(f"워터마크 조회 실패 (전체 계산으로 대체): {str(e)}")
+        return None
+    
+    return {'last_run_at': watermark.get('last_run_at', ''), 'project_history_digests': digests}
+
+
+def save_watermark(
+    run_started_at: str,
+    employees: List[Dict[str, Any]],
+    previous_digests: Optional[Dict[str, str]] = None
+) -> None:
+    """
+    친밀도 계산 워터마크 저장
+    
+    바뀐 직원별 해시 항목을 먼저 저장하고 마지막에 실행 시각을 갱신하므로,
+    중간에 실패하면 다음 실행은 이전 워터마크 기준으로 변경분을 다시 찾습니다.
+    
+    Args:
+        run_started_at: 이번 실행 시작 시각
+        employees: 이번 실행에서 조회한 직원 목록
+        previous_digests: 저장되어 있는 직원별 해시 (선택사항, 있으면 바뀐 항목만 저장)
+        
+    Raises:
+        DynamoDBClientError: 저장 실패 시 (워터마크가 갱신되지 않음)
+    """
+    previous_digests = previous_digests or {}
+    digest_items = {}
+    for employee in employees:
+        employee_id = get_employee_id(employee)
+        if not employee_id:
+            continue
+        digest = get_project_history_digest(employee)
+        if previous_digests.get(employee_id) != digest:
+            digest_items[employee_id] = {'job_name': get_digest_key(employee_id), 'digest': digest}
+    
+    try:
+        dynamodb_client.batch_put_items(
+            AFFINITY_STATE_TABLE,
+            list(digest_items.values()),
+            max_workers=AFFINITY_WRITE_WORKERS
+        )
+        dynamodb_client.put_item(AFFINITY_STATE_TABLE, {
+            'job_name': AFFINITY_JOB_NAME,
+            'last_run_at': run_started_at
+        })
+    except DynamoDBClientError as e:
+        logger.error(f"워터마크 저장 실패: {str(e)}")
+        raise
+    
+    logger.info(f"워터마크 저장 완료: {run_started_at} (해시 갱신 직원 {len(digest_items)}명)")
+
+
+def get_company_events_since(since: str) -> List[Dict[str, Any]]:
+    """
+    워터마크 이후 등록/수정된 회사 행사 조회
+    
+    지난 날짜의 행사를 나중에 등록해도 찾을 수 있도록 행사 날짜가 아니라
+    항목의 updated_at/created_at으로 판단합니다. 두 속성이 모두 없는 항목은
+    등록 시각을 알 수 없으므로 행사 날짜가 워터마크 이후인지로 판단합니다.
+    
+    Args:
+        since: 워터마크 시각 (ISO 형식)
+        
+    Returns:
+        list: 회사 행사 목록
+    """
+    filter_expression = (
+        Attr('updated_at').gt(since) |
+        Attr('created_at').gt(since) |
+        (
+            Attr('updated_at').not_exists() &
+            Attr('created_at').not_exists() &
+            Attr('event_date').gte(since[:10])
+        )
+    )
+    return dynamodb_client.scan('CompanyEvents', filter_expression=filter_expression)
+
+
+def get_messenger_logs_since(since: str, event_dates: Set[str]) -> List[Dict[str, Any]]:
+    """
+    워터마크 이후 메시지와 신규 행사 당일 메시지 조회
+    
+    행사 당일 메시지는 상황별 가중치가 바뀌므로 워터마크 이전이라도 포함합니다.
+    행사 날짜 수와 관계없이 필터 표현식 크기가 일정하도록, 스캔은 가장 이른 행사 날짜
+    이후 범위로만 좁히고 행사 당일 여부는 읽은 뒤에 확인합니다.
+    
+    Args:
+        since: 워터마크 시각 (ISO 형식)
+        event_dates: 신규 행사 날짜 집합 (YYYY-MM-DD)
+        
+    Returns:
+        list: 메시지 목록
+    """
+    filter_expression = Attr('timestamp').gt(since)
+    if event_dates:
+        filter_expression = filter_expression | Attr('timestamp').gte(min(event_dates))
+    
+    return [
+        message
+        for page in dynamodb_client.scan_pages('MessengerLogs', filter_expression=filter_expression)
+        for message in page
+        if message.get('timestamp', '') > since or message.get('timestamp', '')[:10] in event_dates
+    ]
+
+
+def collect_changed_pairs(
+    employees: List[Dict[str, Any]],
+    watermark: Dict[str, Any]
+) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    워터마크 이후 변경의 영향을 받은 직원 쌍 수집
+    
+    - 새 메신저 로그의 발신자/수신자 쌍
+    - 새 회사 행사의 참여자 쌍 및 행사 당일 메시지 쌍
+    - 프로젝트 이력이 변경되었거나 새로 추가된 직원이 포함된 모든 쌍
+    
+    Args:
+        employees: 직원 ID 순으로 정렬된 직원 목록
+        watermark: 마지막 실행 워터마크
+        
+    Returns:
+        list: 다시 계산할 (직원 1, 직원 2) 쌍 목록
+    """
+    last_run_at = watermark.get('last_run_at', '')
+    previous_digests = watermark.get('project_history_digests', {})
+    employees_by_id = {
+        get_employee_id(employee): employee
+        for employee in employees
+        if get_employee_id(employee)
+    }
+    
+    touched_pairs: Set[Tuple[str, str]] = set()
+    
+    def _touch(employee_1_id: Optional[str], employee_2_id: Optional[str]) -> None:
+        if (employee_1_id and employee_2_id and employee_1_id != employee_2_id and
+                employee_1_id in employees_by_id and employee_2_id in employees_by_id):
+            touched_pairs.add(get_pair_key(employee_1_id, employee_2_id))
+    
+    # 1. 신규 회사 행사
+    new_events = get_company_events_since(last_run_at)
+    event_dates = {event['event_date'] for event in new_events if event.get('event_date')}
+    for event in new_events:
+        for employee_1_id, employee_2_id in combinations(event.get('participants', []), 2):
+            _touch(employee_1_id, employee_2_id)
+    
+    # 2. 신규 메신저 로그
+    for message in get_messenger_logs_since(last_run_at, event_dates):
+        _touch(message.get('sender_id'), message.get('receiver_id'))
+    
+    # 3. 프로젝트 이력 변경 (신규 직원 포함)
+    changed_ids = [
+        employee_id for employee_id, employee in employees_by_id.items()
+        if previous_digests.get(employee_id) != get_project_history_digest(employee)
+    ]
+    for changed_id in changed_ids:
+        for other_id in employees_by_id:
+            _touch(changed_id, other_id)
+    
+    logger.info(
+        f"변경 감지: 신규 행사 {len(new_events)}건, "
+        f"프로젝트 이력 변경 직원 {len(changed_ids)}명"
+    )
+    
+    return [
+        (employees_by_id[employee_1_id], employees_by_id[employee_2_id])
+        for employee_1_id, employee_2_id in sorted(touched_pairs)
+    ]
+
+
 def get_all_employees() -> List[Dict[str, Any]]:
     """
     모든 직원 조회
@@ -109,7 +1332,12 @@ def get_all_employees() -> List[Dict[str, Any]]:
         raise
 
 
-def calculate_affinity_score(employee_1: Dict[str, Any], employee_2: Dict[str, Any]) -> Affinity:
+def calculate_affinity_score(
+    employee_1: Dict[str, Any],
+    employee_2: Dict[str, Any],
+    messenger_index: Optional[Dict[Tuple[str, str], List[Dict[str, Any]]]] = None,
+    event_dates: Optional[Set[str]] = None
+) -> Affinity:
     """
     두 직원 간 친밀도 점수 계산
     
@@ -118,12 +1346,14 @@ def calculate_affinity_score(employee_1: Dict[str, Any], employee_2: Dict[str, A
     Args:
         employee_1: 직원 1 데이터
         employee_2: 직원 2 데이터
+        messenger_index: 직원 쌍별 메시지 인덱스 (선택사항, 없으면 조회)
+        event_dates: 회사 행사 날짜 집합 (선택사항, 없으면 조회)
         
     Returns:
         Affinity: 친밀도 객체
     """
-    employee_1_id = employee_1.get('employee_id')
-    employee_2_id = employee_2.get('employee_id')
+    employee_1_id = get_employee_id(employee_1)
+    employee_2_id = get_employee_id(employee_2)
     
     logger.info(f"친밀도 계산 시작: {employee_1_id} - {employee_2_id}")
     
@@ -131,7 +1361,14 @@ def calculate_affinity_score(employee_1: Dict[str, Any], employee_2: Dict[str, A
     project_collaboration = analyze_project_collaboration(employee_1, employee_2)
     
     # 2. 메신저 커뮤니케이션 분석 (Requirements: 2-1.2, 2-1.3)
-    messenger_communication = analyze_messenger_communication(employee_1_id, employee_2_id)
+    if messenger_index is None:
+        messenger_index = load_messenger_index()
+    messenger_communication = analyze_messenger_communication(
+        employee_1_id,
+        employee_2_id,
+        messages=messenger_index.get(get_pair_key(employee_1_id, employee_2_id), []),
+        event_dates=event_dates
+    )
     
     # 3. 회사 행사 참여 분석 (Requirements: 2-1.4)
     company_events = analyze_company_events(employee_1_id, employee_2_id)
@@ -166,6 +1403,111 @@ def calculate_affinity_score(employee_1: Dict[str, Any], employee_2: Dict[str, A
     return affinity
 
 
+def iter_pair_batches(
+    employee_pairs,
+    batch_size: int
+):
+    """
+    직원 쌍 이터러블을 고정 크기 배치로 분할
+    
+    Args:
+        employee_pairs: (직원 1, 직원 2) 이터러블
+        batch_size: 배치 크기
+        
+    Yields:
+        list: 최대 batch_size개의 직원 쌍
+    """
+    iterator = iter(employee_pairs)
+    while True:
+        batch = list(islice(iterator, max(1, batch_size)))
+        if not batch:
+            return
+        yield batch
+
+
+def calculate_affinity_scores_batch(
+    employee_pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    messenger_index: Dict[Tuple[str, str], List[Dict[str, Any]]],
+    event_dates: Set[str],
+    messenger_scores: Optional[Dict[Tuple[str, str], Tuple[int, float, float]]] = None
+) -> List[Affinity]:
+    """
+    여러 직원 쌍의 친밀도 점수를 한 번에 계산
+    
+    messenger_scores가 있으면 메신저 점수를 다시 계산하지 않고 사용하며,
+    가중 평균은 배치 커널로 한 번에 계산합니다. NumPy가 없으면
+    calculate_affinity_score를 직원 쌍마다 호출합니다.
+    
+    Requirements: 2-1.1 ~ 2-1.6
+    
+    Args:
+        employee_pairs: (직원 1, 직원 2) 목록
+        messenger_index: 직원 쌍별 메시지 인덱스
+        event_dates: 회사 행사 날짜 집합
+        messenger_scores: score_messenger_index 결과 (선택사항)
+        
+    Returns:
+        list: Affinity 객체 목록 (employee_pairs와 같은 순서)
+    """
+    if not NUMPY_AVAILABLE or messenger_scores is None:
+        return [
+            calculate_affinity_score(
+                employee_1,
+                employee_2,
+                messenger_index=messenger_index,
+                event_dates=event_dates
+            )
+            for employee_1, employee_2 in employee_pairs
+        ]
+    
+    components = []
+    for employee_1, employee_2 in employee_pairs:
+        employee_1_id = get_employee_id(employee_1)
+        employee_2_id = get_employee_id(employee_2)
+        
+        total_messages, avg_response_time, communication_score = messenger_scores.get(
+            get_pair_key(employee_1_id, employee_2_id), (0, 0.0, 0.0)
+        )
+        components.append((
+            employee_1_id,
+            employee_2_id,
+            analyze_project_collaboration(employee_1, employee_2),
+            MessengerCommunication(
+                total_messages_exchanged=total_messages,
+                avg_response_time_minutes=avg_response_time,
+                communication_score=communication_score
+            ),
+            analyze_company_events(employee_1_id, employee_2_id),
+            analyze_personal_closeness(employee_1_id, employee_2_id)
+        ))
+    
+    overall_scores = weighted_average_kernel(
+        [item[2].collaboration_score for item in components],
+        [item[3].communication_score for item in components],
+        [item[4].social_score for item in components],
+        [item[5].personal_score for item in components]
+    )
+    
+    return [
+        Affinity(
+            affinity_id=f"AFF_{employee_1_id}_{employee_2_id}",
+            employee_pair=EmployeePair(
+                employee_1=employee_1_id,
+                employee_2=employee_2_id
+            ),
+            project_collaboration=project_collaboration,
+            messenger_communication=messenger_communication,
+            company_events=company_events,
+            personal_closeness=personal_closeness,
+            overall_affinity_score=float(overall_score)
+        )
+        for (
+            employee_1_id, employee_2_id, project_collaboration,
+            messenger_communication, company_events, personal_closeness
+        ), overall_score in zip(components, overall_scores)
+    ]
+
+
 def analyze_project_collaboration(
     employee_1: Dict[str, Any],
     employee_2: Dict[str, Any]
@@ -257,7 +1599,13 @@ def calculate_overlap_months(duration_1: str, duration_2: str) -> int:
         return 0
 
 
-def analyze_messenger_communication(employee_1_id: str, employee_2_id: str) -> MessengerCommunication:
+def analyze_messenger_communication(
+    employee_1_id: str,
+    employee_2_id: str,
+    messages: Optional[List[Dict[str, Any]]] = None,
+    event_dates: Optional[Set[str]] = None,
+    current_time: Optional[datetime] = None
+) -> MessengerCommunication:
     """
     메신저 커뮤니케이션 분석 (가중치 기반)
     
@@ -271,32 +1619,21 @@ def analyze_messenger_communication(employee_1_id: str, employee_2_id: str) -> M
     Args:
         employee_1_id: 직원 1 ID
         employee_2_id: 직원 2 ID
+        messages: 두 직원 간 메시지 목록 (선택사항, 없으면 메신저 로그 인덱스에서 조회)
+        event_dates: 회사 행사 날짜 집합 (선택사항, 없으면 조회)
+        current_time: 시간 감쇠 기준 시각 (UTC naive, 기본값: 현재 시각)
         
     Returns:
         MessengerCommunication: 메신저 커뮤니케이션 정보
     """
     try:
-        import math
-        from datetime import datetime, timedelta
-        
-        # MessengerLogs 테이블에서 데이터 조회
-        table = dynamodb_client.get_table('MessengerLogs')
-        
         # 두 직원 간 메시지 조회
-        response = table.scan(
-            FilterExpression='(sender_id = :emp1 AND receiver_id = :emp2) OR (sender_id = :emp2 AND receiver_id = :emp1)',
-            ExpressionAttributeValues={
-                ':emp1': employee_1_id,
-                ':emp2': employee_2_id
-            }
-        )
+        if messages is None:
+            messages = load_messenger_index().get(get_pair_key(employee_1_id, employee_2_id), [])
         
-        messages = response.get('Items', [])
-        
-        # 회사 행사 및 연차 정보 조회
-        events_table = dynamodb_client.get_table('CompanyEvents')
-        events_response = events_table.scan()
-        company_events = events_response.get('Items', [])
+        # 회사 행사 날짜 조회
+        if event_dates is None:
+            event_dates = load_company_event_dates()
         
         # 가중치 점수 계산
         weighted_score = 0.0
@@ -304,7 +1641,8 @@ def analyze_messenger_communication(employee_1_id: str, employee_2_id: str) -> M
         total_response_time = 0.0
         response_count = 0
         
-        current_time = datetime.now()
+        if current_time is None:
+            current_time = datetime.utcnow()
         
         for message in messages:
             timestamp = message.get('timestamp', '')
@@ -316,6 +1654,10 @@ def analyze_messenger_communication(employee_1_id: str, employee_2_id: str) -> M
             except:
                 continue
             
+            # UTC 기준 naive datetime으로 통일
+            if msg_time.tzinfo is not None:
+                msg_time = msg_time.astimezone(timezone.utc).replace(tzinfo=None)
+            
             # 1. 시간 감쇠 계산 (Wdecay)
             days_ago = (current_time - msg_time).days
             months_ago = days_ago / 30.0
@@ -339,11 +1681,8 @@ def analyze_messenger_communication(employee_1_id: str, employee_2_id: str) -> M
                 context_weight = 1.5
             
             # 회사 행사 기간 확인
-            for event in company_events:
-                event_date = event.get('event_date', '')
-                if event_date and event_date == msg_time.strftime('%Y-%m-%d'):
-                    context_weight = 2.0
-                    break
+            if msg_time.strftime('%Y-%m-%d') in event_dates:
+                context_weight = 2.0
             
             # 연차/휴가 기간 확인 (메시지 메타데이터에서)
             if message.get('is_vacation_period', False):
@@ -483,13 +1822,8 @@ def calculate_weighted_average(
     Returns:
         float: 전체 친밀도 점수 (0-100)
     """
-    # 가중치 설정
-    weights = {
-        'collaboration': 0.35,    # 35%
-        'communication': 0.30,    # 30%
-        'social': 0.20,           # 20%
-        'personal': 0.15          # 15%
-    }
+    # 가중치 설정 (배치 커널과 공유)
+    weights = AFFINITY_WEIGHTS
     
     # 가중 평균 계산
     overall_score = (
@@ -0,0 +1,258 @@
+"""
+친밀도 점수 배치 계산 커널
+
+메신저 커뮤니케이션 점수와 가중 평균을 NumPy 배열 연산으로 모든 직원 쌍에 대해
+한 번에 계산합니다. index.py의 analyze_messenger_communication,
+calculate_weighted_average와 동일한 결과를 반환합니다.
+
+Requirements: 2-1.2, 2-1.3, 2-1.6
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Tuple, Optional, Set
+
+try:
+    import numpy as np
+except ImportError:  # Lambda Layer에 numpy가 없으면 스칼라 계산 사용
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+# 가중 평균 가중치 (Requirements: 2-1.6)
+AFFINITY_WEIGHTS = {
+    'collaboration': 0.35,    # 35%
+    'communication': 0.30,    # 30%
+    'social': 0.20,           # 20%
+    'personal': 0.15          # 15%
+}
+
+# 메신저 점수 상수 (Requirements: 2-1.2, 2-1.3)
+DECAY_LAMBDA = 0.1
+WEIGHT_OFF_HOURS = 1.5
+WEIGHT_EVENT_DAY = 2.0
+WEIGHT_VACATION = 3.0
+SECONDS_PER_DAY = 86400
+# 1970-01-01은 목요일 (weekday 3)
+EPOCH_WEEKDAY = 3
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_epoch_seconds(timestamp: str) -> float:
+    """
+    메시지 타임스탬프를 UTC epoch 초로 변환
+
+    Args:
+        timestamp: ISO 형식 타임스탬프 (예: 2024-11-15T09:23:45Z)
+
+    Returns:
+        float: epoch 초 (파싱 실패 시 NaN)
+    """
+    if not timestamp:
+        return float('nan')
+    try:
+        msg_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        return float('nan')
+    if msg_time.tzinfo is not None:
+        msg_time = msg_time.astimezone(timezone.utc).replace(tzinfo=None)
+    return (msg_time - _EPOCH).total_seconds()
+
+
+def _to_epoch_day(date_str: str) -> Optional[int]:
+    """YYYY-MM-DD 문자열을 epoch 일 수로 변환 (실패 시 None)"""
+    try:
+        return (datetime.strptime(date_str, '%Y-%m-%d') - _EPOCH).days
+    except (TypeError, ValueError):
+        return None
+
+
+def build_message_columns(
+    messenger_index: Dict[Tuple[str, str], List[Dict[str, Any]]]
+) -> Tuple[List[Tuple[str, str]], Dict[str, Any]]:
+    """
+    직원 쌍별 메시지 인덱스를 열 단위 배열로 변환
+
+    Args:
+        messenger_index: 직원 쌍 키별 메시지 목록
+
+    Returns:
+        tuple: (직원 쌍 키 목록, 열 배열 딕셔너리)
+            - pair_ids: 메시지별 직원 쌍 번호
+            - timestamps: 메시지별 UTC epoch 초 (파싱 실패 시 NaN)
+            - vacation_flags: 메시지별 연차 기간 여부
+            - response_times: 메시지별 응답 시간 (없으면 0)
+            - has_response: 메시지별 응답 시간 존재 여부
+    """
+    pair_keys = list(messenger_index.keys())
+    pair_ids = []
+    timestamps = []
+    vacation_flags = []
+    response_times = []
+    has_response = []
+
+    for pair_id, pair_key in enumerate(pair_keys):
+        for message in messenger_index[pair_key]:
+            response_time = message.get('response_time_minutes')
+            pair_ids.append(pair_id)
+            timestamps.append(_to_epoch_seconds(message.get('timestamp', '')))
+            vacation_flags.append(bool(message.get('is_vacation_period', False)))
+            response_times.append(float(response_time) if response_time else 0.0)
+            has_response.append(bool(response_time))
+
+    columns = {
+        'pair_ids': np.asarray(pair_ids, dtype=np.int64),
+        'timestamps': np.asarray(timestamps, dtype=np.float64),
+        'vacation_flags': np.asarray(vacation_flags, dtype=bool),
+        'response_times': np.asarray(response_times, dtype=np.float64),
+        'has_response': np.asarray(has_response, dtype=bool)
+    }
+    return pair_keys, columns
+
+
+def score_messenger_columns(
+    columns: Dict[str, Any],
+    num_pairs: int,
+    event_dates: Set[str],
+    current_time: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    열 단위 메시지 배열로 직원 쌍별 메신저 점수 계산
+
+    Score(A,B) = Σ(Mt × Wcontext × Wdecay)를 직원 쌍별 group-by 합계로 계산합니다.
+
+    Args:
+        columns: build_message_columns가 만든 열 배열
+        num_pairs: 직원 쌍 수
+        event_dates: 회사 행사 날짜 집합 (YYYY-MM-DD)
+        current_time: 기준 시각 (UTC naive, 기본값: 현재 시각)
+
+    Returns:
+        dict: 직원 쌍 번호 순서의 배열
+            - total_messages: 총 메시지 수
+            - avg_response_time_minutes: 평균 응답 시간
+            - communication_score: 커뮤니케이션 점수 (0-100)
+    """
+    if current_time is None:
+        current_time = datetime.utcnow()
+    now_seconds = (current_time - _EPOCH).total_seconds()
+
+    pair_ids = columns['pair_ids']
+    timestamps = columns['timestamps']
+    valid = ~np.isnan(timestamps)
+
+    total_messages = np.bincount(pair_ids, minlength=num_pairs)
+
+    seconds = np.where(valid, timestamps, 0.0)
+    whole_seconds = np.floor(seconds).astype(np.int64)
+    epoch_days = np.floor_divide(whole_seconds, SECONDS_PER_DAY)
+
+    # 1. 시간 감쇠 (Wdecay): timedelta.days와 동일하게 내림
+    days_ago = np.floor((now_seconds - seconds) / SECONDS_PER_DAY)
+    time_decay = np.exp(-DECAY_LAMBDA * (days_ago / 30.0))
+
+    # 2. 상황별 가중치 (Wcontext) - 뒤의 조건이 앞의 조건을 덮어씀
+    hours = np.floor_divide(whole_seconds, 3600) % 24
+    is_weekend = (epoch_days + EPOCH_WEEKDAY) % 7 >= 5
+    event_days = [day for day in (_to_epoch_day(d) for d in event_dates) if day is not None]
+    is_event_day = np.isin(epoch_days, np.asarray(event_days, dtype=np.int64))
+
+    context_weight = np.ones_like(seconds)
+    context_weight = np.where((hours < 9) | (hours >= 18) | is_weekend, WEIGHT_OFF_HOURS, context_weight)
+    context_weight = np.where(is_event_day, WEIGHT_EVENT_DAY, context_weight)
+    context_weight = np.where(columns['vacation_flags'], WEIGHT_VACATION, context_weight)
+
+    # 3. 직원 쌍별 가중치 점수 합계
+    weighted_score = np.bincount(
+        pair_ids,
+        weights=np.where(valid, context_weight * time_decay, 0.0),
+        minlength=num_pairs
+    )
+
+    # 평균 응답 시간
+    response_mask = valid & columns['has_response']
+    response_total = np.bincount(
+        pair_ids,
+        weights=np.where(response_mask, columns['response_times'], 0.0),
+        minlength=num_pairs
+    )
+    response_count = np.bincount(pair_ids, weights=response_mask.astype(np.float64), minlength=num_pairs)
+    avg_response_time = np.divide(
+        response_total,
+        response_count,
+        out=np.zeros(num_pairs, dtype=np.float64),
+        where=response_count > 0
+    )
+
+    # 커뮤니케이션 점수 (0-100) 및 응답 시간 보정
+    communication_score = np.minimum(100.0, weighted_score * 2.0)
+    response_bonus = np.maximum(0.0, 20.0 - (avg_response_time / 10.0))
+    communication_score = np.where(
+        avg_response_time > 0,
+        np.minimum(100.0, communication_score + response_bonus),
+        communication_score
+    )
+
+    return {
+        'total_messages': total_messages,
+        'avg_response_time_minutes': avg_response_time,
+        'communication_score': communication_score
+    }
+
+
+def score_messenger_index(
+    messenger_index: Dict[Tuple[str, str], List[Dict[str, Any]]],
+    event_dates: Set[str],
+    current_time: Optional[datetime] = None
+) -> Dict[Tuple[str, str], Tuple[int, float, float]]:
+    """
+    메시지가 있는 모든 직원 쌍의 메신저 점수를 한 번에 계산
+
+    Args:
+        messenger_index: 직원 쌍 키별 메시지 목록
+        event_dates: 회사 행사 날짜 집합 (YYYY-MM-DD)
+        current_time: 기준 시각 (UTC naive, 기본값: 현재 시각)
+
+    Returns:
+        dict: 직원 쌍 키별 (총 메시지 수, 평균 응답 시간, 커뮤니케이션 점수)
+    """
+    pair_keys, columns = build_message_columns(messenger_index)
+    if not pair_keys:
+        return {}
+
+    scores = score_messenger_columns(columns, len(pair_keys), event_dates, current_time)
+    return {
+        pair_key: (
+            int(scores['total_messages'][pair_id]),
+            float(scores['avg_response_time_minutes'][pair_id]),
+            float(scores['communication_score'][pair_id])
+        )
+        for pair_id, pair_key in enumerate(pair_keys)
+    }
+
+
+def weighted_average_kernel(
+    collaboration_scores,
+    communication_scores,
+    social_scores,
+    personal_scores
+):
+    """
+    모든 직원 쌍의 가중 평균 친밀도 점수를 한 번에 계산
+
+    Args:
+        collaboration_scores: 협업 점수 배열
+        communication_scores: 커뮤니케이션 점수 배열
+        social_scores: 소셜 점수 배열
+        personal_scores: 개인적 친밀도 점수 배열
+
+    Returns:
+        numpy.ndarray: 전체 친밀도 점수 배열 (0-100)
+    """
+    overall_scores = (
+        np.asarray(collaboration_scores, dtype=np.float64) * AFFINITY_WEIGHTS['collaboration'] +
+        np.asarray(communication_scores, dtype=np.float64) * AFFINITY_WEIGHTS['communication'] +
+        np.asarray(social_scores, dtype=np.float64) * AFFINITY_WEIGHTS['social'] +
+        np.asarray(personal_scores, dtype=np.float64) * AFFINITY_WEIGHTS['personal']
+    )
+    return np.clip(overall_scores, 0.0, 100.0)
@@ -0,0 +1,1301 @@
+"""
+대시보드 지표 누적기
+
+각 지표는 DashboardAccumulator를 상속한 누적기로 등록되고, aggregate_snapshot이
+테이블별 항목 목록을 한 번씩만 순회하며 등록된 모든 누적기에 항목을 전달합니다.
+패널이 늘어나도 전체 집계는 테이블별 한 번의 순회로 끝납니다.
+
+누적기는 sign=-1로 항목을 제거할 수 있고 상태를 JSON으로 직렬화할 수 있어,
+DynamoDB Streams 변경분으로 대시보드 view를 증분 갱신하는 데에도 사용됩니다.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+# 응답 키별 누적기 클래스 (등록 순서 = 응답 순서)
+ACCUMULATORS: Dict[str, type] = {}
+
+# 스냅샷 키별 누적 메서드 이름
+TABLE_HANDLERS = {
+    'employees': 'add_employee',
+    'projects': 'add_project',
+    'evaluations': 'add_evaluation',
+    'pending_candidates': 'add_pending_candidate'
+}
+
+# 프로젝트 이름에서 도메인 추출을 위한 키워드 매핑
+DOMAIN_KEYWORDS = {
+    '금융': ['금융', '뱅킹', '은행', '증권', '보험', '카드', 'banking', 'finance'],
+    '전자상거래': ['커머스', '쇼핑', '이커머스', '유통', '리테일', 'commerce', 'retail', 'shopping'],
+    '의료': ['의료', '병원', '헬스케어', '건강', 'healthcare', 'medical', 'hospital'],
+    '제조': ['제조', '공장', '생산', 'manufacturing', 'factory'],
+    '통신': ['통신', '네트워크', '5G', 'telecom', 'network'],
+    '교육': ['교육', '학습', '이러닝', 'education', 'learning'],
+    '물류': ['물류', '배송', '운송', 'logistics', 'delivery'],
+    '게임': ['게임', 'game', 'gaming'],
+    '미디어': ['미디어', '콘텐츠', '방송', 'media', 'content'],
+    '공공': ['공공', '정부', '행정', 'government', 'public']
+}
+
+# 고급 기술 키워드 (난이도 높은 기술)
+ADVANCED_TECH_KEYWORDS = ['kubernetes', 'k8s', 'msa', 'microservices', 'aws', 'azure', 'gcp', 'ai', 'ml', 'machine learning']
+
+LEVEL_PRIORITY = {'Expert': 4, 'Advanced': 3, 'Intermediate': 2, 'Beginner': 1}
+
+# 스냅샷 키별 테이블 키 속성 (프로젝션 조회에서도 항상 포함)
+TABLE_KEY_ATTRIBUTES = {
+    'employees': 'user_id',
+    'projects': 'project_id',
+    'evaluations': 'evaluation_id',
+    'pending_candidates': 'candidate_id'
+}
+
+# calculate_employee_score가 읽는 직원 속성
+EMPLOYEE_SCORE_ATTRIBUTES = ('skills', 'basic_info', 'work_experience', 'certifications')
+
+# 진행 중인 프로젝트 배정 계산에 필요한 프로젝트 속성
+ASSIGNMENT_ATTRIBUTES = ('status', 'team_members')
+
+# 시각 단위로 세는 경과 일수 (대기 기간 경계 14일 + 1일, 이후에는 날짜 단위로 합침)
+EXACT_WAIT_DAYS = 15
+
+
+def register_accumulator(key: str):
+    """
+    응답 키로 누적기 클래스를 등록하는 데코레이터
+
+    Args:
+        key: 대시보드 응답의 지표 키
+    """
+    def decorator(cls):
+        cls.key = key
+        ACCUMULATORS[key] = cls
+        return cls
+    return decorator
+
+
+class DashboardAccumulator:
+    """
+    대시보드 지표 누적기 기본 클래스
+
+    하위 클래스는 tables에 필요한 스냅샷 키를, attributes에 테이블별로 읽는 최상위 속성을
+    선언하고 add_* 메서드로 항목을 누적(sign=1) 또는 제거(sign=-1)한 뒤 result()에서
+    최종 지표를 반환합니다. attributes에 없는 테이블은 전체 항목을 읽습니다.
+    상태는 인스턴스 속성에 JSON으로 직렬화 가능한 값(문자열 키 딕셔너리, 숫자)으로만 둡니다.
+    """
+
+    key = ''
+    tables = ('employees',)
+    attributes: Dict[str, Tuple[str, ...]] = {'employees': ()}
+
+    def add_employee(self, employee: Dict[str, Any], context: Dict[str, Any], sign: int = 1) -> None:
+        """직원 한 명 누적 (context는 같은 직원에 대해 누적기 간 공유되는 계산 캐시)"""
+
+    def add_project(self, project: Dict[str, Any], sign: int = 1) -> None:
+        """프로젝트 하나 누적"""
+
+    def add_evaluation(self, evaluation: Dict[str, Any], sign: int = 1) -> None:
+        """평가 하나 누적"""
+
+    def add_pending_candidate(self, candidate: Dict[str, Any], sign: int = 1) -> None:
+        """대기자 한 명 누적"""
+
+    def result(self) -> Any:
+        """최종 지표 반환"""
+        raise NotImplementedError
+
+    def default(self) -> Any:
+        """집계 실패 시 반환할 기본 지표"""
+        return {}
+
+    def to_state(self) -> Dict[str, Any]:
+        """누적 상태 반환"""
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'DashboardAccumulator':
+        """저장된 누적 상태로 누적기 복원"""
+        accumulator = cls()
+        accumulator.__dict__.update(state)
+        return accumulator
+
+
+def parse_years(years: Any) -> float:
+    """경력 연수 타입 변환 (Decimal, str, int 모두 처리)"""
+    try:
+        if isinstance(years, Decimal):
+            return float(years)
+        if isinstance(years, str):
+            return float(years) if years else 0
+        if not isinstance(years, (int, float)):
+            return 0
+        return years
+    except (ValueError, TypeError):
+        return 0
+
+
+def experience_band(years: float) -> str:
+    """경력 연수로 경력 구간 반환"""
+    if years < 3:
+        return '신입'
+    if years < 6:
+        return '주니어'
+    if years < 11:
+        return '시니어'
+    return '리드'
+
+
+def extract_domain(project_name: str) -> str:
+    """프로젝트 이름에서 도메인 추출"""
+    if not project_name:
+        return '기타'
+
+    project_name_lower = project_name.lower()
+    for domain, keywords in DOMAIN_KEYWORDS.items():
+        for keyword in keywords:
+            if keyword in project_name_lower:
+                return domain
+    return '기타'
+
+
+def assigned_member_ids(project: Dict[str, Any]) -> List[str]:
+    """진행 중인 프로젝트에 배정된 직원 ID 목록 (진행 중이 아니면 빈 목록)"""
+    if project.get('status') != 'in-progress':
+        return []
+
+    member_ids = []
+    for member in project.get('team_members', []):
+        if isinstance(member, dict):
+            employee_id = member.get('employee_id') or member.get('user_id')
+            if employee_id:
+                member_ids.append(employee_id)
+    return member_ids
+
+
+def day_bucket(timestamp: str) -> str:
+    """ISO 타임스탬프의 날짜 부분 (YYYY-MM-DD, 일 단위 건수 키)"""
+    return timestamp[:10]
+
+
+def timestamp_bucket(timestamp: str) -> str:
+    """
+    시각별 건수 키
+
+    경과 EXACT_WAIT_DAYS일 이내 항목은 원래 시각을 키로 써서 7일/14일 경계 판정이 항목별
+    계산과 같고, 그보다 오래된 항목만 날짜 키로 합칩니다.
+    """
+    try:
+        if days_since(timestamp) > EXACT_WAIT_DAYS:
+            return day_bucket(timestamp)
+    except ValueError:
+        pass
+    return timestamp
+
+
+def bump_timestamp(counts: Dict[str, int], timestamp: str, delta: int) -> None:
+    """시각별 건수 증감 (제거할 항목의 시각 키가 이미 날짜로 합쳐졌으면 날짜 키에서 뺌)"""
+    if delta < 0 and timestamp in counts:
+        _bump(counts, timestamp, delta)
+    elif delta < 0 and day_bucket(timestamp) in counts:
+        _bump(counts, day_bucket(timestamp), delta)
+    else:
+        _bump(counts, timestamp_bucket(timestamp), delta)
+
+
+def compact_timestamps(counts: Dict[str, int]) -> Dict[str, int]:
+    """EXACT_WAIT_DAYS일이 지난 시각 키를 날짜 키로 합친 건수 딕셔너리 반환 (view 상태 크기 제한)"""
+    compacted = {}
+    for timestamp, count in counts.items():
+        _bump(compacted, timestamp_bucket(timestamp), count)
+    return compacted
+
+
+def days_since(timestamp: str) -> int:
+    """ISO 타임스탬프로부터 현재까지 경과 일수"""
+    since = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    return (datetime.now(since.tzinfo) - since).days
+
+
+def calculate_employee_score(employee: Dict) -> float:
+    """직원 평가 점수 계산 (간소화 버전)"""
+    try:
+        score = 0
+
+        # 1. 기술 역량 (40점)
+        skills = employee.get('skills', [])
+        skill_score = 0
+        for skill in skills:
+            if isinstance(skill, dict):
+                level = skill.get('level', 'Beginner')
+                years = skill.get('years', 0)
+                if isinstance(years, Decimal):
+                    years = float(years)
+
+                level_score = {'Expert': 10, 'Advanced': 7, 'Intermediate': 5, 'Beginner': 3}.get(level, 3)
+                skill_score += level_score + min(years, 5)
+
+        score += min(skill_score / len(skills) * 4, 40) if skills else 0
+
+        # 2. 경력 (30점)
+        years_exp = employee.get('basic_info', {}).get('years_of_experience', 0)
+        if isinstance(years_exp, Decimal):
+            years_exp = float(years_exp)
+        score += min(years_exp * 2, 30)
+
+        # 3. 프로젝트 경험 (20점)
+        work_exp = employee.get('work_experience', [])
+        project_score = len(work_exp) * 5
+        # 성과 기록 보너스
+        for exp in work_exp:
+            if isinstance(exp, dict) and exp.get('performance_result'):
+                project_score += 5
+                break
+        score += min(project_score, 20)
+
+        # 4. 자격증 (10점)
+        certs = employee.get('certifications', [])
+        cert_count = len(certs) if isinstance(certs, list) else 0
+        score += min(cert_count * 2, 10)
+
+        return round(min(score, 100), 1)
+    except Exception as e:
+        print(f"Error calculating score: {str(e)}")
+        return 0
+
+
+def _employee_score_tenths(employee: Dict[str, Any], context: Dict[str, Any]) -> int:
+    """직원 평가 점수를 0.1점 단위 정수로 반환 (같은 직원은 한 번만 계산)"""
+    if 'score_tenths' not in context:
+        context['score_tenths'] = int(round(calculate_employee_score(employee) * 10))
+    return context['score_tenths']
+
+
+def _employee_years(employee: Dict[str, Any], context: Dict[str, Any]) -> float:
+    """직원 경력 연수 (같은 직원은 한 번만 변환)"""
+    if 'years' not in context:
+        context['years'] = parse_years(employee.get('basic_info', {}).get('years_of_experience', 0))
+    return context['years']
+
+
+def _bump(counts: Dict[str, int], key: Any, delta: int) -> None:
+    """건수 딕셔너리 증감 (0이 되면 키 제거)"""
+    key = str(key)
+    count = counts.get(key, 0) + delta
+    if count:
+        counts[key] = count
+    else:
+        counts.pop(key, None)
+
+
+def _named(counts: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """{이름: 건수} 딕셔너리를 [{'name', 'count'}] 목록으로 변환"""
+    return [{'name': k, 'count': v} for k, v in counts.items()]
+
+
+@register_accumulator('total_employees')
+class TotalEmployeesAccumulator(DashboardAccumulator):
+    """전체 직원 수"""
+
+    def __init__(self):
+        self.count = 0
+
+    def add_employee(self, employee, context, sign=1):
+        self.count += sign
+
+    def result(self):
+        return self.count
+
+    def default(self):
+        return 0
+
+
+@register_accumulator('active_projects')
+class ActiveProjectsAccumulator(DashboardAccumulator):
+    """진행 중인 프로젝트 수"""
+
+    tables = ('projects',)
+    attributes = {'projects': ('status',)}
+
+    def __init__(self):
+        self.count = 0
+
+    def add_project(self, project, sign=1):
+        if project.get('status') == 'in-progress':
+            self.count += sign
+
+    def result(self):
+        return self.count
+
+    def default(self):
+        return 0
+
+
+class _AssignmentAccumulator(DashboardAccumulator):
+    """전체 직원 수와 진행 중인 프로젝트 배정 현황을 함께 누적하는 기반 클래스"""
+
+    tables = ('employees', 'projects')
+    attributes = {'employees': (), 'projects': ASSIGNMENT_ATTRIBUTES}
+
+    def __init__(self):
+        self.total_employees = 0
+        # 진행 중인 프로젝트에 한 건 이상 배정된 직원 수
+        self.assigned_employees = 0
+        # 직원 ID별 진행 중인 프로젝트 배정 건수
+        # (직원 수에 비례해 커지므로 view 상태에 넣지 않고 별도 항목으로 나눠 저장)
+        self.assignments = {}
+
+    def add_employee(self, employee, context, sign=1):
+        self.total_employees += sign
+
+    def add_project(self, project, sign=1):
+        for employee_id in set(assigned_member_ids(project)):
+            before = self.assignments.get(employee_id, 0)
+            _bump(self.assignments, employee_id, sign)
+            after = self.assignments.get(employee_id, 0)
+            if before <= 0 < after:
+                self.assigned_employees += 1
+            elif after <= 0 < before:
+                self.assigned_employees -= 1
+
+    def load_assignments(self, counts: Dict[str, int]) -> None:
+        """별도 항목에 저장된 직원별 배정 건수를 변경분 적용 전에 불러옴"""
+        self.assignments.update(counts)
+
+    def to_state(self):
+        state = super().to_state()
+        state.pop('assignments', None)
+        return state
+
+
+@register_accumulator('available_employees')
+class AvailableEmployeesAccumulator(_AssignmentAccumulator):
+    """투입 대기 인력 수 (현재 프로젝트에 배정되지 않은 직원)"""
+
+    def result(self):
+        return self.total_employees - self.assigned_employees
+
+    def default(self):
+        return 0
+
+
+@register_accumulator('pending_candidates')
+class PendingCandidatesAccumulator(DashboardAccumulator):
+    """대기자명단 수"""
+
+    tables = ('pending_candidates',)
+    attributes = {'pending_candidates': ()}
+
+    def __init__(self):
+        self.count = 0
+
+    def add_pending_candidate(self, candidate, sign=1):
+        self.count += sign
+
+    def result(self):
+        return self.count
+
+    def default(self):
+        return 0
+
+
+@register_accumulator('top_skills')
+class TopSkillsAccumulator(DashboardAccumulator):
+    """주요 기술 스택 분포 (상위 5개)"""
+
+    attributes = {'employees': ('skills',)}
+
+    def __init__(self):
+        self.skill_counts = {}
+        self.total_employees = 0
+
+    def add_employee(self, employee, context, sign=1):
+        self.total_employees += sign
+        for skill in employee.get('skills', []):
+            skill_name = skill.get('name', '') if isinstance(skill, dict) else str(skill)
+            if skill_name:
+                _bump(self.skill_counts, skill_name, sign)
+
+    def result(self):
+        sorted_skills = sorted(self.skill_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        return [
+            {
+                "name": skill_name,
+                "count": count,
+                "percentage": int((count / self.total_employees) * 100) if self.total_employees > 0 else 0
+            }
+            for skill_name, count in sorted_skills
+        ]
+
+    def default(self):
+        return []
+
+
+@register_accumulator('employee_distribution')
+class EmployeeDistributionAccumulator(DashboardAccumulator):
+    """인력 현황 상세 분포"""
+
+    attributes = {'employees': ('department', 'basic_info')}
+
+    def __init__(self):
+        # 부서별 분포
+        self.department_dist = {}
+        # 경력 분포
+        self.experience_dist = {'신입': 0, '주니어': 0, '시니어': 0, '리드': 0}
+        # 역할별 분포
+        self.role_dist = {}
+
+    def add_employee(self, employee, context, sign=1):
+        _bump(self.department_dist, employee.get('department', '미지정'), sign)
+        self.experience_dist[experience_band(_employee_years(employee, context))] += sign
+        _bump(self.role_dist, employee.get('basic_info', {}).get('role', '미지정'), sign)
+
+    def result(self):
+        return {
+            'by_department': _named(self.department_dist),
+            'by_experience': [{'name': k, 'count': v} for k, v in self.experience_dist.items() if v > 0],
+            'by_role': _named(self.role_dist)
+        }
+
+    def default(self):
+        return {'by_department': [], 'by_experience': [], 'by_role': []}
+
+
+@register_accumulator('project_distribution')
+class ProjectDistributionAccumulator(DashboardAccumulator):
+    """프로젝트 현황 분포"""
+
+    tables = ('projects',)
+    attributes = {'projects': ('status', 'client_industry', 'budget_scale')}
+
+    def __init__(self):
+        # 상태별 분포
+        self.status_dist = {'planning': 0, 'in-progress': 0, 'completed': 0}
+        # 산업별 분포
+        self.industry_dist = {}
+        # 예산 규모별 분포
+        self.budget_dist = {'소형': 0, '중형': 0, '대형': 0}
+
+    def add_project(self, project, sign=1):
+        status = project.get('status', 'in-progress')
+        if status in self.status_dist:
+            self.status_dist[status] += sign
+
+        _bump(self.industry_dist, project.get('client_industry', '기타'), sign)
+
+        budget = project.get('budget_scale', '중형')
+        if budget in self.budget_dist:
+            self.budget_dist[budget] += sign
+
+    def result(self):
+        return {
+            'by_status': _named(self.status_dist),
+            'by_industry': _named(self.industry_dist),
+            'by_budget': _named(self.budget_dist)
+        }
+
+    def default(self):
+        return {'by_status': [], 'by_industry': [], 'by_budget': []}
+
+
+@register_accumulator('evaluation_stats')
+class EvaluationStatsAccumulator(DashboardAccumulator):
+    """평가 현황 통계"""
+
+    tables = ('evaluations',)
+    attributes = {'evaluations': ('status', 'type', 'overall_score')}
+
+    def __init__(self):
+        self.total_evaluations = 0
+        # 상태별 건수
+        self.status_dist = {'pending': 0, 'approved': 0, 'rejected': 0, 'review': 0}
+        # 유형별 건수
+        self.type_dist = {'career': 0, 'freelancer': 0}
+        self.total_score = 0
+        self.score_count = 0
+
+    def add_evaluation(self, evaluation, sign=1):
+        self.total_evaluations += sign
+
+        status = evaluation.get('status', 'pending')
+        if status in self.status_dist:
+            self.status_dist[status] += sign
+
+        eval_type = evaluation.get('type', 'career')
+        if eval_type in self.type_dist:
+            self.type_dist[eval_type] += sign
+
+        score = evaluation.get('overall_score')
+        if score is not None:
+            if isinstance(score, Decimal):
+                score = float(score)
+            self.total_score += score * sign
+            self.score_count += sign
+
+    def result(self):
+        avg_score = round(self.total_score / self.score_count, 1) if self.score_count > 0 else 0
+
+        # 승인율 계산
+        total_processed = self.status_dist['approved'] + self.status_dist['rejected']
+        approval_rate = round((self.status_dist['approved'] / total_processed * 100), 1) if total_processed > 0 else 0
+
+        return {
+            'by_status': _named(self.status_dist),
+            'by_type': _named(self.type_dist),
+            'average_score': avg_score,
+            'approval_rate': approval_rate,
+            'total_evaluations': self.total_evaluations
+        }
+
+    def default(self):
+        return {
+            'by_status': [],
+            'by_type': [],
+            'average_score': 0,
+            'approval_rate': 0,
+            'total_evaluations': 0
+        }
+
+
+@register_accumulator('pending_candidates_detail')
+class PendingCandidatesDetailAccumulator(DashboardAccumulator):
+    """대기자명단 상세 정보 (대기 기간은 조회 시점 기준으로 계산)"""
+
+    tables = ('pending_candidates',)
+    attributes = {'pending_candidates': ('created_at',)}
+
+    def __init__(self):
+        self.total = 0
+        # 등록 시각별 대기자 수 (EXACT_WAIT_DAYS일이 지나면 등록일별로 합침)
+        self.created_at_counts = {}
+
+    def add_pending_candidate(self, candidate, sign=1):
+        self.total += sign
+        created_at = candidate.get('created_at', '')
+        if created_at:
+            bump_timestamp(self.created_at_counts, created_at, sign)
+
+    def to_state(self):
+        state = super().to_state()
+        state['created_at_counts'] = compact_timestamps(self.created_at_counts)
+        return state
+
+    def result(self):
+        # 대기 기간별 분포
+        wait_dist = {'1주 이내': 0, '1-2주': 0, '2주 이상': 0}
+        total_wait_days = 0
+
+        for created_at, count in self.created_at_counts.items():
+            try:
+                wait_days = days_since(created_at)
+                total_wait_days += wait_days * count
+
+                if wait_days <= 7:
+                    wait_dist['1주 이내'] += count
+                elif wait_days <= 14:
+                    wait_dist['1-2주'] += count
+                else:
+                    wait_dist['2주 이상'] += count
+            except:
+                wait_dist['1주 이내'] += count
+
+        return {
+            'total': self.total,
+            'by_wait_period': _named(wait_dist),
+            'average_wait_days': round(total_wait_days / self.total) if self.total > 0 else 0
+        }
+
+    def default(self):
+        return {'total': 0, 'by_wait_period': [], 'average_wait_days': 0}
+
+
+@register_accumulator('action_required')
+class ActionRequiredAccumulator(_AssignmentAccumulator):
+    """알림/액션 필요 항목 (평가 지연은 조회 시점 기준으로 계산)"""
+
+    tables = ('employees', 'projects', 'evaluations', 'pending_candidates')
+    attributes = {
+        'employees': (),
+        'projects': ASSIGNMENT_ATTRIBUTES,
+        'evaluations': ('status', 'submitted_at'),
+        'pending_candidates': ('verification_completed',)
+    }
+
+    def __init__(self):
+        super().__init__()
+        # 제출 시각별 pending 평가 수 (EXACT_WAIT_DAYS일이 지나면 제출일별로 합침)
+        self.pending_submitted_counts = {}
+        # 검증 필요 이력서 수
+        self.verification_needed = 0
+
+    def add_evaluation(self, evaluation, sign=1):
+        if evaluation.get('status') == 'pending':
+            submitted_at = evaluation.get('submitted_at', '')
+            if submitted_at:
+                bump_timestamp(self.pending_submitted_counts, submitted_at, sign)
+
+    def add_pending_candidate(self, candidate, sign=1):
+        if not candidate.get('verification_completed'):
+            self.verification_needed += sign
+
+    def to_state(self):
+        state = super().to_state()
+        state['pending_submitted_counts'] = compact_timestamps(self.pending_submitted_counts)
+        return state
+
+    def result(self):
+        # 평가 지연 건 (제출 후 7일 이상 pending)
+        delayed_evaluations = 0
+        for submitted_at, count in self.pending_submitted_counts.items():
+            try:
+                if days_since(submitted_at) >= 7:
+                    delayed_evaluations += count
+            except:
+                pass
+
+        return {
+            'long_waiting_employees': self.total_employees - self.assigned_employees,
+            'delayed_evaluations': delayed_evaluations,
+            'verification_needed': self.verification_needed
+        }
+
+    def default(self):
+        return {
+            'long_waiting_employees': 0,
+            'delayed_evaluations': 0,
+            'verification_needed': 0
+        }
+
+
+@register_accumulator('skill_competency')
+class SkillCompetencyAccumulator(DashboardAccumulator):
+    """기술 역량 분석"""
+
+    attributes = {'employees': ('skills',)}
+
+    def __init__(self):
+        self.skill_levels = {}  # 기술별 숙련도 집계
+        self.skill_counts = {}  # 기술별 보유 인력 수
+        self.multi_skilled = 0  # 5개 이상 기술 보유
+
+    def add_employee(self, employee, context, sign=1):
+        skills = employee.get('skills', [])
+        if len(skills) >= 5:
+            self.multi_skilled += sign
+
+        for skill in skills:
+            if isinstance(skill, dict):
+                skill_name = skill.get('name', '')
+                skill_level = skill.get('level', 'Beginner')
+
+                if skill_name:
+                    _bump(self.skill_counts, skill_name, sign)
+
+                    if skill_name not in self.skill_counts:
+                        self.skill_levels.pop(skill_name, None)
+                        continue
+                    if skill_name not in self.skill_levels:
+                        self.skill_levels[skill_name] = {'Beginner': 0, 'Intermediate': 0, 'Advanced': 0, 'Expert': 0}
+                    levels = self.skill_levels[skill_name]
+                    levels[skill_level] = levels.get(skill_level, 0) + sign
+
+    def result(self):
+        # 희소 기술 (3명 이하)
+        rare_skills = [{'name': k, 'count': v} for k, v in self.skill_counts.items() if v <= 3]
+
+        # 기술별 평균 숙련도 (Beginner=1, Intermediate=2, Advanced=3, Expert=4)
+        skill_proficiency = []
+        for skill_name, levels in self.skill_levels.items():
+            total = sum(levels.values())
+            if total > 0:
+                score = (levels.get('Beginner', 0) * 1 + levels.get('Intermediate', 0) * 2 +
+                        levels.get('Advanced', 0) * 3 + levels.get('Expert', 0) * 4) / total
+                skill_proficiency.append({'name': skill_name, 'avg_level': round(score, 2), 'count': total})
+
+        skill_proficiency.sort(key=lambda x: x['avg_level'], reverse=True)
+
+        return {
+            'rare_skills': rare_skills[:10],
+            'multi_skilled_count': self.multi_skilled,
+            'top_proficiency_skills': skill_proficiency[:10],
+            'total_unique_skills': len(self.skill_counts)
+        }
+
+    def default(self):
+        return {'rare_skills': [], 'multi_skilled_count': 0, 'top_proficiency_skills': [], 'total_unique_skills': 0}
+
+
+@register_accumulator('career_growth')
+class CareerGrowthAccumulator(DashboardAccumulator):
+    """경력 & 성장 분석"""
+
+    attributes = {'employees': ('basic_info', 'skills')}
+
+    def __init__(self):
+        self.count = 0
+        self.total_years = 0
+        self.senior_count = 0  # 10년 이상
+        # 경력 대비 기술 수 합계/건수
+        self.skill_per_year_total = 0
+        self.skill_per_year_count = 0
+
+    def add_employee(self, employee, context, sign=1):
+        years = _employee_years(employee, context)
+        self.count += sign
+        self.total_years += years * sign
+
+        if years >= 10:
+            self.senior_count += sign
+
+        if years > 0:
+            self.skill_per_year_total += len(employee.get('skills', [])) / years * sign
+            self.skill_per_year_count += sign
+
+    def result(self):
+        return {
+            'average_years': round(self.total_years / self.count, 1) if self.count > 0 else 0,
+            'senior_count': self.senior_count,
+            'senior_ratio': round((self.senior_count / self.count) * 100, 1) if self.count > 0 else 0,
+            'skill_growth_rate': round(self.skill_per_year_total / self.skill_per_year_count, 2) if self.skill_per_year_count > 0 else 0
+        }
+
+    def default(self):
+        return {'average_years': 0, 'senior_count': 0, 'senior_ratio': 0, 'skill_growth_rate': 0}
+
+
+@register_accumulator('project_experience')
+class ProjectExperienceAccumulator(DashboardAccumulator):
+    """프로젝트 참여 이력 분석"""
+
+    attributes = {'employees': ('work_experience',)}
+
+    def __init__(self):
+        self.count = 0
+        self.total_projects = 0
+        self.no_experience = 0
+        self.multi_industry = 0
+        self.leader_count = 0
+
+    def add_employee(self, employee, context, sign=1):
+        work_exp = employee.get('work_experience', [])
+        project_count = len(work_exp)
+        self.count += sign
+        self.total_projects += project_count * sign
+
+        if project_count == 0:
+            self.no_experience += sign
+
+        # 산업 정보는 프로젝트 테이블과 조인 필요하지만, 간단히 프로젝트 수로 판단
+        if project_count >= 3:
+            self.multi_industry += sign
+
+        for exp in work_exp:
+            if isinstance(exp, dict):
+                role = exp.get('role', '').lower()
+                if 'lead' in role or 'manager' in role or 'architect' in role:
+                    self.leader_count += sign
+                    break
+
+    def result(self):
+        return {
+            'average_projects': round(self.total_projects / self.count, 1) if self.count > 0 else 0,
+            'no_experience_count': self.no_experience,
+            'multi_industry_count': self.multi_industry,
+            'leader_experience_count': self.leader_count
+        }
+
+    def default(self):
+        return {'average_projects': 0, 'no_experience_count': 0, 'multi_industry_count': 0, 'leader_experience_count': 0}
+
+
+@register_accumulator('utilization')
+class UtilizationAccumulator(_AssignmentAccumulator):
+    """인력 활용도 분석"""
+
+    def result(self):
+        assigned = self.assigned_employees
+        return {
+            'assigned_count': assigned,
+            'available_count': self.total_employees - assigned,
+            'utilization_rate': round((assigned / self.total_employees) * 100, 1) if self.total_employees > 0 else 0
+        }
+
+    def default(self):
+        return {'assigned_count': 0, 'available_count': 0, 'utilization_rate': 0}
+
+
+@register_accumulator('education_certification')
+class EducationCertificationAccumulator(DashboardAccumulator):
+    """학력 & 자격증 분석"""
+
+    attributes = {'employees': ('education', 'certifications')}
+
+    def __init__(self):
+        self.count = 0
+        self.education_dist = {}
+        self.total_certs = 0
+        self.no_cert_count = 0
+
+    def add_employee(self, employee, context, sign=1):
+        self.count += sign
+
+        education = employee.get('education', {})
+        if isinstance(education, dict):
+            _bump(self.education_dist, education.get('degree', '미지정'), sign)
+
+        certs = employee.get('certifications', [])
+        cert_count = len(certs) if isinstance(certs, list) else 0
+        self.total_certs += cert_count * sign
+
+        if cert_count == 0:
+            self.no_cert_count += sign
+
+    def result(self):
+        return {
+            'education_distribution': _named(self.education_dist),
+            'average_certifications': round(self.total_certs / self.count, 1) if self.count > 0 else 0,
+            'no_certification_count': self.no_cert_count
+        }
+
+    def default(self):
+        return {'education_distribution': [], 'average_certifications': 0, 'no_certification_count': 0}
+
+
+@register_accumulator('portfolio_health')
+class PortfolioHealthAccumulator(DashboardAccumulator):
+    """인력 포트폴리오 건강도 분석"""
+
+    attributes = {'employees': ('basic_info', 'skills')}
+
+    def __init__(self):
+        self.count = 0
+        self.role_categories = {'Backend': 0, 'Frontend': 0, 'Fullstack': 0, 'DevOps': 0, 'Other': 0}
+        # 기술별 보유 건수 (보유 기술 종류 = 키 수)
+        self.skill_counts = {}
+
+    def add_employee(self, employee, context, sign=1):
+        self.count += sign
+        role = employee.get('basic_info', {}).get('role', '').lower()
+
+        if 'backend' in role:
+            self.role_categories['Backend'] += sign
+        elif 'frontend' in role:
+            self.role_categories['Frontend'] += sign
+        elif 'full' in role or 'fullstack' in role:
+            self.role_categories['Fullstack'] += sign
+        elif 'devops' in role or 'infra' in role:
+            self.role_categories['DevOps'] += sign
+        else:
+            self.role_categories['Other'] += sign
+
+        for skill in employee.get('skills', []):
+            if isinstance(skill, dict):
+                skill_name = skill.get('name', '')
+                if skill_name:
+                    _bump(self.skill_counts, skill_name, sign)
+
+    def result(self):
+        # 기술 다양성 지수 (보유 기술 종류 / 전체 인력)
+        unique_skills = len(self.skill_counts)
+        return {
+            'role_distribution': _named(self.role_categories),
+            'skill_diversity_index': round(unique_skills / self.count, 2) if self.count > 0 else 0,
+            'unique_skills_count': unique_skills
+        }
+
+    def default(self):
+        return {'role_distribution': [], 'skill_diversity_index': 0, 'unique_skills_count': 0}
+
+
+@register_accumulator('employee_quality')
+class EmployeeQualityAccumulator(DashboardAccumulator):
+    """직원 품질 분석 (평가 기반)"""
+
+    attributes = {'employees': ('skills', 'work_experience')}
+
+    def __init__(self):
+        self.count = 0
+        self.advanced_tech_count = 0
+        # 역량 레벨 분포 (직원별 최고 레벨만 카운트)
+        self.skill_level_dist = {'Expert': 0, 'Advanced': 0, 'Intermediate': 0, 'Beginner': 0}
+        # 성과 기록 보유자
+        self.performance_record_count = 0
+        # 다중 역할 경험자
+        self.multi_role_count = 0
+
+    def add_employee(self, employee, context, sign=1):
+        self.count += sign
+        has_advanced_tech = False
+        highest_level = 'Beginner'
+        highest_priority = 0
+
+        for skill in employee.get('skills', []):
+            if isinstance(skill, dict):
+                skill_name = skill.get('name', '').lower()
+                if any(keyword in skill_name for keyword in ADVANCED_TECH_KEYWORDS):
+                    has_advanced_tech = True
+
+                level = skill.get('level', 'Beginner')
+                priority = LEVEL_PRIORITY.get(level, 0)
+                if priority > highest_priority:
+                    highest_priority = priority
+                    highest_level = level
+
+        if highest_level in self.skill_level_dist:
+            self.skill_level_dist[highest_level] += sign
+
+        if has_advanced_tech:
+            self.advanced_tech_count += sign
+
+        has_performance_record = False
+        roles = set()
+        for exp in employee.get('work_experience', []):
+            if isinstance(exp, dict):
+                if exp.get('performance_result'):
+                    has_performance_record = True
+                role = exp.get('role', '')
+                if role:
+                    roles.add(role)
+
+        if has_performance_record:
+            self.performance_record_count += sign
+        if len(roles) >= 3:
+            self.multi_role_count += sign
+
+    def result(self):
+        total = self.count
+        return {
+            'advanced_tech_count': self.advanced_tech_count,
+            'advanced_tech_ratio': round((self.advanced_tech_count / total) * 100, 1) if total > 0 else 0,
+            'skill_level_distribution': _named(self.skill_level_dist),
+            'performance_record_count': self.performance_record_count,
+            'performance_ratio': round((self.performance_record_count / total) * 100, 1) if total > 0 else 0,
+            'multi_role_count': self.multi_role_count
+        }
+
+    def default(self):
+        return {
+            'advanced_tech_count': 0,
+            'advanced_tech_ratio': 0,
+            'skill_level_distribution': [],
+            'performance_record_count': 0,
+            'performance_ratio': 0,
+            'multi_role_count': 0
+        }
+
+
+@register_accumulator('domain_expertise')
+class DomainExpertiseAccumulator(DashboardAccumulator):
+    """도메인 전문성 분석 (프로젝트 경험 기반)"""
+
+    attributes = {'employees': ('work_experience',)}
+
+    def __init__(self):
+        self.count = 0
+        self.domain_exp_count = {}
+        self.multi_domain_count = 0
+        self.total_projects = 0
+
+    def add_employee(self, employee, context, sign=1):
+        self.count += sign
+        employee_domains = set()
+
+        for exp in employee.get('work_experience', []):
+            if isinstance(exp, dict):
+                project_name = exp.get('project_name', '')
+                if project_name:
+                    employee_domains.add(extract_domain(project_name))
+                    self.total_projects += sign
+
+        # 2개 이상 도메인 경험
+        if len(employee_domains) >= 2:
+            self.multi_domain_count += sign
+
+        for domain in employee_domains:
+            _bump(self.domain_exp_count, domain, sign)
+
+    def result(self):
+        top_domains = sorted(self.domain_exp_count.items(), key=lambda x: x[1], reverse=True)[:5]
+        return {
+            'multi_domain_experts': self.multi_domain_count,
+            'average_domain_years': round(self.total_projects / self.count, 1) if self.count > 0 else 0,
+            'top_domains': [{'name': k, 'count': v} for k, v in top_domains],
+            'total_domains': len(self.domain_exp_count)
+        }
+
+    def default(self):
+        return {
+            'multi_domain_experts': 0,
+            'average_domain_years': 0,
+            'top_domains': [],
+            'total_domains': 0
+        }
+
+
+@register_accumulator('evaluation_scores')
+class EvaluationScoreAccumulator(DashboardAccumulator):
+    """평가 점수 분석 (점수는 0.1점 단위 정수로 합산)"""
+
+    attributes = {'employees': EMPLOYEE_SCORE_ATTRIBUTES}
+
+    def __init__(self):
+        self.score_count = 0
+        self.score_tenths_total = 0
+        # 역할별/경력별 점수 합계와 인원
+        self.role_tenths_totals = {}
+        self.role_counts = {}
+        self.experience_tenths_totals = {'신입': 0, '주니어': 0, '시니어': 0, '리드': 0}
+        self.experience_counts = {'신입': 0, '주니어': 0, '시니어': 0, '리드': 0}
+        self.score_dist = {'우수 (90+)': 0, '양호 (80-89)': 0, '보통 (70-79)': 0, '개선필요 (<70)': 0}
+
+    def add_employee(self, employee, context, sign=1):
+        tenths = _employee_score_tenths(employee, context)
+        self.score_count += sign
+        self.score_tenths_total += tenths * sign
+
+        if tenths >= 900:
+            self.score_dist['우수 (90+)'] += sign
+        elif tenths >= 800:
+            self.score_dist['양호 (80-89)'] += sign
+        elif tenths >= 700:
+            self.score_dist['보통 (70-79)'] += sign
+        else:
+            self.score_dist['개선필요 (<70)'] += sign
+
+        role = str(employee.get('basic_info', {}).get('role', '미지정'))
+        _bump(self.role_counts, role, sign)
+        if role in self.role_counts:
+            self.role_tenths_totals[role] = self.role_tenths_totals.get(role, 0) + tenths * sign
+        else:
+            self.role_tenths_totals.pop(role, None)
+
+        band = experience_band(_employee_years(employee, context))
+        self.experience_tenths_totals[band] += tenths * sign
+        self.experience_counts[band] += sign
+
+    def result(self):
+        avg_score = round(self.score_tenths_total / self.score_count / 10, 1) if self.score_count > 0 else 0
+
+        # 역할별 평균 (상위 5개)
+        role_avg = [
+            (role, round(self.role_tenths_totals[role] / count / 10, 1))
+            for role, count in self.role_counts.items() if count > 0
+        ]
+        role_avg.sort(key=lambda x: x[1], reverse=True)
+
+        # 경력별 평균
+        exp_avg = [
+            (level, round(self.experience_tenths_totals[level] / count / 10, 1))
+            for level, count in self.experience_counts.items() if count > 0
+        ]
+
+        return {
+            'average_score': avg_score,
+            'score_distribution': _named(self.score_dist),
+            'top_roles_by_score': [{'name': role, 'avg_score': score} for role, score in role_avg[:5]],
+            'score_by_experience': [{'name': level, 'avg_score': score} for level, score in exp_avg],
+            'high_performers': self.score_dist['우수 (90+)'],
+            'low_performers': self.score_dist['개선필요 (<70)']
+        }
+
+    def default(self):
+        return {
+            'average_score': 0,
+            'score_distribution': [],
+            'top_roles_by_score': [],
+            'score_by_experience': [],
+            'high_performers': 0,
+            'low_performers': 0
+        }
+
+
+@register_accumulator('skill_gaps')
+class SkillGapAccumulator(DashboardAccumulator):
+    """역량 갭 분석"""
+
+    tables = ('employees', 'projects')
+    attributes = {'employees': EMPLOYEE_SCORE_ATTRIBUTES, 'projects': ('tech_stack',)}
+
+    def __init__(self):
+        self.employee_skills = {}
+        self.project_skills = {}
+        # 0.1점 단위 점수별 인원 (평균 이하 인원 계산용)
+        self.score_histogram = {}
+
+    def add_employee(self, employee, context, sign=1):
+        for skill in employee.get('skills', []):
+            if isinstance(skill, dict):
+                skill_name = skill.get('name', '')
+                if skill_name:
+                    _bump(self.employee_skills, skill_name, sign)
+        _bump(self.score_histogram, _employee_score_tenths(employee, context), sign)
+
+    def add_project(self, project, sign=1):
+        tech_stack = project.get('tech_stack', {})
+        for category in ['backend', 'frontend', 'data', 'infra']:
+            for skill in tech_stack.get(category, []):
+                _bump(self.project_skills, skill, sign)
+
+    def result(self):
+        # 부족한 기술 (수요 > 공급)
+        skill_gaps = []
+        for skill, demand in self.project_skills.items():
+            supply = self.employee_skills.get(skill, 0)
+            if demand > supply:
+                skill_gaps.append({'skill': skill, 'gap': demand - supply, 'demand': demand, 'supply': supply})
+
+        skill_gaps.sort(key=lambda x: x['gap'], reverse=True)
+
+        # 교육 필요 인력 수 (평균 이하 점수): score < total / n  <=>  score * n < total
+        employee_count = sum(self.score_histogram.values())
+        tenths_total = sum(int(tenths) * count for tenths, count in self.score_histogram.items())
+        training_needed = sum(
+            count for tenths, count in self.score_histogram.items()
+            if int(tenths) * employee_count < tenths_total
+        )
+
+        return {
+            'top_skill_gaps': skill_gaps[:10],
+            'total_skill_gaps': len(skill_gaps),
+            'training_needed_count': training_needed
+        }
+
+    def default(self):
+        return {
+            'top_skill_gaps': [],
+            'total_skill_gaps': 0,
+            'training_needed_count': 0
+        }
+
+
+def assignment_accumulators(accumulators: Dict[str, DashboardAccumulator]) -> List[DashboardAccumulator]:
+    """직원별 배정 건수를 별도 항목으로 저장하는 누적기 목록"""
+    return [accumulator for accumulator in accumulators.values() if isinstance(accumulator, _AssignmentAccumulator)]
+
+
+def required_tables(keys: Iterable[str]) -> List[str]:
+    """누적기들이 필요로 하는 스냅샷 키 목록"""
+    tables = []
+    for key in keys:
+        for table in ACCUMULATORS[key].tables:
+            if table not in tables:
+                tables.append(table)
+    return tables
+
+
+def required_attributes(keys: Iterable[str]) -> Dict[str, Optional[List[str]]]:
+    """
+    누적기들이 테이블별로 읽는 최상위 속성 목록
+
+    Args:
+        keys: 지표 키 목록
+
+    Returns:
+        dict: 스냅샷 키별 속성 목록 (테이블 키 속성 포함, 전체 항목이 필요하면 None)
+    """
+    attributes: Dict[str, Optional[List[str]]] = {}
+    for key in keys:
+        accumulator = ACCUMULATORS[key]
+        for table in accumulator.tables:
+            if table not in accumulator.attributes:
+                attributes[table] = None
+                continue
+            if table not in attributes:
+                attributes[table] = [TABLE_KEY_ATTRIBUTES[table]]
+            names = attributes[table]
+            if names is None:
+                continue
+            for name in accumulator.attributes[table]:
+                if name not in names:
+                    names.append(name)
+    return attributes
+
+
+def create_accumulators(keys: Optional[Iterable[str]] = None) -> Dict[str, DashboardAccumulator]:
+    """지표 키별 빈 누적기 생성 (기본값: 등록된 모든 지표)"""
+    if keys is None:
+        keys = ACCUMULATORS.keys()
+    return {key: ACCUMULATORS[key]() for key in keys}
+
+
+def feed_items(
+    accumulators: Dict[str, DashboardAccumulator],
+    table: str,
+    items: Iterable[Dict[str, Any]],
+    sign: int = 1,
+    failed: Optional[Dict[str, Exception]] = None
+) -> None:
+    """
+    한 테이블의 항목들을 한 번 순회하며 해당 테이블이 필요한 누적기에 전달
+
+    Args:
+        accumulators: 지표 키별 누적기
+        table: 스냅샷 키 (employees, projects, evaluations, pending_candidates)
+        items: 누적할 항목 목록
+        sign: 1이면 추가, -1이면 제거
+        failed: 오류가 난 누적기를 기록할 딕셔너리 (기록된 누적기는 이후 항목을 받지 않음)
+    """
+    if failed is None:
+        failed = {}
+
+    method_name = TABLE_HANDLERS[table]
+    targets = [
+        (key, getattr(accumulator, method_name))
+        for key, accumulator in accumulators.items()
+        if table in accumulator.tables
+    ]
+    if not targets:
+        return
+
+    for item in items:
+        args = (item, {}, sign) if table == 'employees' else (item, sign)
+        for key, add in targets:
+            if key in failed:
+                continue
+            try:
+                add(*args)
+            except Exception as e:
+                failed[key] = e
+
+
+def collect_results(
+    accumulators: Dict[str, DashboardAccumulator],
+    failed: Optional[Dict[str, Exception]] = None
+) -> Dict[str, Any]:
+    """누적기별 최종 지표 반환 (오류가 난 누적기는 기본값)"""
+    failed = failed or {}
+    results = {}
+    for key, accumulator in accumulators.items():
+        try:
+            if key in failed:
+                raise failed[key]
+            results[key] = accumulator.result()
+        except Exception as e:
+            print(f"Error in {key} aggregation: {str(e)}")
+            results[key] = accumulator.default()
+    return results
+
+
+def aggregate_snapshot(
+    snapshot: Dict[str, List[Dict[str, Any]]],
+    keys: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
+    """
+    테이블별 항목 목록을 한 번씩만 순회하며 등록된 누적기 지표를 계산
+
+    한 누적기에서 오류가 나면 해당 지표만 기본값으로 대체하고 나머지는 계속 집계합니다.
+
+    Args:
+        snapshot: 스냅샷 키별 항목 목록
+        keys: 계산할 지표 키 목록 (기본값: 등록된 모든 지표)
+
+    Returns:
+        dict: 지표 키별 결과
+    """
+    accumulators = create_accumulators(keys)
+    failed = {}
+
+    for table in required_tables(accumulators.keys()):
+        feed_items(accumulators, table, snapshot.get(table, []), 1, failed)
+
+    return collect_results(accumulators, failed)
@@ -1,14 +1,43 @@
 """
 대시보드 메트릭 집계 Lambda 함수
 전체 직원 수, 활성 프로젝트 수, 대기 중인 평가 등의 통계를 집계하여 반환
+
+조회 요청은 DashboardSnapshot 테이블의 materialized view 항목 하나를 읽어 응답하고,
+view는 원본 테이블의 DynamoDB Streams 변경분으로 stream_handler가 증분 갱신합니다.
 """
 
 import json
 import os
+import sys
+import threading
 import boto3
+from concurrent.futures import ThreadPoolExecutor, wait
 from decimal import Decimal
-from boto3.dynamodb.conditions import Attr
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    from accumulators import (
+        ACCUMULATORS, aggregate_snapshot, calculate_employee_score, collect_results,
+        create_accumulators, feed_items, required_attributes, required_tables
+    )
+    from view import (
+        DashboardView, ViewTooLargeError, apply_stream_records, load_view, mark_view_stale,
+        record_table_name, save_view
+    )
+except ImportError:
+    from lambda_functions.dashboard_metrics.accumulators import (
+        ACCUMULATORS, aggregate_snapshot, calculate_employee_score, collect_results,
+        create_accumulators, feed_items, required_attributes, required_tables
+    )
+    from lambda_functions.dashboard_metrics.view import (
+        DashboardView, ViewTooLargeError, apply_stream_records, load_view, mark_view_stale,
+        record_table_name, save_view
+    )
+
+# Lambda Layer의 common 모듈 경로 추가
+sys.path.insert(0, '/opt/python')
+
+from common.response_cache import ResponseCache, conditional_response, invalidate as invalidate_cache
 
 # DynamoDB 클라이언트 초기화
 dynamodb = boto3.resource('dynamodb')
@@ -17,6 +46,40 @@ dynamodb = boto3.resource('dynamodb')
 EMPLOYEES_TABLE = os.environ.get('EMPLOYEES_TABLE', 'Employees')
 PROJECTS_TABLE = os.environ.get('PROJECTS_TABLE', 'Projects')
 EVALUATIONS_TABLE = os.environ.get('EVALUATIONS_TABLE', 'EmployeeEvaluations')
+PENDING_CANDIDATES_TABLE = os.environ.get('PENDING_CANDIDATES_TABLE', 'PendingCandidates')
+DASHBOARD_VIEW_TABLE = os.environ.get('DASHBOARD_VIEW_TABLE', 'DashboardSnapshot')
+
+# materialized view 사용 여부 (false면 매 요청마다 원본 테이블을 집계)
+DASHBOARD_VIEW_ENABLED = os.environ.get('DASHBOARD_VIEW_ENABLED', 'true').lower() == 'true'
+
+# 원본 테이블 동시 조회 제한 시간(초)과 스레드 수
+DASHBOARD_SECTION_TIMEOUT = float(os.environ.get('DASHBOARD_SECTION_TIMEOUT', '10'))
+DASHBOARD_MAX_WORKERS = int(os.environ.get('DASHBOARD_MAX_WORKERS', '8'))
+
+# 섹션 상태
+SECTION_OK = 'ok'
+SECTION_STALE = 'stale'
+SECTION_TIMED_OUT = 'timed_out'
+SECTION_FAILED = 'failed'
+
+# 스냅샷 키별 테이블 이름
+SNAPSHOT_TABLES = {
+    'employees': EMPLOYEES_TABLE,
+    'projects': PROJECTS_TABLE,
+    'evaluations': EVALUATIONS_TABLE,
+    'pending_candidates': PENDING_CANDIDATES_TABLE
+}
+
+# 테이블 조회 스레드 풀과 워커별 리소스 (boto3 리소스는 스레드 안전하지 않음)
+_section_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_worker_local = threading.local()
+
+# 섹션별 마지막 정상 결과 (시간 초과/실패 시 stale 값으로 응답)
+_last_good_results: Dict[str, Any] = {}
+
+# 대시보드 응답 캐시 (원본 테이블 중 하나라도 바뀌면 무효화)
+response_cache = ResponseCache('dashboard_metrics', depends_on=tuple(SNAPSHOT_TABLES))
 
 
 class DecimalEncoder(json.JSONEncoder):
@@ -27,1033 +90,499 @@ class DecimalEncoder(json.JSONEncoder):
         return super(DecimalEncoder, self).default(obj)
 
 
-def get_total_employees() -> int:
-    """전체 직원 수 조회"""
+def scan_all_items(
+    table_name: str,
+    resource=None,
+    attributes: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    테이블 전체 항목 조회 (LastEvaluatedKey 기준 페이지네이션)
+
+    Args:
+        table_name: DynamoDB 테이블 이름
+        resource: 사용할 DynamoDB 리소스 (없으면 모듈 리소스)
+        attributes: 읽을 최상위 속성 목록 (없으면 전체 항목)
+
+    Returns:
+        list: 테이블의 모든 항목
+    """
+    table = (resource or dynamodb).Table(table_name)
+    items = []
+    scan_kwargs = {}
+    if attributes:
+        # status 등 예약어와 겹치지 않도록 속성 이름은 치환자로 지정
+        names = {f"#a{i}": name for i, name in enumerate(attributes)}
+        scan_kwargs['ProjectionExpression'] = ', '.join(names)
+        scan_kwargs['ExpressionAttributeNames'] = names
+
+    while True:
+        response = table.scan(**scan_kwargs)
+        items.extend(response.get('Items', []))
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    return items
+
+
+def _get_section_executor() -> ThreadPoolExecutor:
+    """
+    테이블 조회용 스레드 풀 반환
+
+    워커 스레드와 스레드별 리소스를 Lambda 컨테이너가 재사용되는 동안 유지하도록 한 번만 생성합니다.
+    """
+    global _section_executor
+    with _executor_lock:
+        if _section_executor is None:
+            _section_executor = ThreadPoolExecutor(
+                max_workers=DASHBOARD_MAX_WORKERS,
+                thread_name_prefix='dashboard-section'
+            )
+        return _section_executor
+
+
+def _worker_dynamodb():
+    """워커 스레드 전용 DynamoDB 리소스 반환"""
+    resource = getattr(_worker_local, 'dynamodb', None)
+    if resource is None:
+        resource = boto3.session.Session().resource('dynamodb')
+        _worker_local.dynamodb = resource
+    return resource
+
+
+def _scan_in_worker(table_name: str, attributes: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """워커 스레드에서 테이블 전체 조회"""
+    return scan_all_items(table_name, _worker_dynamodb(), attributes)
+
+
+def load_snapshot_tables(
+    timeout: Optional[float] = None,
+    keys: Optional[List[str]] = None
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, str]]:
+    """
+    대시보드 집계에 필요한 테이블을 동시에 한 번씩 읽어 메모리 스냅샷 생성
+
+    모든 테이블 조회가 같은 시각에 시작하므로 응답 시간은 가장 느린 테이블 하나로
+    제한됩니다. 제한 시간 안에 끝나지 않거나 실패한 테이블은 빈 목록으로 둡니다.
+    지표가 선언한 속성만 ProjectionExpression으로 읽습니다.
+
+    Args:
+        timeout: 조회 제한 시간(초, 없으면 DASHBOARD_SECTION_TIMEOUT)
+        keys: 계산할 지표 키 목록 (없으면 등록된 모든 지표)
+
+    Returns:
+        tuple: (스냅샷 키별 항목 목록, 스냅샷 키별 상태 - ok/timed_out/failed)
+    """
+    if timeout is None:
+        timeout = DASHBOARD_SECTION_TIMEOUT
+    attributes = required_attributes(ACCUMULATORS.keys() if keys is None else keys)
+
+    executor = _get_section_executor()
+    futures = {
+        key: executor.submit(_scan_in_worker, SNAPSHOT_TABLES[key], attributes[key])
+        for key in SNAPSHOT_TABLES
+        if key in attributes
+    }
+    wait(futures.values(), timeout=timeout)
+
+    snapshot = {}
+    table_status = {}
+    for key, future in futures.items():
+        table_name = SNAPSHOT_TABLES[key]
+        snapshot[key] = []
+        if not future.done():
+            # 실행 전이면 취소하고, 이미 실행 중이면 결과를 기다리지 않음
+            future.cancel()
+            print(f"Timed out loading {table_name} snapshot after {timeout}s")
+            table_status[key] = SECTION_TIMED_OUT
+            continue
+        try:
+            snapshot[key] = future.result()
+            table_status[key] = SECTION_OK
+        except Exception as e:
+            print(f"Error loading {table_name} snapshot: {str(e)}")
+            table_status[key] = SECTION_FAILED
+
+    print(
+        "Dashboard snapshot loaded: "
+        + ", ".join(f"{key}={len(items)}" for key, items in snapshot.items())
+    )
+    return snapshot, table_status
+
+
+def load_dashboard_snapshot(keys: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    대시보드 집계에 필요한 테이블을 한 번씩만 읽어 메모리 스냅샷 생성
+
+    테이블 조회에 실패하면 해당 테이블은 빈 목록으로 두고 나머지 지표는 계속 집계합니다.
+
+    Args:
+        keys: 계산할 지표 키 목록 (없으면 등록된 모든 지표)
+
+    Returns:
+        dict: 스냅샷 키(employees, projects, evaluations, pending_candidates)별 항목 목록
+    """
+    snapshot, _ = load_snapshot_tables(keys=keys)
+    return snapshot
+
+
+def aggregate_metric(key: str, snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Any:
+    """
+    누적기 기반 지표 하나 계산 (스냅샷이 없으면 필요한 테이블의 필요한 속성만 조회)
+
+    Args:
+        key: 누적기 지표 키
+        snapshot: load_dashboard_snapshot 결과 (없으면 None)
+
+    Returns:
+        지표 결과 (조회 실패 시 누적기 기본값)
+    """
     try:
-        table = dynamodb.Table(EMPLOYEES_TABLE)
-        response = table.scan(Select='COUNT')
-        return response.get('Count', 0)
+        if snapshot is None:
+            snapshot = {
+                table: scan_all_items(SNAPSHOT_TABLES[table], attributes=attributes)
+                for table, attributes in required_attributes([key]).items()
+            }
+        return aggregate_snapshot(snapshot, [key])[key]
     except Exception as e:
-        print(f"Error getting total employees: {str(e)}")
-        return 0
+        print(f"Error in {key} aggregation: {str(e)}")
+        return ACCUMULATORS[key]().default()
+
+
+def get_total_employees(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> int:
+    """전체 직원 수 조회"""
+    return aggregate_metric('total_employees', snapshot)
 
 
-def get_active_projects() -> int:
+def get_active_projects(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> int:
     """진행 중인 프로젝트 수 조회"""
-    try:
-        table = dynamodb.Table(PROJECTS_TABLE)
-        # 프로젝트 상태가 'in-progress'인 것만 카운트
-        response = table.scan(
-            FilterExpression=Attr('status').eq('in-progress'),
-            Select='COUNT'
-        )
-        return response.get('Count', 0)
-    except Exception as e:
-        print(f"Error getting active projects: {str(e)}")
-        # 상태 필드가 없는 경우 전체 프로젝트 수 반환
-        try:
-            response = table.scan(Select='COUNT')
-            return response.get('Count', 0)
-        except:
-            return 0
+    return aggregate_metric('active_projects', snapshot)
 
 
-def get_available_employees() -> int:
+def get_available_employees(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> int:
     """투입 대기 인력 수 조회 (현재 프로젝트에 배정되지 않은 직원)"""
-    try:
-        # 전체 직원 수 조회
-        emp_table = dynamodb.Table(EMPLOYEES_TABLE)
-        emp_response = emp_table.scan(Select='COUNT')
-        total_employees = emp_response.get('Count', 0)
-        
-        # 프로젝트에 배정된 직원 수 조회
-        proj_table = dynamodb.Table(PROJECTS_TABLE)
-        proj_response = proj_table.scan()
-        projects = proj_response.get('Items', [])
-        
-        assigned_employees = set()
-        for project in projects:
-            # 진행 중인 프로젝트만 확인
-            if project.get('status') == 'in-progress':
-                team_members = project.get('team_members', [])
-                for member in team_members:
-                    if isinstance(member, dict):
-                        employee_id = member.get('employee_id') or member.get('user_id')
-                        if employee_id:
-                            assigned_employees.add(employee_id)
-        
-        # 투입 대기 인력 = 전체 직원 - 배정된 직원
-        available_count = total_employees - len(assigned_employees)
-        
-        print(f"Total employees: {total_employees}, Assigned: {len(assigned_employees)}, Available: {available_count}")
-        
-        return available_count
-    except Exception as e:
-        print(f"Error getting available employees: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return 0
+    return aggregate_metric('available_employees', snapshot)
 
 
-def get_pending_candidates() -> int:
+def get_pending_candidates(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> int:
     """대기자명단 수 조회"""
-    try:
-        table = dynamodb.Table('PendingCandidates')
-        response = table.scan(Select='COUNT')
-        return response.get('Count', 0)
-    except Exception as e:
-        print(f"Error getting pending candidates: {str(e)}")
-        return 0
+    return aggregate_metric('pending_candidates', snapshot)
 
 
-def get_employee_distribution() -> Dict[str, Any]:
+def get_employee_distribution(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """인력 현황 상세 분포"""
-    try:
-        table = dynamodb.Table(EMPLOYEES_TABLE)
-        response = table.scan()
-        items = response.get('Items', [])
-        
-        print(f"Total employees for distribution: {len(items)}")
-        
-        # 부서별 분포
-        department_dist = {}
-        # 경력 분포
-        experience_dist = {'신입': 0, '주니어': 0, '시니어': 0, '리드': 0}
-        # 역할별 분포
-        role_dist = {}
-        
-        for employee in items:
-            # 부서별
-            dept = employee.get('department', '미지정')
-            department_dist[dept] = department_dist.get(dept, 0) + 1
-            
-            # 경력별
-            basic_info = employee.get('basic_info', {})
-            years = basic_info.get('years_of_experience', 0)
-            
-            # 타입 변환 (Decimal, str, int 모두 처리)
-            try:
-                if isinstance(years, Decimal):
-                    years = float(years)
-                elif isinstance(years, str):
-                    years = float(years) if years else 0
-                elif not isinstance(years, (int, float)):
-                    years = 0
-            except (ValueError, TypeError):
-                years = 0
-            
-            if years < 3:
-                experience_dist['신입'] += 1
-            elif years < 6:
-                experience_dist['주니어'] += 1
-            elif years < 11:
-                experience_dist['시니어'] += 1
-            else:
-                experience_dist['리드'] += 1
-            
-            # 역할별
-            role = basic_info.get('role', '미지정')
-            role_dist[role] = role_dist.get(role, 0) + 1
-        
-        print(f"Experience distribution: {experience_dist}")
-        print(f"Role distribution count: {len(role_dist)}")
-        
-        result = {
-            'by_department': [{'name': k, 'count': v} for k, v in department_dist.items()],
-            'by_experience': [{'name': k, 'count': v} for k, v in experience_dist.items() if v > 0],
-            'by_role': [{'name': k, 'count': v} for k, v in role_dist.items()]
-        }
-        
-        return result
-    except Exception as e:
-        print(f"Error getting employee distribution: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return {'by_department': [], 'by_experience': [], 'by_role': []}
+    return aggregate_metric('employee_distribution', snapshot)
 
 
-def get_project_distribution() -> Dict[str, Any]:
+def get_project_distribution(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """프로젝트 현황 분포"""
-    try:
-        table = dynamodb.Table(PROJECTS_TABLE)
-        response = table.scan()
-        items = response.get('Items', [])
-        
-        # 상태별 분포
-        status_dist = {'planning': 0, 'in-progress': 0, 'completed': 0}
-        # 산업별 분포
-        industry_dist = {}
-        # 예산 규모별 분포
-        budget_dist = {'소형': 0, '중형': 0, '대형': 0}
-        
-        for project in items:
-            # 상태별
-            status = project.get('status', 'in-progress')
-            if status in status_dist:
-                status_dist[status] += 1
-            
-            # 산업별
-            industry = project.get('client_industry', '기타')
-            industry_dist[industry] = industry_dist.get(industry, 0) + 1
-            
-            # 예산 규모별
-            budget = project.get('budget_scale', '중형')
-            if budget in budget_dist:
-                budget_dist[budget] += 1
-        
-        return {
-            'by_status': [{'name': k, 'count': v} for k, v in status_dist.items()],
-            'by_industry': [{'name': k, 'count': v} for k, v in industry_dist.items()],
-            'by_budget': [{'name': k, 'count': v} for k, v in budget_dist.items()]
-        }
-    except Exception as e:
-        print(f"Error getting project distribution: {str(e)}")
-        return {'by_status': [], 'by_industry': [], 'by_budget': []}
+    return aggregate_metric('project_distribution', snapshot)
 
 
-def get_evaluation_stats() -> Dict[str, Any]:
+def get_evaluation_stats(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """평가 현황 통계"""
-    try:
-        table = dynamodb.Table(EVALUATIONS_TABLE)
-        response = table.scan()
-        items = response.get('Items', [])
-        
-        # 상태별 건수
-        status_dist = {'pending': 0, 'approved': 0, 'rejected': 0, 'review': 0}
-        # 유형별 건수
-        type_dist = {'career': 0, 'freelancer': 0}
-        # 평균 점수
-        total_score = 0
-        score_count = 0
-        
-        for evaluation in items:
-            # 상태별
-            status = evaluation.get('status', 'pending')
-            if status in status_dist:
-                status_dist[status] += 1
-            
-            # 유형별
-            eval_type = evaluation.get('type', 'career')
-            if eval_type in type_dist:
-                type_dist[eval_type] += 1
-            
-            # 평균 점수 계산
-            score = evaluation.get('overall_score')
-            if score is not None:
-                if isinstance(score, Decimal):
-                    score = float(score)
-                total_score += score
-                score_count += 1
-        
-        avg_score = round(total_score / score_count, 1) if score_count > 0 else 0
-        
-        # 승인율 계산
-        total_processed = status_dist['approved'] + status_dist['rejected']
-        approval_rate = round((status_dist['approved'] / total_processed * 100), 1) if total_processed > 0 else 0
-        
-        return {
-            'by_status': [{'name': k, 'count': v} for k, v in status_dist.items()],
-            'by_type': [{'name': k, 'count': v} for k, v in type_dist.items()],
-            'average_score': avg_score,
-            'approval_rate': approval_rate,
-            'total_evaluations': len(items)
-        }
-    except Exception as e:
-        print(f"Error getting evaluation stats: {str(e)}")
-        return {
-            'by_status': [],
-            'by_type': [],
-            'average_score': 0,
-            'approval_rate': 0,
-            'total_evaluations': 0
-        }
+    return aggregate_metric('evaluation_stats', snapshot)
 
 
-def get_pending_candidates_detail() -> Dict[str, Any]:
+def get_pending_candidates_detail(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """대기자명단 상세 정보"""
-    try:
-        table = dynamodb.Table('PendingCandidates')
-        response = table.scan()
-        items = response.get('Items', [])
-        
-        from datetime import datetime, timedelta
-        
-        # 대기 기간별 분포
-        wait_dist = {'1주 이내': 0, '1-2주': 0, '2주 이상': 0}
-        total_wait_days = 0
-        
-        for candidate in items:
-            created_at = candidate.get('created_at', '')
-            if created_at:
-                try:
-                    created_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    wait_days = (datetime.now(created_date.tzinfo) - created_date).days
-                    total_wait_days += wait_days
-                    
-                    if wait_days <= 7:
-                        wait_dist['1주 이내'] += 1
-                    elif wait_days <= 14:
-                        wait_dist['1-2주'] += 1
-                    else:
-                        wait_dist['2주 이상'] += 1
-                except:
-                    wait_dist['1주 이내'] += 1
-        
-        avg_wait_days = round(total_wait_days / len(items)) if len(items) > 0 else 0
-        
-        return {
-            'total': len(items),
-            'by_wait_period': [{'name': k, 'count': v} for k, v in wait_dist.items()],
-            'average_wait_days': avg_wait_days
-        }
-    except Exception as e:
-        print(f"Error getting pending candidates detail: {str(e)}")
-        return {'total': 0, 'by_wait_period': [], 'average_wait_days': 0}
+    return aggregate_metric('pending_candidates_detail', snapshot)
 
 
-def get_action_required_items() -> Dict[str, Any]:
+def get_action_required_items(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """알림/액션 필요 항목"""
-    try:
-        from datetime import datetime, timedelta
-        
-        # 장기 대기 인력 (프로젝트 미배정)
-        # 전체 직원 수
-        emp_table = dynamodb.Table(EMPLOYEES_TABLE)
-        emp_response = emp_table.scan(Select='COUNT')
-        total_employees = emp_response.get('Count', 0)
-        
-        # 프로젝트에 배정된 직원 수 조회
-        proj_table = dynamodb.Table(PROJECTS_TABLE)
-        proj_response = proj_table.scan()
-        projects = proj_response.get('Items', [])
-        
-        assigned_employees = set()
-        for project in projects:
-            if project.get('status') == 'in-progress':
-                team_members = project.get('team_members', [])
-                for member in team_members:
-                    if isinstance(member, dict):
-                        employee_id = member.get('employee_id') or member.get('user_id')
-                        if employee_id:
-                            assigned_employees.add(employee_id)
-        
-        long_waiting = total_employees - len(assigned_employees)
-        
-        # 평가 지연 건 (제출 후 7일 이상 pending)
-        eval_table = dynamodb.Table(EVALUATIONS_TABLE)
-        eval_response = eval_table.scan()
-        evaluations = eval_response.get('Items', [])
-        
-        delayed_evaluations = 0
-        for evaluation in evaluations:
-            if evaluation.get('status') == 'pending':
-                submitted_at = evaluation.get('submitted_at', '')
-                if submitted_at:
-                    try:
-                        submitted_date = datetime.fromisoformat(submitted_at.replace('Z', '+00:00'))
-                        days_pending = (datetime.now(submitted_date.tzinfo) - submitted_date).days
-                        if days_pending >= 7:
-                            delayed_evaluations += 1
-                    except:
-                        pass
-        
-        # 검증 필요 이력서 (verification_questions 미완료)
-        # PendingCandidates 테이블에서 확인
-        pending_table = dynamodb.Table('PendingCandidates')
-        pending_response = pending_table.scan()
-        pending_items = pending_response.get('Items', [])
-        
-        verification_needed = 0
-        for item in pending_items:
-            if not item.get('verification_completed'):
-                verification_needed += 1
-        
-        return {
-            'long_waiting_employees': long_waiting,
-            'delayed_evaluations': delayed_evaluations,
-            'verification_needed': verification_needed
-        }
-    except Exception as e:
-        print(f"Error getting action required items: {str(e)}")
-        return {
-            'long_waiting_employees': 0,
-            'delayed_evaluations': 0,
-            'verification_needed': 0
-        }
+    return aggregate_metric('action_required', snapshot)
 
 
-def get_skill_competency_analysis() -> Dict[str, Any]:
+def get_skill_competency_analysis(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """기술 역량 분석"""
-    try:
-        table = dynamodb.Table(EMPLOYEES_TABLE)
-        response = table.scan()
-        items = response.get('Items', [])
-        
-        skill_levels = {}  # 기술별 숙련도 집계
-        skill_counts = {}  # 기술별 보유 인력 수
-        multi_skilled = 0  # 5개 이상 기술 보유
-        
-        for employee in items:
-            skills = employee.get('skills', [])
-            if len(skills) >= 5:
-                multi_skilled += 1
-            
-            for skill in skills:
-                if isinstance(skill, dict):
-                    skill_name = skill.get('name', '')
-                    skill_level = skill.get('level', 'Beginner')
-                    
-                    if skill_name:
-                        skill_counts[skill_name] = skill_counts.get(skill_name, 0) + 1
-                        
-                        if skill_name not in skill_levels:
-                            skill_levels[skill_name] = {'Beginner': 0, 'Intermediate': 0, 'Advanced': 0, 'Expert': 0}
-                        skill_levels[skill_name][skill_level] = skill_levels[skill_name].get(skill_level, 0) + 1
-        
-        # 희소 기술 (3명 이하)
-        rare_skills = [{'name': k, 'count': v} for k, v in skill_counts.items() if v <= 3]
-        
-        # 기술별 평균 숙련도
-        skill_proficiency = []
-        for skill_name, levels in skill_levels.items():
-            total = sum(levels.values())
-            if total > 0:
-                # 숙련도 점수 계산 (Beginner=1, Intermediate=2, Advanced=3, Expert=4)
-                score = (levels.get('Beginner', 0) * 1 + levels.get('Intermediate', 0) * 2 + 
-                        levels.get('Advanced', 0) * 3 + levels.get('Expert', 0) * 4) / total
-                skill_proficiency.append({'name': skill_name, 'avg_level': round(score, 2), 'count': total})
-        
-        skill_proficiency.sort(key=lambda x: x['avg_level'], reverse=True)
-        
-        return {
-            'rare_skills': rare_skills[:10],
-            'multi_skilled_count': multi_skilled,
-            'top_proficiency_skills': skill_proficiency[:10],
-            'total_unique_skills': len(skill_counts)
-        }
-    except Exception as e:
-        print(f"Error in skill competency analysis: {str(e)}")
-        return {'rare_skills': [], 'multi_skilled_count': 0, 'top_proficiency_skills': [], 'total_unique_skills': 0}
+    return aggregate_metric('skill_competency', snapshot)
 
 
-def get_career_growth_analysis() -> Dict[str, Any]:
+def get_career_growth_analysis(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """경력 & 성장 분석"""
-    try:
-        table = dynamodb.Table(EMPLOYEES_TABLE)
-        response = table.scan()
-        items = response.get('Items', [])
-        
-        total_years = 0
-        senior_count = 0  # 10년 이상
-        skill_per_year = []
-        
-        for employee in items:
-            years = employee.get('basic_info', {}).get('years_of_experience', 0)
-            if isinstance(years, Decimal):
-                years = float(years)
-            
-            total_years += years
-            
-            if years >= 10:
-                senior_count += 1
-            
-            # 경력 대비 기술 수
-            skills_count = len(employee.get('skills', []))
-            if years > 0:
-                skill_per_year.append(skills_count / years)
-        
-        avg_years = round(total_years / len(items), 1) if len(items) > 0 else 0
-        avg_skill_growth = round(sum(skill_per_year) / len(skill_per_year), 2) if skill_per_year else 0
-        senior_ratio = round((senior_count / len(items)) * 100, 1) if len(items) > 0 else 0
-        
-        return {
-            'average_years': avg_years,
-            'senior_count': senior_count,
-            'senior_ratio': senior_ratio,
-            'skill_growth_rate': avg_skill_growth
-        }
-    except Exception as e:
-        print(f"Error in career growth analysis: {str(e)}")
-        return {'average_years': 0, 'senior_count': 0, 'senior_ratio': 0, 'skill_growth_rate': 0}
+    return aggregate_metric('career_growth', snapshot)
 
 
-def get_project_experience_analysis() -> Dict[str, Any]:
+def get_project_experience_analysis(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """프로젝트 참여 이력 분석"""
-    try:
-        table = dynamodb.Table(EMPLOYEES_TABLE)
-        response = table.scan()
-        items = response.get('Items', [])
-        
-        total_projects = 0
-        no_experience = 0
-        multi_industry = 0
-        leader_count = 0
-        
-        for employee in items:
-            work_exp = employee.get('work_experience', [])
-            project_count = len(work_exp)
-            total_projects += project_count
-            
-            if project_count == 0:
-                no_experience += 1
-            
-            # 다양한 산업 경험 (3개 이상 다른 산업)
-            industries = set()
-            has_leader_role = False
-            
-            for exp in work_exp:
-                if isinstance(exp, dict):
-                    # 산업 정보는 프로젝트 테이블과 조인 필요하지만, 간단히 프로젝트 수로 판단
-                    role = exp.get('role', '').lower()
-                    if 'lead' in role or 'manager' in role or 'architect' in role:
-                        has_leader_role = True
-            
-            if project_count >= 3:
-                multi_industry += 1
-            
-            if has_leader_role:
-                leader_count += 1
-        
-        avg_projects = round(total_projects / len(items), 1) if len(items) > 0 else 0
-        
-        return {
-            'average_projects': avg_projects,
-            'no_experience_count': no_experience,
-            'multi_industry_count': multi_industry,
-            'leader_experience_count': leader_count
-        }
-    except Exception as e:
-        print(f"Error in project experience analysis: {str(e)}")
-        return {'average_projects': 0, 'no_experience_count': 0, 'multi_industry_count': 0, 'leader_experience_count': 0}
+    return aggregate_metric('project_experience', snapshot)
 
 
-def get_utilization_analysis() -> Dict[str, Any]:
+def get_utilization_analysis(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """인력 활용도 분석"""
-    try:
-        # 전체 직원 수
-        emp_table = dynamodb.Table(EMPLOYEES_TABLE)
-        emp_response = emp_table.scan(Select='COUNT')
-        total_employees = emp_response.get('Count', 0)
-        
-        # 프로젝트에 배정된 직원 수 조회
-        proj_table = dynamodb.Table(PROJECTS_TABLE)
-        proj_response = proj_table.scan()
-        projects = proj_response.get('Items', [])
-        
-        assigned_employees = set()
-        for project in projects:
-            if project.get('status') == 'in-progress':
-                team_members = project.get('team_members', [])
-                for member in team_members:
-                    if isinstance(member, dict):
-                        employee_id = member.get('employee_id') or member.get('user_id')
-                        if employee_id:
-                            assigned_employees.add(employee_id)
-        
-        assigned = len(assigned_employees)
-        available = total_employees - assigned
-        utilization_rate = round((assigned / total_employees) * 100, 1) if total_employees > 0 else 0
-        
-        return {
-            'assigned_count': assigned,
-            'available_count': available,
-            'utilization_rate': utilization_rate
-        }
-    except Exception as e:
-        print(f"Error in utilization analysis: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return {'assigned_count': 0, 'available_count': 0, 'utilization_rate': 0}
+    return aggregate_metric('utilization', snapshot)
 
 
-def get_education_certification_analysis() -> Dict[str, Any]:
+def get_education_certification_analysis(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """학력 & 자격증 분석"""
-    try:
-        table = dynamodb.Table(EMPLOYEES_TABLE)
-        response = table.scan()
-        items = response.get('Items', [])
-        
-        education_dist = {}
-        total_certs = 0
-        no_cert_count = 0
-        
-        for employee in items:
-            # 학력
-            education = employee.get('education', {})
-            if isinstance(education, dict):
-                degree = education.get('degree', '미지정')
-                education_dist[degree] = education_dist.get(degree, 0) + 1
-            
-            # 자격증
-            certs = employee.get('certifications', [])
-            cert_count = len(certs) if isinstance(certs, list) else 0
-            total_certs += cert_count
-            
-            if cert_count == 0:
-                no_cert_count += 1
-        
-        avg_certs = round(total_certs / len(items), 1) if len(items) > 0 else 0
-        
-        return {
-            'education_distribution': [{'name': k, 'count': v} for k, v in education_dist.items()],
-            'average_certifications': avg_certs,
-            'no_certification_count': no_cert_count
-        }
-    except Exception as e:
-        print(f"Error in education certification analysis: {str(e)}")
-        return {'education_distribution': [], 'average_certifications': 0, 'no_certification_count': 0}
+    return aggregate_metric('education_certification', snapshot)
 
 
-def get_portfolio_health_analysis() -> Dict[str, Any]:
+def get_portfolio_health_analysis(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """인력 포트폴리오 건강도 분석"""
-    try:
-        table = dynamodb.Table(EMPLOYEES_TABLE)
-        response = table.scan()
-        items = response.get('Items', [])
-        
-        role_categories = {'Backend': 0, 'Frontend': 0, 'Fullstack': 0, 'DevOps': 0, 'Other': 0}
-        
-        for employee in items:
-            role = employee.get('basic_info', {}).get('role', '').lower()
-            
-            if 'backend' in role:
-                role_categories['Backend'] += 1
-            elif 'frontend' in role:
-                role_categories['Frontend'] += 1
-            elif 'full' in role or 'fullstack' in role:
-                role_categories['Fullstack'] += 1
-            elif 'devops' in role or 'infra' in role:
-                role_categories['DevOps'] += 1
-            else:
-                role_categories['Other'] += 1
-        
-        # 기술 다양성 지수 (보유 기술 종류 / 전체 인력)
-        all_skills = set()
-        for employee in items:
-            for skill in employee.get('skills', []):
-                if isinstance(skill, dict):
-                    skill_name = skill.get('name', '')
-                    if skill_name:
-                        all_skills.add(skill_name)
-        
-        diversity_index = round(len(all_skills) / len(items), 2) if len(items) > 0 else 0
-        
-        return {
-            'role_distribution': [{'name': k, 'count': v} for k, v in role_categories.items()],
-            'skill_diversity_index': diversity_index,
-            'unique_skills_count': len(all_skills)
-        }
-    except Exception as e:
-        print(f"Error in portfolio health analysis: {str(e)}")
-        return {'role_distribution': [], 'skill_diversity_index': 0, 'unique_skills_count': 0}
+    return aggregate_metric('portfolio_health', snapshot)
 
 
-def get_employee_quality_analysis() -> Dict[str, Any]:
+def get_employee_quality_analysis(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """직원 품질 분석 (평가 기반)"""
-    try:
-        table = dynamodb.Table(EMPLOYEES_TABLE)
-        response = table.scan()
-        items = response.get('Items', [])
-        
-        # 고급 기술 보유자 (난이도 높은 기술)
-        advanced_tech_keywords = ['kubernetes', 'k8s', 'msa', 'microservices', 'aws', 'azure', 'gcp', 'ai', 'ml', 'machine learning']
-        advanced_tech_count = 0
-        
-        # 역량 레벨 분포 (직원별 최고 레벨만 카운트)
-        skill_level_dist = {'Expert': 0, 'Advanced': 0, 'Intermediate': 0, 'Beginner': 0}
-        level_priority = {'Expert': 4, 'Advanced': 3, 'Intermediate': 2, 'Beginner': 1}
-        
-        # 성과 기록 보유자
-        performance_record_count = 0
-        
-        # 다중 역할 경험자
-        multi_role_count = 0
-        
-        for employee in items:
-            # 고급 기술 체크
-            skills = employee.get('skills', [])
-            has_advanced_tech = False
-            
-            # 직원의 최고 역량 레벨 찾기
-            highest_level = 'Beginner'
-            highest_priority = 0
-            
-            for skill in skills:
-                if isinstance(skill, dict):
-                    skill_name = skill.get('name', '').lower()
-                    if any(keyword in skill_name for keyword in advanced_tech_keywords):
-                        has_advanced_tech = True
-                    
-                    # 최고 레벨 찾기
-                    level = skill.get('level', 'Beginner')
-                    priority = level_priority.get(level, 0)
-                    if priority > highest_priority:
-                        highest_priority = priority
-                        highest_level = level
-            
-            # 직원별 최고 레벨만 카운트
-            if highest_level in skill_level_dist:
-                skill_level_dist[highest_level] += 1
-            
-            if has_advanced_tech:
-                advanced_tech_count += 1
-            
-            # 성과 기록 체크
-            work_exp = employee.get('work_experience', [])
-            for exp in work_exp:
-                if isinstance(exp, dict) and exp.get('performance_result'):
-                    performance_record_count += 1
-                    break
-            
-            # 다중 역할 경험 체크
-            roles = set()
-            for exp in work_exp:
-                if isinstance(exp, dict):
-                    role = exp.get('role', '')
-                    if role:
-                        roles.add(role)
-            if len(roles) >= 3:
-                multi_role_count += 1
-        
-        # 비율 계산
-        total = len(items)
-        advanced_tech_ratio = round((advanced_tech_count / total) * 100, 1) if total > 0 else 0
-        performance_ratio = round((performance_record_count / total) * 100, 1) if total > 0 else 0
-        
-        return {
-            'advanced_tech_count': advanced_tech_count,
-            'advanced_tech_ratio': advanced_tech_ratio,
-            'skill_level_distribution': [{'name': k, 'count': v} for k, v in skill_level_dist.items()],
-            'performance_record_count': performance_record_count,
-            'performance_ratio': performance_ratio,
-            'multi_role_count': multi_role_count
-        }
-    except Exception as e:
-        print(f"Error in employee quality analysis: {str(e)}")
-        return {
-            'advanced_tech_count': 0,
-            'advanced_tech_ratio': 0,
-            'skill_level_distribution': [],
-            'performance_record_count': 0,
-            'performance_ratio': 0,
-            'multi_role_count': 0
-        }
+    return aggregate_metric('employee_quality', snapshot)
 
 
-def get_domain_expertise_analysis() -> Dict[str, Any]:
+def get_domain_expertise_analysis(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """도메인 전문성 분석 (프로젝트 경험 기반)"""
-    try:
-        emp_table = dynamodb.Table(EMPLOYEES_TABLE)
-        emp_response = emp_table.scan()
-        employees = emp_response.get('Items', [])
-        
-        # 프로젝트 이름에서 도메인 추출을 위한 키워드 매핑
-        domain_keywords = {
-            '금융': ['금융', '뱅킹', '은행', '증권', '보험', '카드', 'banking', 'finance'],
-            '전자상거래': ['커머스', '쇼핑', '이커머스', '유통', '리테일', 'commerce', 'retail', 'shopping'],
-            '의료': ['의료', '병원', '헬스케어', '건강', 'healthcare', 'medical', 'hospital'],
-            '제조': ['제조', '공장', '생산', 'manufacturing', 'factory'],
-            '통신': ['통신', '네트워크', '5G', 'telecom', 'network'],
-            '교육': ['교육', '학습', '이러닝', 'education', 'learning'],
-            '물류': ['물류', '배송', '운송', 'logistics', 'delivery'],
-            '게임': ['게임', 'game', 'gaming'],
-            '미디어': ['미디어', '콘텐츠', '방송', 'media', 'content'],
-            '공공': ['공공', '정부', '행정', 'government', 'public']
-        }
-        
-        def extract_domain(project_name: str) -> str:
-            """프로젝트 이름에서 도메인 추출"""
-            if not project_name:
-                return '기타'
-            
-            project_name_lower = project_name.lower()
-            for domain, keywords in domain_keywords.items():
-                for keyword in keywords:
-                    if keyword in project_name_lower:
-                        return domain
-            return '기타'
-        
-        # 직원별 경험한 도메인 집계
-        domain_exp_count = {}
-        multi_domain_count = 0
-        total_projects = 0
-        
-        for employee in employees:
-            work_exp = employee.get('work_experience', [])
-            employee_domains = set()
-            
-            for exp in work_exp:
-                if isinstance(exp, dict):
-                    project_name = exp.get('project_name', '')
-                    if project_name:
-                        domain = extract_domain(project_name)
-                        employee_domains.add(domain)
-                        total_projects += 1
-            
-            # 2개 이상 도메인 경험
-            if len(employee_domains) >= 2:
-                multi_domain_count += 1
-            
-            # 도메인별 경험 인력 수 집계
-            for domain in employee_domains:
-                domain_exp_count[domain] = domain_exp_count.get(domain, 0) + 1
-        
-        # 평균 프로젝트 수
-        avg_projects = round(total_projects / len(employees), 1) if len(employees) > 0 else 0
-        
-        # 상위 도메인
-        top_domains = sorted(domain_exp_count.items(), key=lambda x: x[1], reverse=True)[:5]
-        
-        return {
-            'multi_domain_experts': multi_domain_count,
-            'average_domain_years': avg_projects,
-            'top_domains': [{'name': k, 'count': v} for k, v in top_domains],
-            'total_domains': len(domain_exp_count)
-        }
-    except Exception as e:
-        print(f"Error in domain expertise analysis: {str(e)}")
-        return {
-            'multi_domain_experts': 0,
-            'average_domain_years': 0,
-            'top_domains': [],
-            'total_domains': 0
-        }
-
-
-def calculate_employee_score(employee: Dict) -> float:
-    """직원 평가 점수 계산 (간소화 버전)"""
-    try:
-        score = 0
-        
-        # 1. 기술 역량 (40점)
-        skills = employee.get('skills', [])
-        skill_score = 0
-        for skill in skills:
-            if isinstance(skill, dict):
-                level = skill.get('level', 'Beginner')
-                years = skill.get('years', 0)
-                if isinstance(years, Decimal):
-                    years = float(years)
-                
-                level_score = {'Expert': 10, 'Advanced': 7, 'Intermediate': 5, 'Beginner': 3}.get(level, 3)
-                skill_score += level_score + min(years, 5)
-        
-        score += min(skill_score / len(skills) * 4, 40) if skills else 0
-        
-        # 2. 경력 (30점)
-        years_exp = employee.get('basic_info', {}).get('years_of_experience', 0)
-        if isinstance(years_exp, Decimal):
-            years_exp = float(years_exp)
-        score += min(years_exp * 2, 30)
-        
-        # 3. 프로젝트 경험 (20점)
-        work_exp = employee.get('work_experience', [])
-        project_score = len(work_exp) * 5
-        # 성과 기록 보너스
-        for exp in work_exp:
-            if isinstance(exp, dict) and exp.get('performance_result'):
-                project_score += 5
-                break
-        score += min(project_score, 20)
-        
-        # 4. 자격증 (10점)
-        certs = employee.get('certifications', [])
-        cert_count = len(certs) if isinstance(certs, list) else 0
-        score += min(cert_count * 2, 10)
-        
-        return round(min(score, 100), 1)
-    except Exception as e:
-        print(f"Error calculating score: {str(e)}")
-        return 0
+    return aggregate_metric('domain_expertise', snapshot)
 
 
-def get_evaluation_score_analysis() -> Dict[str, Any]:
+def get_evaluation_score_analysis(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """평가 점수 분석"""
-    try:
-        table = dynamodb.Table(EMPLOYEES_TABLE)
-        response = table.scan()
-        items = response.get('Items', [])
-        
-        scores = []
-        score_by_role = {}
-        score_by_dept = {}
-        score_by_experience = {'신입': [], '주니어': [], '시니어': [], '리드': []}
-        
-        # 점수 분포
-        score_dist = {'우수 (90+)': 0, '양호 (80-89)': 0, '보통 (70-79)': 0, '개선필요 (<70)': 0}
-        
-        for employee in items:
-            score = calculate_employee_score(employee)
-            scores.append(score)
-            
-            # 점수 분포
-            if score >= 90:
-                score_dist['우수 (90+)'] += 1
-            elif score >= 80:
-                score_dist['양호 (80-89)'] += 1
-            elif score >= 70:
-                score_dist['보통 (70-79)'] += 1
-            else:
-                score_dist['개선필요 (<70)'] += 1
-            
-            # 역할별
-            role = employee.get('basic_info', {}).get('role', '미지정')
-            if role not in score_by_role:
-                score_by_role[role] = []
-            score_by_role[role].append(score)
-            
-            # 부서별
-            dept = employee.get('department', '미지정')
-            if dept not in score_by_dept:
-                score_by_dept[dept] = []
-            score_by_dept[dept].append(score)
-            
-            # 경력별
-            years = employee.get('basic_info', {}).get('years_of_experience', 0)
-            
-            # 타입 변환
-            try:
-                if isinstance(years, Decimal):
-                    years = float(years)
-                elif isinstance(years, str):
-                    years = float(years) if years else 0
-                elif not isinstance(years, (int, float)):
-                    years = 0
-            except (ValueError, TypeError):
-                years = 0
-            
-            if years < 3:
-                score_by_experience['신입'].append(score)
-            elif years < 6:
-                score_by_experience['주니어'].append(score)
-            elif years < 11:
-                score_by_experience['시니어'].append(score)
-            else:
-                score_by_experience['리드'].append(score)
-        
-        # 평균 계산
-        avg_score = round(sum(scores) / len(scores), 1) if scores else 0
-        
-        # 역할별 평균 (상위 5개)
-        role_avg = [(role, round(sum(scores) / len(scores), 1)) for role, scores in score_by_role.items() if scores]
-        role_avg.sort(key=lambda x: x[1], reverse=True)
-        
-        # 경력별 평균
-        exp_avg = [(level, round(sum(scores) / len(scores), 1)) for level, scores in score_by_experience.items() if scores]
-        
-        return {
-            'average_score': avg_score,
-            'score_distribution': [{'name': k, 'count': v} for k, v in score_dist.items()],
-            'top_roles_by_score': [{'name': role, 'avg_score': score} for role, score in role_avg[:5]],
-            'score_by_experience': [{'name': level, 'avg_score': score} for level, score in exp_avg],
-            'high_performers': score_dist['우수 (90+)'],
-            'low_performers': score_dist['개선필요 (<70)']
-        }
-    except Exception as e:
-        print(f"Error in evaluation score analysis: {str(e)}")
-        return {
-            'average_score': 0,
-            'score_distribution': [],
-            'top_roles_by_score': [],
-            'score_by_experience': [],
-            'high_performers': 0,
-            'low_performers': 0
-        }
+    return aggregate_metric('evaluation_scores', snapshot)
 
 
-def get_skill_gap_analysis() -> Dict[str, Any]:
+def get_skill_gap_analysis(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """역량 갭 분석"""
-    try:
-        emp_table = dynamodb.Table(EMPLOYEES_TABLE)
-        proj_table = dynamodb.Table(PROJECTS_TABLE)
-        
-        emp_response = emp_table.scan()
-        proj_response = proj_table.scan()
-        
-        employees = emp_response.get('Items', [])
-        projects = proj_response.get('Items', [])
-        
-        # 직원 보유 기술 집계
-        employee_skills = {}
-        for emp in employees:
-            for skill in emp.get('skills', []):
-                if isinstance(skill, dict):
-                    skill_name = skill.get('name', '')
-                    if skill_name:
-                        employee_skills[skill_name] = employee_skills.get(skill_name, 0) + 1
-        
-        # 프로젝트 필요 기술 집계
-        project_skills = {}
-        for proj in projects:
-            tech_stack = proj.get('tech_stack', {})
-            for category in ['backend', 'frontend', 'data', 'infra']:
-                skills = tech_stack.get(category, [])
-                for skill in skills:
-                    project_skills[skill] = project_skills.get(skill, 0) + 1
-        
-        # 부족한 기술 (수요 > 공급)
-        skill_gaps = []
-        for skill, demand in project_skills.items():
-            supply = employee_skills.get(skill, 0)
-            if demand > supply:
-                gap = demand - supply
-                skill_gaps.append({'skill': skill, 'gap': gap, 'demand': demand, 'supply': supply})
-        
-        skill_gaps.sort(key=lambda x: x['gap'], reverse=True)
-        
-        # 교육 필요 인력 수 (평균 이하 점수)
-        scores = [calculate_employee_score(emp) for emp in employees]
-        avg_score = sum(scores) / len(scores) if scores else 0
-        training_needed = sum(1 for score in scores if score < avg_score)
-        
-        return {
-            'top_skill_gaps': skill_gaps[:10],
-            'total_skill_gaps': len(skill_gaps),
-            'training_needed_count': training_needed
-        }
-    except Exception as e:
-        print(f"Error in skill gap analysis: {str(e)}")
-        return {
-            'top_skill_gaps': [],
-            'total_skill_gaps': 0,
-            'training_needed_count': 0
-        }
+    return aggregate_metric('skill_gaps', snapshot)
 
 
-def get_top_skills() -> List[Dict[str, Any]]:
+def get_top_skills(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> List[Dict[str, Any]]:
     """주요 기술 스택 분포 조회"""
+    return aggregate_metric('top_skills', snapshot)
+
+
+def compute_dashboard_sections(
+    snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    table_status: Optional[Dict[str, str]] = None,
+    save: bool = True,
+    keys: Optional[List[str]] = None
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    원본 테이블 스냅샷으로 섹션을 계산하고 섹션별 상태를 함께 반환
+
+    필요한 테이블이 제한 시간 안에 조회되지 않았거나 실패한 섹션은 기본값과
+    timed_out/failed 상태로 응답합니다. 모든 섹션을 계산하고 모든 테이블이 조회된
+    경우에만 view를 덮어씁니다.
+
+    Args:
+        snapshot: 스냅샷 키별 항목 목록 (없으면 동시 조회)
+        table_status: 스냅샷 키별 조회 상태 (없으면 모두 ok)
+        save: True면 계산 결과로 materialized view를 덮어씀
+        keys: 계산할 지표 키 목록 (없으면 등록된 모든 지표)
+
+    Returns:
+        tuple: (지표 키별 결과, 지표 키별 상태)
+    """
+    if snapshot is None:
+        snapshot, table_status = load_snapshot_tables(keys=keys)
+    table_status = table_status or {}
+    unavailable = {table: status for table, status in table_status.items() if status != SECTION_OK}
+
+    accumulators = create_accumulators(keys)
+    failed = {}
+    for table in required_tables(accumulators.keys()):
+        if table not in unavailable:
+            feed_items(accumulators, table, snapshot.get(table, []), 1, failed)
+
+    status = {}
+    for key, accumulator in accumulators.items():
+        missing = [unavailable[table] for table in accumulator.tables if table in unavailable]
+        if SECTION_TIMED_OUT in missing:
+            status[key] = SECTION_TIMED_OUT
+        elif missing or key in failed:
+            status[key] = SECTION_FAILED
+        else:
+            status[key] = SECTION_OK
+
+    if save and keys is not None:
+        print("Skipping dashboard view save, partial sections requested")
+    elif save and unavailable:
+        print(f"Skipping dashboard view save, unavailable tables: {unavailable}")
+    elif save:
+        try:
+            view = DashboardView(accumulators, failed_keys=list(failed))
+            save_view(dynamodb.Table(DASHBOARD_VIEW_TABLE), view, overwrite=True)
+            print(f"Dashboard view rebuilt: version={view.version}")
+        except Exception as e:
+            print(f"Error saving dashboard view: {str(e)}")
+
+    results = collect_results(accumulators, failed)
+    for key, section_status in status.items():
+        if section_status != SECTION_OK:
+            results[key] = accumulators[key].default()
+    return results, status
+
+
+def rebuild_dashboard_view(snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
+    """
+    원본 테이블 전체를 다시 집계해 materialized view를 덮어씀
+
+    view가 없거나 변경분 적용에 실패했을 때 사용합니다. view 저장에 실패해도
+    집계 결과는 반환합니다.
+
+    Args:
+        snapshot: load_dashboard_snapshot 결과 (없으면 새로 조회)
+
+    Returns:
+        dict: 지표 키별 결과
+    """
+    results, _ = compute_dashboard_sections(snapshot)
+    return results
+
+
+def apply_stale_results(results: Dict[str, Any], status: Dict[str, str]) -> None:
+    """
+    정상 섹션 결과를 기억하고, 시간 초과/실패 섹션은 마지막 정상 결과로 대체
+
+    Args:
+        results: 지표 키별 결과 (제자리에서 갱신)
+        status: 지표 키별 상태 (대체한 섹션은 stale로 갱신)
+    """
+    for key, section_status in status.items():
+        if section_status == SECTION_OK:
+            _last_good_results[key] = results[key]
+        elif key in _last_good_results:
+            results[key] = _last_good_results[key]
+            status[key] = SECTION_STALE
+
+
+def parse_sections(value: Optional[str]) -> Optional[List[str]]:
+    """
+    sections 쿼리 파라미터 파싱
+
+    Args:
+        value: 쉼표로 구분한 지표 키 (예: "total_employees,top_skills")
+
+    Returns:
+        list: 등록 순서로 정렬한 지표 키 목록 (값이 없으면 None - 전체 지표)
+
+    Raises:
+        ValueError: 등록되지 않은 지표 키가 포함된 경우
+    """
+    if not value:
+        return None
+
+    requested = {section.strip() for section in value.split(',') if section.strip()}
+    if not requested:
+        return None
+
+    unknown = sorted(requested - set(ACCUMULATORS))
+    if unknown:
+        raise ValueError(f"알 수 없는 섹션: {', '.join(unknown)}")
+    return [key for key in ACCUMULATORS if key in requested]
+
+
+def get_dashboard_metrics(sections: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    대시보드 지표 조회
+
+    materialized view가 있으면 항목 하나만 읽어 응답하고, 없으면 원본 테이블을
+    동시에 한 번씩 읽어 집계한 뒤 view를 새로 만듭니다. view를 쓰지 않으면
+    요청한 섹션만 필요한 속성으로 계산합니다.
+
+    Args:
+        sections: 응답할 지표 키 목록 (없으면 등록된 모든 지표)
+
+    Returns:
+        dict: 지표 키별 결과 (등록 순서)와 섹션별 상태(section_status)
+    """
+    metrics, _ = _load_dashboard_metrics(sections)
+    return metrics
+
+
+def _load_dashboard_metrics(sections: Optional[List[str]] = None) -> Tuple[Dict[str, Any], bool]:
+    """대시보드 지표와 materialized view에서 읽었는지 여부 반환"""
+    results = None
+    from_view = False
+    if DASHBOARD_VIEW_ENABLED:
+        try:
+            view = load_view(dynamodb.Table(DASHBOARD_VIEW_TABLE))
+            if view is not None:
+                results = view.results(sections)
+                from_view = True
+                status = {
+                    key: SECTION_FAILED if key in view.failed_keys else SECTION_OK
+                    for key in results
+                }
+        except Exception as e:
+            print(f"Error reading dashboard view: {str(e)}")
+
+    if results is None and DASHBOARD_VIEW_ENABLED:
+        # 이후 요청이 view를 읽도록 전체 섹션으로 view를 새로 만든 뒤 요청한 섹션만 응답
+        results, status = compute_dashboard_sections()
+        if sections is not None:
+            results = {key: results[key] for key in sections}
+            status = {key: status[key] for key in sections}
+    elif results is None:
+        results, status = compute_dashboard_sections(save=False, keys=sections)
+
+    apply_stale_results(results, status)
+    results['section_status'] = status
+    return results, from_view
+
+
+def build_metrics_body(sections: Optional[List[str]] = None) -> Tuple[str, bool]:
+    """
+    대시보드 응답 본문 생성
+
+    Args:
+        sections: 응답할 지표 키 목록 (없으면 등록된 모든 지표)
+
+    Returns:
+        tuple: (JSON 응답 본문, 캐시 가능 여부)
+            view에서 읽었고 모든 섹션이 정상인 응답만 캐시합니다. view는 Streams로
+            갱신되고 그때마다 캐시가 무효화되지만, 원본 테이블 직접 집계 결과는 그렇지 않습니다.
+    """
+    metrics, from_view = _load_dashboard_metrics(sections)
+    complete = all(status == SECTION_OK for status in metrics['section_status'].values())
+    return json.dumps(metrics, cls=DecimalEncoder), from_view and complete
+
+
+def stream_handler(event, context):
+    """
+    DynamoDB Streams 핸들러
+    Employees/Projects/EmployeeEvaluations/PendingCandidates 변경분을 대시보드 view에 반영
+
+    처리에 실패하면 예외를 다시 발생시켜 Lambda가 같은 배치를 재시도하도록 합니다.
+    view 항목이 최대 크기를 넘으면 재시도해도 같은 결과이므로, view를 오래된 view로 표시해
+    조회 요청이 원본 테이블을 직접 집계하도록 하고 배치는 처리한 것으로 끝냅니다.
+    """
+    records = event.get('Records', [])
+    print(f"Dashboard stream records: {len(records)}")
+
+    table_keys = {table_name: key for key, table_name in SNAPSHOT_TABLES.items()}
+    table = dynamodb.Table(DASHBOARD_VIEW_TABLE)
+
     try:
-        table = dynamodb.Table(EMPLOYEES_TABLE)
-        response = table.scan()
-        items = response.get('Items', [])
-        
-        # 모든 직원의 기술 스택 집계
-        skill_counts = {}
-        total_employees = len(items)
-        
-        for employee in items:
-            skills = employee.get('skills', [])
-            for skill in skills:
-                skill_name = skill.get('name', '') if isinstance(skill, dict) else str(skill)
-                if skill_name:
-                    skill_counts[skill_name] = skill_counts.get(skill_name, 0) + 1
-        
-        # 상위 5개 기술 추출
-        sorted_skills = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        
-        top_skills = []
-        for skill_name, count in sorted_skills:
-            percentage = int((count / total_employees) * 100) if total_employees > 0 else 0
-            top_skills.append({
-                "name": skill_name,
-                "count": count,
-                "percentage": percentage
+        stale = False
+        try:
+            view = apply_stream_records(table, records, table_keys)
+        except ViewTooLargeError as e:
+            print(f"Dashboard view too large, serving live aggregation: {str(e)}")
+            mark_view_stale(table)
+            view = None
+            stale = True
+
+        if view is None and not stale:
+            # view가 없거나 변경분을 적용할 수 없으면 전체 재집계
+            rebuild_dashboard_view()
+
+        # view 갱신 후 바뀐 테이블의 응답 캐시 무효화 (쓰기 Lambda 외의 변경도 반영)
+        changed = sorted({table_keys[name] for name in map(record_table_name, records) if name in table_keys})
+        if changed:
+            invalidate_cache(*changed)
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps({
+                'message': 'Dashboard view updated',
+                'processed_records': len(records),
+                'rebuilt': view is None and not stale,
+                'stale': stale
             })
-        
-        return top_skills
+        }
     except Exception as e:
-        print(f"Error getting top skills: {str(e)}")
-        return []
+        print(f"Error in stream_handler: {str(e)}")
+        raise
 
 
 def lambda_handler(event, context):
@@ -1066,10 +595,10 @@ def lambda_handler(event, context):
         headers = {
             'Content-Type': 'application/json',
             'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
+            'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,If-None-Match',
             'Access-Control-Allow-Methods': 'GET,OPTIONS'
         }
-        
+
         # OPTIONS 요청 처리 (CORS preflight)
         if event.get('httpMethod') == 'OPTIONS':
             return {
@@ -1077,64 +606,37 @@ def lambda_handler(event, context):
                 'headers': headers,
                 'body': json.dumps({'message': 'OK'})
             }
-        
-        # 메트릭 집계
-        total_employees = get_total_employees()
-        active_projects = get_active_projects()
-        available_employees = get_available_employees()
-        pending_candidates = get_pending_candidates()
-        top_skills = get_top_skills()
-        
-        # 기존 상세 지표들
-        employee_distribution = get_employee_distribution()
-        project_distribution = get_project_distribution()
-        evaluation_stats = get_evaluation_stats()
-        pending_candidates_detail = get_pending_candidates_detail()
-        action_required = get_action_required_items()
-        
-        # 새로운 인력 분석 지표들
-        skill_competency = get_skill_competency_analysis()
-        career_growth = get_career_growth_analysis()
-        project_experience = get_project_experience_analysis()
-        utilization = get_utilization_analysis()
-        education_cert = get_education_certification_analysis()
-        portfolio_health = get_portfolio_health_analysis()
-        employee_quality = get_employee_quality_analysis()
-        domain_expertise = get_domain_expertise_analysis()
-        evaluation_scores = get_evaluation_score_analysis()
-        skill_gaps = get_skill_gap_analysis()
-        
-        # 응답 데이터 구성
-        metrics = {
-            'total_employees': total_employees,
-            'active_projects': active_projects,
-            'available_employees': available_employees,
-            'pending_candidates': pending_candidates,
-            'top_skills': top_skills,
-            'employee_distribution': employee_distribution,
-            'project_distribution': project_distribution,
-            'evaluation_stats': evaluation_stats,
-            'pending_candidates_detail': pending_candidates_detail,
-            'action_required': action_required,
-            # 새로운 분석 지표
-            'skill_competency': skill_competency,
-            'career_growth': career_growth,
-            'project_experience': project_experience,
-            'utilization': utilization,
-            'education_certification': education_cert,
-            'portfolio_health': portfolio_health,
-            'employee_quality': employee_quality,
-            'domain_expertise': domain_expertise,
-            'evaluation_scores': evaluation_scores,
-            'skill_gaps': skill_gaps
-        }
-        
-        return {
-            'statusCode': 200,
-            'headers': headers,
-            'body': json.dumps(metrics, cls=DecimalEncoder)
-        }
-        
+
+        # 요청한 섹션 (sections=total_employees,top_skills 형식, 없으면 전체)
+        query_params = event.get('queryStringParameters') or {}
+        try:
+            sections = parse_sections(query_params.get('sections'))
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': headers,
+                'body': json.dumps({
+                    'error': 'Invalid sections',
+                    'message': f"{str(e)} (유효한 섹션: {', '.join(ACCUMULATORS)})"
+                })
+            }
+
+        # 응답 데이터 구성 (total_employees, active_projects, ..., skill_gaps, section_status)
+        cacheable = {}
+
+        def build_body() -> str:
+            body, cacheable['value'] = build_metrics_body(sections)
+            return body
+
+        cached, hit = response_cache.get_or_build(
+            ','.join(sections) if sections else 'all',
+            build_body,
+            cacheable=lambda body: cacheable.get('value', False)
+        )
+        print(f"Dashboard response cache {'hit' if hit else 'miss'}")
+
+        return conditional_response(event, cached, headers)
+
     except Exception as e:
         print(f"Error in lambda_handler: {str(e)}")
         return {
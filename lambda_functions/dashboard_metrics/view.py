@@ -0,0 +1,436 @@
+"""
+대시보드 materialized view
+
+DashboardSnapshot 테이블의 항목 하나에 모든 누적기 상태를 저장합니다. 원본 테이블의
+DynamoDB Streams 레코드가 들어오면 OldImage를 제거(sign=-1)하고 NewImage를 추가(sign=1)해
+변경분만 반영하므로, 대시보드 조회는 항목 하나를 읽는 것으로 끝납니다.
+
+직원 수에 비례해 커지는 직원별 프로젝트 배정 건수는 view 항목에 넣지 않고 직원 ID 해시로
+나눈 배정 항목(dashboard#assignments#NN#<version>)에 저장해, view 항목이 DynamoDB 항목 크기
+제한을 넘지 않게 합니다. 배정 항목은 덮어쓰지 않고 새 version 키로 쓴 뒤 view 항목이 가리키는
+키를 바꾸므로, view 항목 하나의 조건부 쓰기로 함께 반영됩니다.
+
+동시 갱신은 version 토큰 조건부 쓰기로 막고, 충돌 시 다시 읽어 재적용합니다.
+"""
+
+import json
+import uuid
+import zlib
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.exceptions import ClientError
+
+try:
+    from accumulators import (
+        ACCUMULATORS, DashboardAccumulator, assigned_member_ids, assignment_accumulators, feed_items
+    )
+except ImportError:
+    from lambda_functions.dashboard_metrics.accumulators import (
+        ACCUMULATORS, DashboardAccumulator, assigned_member_ids, assignment_accumulators, feed_items
+    )
+
+# view 항목 키
+DASHBOARD_VIEW_ID = 'dashboard'
+
+# 누적 상태 형식 버전 (저장된 view의 버전이 다르면 전체 재집계)
+VIEW_STATE_VERSION = 2
+
+# 직원별 배정 건수를 나눠 저장하는 항목 수
+ASSIGNMENT_BUCKETS = 32
+
+# view/배정 항목 최대 크기 (DynamoDB 항목 크기 제한 400KB에 여유를 둠)
+MAX_VIEW_ITEM_BYTES = 350 * 1024
+
+# 조건부 쓰기 충돌 시 재시도 횟수
+VIEW_UPDATE_MAX_RETRIES = 5
+
+_deserializer = TypeDeserializer()
+
+
+class ViewTooLargeError(ValueError):
+    """저장할 view 항목이 최대 크기를 넘는 경우"""
+
+
+class DashboardView:
+    """
+    저장된 대시보드 view
+
+    Attributes:
+        accumulators: 지표 키별 누적기
+        failed_keys: 재집계 중 오류가 나 기본값으로 응답하는 지표 키
+        version: 조건부 쓰기용 version 토큰 (저장 전이면 None)
+        updated_at: 마지막 갱신 시각
+        assignment_refs: 배정 항목 번호별 현재 배정 항목 키
+        assignment_buckets: 불러온 배정 항목 번호 (저장할 때 이 항목들만 새로 씀)
+    """
+
+    def __init__(
+        self,
+        accumulators: Dict[str, DashboardAccumulator],
+        failed_keys: Optional[List[str]] = None,
+        version: Optional[str] = None,
+        updated_at: Optional[str] = None,
+        assignment_refs: Optional[Dict[str, str]] = None
+    ):
+        self.accumulators = accumulators
+        self.failed_keys = list(failed_keys or [])
+        self.version = version
+        self.updated_at = updated_at
+        self.assignment_refs = dict(assignment_refs or {})
+        self.assignment_buckets: List[str] = []
+
+    def assignment_sources(self) -> List[DashboardAccumulator]:
+        """직원별 배정 건수를 가진 누적기 (재집계에서 실패한 지표 제외)"""
+        return [
+            accumulator for accumulator in assignment_accumulators(self.accumulators)
+            if accumulator.key not in self.failed_keys
+        ]
+
+    def results(self, keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """지표 키별 결과 (등록 순서, keys가 있으면 해당 지표만)"""
+        if keys is not None:
+            keys = set(keys)
+        results = {}
+        for key, accumulator in self.accumulators.items():
+            if keys is not None and key not in keys:
+                continue
+            try:
+                if key in self.failed_keys:
+                    results[key] = accumulator.default()
+                else:
+                    results[key] = accumulator.result()
+            except Exception as e:
+                print(f"Error in {key} view result: {str(e)}")
+                results[key] = accumulator.default()
+        return results
+
+
+def _json_default(value: Any) -> Any:
+    """누적 상태의 Decimal 값을 JSON 숫자로 변환"""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def assignment_bucket(employee_id: str) -> str:
+    """직원 ID가 속한 배정 항목 번호"""
+    return f"{zlib.crc32(str(employee_id).encode('utf-8')) % ASSIGNMENT_BUCKETS:02d}"
+
+
+def _assignment_item_id(bucket: str, version: str) -> str:
+    """배정 항목 번호와 view version의 배정 항목 키"""
+    return f"{DASHBOARD_VIEW_ID}#assignments#{bucket}#{version}"
+
+
+def _check_item_size(item: Dict[str, Any]) -> None:
+    """
+    저장할 항목 크기 확인 (속성 이름과 문자열 값의 UTF-8 길이 합으로 근사)
+
+    Raises:
+        ViewTooLargeError: 항목이 MAX_VIEW_ITEM_BYTES를 넘는 경우
+    """
+    size = sum(
+        len(name.encode('utf-8')) + len(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+        for name, value in item.items()
+    )
+    if size > MAX_VIEW_ITEM_BYTES:
+        raise ViewTooLargeError(
+            f"Dashboard view item {item['snapshot_id']} is {size} bytes (limit {MAX_VIEW_ITEM_BYTES})"
+        )
+
+
+def load_view(table) -> Optional[DashboardView]:
+    """
+    저장된 view 조회 (직원별 배정 건수는 불러오지 않음)
+
+    Args:
+        table: DashboardSnapshot 테이블 리소스
+
+    Returns:
+        DashboardView: 저장된 view (없거나, 오래된 view로 표시되었거나, 상태 형식이 다르거나,
+            등록된 지표가 빠져 있으면 None)
+    """
+    response = table.get_item(Key={'snapshot_id': DASHBOARD_VIEW_ID}, ConsistentRead=True)
+    item = response.get('Item')
+    if not item:
+        return None
+
+    if item.get('stale'):
+        # 변경분을 반영하지 못한 view (재집계로 저장되면 표시가 사라짐)
+        print("Dashboard view is marked stale")
+        return None
+
+    if int(item.get('state_version', 1)) != VIEW_STATE_VERSION:
+        # 이전 형식으로 저장된 view
+        print(f"Dashboard view state version is {item.get('state_version', 1)}, rebuilding")
+        return None
+
+    states = json.loads(item['state'])
+    missing = [key for key in ACCUMULATORS if key not in states]
+    if missing:
+        # 새 지표가 추가된 뒤 아직 재집계되지 않은 view
+        print(f"Dashboard view is missing metrics: {missing}")
+        return None
+
+    accumulators = {key: ACCUMULATORS[key].from_state(states[key]) for key in ACCUMULATORS}
+    return DashboardView(
+        accumulators,
+        failed_keys=item.get('failed_keys', []),
+        version=item.get('version'),
+        updated_at=item.get('updated_at'),
+        assignment_refs=item.get('assignment_buckets', {})
+    )
+
+
+def load_assignments(table, view: DashboardView, employee_ids: Iterable[str]) -> bool:
+    """
+    직원들이 속한 배정 항목을 읽어 view의 배정 누적기에 불러옴
+
+    Args:
+        table: DashboardSnapshot 테이블 리소스
+        view: load_view로 읽은 view
+        employee_ids: 변경분에 포함된 직원 ID 목록
+
+    Returns:
+        bool: 모두 읽었으면 True (그 사이 다른 갱신이 저장되어 배정 항목이 지워졌으면 False)
+    """
+    sources = view.assignment_sources()
+    if not sources:
+        return True
+
+    buckets = sorted({assignment_bucket(employee_id) for employee_id in employee_ids})
+    for bucket in buckets:
+        counts = {}
+        item_id = view.assignment_refs.get(bucket)
+        if item_id:
+            item = table.get_item(Key={'snapshot_id': item_id}, ConsistentRead=True).get('Item')
+            if item is None:
+                return False
+            counts = json.loads(item['counts'])
+        for accumulator in sources:
+            accumulator.load_assignments(counts)
+    view.assignment_buckets = buckets
+    return True
+
+
+def _assignment_items(view: DashboardView, buckets: List[str], version: str) -> List[Dict[str, Any]]:
+    """새 version 키로 저장할 배정 항목 목록 (배정 항목 번호별 직원 배정 건수)"""
+    sources = view.assignment_sources()
+    if not sources:
+        return []
+
+    bucket_counts: Dict[str, Dict[str, int]] = {bucket: {} for bucket in buckets}
+    for employee_id, count in sources[0].assignments.items():
+        counts = bucket_counts.get(assignment_bucket(employee_id))
+        if counts is not None:
+            counts[employee_id] = count
+
+    return [
+        {
+            'snapshot_id': _assignment_item_id(bucket, version),
+            'counts': json.dumps(counts, ensure_ascii=False, default=_json_default)
+        }
+        for bucket, counts in bucket_counts.items()
+    ]
+
+
+def _delete_items(table, item_ids: Iterable[str]) -> None:
+    """더 이상 가리키지 않는 배정 항목 삭제 (실패해도 view에는 영향 없음)"""
+    try:
+        with table.batch_writer() as batch:
+            for item_id in item_ids:
+                batch.delete_item(Key={'snapshot_id': item_id})
+    except Exception as e:
+        print(f"Error deleting dashboard assignment items: {str(e)}")
+
+
+def save_view(table, view: DashboardView, overwrite: bool = False) -> None:
+    """
+    view 저장 (version 토큰 조건부 쓰기)
+
+    불러온 배정 항목(전체 재집계면 모든 배정 항목)을 새 version 키로 먼저 쓰고, view 항목이
+    새 키를 가리키도록 저장합니다. view 저장에 실패하면 새로 쓴 배정 항목을, 성공하면 이전
+    배정 항목을 지웁니다.
+
+    Args:
+        table: DashboardSnapshot 테이블 리소스
+        view: 저장할 view
+        overwrite: True면 조건 없이 덮어씀 (전체 재집계)
+
+    Raises:
+        ViewTooLargeError: view 또는 배정 항목이 최대 크기를 넘는 경우
+        ClientError: 다른 갱신이 먼저 저장된 경우 (ConditionalCheckFailedException)
+    """
+    version = uuid.uuid4().hex
+    if overwrite:
+        buckets = [f"{bucket:02d}" for bucket in range(ASSIGNMENT_BUCKETS)]
+        refs = {}
+    else:
+        buckets = view.assignment_buckets
+        refs = dict(view.assignment_refs)
+    assignment_items = _assignment_items(view, buckets, version)
+
+    replaced = []
+    for bucket, assignment_item in zip(buckets, assignment_items):
+        if bucket in view.assignment_refs:
+            replaced.append(view.assignment_refs[bucket])
+        refs[bucket] = assignment_item['snapshot_id']
+    if overwrite:
+        # 전체 재집계는 이전 배정 항목을 모두 대체
+        replaced = list(view.assignment_refs.values())
+
+    states = {key: accumulator.to_state() for key, accumulator in view.accumulators.items()}
+    item = {
+        'snapshot_id': DASHBOARD_VIEW_ID,
+        'version': version,
+        'state_version': VIEW_STATE_VERSION,
+        'updated_at': datetime.utcnow().isoformat() + 'Z',
+        'failed_keys': view.failed_keys,
+        'assignment_buckets': refs,
+        'state': json.dumps(states, ensure_ascii=False, default=_json_default)
+    }
+
+    for assignment_item in assignment_items:
+        _check_item_size(assignment_item)
+    _check_item_size(item)
+
+    put_kwargs = {'Item': item}
+    if not overwrite:
+        if view.version is None:
+            put_kwargs['ConditionExpression'] = 'attribute_not_exists(snapshot_id)'
+        else:
+            put_kwargs['ConditionExpression'] = 'version = :version'
+            put_kwargs['ExpressionAttributeValues'] = {':version': view.version}
+
+    if assignment_items:
+        with table.batch_writer() as batch:
+            for assignment_item in assignment_items:
+                batch.put_item(Item=assignment_item)
+
+    try:
+        table.put_item(**put_kwargs)
+    except Exception:
+        _delete_items(table, [assignment_item['snapshot_id'] for assignment_item in assignment_items])
+        raise
+
+    _delete_items(table, replaced)
+    view.version = item['version']
+    view.updated_at = item['updated_at']
+    view.assignment_refs = refs
+    view.assignment_buckets = []
+
+
+def mark_view_stale(table) -> None:
+    """
+    저장된 view를 오래된 view로 표시
+
+    변경분을 반영할 수 없는 경우(view 항목 크기 초과 등) 조회 요청이 원본 테이블을 직접
+    집계하도록 합니다. 전체 재집계로 view를 다시 저장하면 표시가 사라집니다.
+
+    Args:
+        table: DashboardSnapshot 테이블 리소스
+    """
+    try:
+        table.update_item(
+            Key={'snapshot_id': DASHBOARD_VIEW_ID},
+            UpdateExpression='SET stale = :stale',
+            ConditionExpression='attribute_exists(snapshot_id)',
+            ExpressionAttributeValues={':stale': True}
+        )
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
+            raise
+
+
+def record_table_name(record: Dict[str, Any]) -> str:
+    """Stream 레코드의 원본 테이블 이름 (arn:aws:dynamodb:...:table/<이름>/stream/...)"""
+    return record.get('eventSourceARN', '').split(':table/')[-1].split('/')[0]
+
+
+def record_images(record: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Stream 레코드의 (OldImage, NewImage)를 Python 딕셔너리로 변환"""
+    stream_record = record.get('dynamodb', {})
+    images = []
+    for name in ('OldImage', 'NewImage'):
+        image = stream_record.get(name)
+        images.append(
+            {key: _deserializer.deserialize(value) for key, value in image.items()} if image else None
+        )
+    return images[0], images[1]
+
+
+def apply_stream_records(
+    table,
+    records: List[Dict[str, Any]],
+    table_keys: Dict[str, str]
+) -> Optional[DashboardView]:
+    """
+    Stream 레코드 변경분을 view에 반영
+
+    Args:
+        table: DashboardSnapshot 테이블 리소스
+        records: DynamoDB Stream 레코드 목록
+        table_keys: 원본 테이블 이름별 스냅샷 키
+
+    Returns:
+        DashboardView: 갱신된 view (view가 없거나 변경분 적용 중 오류가 나 재집계가 필요하면 None)
+
+    Raises:
+        ClientError: 재시도 후에도 조건부 쓰기 충돌이 계속되는 경우
+    """
+    for attempt in range(VIEW_UPDATE_MAX_RETRIES):
+        view = load_view(table)
+        if view is None:
+            return None
+
+        # 재집계에서 이미 실패한 지표는 변경분도 적용하지 않음
+        accumulators = {
+            key: accumulator for key, accumulator in view.accumulators.items()
+            if key not in view.failed_keys
+        }
+        failed = {}
+
+        changes = []
+        employee_ids = set()
+        for record in records:
+            snapshot_key = table_keys.get(record_table_name(record))
+            if snapshot_key is None:
+                continue
+
+            old_image, new_image = record_images(record)
+            changes.append((snapshot_key, old_image, new_image))
+            if snapshot_key == 'projects':
+                for image in (old_image, new_image):
+                    if image:
+                        employee_ids.update(assigned_member_ids(image))
+
+        # 변경된 프로젝트의 배정 직원이 속한 배정 항목만 읽음
+        if employee_ids and not load_assignments(table, view, employee_ids):
+            print(f"Dashboard view changed while loading assignments, retrying ({attempt + 1}/{VIEW_UPDATE_MAX_RETRIES})")
+            continue
+
+        for snapshot_key, old_image, new_image in changes:
+            if old_image:
+                feed_items(accumulators, snapshot_key, [old_image], -1, failed)
+            if new_image:
+                feed_items(accumulators, snapshot_key, [new_image], 1, failed)
+
+        if failed:
+            print(f"Error applying dashboard deltas: {', '.join(f'{k}: {v}' for k, v in failed.items())}")
+            return None
+
+        try:
+            save_view(table, view)
+            return view
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
+                raise
+            print(f"Dashboard view update conflict, retrying ({attempt + 1}/{VIEW_UPDATE_MAX_RETRIES})")
+
+    raise ClientError(
+        {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'Dashboard view update retries exhausted'}},
+        'PutItem'
+    )
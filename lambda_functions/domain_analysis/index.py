@@ -8,10 +8,16 @@ Requirements: 4.1, 4.2, 4.3, 4.4
 import json
 import logging
 import os
+import sys
 from typing import Dict, Any, List, Set
 from decimal import Decimal
 import boto3
 
+# Lambda Layer의 common 모듈 경로 추가
+sys.path.insert(0, '/opt/python')
+
+from common.skill_index import get_default_index
+
 # 로깅 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -929,6 +935,10 @@ def find_transferable_employees(
     """
     전환 가능한 직원 찾기
     
+    기술 역색인이 있으면 주어진 직원 목록에서 비교할 직원만 추립니다. 호출하는 도메인
+    분석은 보유 기술 분포를 계산하려고 이미 전체 직원을 조회하므로, 색인은 Employees
+    스캔을 줄이지 않고 직원별 기술 비교만 줄입니다.
+    
     Args:
         employees: 직원 목록
         required_skills: 필요 기술 목록
@@ -938,6 +948,19 @@ def find_transferable_employees(
     """
     transferable = []
     
+    skill_index = get_default_index()
+    if skill_index is not None and required_skills:
+        # 기술 역색인으로 후보만 추림 (필요 기술 이름별로 세므로 정규화 일치 수 ≥ 아래 이름 일치 수)
+        counts: Dict[str, int] = {}
+        for skill in set(required_skills):
+            for user_id in skill_index.postings(skill):
+                counts[user_id] = counts.get(user_id, 0) + 1
+        candidate_ids = {
+            user_id for user_id, count in counts.items()
+            if count >= len(required_skills) * 0.3
+        }
+        employees = [employee for employee in employees if employee.get('user_id') in candidate_ids]
+    
     for employee in employees:
         employee_skills = set()
         skills = employee.get('skills', [])
@@ -20,6 +20,7 @@ sys.path.append('/opt/python')
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from common.models import Employee, BasicInfo, Skill, Education
+from common.response_cache import invalidate as invalidate_cache
 from common.utils import setup_logger, validate_email
 
 # 로거 설정
@@ -182,11 +183,13 @@ def create_employee(event_body: Dict[str, Any]) -> Dict[str, Any]:
             
             pending_table.put_item(Item=pending_data)
             logger.info(f"대기자 생성 완료: {candidate_id}")
+            invalidate_cache('pending_candidates')
             return pending_data
         else:
             # 일반 직원은 Employees 테이블에 저장
             employees_table.put_item(Item=employee.to_dynamodb())
             logger.info(f"직원 생성 완료: {user_id}")
+            invalidate_cache('employees')
             return employee.to_dynamodb()
     except ClientError as e:
         logger.error(f"DynamoDB 저장 실패: {str(e)}")
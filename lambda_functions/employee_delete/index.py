@@ -6,9 +6,15 @@ DynamoDB Employees 테이블에서 직원을 삭제합니다.
 
 import json
 import os
+import sys
 import boto3
 from botocore.exceptions import ClientError
 
+# Lambda Layer의 common 모듈 경로 추가
+sys.path.insert(0, '/opt/python')
+
+from common.response_cache import invalidate as invalidate_cache
+
 # DynamoDB 클라이언트
 dynamodb = boto3.resource('dynamodb', region_name='us-east-2')
 employees_table = dynamodb.Table(os.environ.get('EMPLOYEES_TABLE', 'Employees'))
@@ -70,6 +76,9 @@ def lambda_handler(event, context):
             print(f"DynamoDB 삭제 실패: {str(e)}")
             raise Exception(f"데이터베이스 삭제에 실패했습니다: {str(e)}")
         
+        # 직원 목록/대시보드 응답 캐시 무효화
+        invalidate_cache('employees')
+        
         # 성공 응답
         return {
             'statusCode': 200,
@@ -9,20 +9,77 @@ DB에 등록된 직원을 기준으로 상대 평가 수행
 4. 문화 적합성 (20%): self_introduction, role, education 기반 평가
 
 상대 평가: 각 항목별로 최고점자를 100점으로 하고 나머지는 비율로 환산
+
+코호트 통계: 직원별 임시 점수와 항목별 최고점/백분위를 EvaluationCohortStats 테이블에
+저장해 두고(stream_handler가 Employees 변경분으로 갱신), 평가 요청은 통계 항목 하나만 읽어
+상대 평가합니다. 요약에는 항목별 점수 분포(0.1점 단위 건수)를 함께 저장해 변경 전/후 점수만으로
+직원 수/최고점/백분위를 갱신합니다. 통계가 없거나 프로젝트 구성이 바뀌었으면 통계 갱신 Lambda에
+전체 재구성을 비동기로 요청합니다.
+기술 격차 분석의 동료 집단도 (경력 구간, 직책) 버킷별 기술 빈도로 같은 테이블에 저장합니다.
+버킷 구성원은 경계 버킷 비교에만 필요하므로 버킷 항목이 아니라 구성원별 항목으로 저장합니다.
 """
 
+import hashlib
 import json
+import math
 import os
+import uuid
 import boto3
+from botocore.exceptions import ClientError
+from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
 from decimal import Decimal
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 dynamodb = boto3.resource('dynamodb', region_name='us-east-2')
 bedrock = boto3.client('bedrock-runtime', region_name='us-east-2')
+lambda_client = boto3.client('lambda', region_name='us-east-2')
 
 EMPLOYEES_TABLE = os.environ.get('EMPLOYEES_TABLE', 'Employees')
 PROJECTS_TABLE = os.environ.get('PROJECTS_TABLE', 'Projects')
+EVALUATIONS_TABLE = os.environ.get('EVALUATIONS_TABLE', 'EmployeeEvaluations')
+COHORT_STATS_TABLE = os.environ.get('COHORT_STATS_TABLE', 'EvaluationCohortStats')
+# 코호트 통계를 재구성하는 Lambda (stream_handler)
+COHORT_STATS_UPDATER_FUNCTION = os.environ.get('COHORT_STATS_UPDATER_FUNCTION', 'EvaluationCohortStatsUpdater')
+
+# 코호트 통계 항목 키 (cohort 파티션 하나에 직원별 임시 점수와 요약 항목을 저장)
+COHORT_ID = 'employees'
+COHORT_SUMMARY_MEMBER = '#summary'
+
+# 상대 평가 항목 (임시 점수 키)
+SCORE_DIMENSIONS = ('tech_skill', 'project_experience', 'career_reliability', 'culture_fit')
+
+# 요약 항목에 저장하는 백분위
+COHORT_PERCENTILES = (25, 50, 75, 90)
+
+# 일괄 평가 결과의 EmployeeEvaluations 상태 (검토 대기열 pending과 구분)
+EVALUATION_STATUS_BATCH = 'batch'
+
+# 요약 항목 저장 형식 (점수 분포가 없던 이전 형식은 다시 집계)
+COHORT_SUMMARY_FORMAT = 2
+
+# 동료 코호트 버킷 파티션 (member_id = "{경력 구간}#{직책}")
+PEER_COHORT_ID = 'peers'
+
+# 동료 코호트 구성원 파티션 (member_id = "{경력 구간}#{직책}#{직원 ID}")
+PEER_MEMBER_COHORT_ID = 'peer_members'
+
+# 동료 코호트 저장 형식 버전 (요약의 버전이 다르면 전체 재구성)
+PEER_INDEX_FORMAT = 2
+
+# 버킷 조건부 쓰기 충돌 시 재시도 횟수
+PEER_BUCKET_MAX_RETRIES = 5
+
+# 동료로 보는 경력 차이(년)
+PEER_EXPERIENCE_RANGE = 3
+
+# 유사 직책 판단에 사용하는 직책 핵심 키워드
+ROLE_KEYWORDS = ('architect', 'developer', 'engineer', 'frontend', 'backend', 'devops', 'fullstack', 'ai', 'ml', 'data')
+
+# 프로젝트 매칭에 사용하는 앞쪽 프로젝트 수 (경험 점수 / 프로젝트 추천)
+EXPERIENCE_MATCH_PROJECTS = 10
+RECOMMENDATION_MATCH_PROJECTS = 20
 
 # 기술 난이도 가중치
 TECH_DIFFICULTY_WEIGHTS = {
@@ -53,7 +110,14 @@ def get_all_employees():
     """모든 직원 데이터 조회"""
     table = dynamodb.Table(EMPLOYEES_TABLE)
     response = table.scan()
-    return response.get('Items', [])
+    items = response.get('Items', [])
+    
+    # 페이지네이션 처리
+    while 'LastEvaluatedKey' in response:
+        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
+        items.extend(response.get('Items', []))
+    
+    return items
 
 
 def get_experience_years(emp_data: Dict) -> float:
@@ -76,6 +140,85 @@ def get_project_history(emp_data: Dict) -> List[Dict]:
     )
 
 
+def get_skill_names(employee_data: Dict) -> set:
+    """직원 보유 기술 이름 (소문자)"""
+    return set([
+        s.get('name', '').lower() if isinstance(s, dict) else str(s).lower()
+        for s in employee_data.get('skills', [])
+    ])
+
+
+class ProjectFeatureIndex:
+    """
+    프로젝트 요구 기술 비트셋 인덱스
+    
+    앞쪽 프로젝트들의 요구 기술(소문자)에 비트 번호를 붙이고 프로젝트마다 요구 기술 비트마스크를
+    만들어 둡니다. 직원 기술도 같은 비트마스크로 바꾸면 매칭 기술 수는 AND 결과의 비트 수입니다.
+    """
+    
+    def __init__(self, all_projects: List[Dict], limit: int = RECOMMENDATION_MATCH_PROJECTS):
+        self.skill_bits: Dict[str, int] = {}
+        # (프로젝트 순서, 프로젝트, 요구 기술 마스크, 요구 기술 수)
+        self.entries: List[Tuple[int, Dict, int, int]] = []
+        
+        for position, project in enumerate(all_projects[:limit]):
+            required_skills = project.get('required_skills', [])
+            if not isinstance(required_skills, list):
+                continue
+            required_set = set([str(s).lower() for s in required_skills])
+            mask = 0
+            for skill in required_set:
+                mask |= 1 << self.skill_bits.setdefault(skill, len(self.skill_bits))
+            self.entries.append((position, project, mask, len(required_set)))
+    
+    def skill_mask(self, skills: set) -> int:
+        """기술 이름 집합의 비트마스크 (어떤 프로젝트도 요구하지 않는 기술은 제외)"""
+        mask = 0
+        for skill in skills:
+            bit = self.skill_bits.get(skill)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+    
+    def match_counts(self, skill_mask: int, limit: Optional[int] = None) -> List[Tuple[Dict, int, int]]:
+        """
+        프로젝트별 매칭 기술 수
+        
+        Args:
+            skill_mask: 직원 기술 비트마스크
+            limit: 앞쪽 프로젝트 수 (없으면 인덱스의 모든 프로젝트)
+        
+        Returns:
+            (프로젝트, 매칭 기술 수, 요구 기술 수) 목록 (프로젝트 순서 유지)
+        """
+        return [
+            (project, (mask & skill_mask).bit_count(), size)
+            for position, project, mask, size in self.entries
+            if limit is None or position < limit
+        ]
+
+
+# 마지막으로 만든 프로젝트 인덱스 (같은 프로젝트 목록으로 여러 직원을 평가할 때 재사용)
+_project_features_cache: Tuple[Optional[List[Dict]], Optional[ProjectFeatureIndex]] = (None, None)
+
+
+def get_project_features(all_projects: List[Dict]) -> ProjectFeatureIndex:
+    """
+    프로젝트 목록의 feature 인덱스 반환
+    
+    같은 목록 객체로 다시 호출하면 만들어 둔 인덱스를 재사용하므로, 요청 하나(또는 코호트 전체
+    계산)에서 인덱스는 한 번만 만들어집니다.
+    """
+    global _project_features_cache
+    cached_projects, cached_index = _project_features_cache
+    if cached_projects is all_projects and cached_index is not None:
+        return cached_index
+    
+    index = ProjectFeatureIndex(all_projects)
+    _project_features_cache = (all_projects, index)
+    return index
+
+
 def calculate_tech_skill_raw_score(employee_data: Dict) -> float:
     """기술역량 임시 점수 계산 (0~100)"""
     skills = employee_data.get('skills', [])
@@ -128,14 +271,18 @@ def calculate_tech_skill_raw_score(employee_data: Dict) -> float:
 def calculate_project_experience_raw_score(employee_data: Dict, all_projects: List[Dict]) -> float:
     """프로젝트 경험 임시 점수 계산 (0~100)"""
     projects = get_project_history(employee_data)
-    employee_skills = set([
-        s.get('name', '').lower() if isinstance(s, dict) else str(s).lower()
-        for s in employee_data.get('skills', [])
-    ])
     
     if not projects:
         return 20.0
     
+    # 프로젝트 매칭 점수 (직원 기술과 앞쪽 프로젝트 요구 기술의 매칭, 이력 프로젝트와 무관하므로 한 번만 계산)
+    features = get_project_features(all_projects)
+    skill_mask = features.skill_mask(get_skill_names(employee_data))
+    matching_score = sum(
+        match_count * 2
+        for _, match_count, _ in features.match_counts(skill_mask, EXPERIENCE_MATCH_PROJECTS)
+    )
+    
     total_score = 0.0
     
     for proj in projects:
@@ -161,16 +308,6 @@ def calculate_project_experience_raw_score(employee_data: Dict, all_projects: Li
         
         duration_bonus = min(duration_months / 2, 10)
         
-        # 프로젝트 매칭 점수
-        matching_score = 0
-        for project in all_projects[:10]:
-            required_skills = project.get('required_skills', [])
-            if isinstance(required_skills, list):
-                required_set = set([str(s).lower() for s in required_skills])
-                match_count = len(employee_skills & required_set)
-                if match_count > 0:
-                    matching_score += match_count * 2
-        
         proj_score = (base_score + duration_bonus) * role_weight + min(matching_score, 15)
         total_score += proj_score
     
@@ -259,45 +396,33 @@ def calculate_culture_fit_raw_score(employee_data: Dict) -> float:
     return min(100.0, raw_score)
 
 
-def calculate_relative_scores(employee_data: Dict, all_employees: List[Dict], all_projects: List[Dict]) -> Dict[str, float]:
-    """
-    상대 평가 점수 계산
-    1. 모든 직원의 임시 점수(raw_score) 계산
-    2. 각 항목별 최고점을 100점으로 환산
-    """
-    
-    # 1. 모든 직원의 임시 점수 계산
-    all_raw_scores = []
-    for emp in all_employees:
-        raw_scores = {
-            'tech_skill': calculate_tech_skill_raw_score(emp),
-            'project_experience': calculate_project_experience_raw_score(emp, all_projects),
-            'career_reliability': calculate_career_reliability_raw_score(emp),
-            'culture_fit': calculate_culture_fit_raw_score(emp)
-        }
-        all_raw_scores.append(raw_scores)
-    
-    # 2. 각 항목별 최대값 찾기
-    max_tech = max([s['tech_skill'] for s in all_raw_scores]) if all_raw_scores else 1
-    max_project = max([s['project_experience'] for s in all_raw_scores]) if all_raw_scores else 1
-    max_reliability = max([s['career_reliability'] for s in all_raw_scores]) if all_raw_scores else 1
-    max_culture = max([s['culture_fit'] for s in all_raw_scores]) if all_raw_scores else 1
-    
-    # 3. 현재 직원의 임시 점수 계산
-    employee_raw = {
+def calculate_raw_scores(employee_data: Dict, all_projects: List[Dict]) -> Dict[str, float]:
+    """직원 한 명의 항목별 임시 점수 계산"""
+    return {
         'tech_skill': calculate_tech_skill_raw_score(employee_data),
         'project_experience': calculate_project_experience_raw_score(employee_data, all_projects),
         'career_reliability': calculate_career_reliability_raw_score(employee_data),
         'culture_fit': calculate_culture_fit_raw_score(employee_data)
     }
+
+
+def relative_scores_from_raw(employee_raw: Dict[str, float], max_scores: Dict[str, float]) -> Dict[str, float]:
+    """
+    임시 점수를 항목별 최고점 기준 상대 점수로 환산
+    
+    최고점자 = 100점, 종합 점수는 가중 평균 (기술 30%, 프로젝트 30%, 신뢰도 20%, 문화 20%)
+    """
+    def relative(dimension: str) -> float:
+        max_score = max_scores.get(dimension, 1)
+        if max_score <= 0:
+            return 50.0
+        return round((employee_raw[dimension] / max_score) * 100, 1)
     
-    # 4. 상대 평가로 환산 (최고점자 = 100점)
-    technical_skills_score = round((employee_raw['tech_skill'] / max_tech) * 100, 1) if max_tech > 0 else 50.0
-    project_experience_score = round((employee_raw['project_experience'] / max_project) * 100, 1) if max_project > 0 else 50.0
-    career_reliability_score = round((employee_raw['career_reliability'] / max_reliability) * 100, 1) if max_reliability > 0 else 50.0
-    cultural_fit_score = round((employee_raw['culture_fit'] / max_culture) * 100, 1) if max_culture > 0 else 50.0
+    technical_skills_score = relative('tech_skill')
+    project_experience_score = relative('project_experience')
+    career_reliability_score = relative('career_reliability')
+    cultural_fit_score = relative('culture_fit')
     
-    # 5. 종합 점수 계산 (가중 평균: 기술 30%, 프로젝트 30%, 신뢰도 20%, 문화 20%)
     overall_score = round(
         technical_skills_score * 0.3 +
         project_experience_score * 0.3 +
@@ -315,6 +440,307 @@ def calculate_relative_scores(employee_data: Dict, all_employees: List[Dict], al
     }
 
 
+def score_bin(value: float) -> str:
+    """점수 분포 건수 키 (0.1점 단위)"""
+    return f"{value:.1f}"
+
+
+def histogram_percentiles(histogram: Dict[str, Any]) -> Dict[str, float]:
+    """점수 분포로 nearest-rank 백분위 계산 (0.1점 단위)"""
+    bins = sorted((float(value), int(count)) for value, count in histogram.items() if count > 0)
+    total = sum(count for _, count in bins)
+    percentiles = {}
+    for p in COHORT_PERCENTILES:
+        rank = max(1, -(-p * total // 100))
+        cumulative = 0
+        percentiles[f"p{p}"] = 0.0
+        for value, count in bins:
+            cumulative += count
+            if cumulative >= rank:
+                percentiles[f"p{p}"] = value
+                break
+    return percentiles
+
+
+def summarize_raw_scores(raw_scores: List[Dict[str, float]]) -> Dict[str, Any]:
+    """
+    직원별 임시 점수로 코호트 요약 계산
+    
+    Returns:
+        dict: 항목별 최고점(max)과 최고점 보유자 수(max_count), 점수 분포(histogram),
+        백분위(percentiles, nearest-rank, 0.1점 단위), 직원 수(employee_count)
+    """
+    summary = {'max': {}, 'max_count': {}, 'histogram': {}, 'percentiles': {}, 'employee_count': len(raw_scores)}
+    
+    for dimension in SCORE_DIMENSIONS:
+        values = [raw[dimension] for raw in raw_scores]
+        histogram = {}
+        for value in values:
+            histogram[score_bin(value)] = histogram.get(score_bin(value), 0) + 1
+        summary['max'][dimension] = max(values) if values else 1
+        summary['max_count'][dimension] = values.count(max(values)) if values else 0
+        summary['histogram'][dimension] = histogram
+        summary['percentiles'][dimension] = histogram_percentiles(histogram)
+    
+    return summary
+
+
+def update_cohort_summary(
+    summary: Dict[str, Any],
+    changes: List[Tuple[Optional[Dict[str, float]], Optional[Dict[str, float]]]]
+) -> bool:
+    """
+    직원별 변경 전/후 임시 점수로 저장된 요약을 갱신 (직원 전체를 다시 읽지 않음)
+    
+    점수 분포와 직원 수는 변경분만큼 증감하고, 최고점은 최고점 보유자 수(max_count)와 함께
+    갱신합니다. 최고점 보유자가 모두 빠지고 더 높은 점수가 들어오지 않으면 다음 최고점을 알 수
+    없으므로 False를 반환합니다.
+    
+    Args:
+        summary: load_cohort_summary로 읽은 요약 (제자리에서 갱신)
+        changes: (변경 전 임시 점수, 변경 후 임시 점수) 목록 (추가/삭제는 한쪽이 None)
+    
+    Returns:
+        bool: 요약을 갱신했으면 True, 전체 임시 점수로 다시 집계해야 하면 False
+    """
+    count = int(summary['employee_count'])
+    for dimension in SCORE_DIMENSIONS:
+        histogram = summary['histogram'][dimension]
+        # 직원이 없으면 최고점이 없음 (저장된 최고점 1은 기본값)
+        max_score = summary['max'][dimension] if count else None
+        max_count = int(summary['max_count'][dimension]) if count else 0
+        
+        for old_raw, new_raw in changes:
+            if old_raw is not None:
+                value = old_raw[dimension]
+                key = score_bin(value)
+                histogram[key] = int(histogram.get(key, 0)) - 1
+                if histogram[key] <= 0:
+                    del histogram[key]
+                if max_score is not None and value >= max_score:
+                    max_count -= 1
+            if new_raw is not None:
+                value = new_raw[dimension]
+                key = score_bin(value)
+                histogram[key] = int(histogram.get(key, 0)) + 1
+                if max_score is None or value > max_score:
+                    max_score, max_count = value, 1
+                elif value == max_score:
+                    max_count += 1
+        
+        if histogram and max_count <= 0:
+            return False
+        summary['max'][dimension] = max_score if histogram else 1
+        summary['max_count'][dimension] = max_count if histogram else 0
+        summary['percentiles'][dimension] = histogram_percentiles(histogram)
+    
+    for old_raw, new_raw in changes:
+        count += (new_raw is not None) - (old_raw is not None)
+    summary['employee_count'] = count
+    return True
+
+
+def calculate_relative_scores(employee_data: Dict, all_employees: List[Dict], all_projects: List[Dict]) -> Dict[str, float]:
+    """
+    상대 평가 점수 계산
+    1. 모든 직원의 임시 점수(raw_score) 계산
+    2. 각 항목별 최고점을 100점으로 환산
+    """
+    all_raw_scores = [calculate_raw_scores(emp, all_projects) for emp in all_employees]
+    summary = summarize_raw_scores(all_raw_scores)
+    return relative_scores_from_raw(calculate_raw_scores(employee_data, all_projects), summary['max'])
+
+
+def projects_signature(all_projects: List[Dict]) -> str:
+    """
+    프로젝트 경험 임시 점수에 영향을 주는 프로젝트 구성의 서명
+    
+    프로젝트 매칭 점수는 앞쪽 10개 프로젝트의 요구 기술만 사용하므로 그 부분만 해시합니다.
+    서명이 바뀌면 저장된 임시 점수를 다시 계산해야 합니다.
+    """
+    basis = []
+    for project in all_projects[:10]:
+        required_skills = project.get('required_skills', [])
+        if isinstance(required_skills, list):
+            basis.append(sorted({str(s).lower() for s in required_skills}))
+        else:
+            basis.append(None)
+    return hashlib.sha256(json.dumps(basis).encode('utf-8')).hexdigest()[:16]
+
+
+def _to_decimal(value: Any) -> Any:
+    """float 값을 DynamoDB에 저장할 수 있도록 Decimal로 변환"""
+    if isinstance(value, float):
+        return Decimal(str(round(value, 4)))
+    if isinstance(value, dict):
+        return {k: _to_decimal(v) for k, v in value.items()}
+    return value
+
+
+def _to_float(value: Any) -> Any:
+    """DynamoDB Decimal 값을 float로 변환"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, dict):
+        return {k: _to_float(v) for k, v in value.items()}
+    return value
+
+
+def load_cohort_summary() -> Optional[Dict[str, Any]]:
+    """
+    저장된 코호트 요약 조회 (get_item 한 번)
+    
+    Returns:
+        요약 항목 (없거나 통계 테이블을 읽을 수 없으면 None)
+    """
+    try:
+        response = dynamodb.Table(COHORT_STATS_TABLE).get_item(
+            Key={'cohort': COHORT_ID, 'member_id': COHORT_SUMMARY_MEMBER}
+        )
+    except ClientError as e:
+        print(f"Cohort stats unavailable: {str(e)}")
+        return None
+    
+    item = response.get('Item')
+    return _to_float(item) if item else None
+
+
+def load_cohort_raw_scores() -> Dict[str, Dict[str, float]]:
+    """저장된 직원별 임시 점수 조회"""
+    table = dynamodb.Table(COHORT_STATS_TABLE)
+    query_kwargs = {'KeyConditionExpression': Key('cohort').eq(COHORT_ID)}
+    raw_by_employee = {}
+    while True:
+        response = table.query(**query_kwargs)
+        for item in response.get('Items', []):
+            if item['member_id'] != COHORT_SUMMARY_MEMBER:
+                raw_by_employee[item['member_id']] = _to_float(item['raw_scores'])
+        if 'LastEvaluatedKey' not in response:
+            break
+        query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    return raw_by_employee
+
+
+def save_cohort_summary(raw_by_employee: Dict[str, Dict[str, float]], signature: str) -> Dict[str, Any]:
+    """직원별 임시 점수로 요약을 계산해 저장"""
+    summary = summarize_raw_scores(list(raw_by_employee.values()))
+    summary['projects_signature'] = signature
+    return put_cohort_summary(summary)
+
+
+def put_cohort_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """요약 항목 저장 (현재 저장 형식으로 표시)"""
+    summary['peer_index_format'] = PEER_INDEX_FORMAT
+    summary['summary_format'] = COHORT_SUMMARY_FORMAT
+    summary['updated_at'] = datetime.now().isoformat()
+    
+    dynamodb.Table(COHORT_STATS_TABLE).put_item(Item=_to_decimal({
+        'cohort': COHORT_ID,
+        'member_id': COHORT_SUMMARY_MEMBER,
+        **summary
+    }))
+    return summary
+
+
+def cohort_stats_stale(summary: Optional[Dict[str, Any]], signature: str) -> bool:
+    """통계가 없거나, 프로젝트 서명이 다르거나, 요약/동료 코호트 저장 형식이 이전 버전이면 True"""
+    return (
+        summary is None
+        or summary.get('projects_signature') != signature
+        or summary.get('summary_format') != COHORT_SUMMARY_FORMAT
+        or summary.get('peer_index_format') != PEER_INDEX_FORMAT
+    )
+
+
+def compute_cohort_raw_scores(all_employees: List[Dict], all_projects: List[Dict]) -> Dict[str, Dict[str, float]]:
+    """전체 직원의 임시 점수를 한 번에 계산 (직원 ID별)"""
+    return {
+        emp['user_id']: calculate_raw_scores(emp, all_projects)
+        for emp in all_employees if emp.get('user_id')
+    }
+
+
+def rebuild_cohort_stats(
+    all_employees: List[Dict],
+    all_projects: List[Dict],
+    raw_by_employee: Optional[Dict[str, Dict[str, float]]] = None
+) -> Dict[str, Any]:
+    """
+    전체 직원으로 코호트 통계 재구성 (배치)
+    
+    현재 직원에게 없는 임시 점수 항목은 삭제합니다.
+    
+    Args:
+        all_employees: 전체 직원
+        all_projects: 전체 프로젝트
+        raw_by_employee: 이미 계산한 직원별 임시 점수 (없으면 계산)
+    
+    Returns:
+        dict: 저장한 요약
+    """
+    if raw_by_employee is None:
+        raw_by_employee = compute_cohort_raw_scores(all_employees, all_projects)
+    
+    table = dynamodb.Table(COHORT_STATS_TABLE)
+    stale = [user_id for user_id in load_cohort_raw_scores() if user_id not in raw_by_employee]
+    with table.batch_writer() as batch:
+        for user_id in stale:
+            batch.delete_item(Key={'cohort': COHORT_ID, 'member_id': user_id})
+        for user_id, raw in raw_by_employee.items():
+            batch.put_item(Item={'cohort': COHORT_ID, 'member_id': user_id, 'raw_scores': _to_decimal(raw)})
+    
+    summary = save_cohort_summary(raw_by_employee, projects_signature(all_projects))
+    rebuild_peer_index(all_employees)
+    print(f"Cohort stats rebuilt: {len(raw_by_employee)} employees, {len(stale)} removed")
+    return summary
+
+
+def request_cohort_rebuild() -> None:
+    """
+    통계 갱신 Lambda에 코호트 통계 재구성을 비동기 요청
+    
+    빈 변경분으로 호출하므로 이미 재구성된 뒤 처리되는 중복 요청은 아무것도 하지 않습니다.
+    """
+    try:
+        lambda_client.invoke(
+            FunctionName=COHORT_STATS_UPDATER_FUNCTION,
+            InvocationType='Event',
+            Payload=json.dumps({'Records': []})
+        )
+    except ClientError as e:
+        print(f"Cohort stats rebuild request failed: {str(e)}")
+
+
+def evaluate_relative_scores(
+    employee_data: Dict,
+    all_projects: List[Dict],
+    all_employees: Optional[List[Dict]] = None
+) -> Dict[str, float]:
+    """
+    저장된 코호트 통계로 상대 평가 점수 계산
+    
+    요약 항목 하나와 평가 대상 직원의 임시 점수만 사용합니다. 통계가 오래됐으면 재구성을
+    비동기로 요청하고(API 요청 시간 안에 재구성하지 않음) 재구성이 끝날 때까지 이전 최고점으로
+    평가합니다. 통계가 아예 없을 때만 전체 직원으로 계산합니다(all_employees가 없으면 조회).
+    """
+    summary = load_cohort_summary()
+    if cohort_stats_stale(summary, projects_signature(all_projects)):
+        request_cohort_rebuild()
+        if summary is None or 'max' not in summary:
+            if all_employees is None:
+                all_employees = get_all_employees()
+            return calculate_relative_scores(employee_data, all_employees, all_projects)
+    
+    employee_raw = calculate_raw_scores(employee_data, all_projects)
+    
+    # 통계 갱신 전에 점수가 오른 직원도 100점을 넘지 않도록 보정
+    max_scores = {
+        dimension: max(summary['max'].get(dimension, 1), employee_raw[dimension])
+        for dimension in SCORE_DIMENSIONS
+    }
+    return relative_scores_from_raw(employee_raw, max_scores)
+
+
 def get_all_projects():
     """모든 프로젝트 데이터 조회"""
     try:
@@ -327,28 +753,19 @@ def get_all_projects():
 
 def generate_project_recommendations(employee_data: Dict, all_projects: List[Dict], scores: Dict) -> List[Dict]:
     """프로젝트 매칭 추천"""
-    employee_skills = set([
-        s.get('name', '').lower() if isinstance(s, dict) else str(s).lower()
-        for s in employee_data.get('skills', [])
-    ])
+    features = get_project_features(all_projects)
+    skill_mask = features.skill_mask(get_skill_names(employee_data))
     
     role = employee_data.get('basic_info', {}).get('role', employee_data.get('role', '')).lower()
     
     recommendations = []
     
-    for proj in all_projects[:20]:
-        required_skills = proj.get('required_skills', [])
-        if not isinstance(required_skills, list):
-            continue
-        
-        required_set = set([str(s).lower() for s in required_skills])
-        match_count = len(employee_skills & required_set)
-        
+    for proj, match_count, required_count in features.match_counts(skill_mask, RECOMMENDATION_MATCH_PROJECTS):
         if match_count == 0:
             continue
         
         # 적합도 점수 계산
-        skill_match_score = (match_count / len(required_set)) * 60 if required_set else 0
+        skill_match_score = (match_count / required_count) * 60 if required_count else 0
         role_match_score = 20 if any(r in role for r in ['architect', 'lead', 'senior']) else 10
         experience_score = min(scores.get('overall_score', 0) * 0.2, 20)
         
@@ -374,97 +791,421 @@ def generate_project_recommendations(employee_data: Dict, all_projects: List[Dic
     return recommendations[:3]
 
 
-def analyze_skill_gaps(employee_data: Dict, all_employees: List[Dict]) -> Dict[str, Any]:
-    """같은 직책의 비슷한 경력자들과 비교하여 부족한 기술 분석"""
-    experience_years = get_experience_years(employee_data)
-    role = employee_data.get('basic_info', {}).get('role', employee_data.get('role', '')).lower()
-    employee_skills = set([
-        s.get('name', '').lower() if isinstance(s, dict) else str(s).lower()
-        for s in employee_data.get('skills', [])
-    ])
+def get_role(emp_data: Dict) -> str:
+    """직책 (소문자)"""
+    return emp_data.get('basic_info', {}).get('role', emp_data.get('role', '')).lower()
+
+
+def role_keywords(role: str) -> frozenset:
+    """직책에 포함된 핵심 키워드"""
+    return frozenset(keyword for keyword in ROLE_KEYWORDS if keyword in role)
+
+
+def experience_band(experience_years: float) -> int:
+    """경력 구간 (1년 단위, 음수 경력은 0년으로 봄)"""
+    return max(0, int(math.floor(experience_years)))
+
+
+class PeerCohortIndex:
+    """
+    동료 코호트 인덱스
     
-    # 같은 직책 또는 유사 직책 찾기
-    similar_employees = []
-    for emp in all_employees:
-        emp_role = emp.get('basic_info', {}).get('role', emp.get('role', '')).lower()
-        emp_exp = get_experience_years(emp)
+    직원을 (경력 구간, 직책) 버킷으로 나누고 버킷마다 인원수, 기술 빈도, 구성원(경력, 기술)을
+    유지합니다. 같은 직책이거나 핵심 키워드를 공유하는 직책의 버킷 중 경력 차이가 2구간 이내인
+    버킷은 경력 ±3년 안에 모두 들어가므로 빈도를 그대로 더하고, 3구간 떨어진 경계 버킷만
+    구성원 경력을 확인합니다.
+    """
+    
+    def __init__(self, buckets: Optional[Dict[Tuple[int, str], Dict[str, Any]]] = None):
+        self.buckets: Dict[Tuple[int, str], Dict[str, Any]] = buckets if buckets is not None else {}
+    
+    @classmethod
+    def from_employees(cls, employees: List[Dict]) -> 'PeerCohortIndex':
+        """직원 목록으로 인덱스 생성"""
+        index = cls()
+        for emp in employees:
+            index.add(emp)
+        return index
+    
+    @staticmethod
+    def bucket_key(emp_data: Dict) -> Tuple[int, str]:
+        """직원의 (경력 구간, 직책) 버킷 키"""
+        return experience_band(get_experience_years(emp_data)), get_role(emp_data)
+    
+    def add(self, emp_data: Dict) -> None:
+        """직원 추가 (같은 버킷에 이미 있으면 교체)"""
+        user_id = emp_data.get('user_id')
+        if not user_id:
+            return
+        
+        self.remove(emp_data)
+        self.add_member(self.bucket_key(emp_data), user_id, self.member_entry(emp_data))
+    
+    @staticmethod
+    def member_entry(emp_data: Dict) -> Dict[str, Any]:
+        """버킷 구성원 정보 (경력, 소문자 기술 이름 목록)"""
+        skills = []
+        for skill in emp_data.get('skills', []):
+            if isinstance(skill, dict):
+                skill_name = skill.get('name', '').lower()
+                if skill_name:
+                    skills.append(skill_name)
+        return {'experience_years': get_experience_years(emp_data), 'skills': skills}
+    
+    def add_member(self, key: Tuple[int, str], user_id: str, member: Dict[str, Any]) -> None:
+        """버킷에 구성원 추가"""
+        bucket = self.buckets.setdefault(key, {'member_count': 0, 'skill_counts': {}, 'members': {}})
+        bucket['members'][user_id] = member
+        bucket['member_count'] += 1
+        for skill_name in member['skills']:
+            bucket['skill_counts'][skill_name] = bucket['skill_counts'].get(skill_name, 0) + 1
+    
+    def remove(self, emp_data: Dict) -> None:
+        """직원 제거 (emp_data의 경력/직책으로 버킷을 찾음)"""
+        key = self.bucket_key(emp_data)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            return
+        member = bucket['members'].pop(emp_data.get('user_id'), None)
+        if member is None:
+            return
+        
+        bucket['member_count'] -= 1
+        for skill_name in member['skills']:
+            count = bucket['skill_counts'].get(skill_name, 0) - 1
+            if count > 0:
+                bucket['skill_counts'][skill_name] = count
+            else:
+                bucket['skill_counts'].pop(skill_name, None)
+        if bucket['member_count'] <= 0:
+            del self.buckets[key]
+    
+    def peer_stats(self, employee_data: Dict) -> Tuple[int, Dict[str, int]]:
+        """
+        같은/유사 직책이고 경력 ±3년인 동료 수와 동료 기술 빈도
+        
+        Returns:
+            tuple: (동료 수, 기술 이름(소문자)별 보유 동료 수)
+        """
+        experience_years = get_experience_years(employee_data)
+        band = experience_band(experience_years)
+        role = get_role(employee_data)
+        keywords = role_keywords(role)
+        
+        peer_count = 0
+        skill_counts: Dict[str, int] = {}
+        for (bucket_band, bucket_role), bucket in self.buckets.items():
+            distance = abs(bucket_band - band)
+            if distance > PEER_EXPERIENCE_RANGE:
+                continue
+            if bucket_role != role and not (keywords & role_keywords(bucket_role)):
+                continue
+            
+            if distance < PEER_EXPERIENCE_RANGE:
+                # 버킷 전체가 경력 범위 안
+                peer_count += bucket['member_count']
+                for skill_name, count in bucket['skill_counts'].items():
+                    skill_counts[skill_name] = skill_counts.get(skill_name, 0) + count
+                continue
+            
+            # 경계 버킷은 구성원 경력을 확인
+            for member in bucket.get('members', {}).values():
+                if abs(member['experience_years'] - experience_years) <= PEER_EXPERIENCE_RANGE:
+                    peer_count += 1
+                    for skill_name in member['skills']:
+                        skill_counts[skill_name] = skill_counts.get(skill_name, 0) + 1
         
-        # 같은 직책이거나 유사 직책 (예: Senior, Lead 등)
-        role_match = False
-        if role == emp_role:
-            role_match = True
+        return peer_count, skill_counts
+
+
+def _peer_bucket_member_id(key: Tuple[int, str]) -> str:
+    """버킷 키를 EvaluationCohortStats 정렬 키로 변환 (경력 구간 순으로 정렬됨)"""
+    band, role = key
+    return f"{band:03d}#{role}"
+
+
+def _peer_member_item_id(key: Tuple[int, str], user_id: str) -> str:
+    """구성원 항목 정렬 키 (버킷 정렬 키 접두사 + 직원 ID)"""
+    return f"{_peer_bucket_member_id(key)}#{user_id}"
+
+
+def _peer_bucket_from_item(item: Dict[str, Any]) -> Tuple[Tuple[int, str], Dict[str, Any]]:
+    """저장된 버킷 항목을 (버킷 키, 버킷)으로 변환"""
+    item = _to_float(item)
+    bucket = {
+        'member_count': int(item.get('member_count', 0)),
+        'skill_counts': {name: int(count) for name, count in item.get('skill_counts', {}).items()}
+    }
+    return (int(item['band']), item['role']), bucket
+
+
+def _query_items(**query_kwargs) -> List[Dict[str, Any]]:
+    """코호트 통계 테이블 Query 전체 페이지 조회"""
+    table = dynamodb.Table(COHORT_STATS_TABLE)
+    items = []
+    while True:
+        response = table.query(**query_kwargs)
+        items.extend(response.get('Items', []))
+        if 'LastEvaluatedKey' not in response:
+            break
+        query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    return items
+
+
+def query_peer_members(lower: int, upper: int) -> Dict[Tuple[int, str], Dict[str, Dict[str, Any]]]:
+    """경력 구간 범위의 버킷별 구성원 조회 (버킷 키별 {직원 ID: 구성원})"""
+    items = _query_items(
+        KeyConditionExpression=Key('cohort').eq(PEER_MEMBER_COHORT_ID) & Key('member_id').between(
+            f"{lower:03d}#", f"{upper:03d}$"
+        ),
+        ConsistentRead=True
+    )
+    members: Dict[Tuple[int, str], Dict[str, Dict[str, Any]]] = {}
+    for item in items:
+        item = _to_float(item)
+        members.setdefault((int(item['band']), item['role']), {})[item['user_id']] = {
+            'experience_years': item['experience_years'],
+            'skills': list(item.get('skills', []))
+        }
+    return members
+
+
+def save_peer_members(changes: List[Tuple[Optional[Dict], Optional[Dict]]]) -> None:
+    """직원 변경분으로 구성원 항목 저장 (버킷이 바뀌었거나 삭제된 직원의 이전 항목은 삭제)"""
+    table = dynamodb.Table(COHORT_STATS_TABLE)
+    with table.batch_writer(overwrite_by_pkeys=['cohort', 'member_id']) as batch:
+        for old, new in changes:
+            new_id = None
+            if new and new.get('user_id'):
+                key = PeerCohortIndex.bucket_key(new)
+                new_id = _peer_member_item_id(key, new['user_id'])
+            if old and old.get('user_id'):
+                old_id = _peer_member_item_id(PeerCohortIndex.bucket_key(old), old['user_id'])
+                if old_id != new_id:
+                    batch.delete_item(Key={'cohort': PEER_MEMBER_COHORT_ID, 'member_id': old_id})
+            if new_id:
+                batch.put_item(Item=_to_decimal({
+                    'cohort': PEER_MEMBER_COHORT_ID,
+                    'member_id': new_id,
+                    'band': key[0],
+                    'role': key[1],
+                    'user_id': new['user_id'],
+                    **PeerCohortIndex.member_entry(new)
+                }))
+
+
+def refresh_peer_bucket(key: Tuple[int, str]) -> None:
+    """
+    저장된 구성원 항목으로 버킷 요약을 다시 집계해 저장 (version 토큰 조건부 쓰기)
+    
+    구성원 항목을 쓴 뒤 호출하므로, 다른 스트림 배치나 재구성과 겹쳐도 충돌 시 다시 읽어
+    마지막에 저장되는 요약은 구성원 항목과 일치합니다. 구성원이 없으면 요약을 삭제합니다.
+    
+    Raises:
+        ClientError: 재시도 후에도 조건부 쓰기 충돌이 계속되는 경우
+    """
+    table = dynamodb.Table(COHORT_STATS_TABLE)
+    bucket_key = {'cohort': PEER_COHORT_ID, 'member_id': _peer_bucket_member_id(key)}
+    
+    for attempt in range(PEER_BUCKET_MAX_RETRIES):
+        item = table.get_item(Key=bucket_key, ConsistentRead=True).get('Item')
+        if item is None:
+            condition = {'ConditionExpression': 'attribute_not_exists(member_id)'}
+        elif 'version' not in item:
+            condition = {'ConditionExpression': 'attribute_not_exists(version)'}
         else:
-            # 핵심 키워드 매칭
-            role_keywords = ['architect', 'developer', 'engineer', 'frontend', 'backend', 'devops', 'fullstack', 'ai', 'ml', 'data']
-            for keyword in role_keywords:
-                if keyword in role and keyword in emp_role:
-                    role_match = True
-                    break
-        
-        # 경력 ±3년 범위
-        if role_match and abs(emp_exp - experience_years) <= 3:
-            similar_employees.append(emp)
-    
-    if len(similar_employees) < 2:
+            condition = {
+                'ConditionExpression': 'version = :version',
+                'ExpressionAttributeValues': {':version': item['version']}
+            }
+        
+        # 요약 version을 읽은 뒤 구성원을 읽어야 그 사이의 갱신이 충돌로 드러남
+        index = PeerCohortIndex()
+        for user_id, member in query_peer_members(key[0], key[0]).get(key, {}).items():
+            index.add_member(key, user_id, member)
+        bucket = index.buckets.get(key)
+        
+        try:
+            if bucket is None:
+                if item is not None:
+                    table.delete_item(Key=bucket_key, **condition)
+            else:
+                table.put_item(Item=_to_decimal({
+                    **bucket_key,
+                    'band': key[0],
+                    'role': key[1],
+                    'member_count': bucket['member_count'],
+                    'skill_counts': bucket['skill_counts'],
+                    'version': uuid.uuid4().hex
+                }), **condition)
+            return
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
+                raise
+            print(f"Peer bucket update conflict, retrying ({attempt + 1}/{PEER_BUCKET_MAX_RETRIES})")
+    
+    raise ClientError(
+        {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'Peer bucket update retries exhausted'}},
+        'PutItem'
+    )
+
+
+def rebuild_peer_index(all_employees: List[Dict]) -> PeerCohortIndex:
+    """전체 직원으로 동료 코호트 버킷 재구성 (현재 직원에게 없는 버킷과 구성원은 삭제)"""
+    index = PeerCohortIndex.from_employees(all_employees)
+    
+    stored_keys = {
+        (int(item['band']), item['role'])
+        for item in _query_items(
+            KeyConditionExpression=Key('cohort').eq(PEER_COHORT_ID),
+            ProjectionExpression='band, #r',
+            ExpressionAttributeNames={'#r': 'role'}
+        )
+    }
+    stored_member_ids = {
+        item['member_id']
+        for item in _query_items(
+            KeyConditionExpression=Key('cohort').eq(PEER_MEMBER_COHORT_ID),
+            ProjectionExpression='member_id'
+        )
+    }
+    
+    current_member_ids = set()
+    with dynamodb.Table(COHORT_STATS_TABLE).batch_writer(overwrite_by_pkeys=['cohort', 'member_id']) as batch:
+        for key, bucket in index.buckets.items():
+            for user_id, member in bucket['members'].items():
+                member_id = _peer_member_item_id(key, user_id)
+                current_member_ids.add(member_id)
+                batch.put_item(Item=_to_decimal({
+                    'cohort': PEER_MEMBER_COHORT_ID,
+                    'member_id': member_id,
+                    'band': key[0],
+                    'role': key[1],
+                    'user_id': user_id,
+                    **member
+                }))
+        for member_id in stored_member_ids - current_member_ids:
+            batch.delete_item(Key={'cohort': PEER_MEMBER_COHORT_ID, 'member_id': member_id})
+    
+    for key in stored_keys | set(index.buckets):
+        refresh_peer_bucket(key)
+    print(f"Peer cohort index rebuilt: {len(index.buckets)} buckets")
+    return index
+
+
+def update_peer_index(changes: List[Tuple[Optional[Dict], Optional[Dict]]]) -> int:
+    """
+    직원 변경분을 동료 코호트 버킷에 반영
+    
+    구성원 항목을 먼저 쓰고 변경 전/후 버킷의 요약만 다시 집계하므로, 같은 배치를 다시
+    적용해도 결과가 같습니다.
+    
+    Args:
+        changes: (변경 전 직원, 변경 후 직원) 목록 (생성은 변경 전, 삭제는 변경 후가 None)
+    
+    Returns:
+        갱신한 버킷 수
+    """
+    keys = set()
+    for old, new in changes:
+        for emp in (old, new):
+            if emp:
+                keys.add(PeerCohortIndex.bucket_key(emp))
+    
+    save_peer_members(changes)
+    for key in sorted(keys):
+        refresh_peer_bucket(key)
+    return len(keys)
+
+
+def load_peer_index(employee_data: Dict) -> PeerCohortIndex:
+    """
+    평가 대상 직원의 동료 비교에 필요한 버킷만 조회
+    
+    경력 구간 차이가 3 이내인 버킷의 요약(인원수, 기술 빈도)을 읽고, 3인 경계 버킷은
+    구성원 항목까지 읽습니다.
+    """
+    band = experience_band(get_experience_years(employee_data))
+    index = PeerCohortIndex()
+    
+    items = _query_items(
+        KeyConditionExpression=Key('cohort').eq(PEER_COHORT_ID) & Key('member_id').between(
+            f"{max(0, band - PEER_EXPERIENCE_RANGE):03d}#", f"{band + PEER_EXPERIENCE_RANGE:03d}$"
+        ),
+        ProjectionExpression='band, #r, member_count, skill_counts',
+        ExpressionAttributeNames={'#r': 'role'}
+    )
+    for item in items:
+        key, bucket = _peer_bucket_from_item(item)
+        index.buckets[key] = bucket
+    
+    for boundary in (band - PEER_EXPERIENCE_RANGE, band + PEER_EXPERIENCE_RANGE):
+        if boundary < 0:
+            continue
+        for key, members in query_peer_members(boundary, boundary).items():
+            if key in index.buckets:
+                index.buckets[key]['members'] = members
+    
+    return index
+
+
+def analyze_skill_gaps(employee_data: Dict, peer_index: PeerCohortIndex) -> Dict[str, Any]:
+    """같은 직책의 비슷한 경력자들과 비교하여 부족한 기술 분석"""
+    employee_skills = get_skill_names(employee_data)
+    
+    # 같은 직책 또는 유사 직책, 경력 ±3년 동료의 기술 빈도
+    peer_count, peer_skill_counts = peer_index.peer_stats(employee_data)
+    
+    if peer_count < 2:
         return {
             'missing_skills': [],
             'recommended_skills': [],
-            'peer_comparison': f"비교 가능한 동료 데이터가 부족합니다 (현재 {len(similar_employees)}명)"
+            'peer_comparison': f"비교 가능한 동료 데이터가 부족합니다 (현재 {peer_count}명)"
         }
     
-    # 동료들이 가진 기술 통계
-    skill_frequency = {}
-    for emp in similar_employees:
-        emp_skills = emp.get('skills', [])
-        for skill in emp_skills:
-            if isinstance(skill, dict):
-                skill_name = skill.get('name', '').lower()
-                if skill_name and skill_name not in employee_skills:
-                    skill_frequency[skill_name] = skill_frequency.get(skill_name, 0) + 1
-    
-    # 빈도순으로 정렬
-    sorted_skills = sorted(skill_frequency.items(), key=lambda x: x[1], reverse=True)
+    # 직원이 보유하지 않은 기술만 빈도순(같으면 이름순)으로 정렬
+    sorted_skills = sorted(
+        ((skill_name, count) for skill_name, count in peer_skill_counts.items() if skill_name not in employee_skills),
+        key=lambda x: (-x[1], x[0])
+    )
     
     # 50% 이상의 동료가 가진 기술 = 필수 기술
-    threshold = len(similar_employees) * 0.5
+    threshold = peer_count * 0.5
     missing_skills = []
     recommended_skills = []
     
     for skill_name, count in sorted_skills:
-        percentage = (count / len(similar_employees)) * 100
+        percentage = (count / peer_count) * 100
         skill_info = {
             'name': skill_name.title(),
             'percentage': round(percentage, 1),
             'count': count,
-            'total': len(similar_employees)
+            'total': peer_count
         }
         
         if count >= threshold:
             missing_skills.append(skill_info)
-        elif count >= len(similar_employees) * 0.3:  # 30% 이상
+        elif count >= peer_count * 0.3:  # 30% 이상
             recommended_skills.append(skill_info)
     
     # 비교 메시지 생성
-    peer_comparison = f"같은 직책의 비슷한 경력자 {len(similar_employees)}명과 비교한 결과입니다."
+    peer_comparison = f"같은 직책의 비슷한 경력자 {peer_count}명과 비교한 결과입니다."
     
     return {
         'missing_skills': missing_skills[:5],  # 상위 5개
         'recommended_skills': recommended_skills[:5],  # 상위 5개
         'peer_comparison': peer_comparison,
-        'peer_count': len(similar_employees)
+        'peer_count': peer_count
     }
 
 
-def generate_ai_analysis(employee_data: Dict, scores: Dict, project_recommendations: List[Dict], all_employees: List[Dict]) -> Dict[str, Any]:
+def generate_ai_analysis(employee_data: Dict, scores: Dict, project_recommendations: List[Dict], skill_gap_analysis: Dict[str, Any]) -> Dict[str, Any]:
     """AI 분석 결과 생성 (규칙 기반)"""
     experience_years = get_experience_years(employee_data)
     skills = employee_data.get('skills', [])
     project_history = get_project_history(employee_data)
     role = employee_data.get('basic_info', {}).get('role', employee_data.get('role', ''))
     
-    # 기술 격차 분석
-    skill_gap_analysis = analyze_skill_gaps(employee_data, all_employees)
-    
     # 강점 분석
     strengths = []
     if experience_years >= 10:
@@ -551,7 +1292,7 @@ def generate_ai_analysis(employee_data: Dict, scores: Dict, project_recommendati
     }
 
 
-def analyze_with_ai(employee_data: Dict, all_projects: List[Dict], scores: Dict, all_employees: List[Dict]) -> Dict[str, Any]:
+def analyze_with_ai(employee_data: Dict, all_projects: List[Dict], scores: Dict, peer_index: PeerCohortIndex) -> Dict[str, Any]:
     """AI를 사용한 상세 분석 및 추천"""
     
     # 직원 정보 추출
@@ -598,11 +1339,11 @@ def analyze_with_ai(employee_data: Dict, all_projects: List[Dict], scores: Dict,
     if not recommended_roles:
         recommended_roles.append(role if role else "개발자")
     
-    # 규칙 기반 AI 분석 생성
-    analysis = generate_ai_analysis(employee_data, scores, project_recommendations, all_employees)
-    
     # 기술 격차 분석
-    skill_gap_analysis = analyze_skill_gaps(employee_data, all_employees)
+    skill_gap_analysis = analyze_skill_gaps(employee_data, peer_index)
+    
+    # 규칙 기반 AI 분석 생성
+    analysis = generate_ai_analysis(employee_data, scores, project_recommendations, skill_gap_analysis)
     
     # 추가 정보 포함
     analysis['deployable'] = deployable
@@ -613,6 +1354,296 @@ def analyze_with_ai(employee_data: Dict, all_projects: List[Dict], scores: Dict,
     return analysis
 
 
+def build_evaluation_result(employee_id: str, employee_data: Dict, scores: Dict, ai_analysis: Dict) -> Dict[str, Any]:
+    """평가 점수와 분석 결과로 평가 결과 구성"""
+    # 직원 이름 추출 (여러 형식 지원)
+    employee_name = (
+        employee_data.get('basic_info', {}).get('name') or
+        employee_data.get('name') or
+        employee_data.get('user_id') or
+        'Unknown'
+    )
+    
+    return {
+        'evaluation_id': f"eval_{employee_id}_{int(datetime.now().timestamp())}",
+        'employee_id': employee_id,
+        'employee_name': employee_name,
+        'evaluation_date': datetime.now().isoformat(),
+        'scores': {
+            'technical_skills': scores['technical_skills'],
+            'project_experience': scores['project_experience'],
+            'resume_credibility': scores['resume_credibility'],
+            'cultural_fit': scores['cultural_fit']
+        },
+        'overall_score': scores['overall_score'],
+        'strengths': ai_analysis.get('strengths', []),
+        'weaknesses': ai_analysis.get('weaknesses', []),
+        'analysis': {
+            'tech_stack': ai_analysis.get('tech_stack_analysis', ''),
+            'project_similarity': ai_analysis.get('project_similarity', ''),
+            'credibility': ai_analysis.get('credibility_check', ''),
+            'market_comparison': ai_analysis.get('market_comparison', '')
+        },
+        'ai_recommendation': ai_analysis.get('summary_comment', ''),
+        'deployable': ai_analysis.get('deployable', '추가 검토 필요'),
+        'recommended_roles': ai_analysis.get('recommended_roles', []),
+        'recommended_projects': ai_analysis.get('recommended_projects', []),
+        'skill_gap_analysis': ai_analysis.get('skill_gap_analysis', {}),
+        'project_history': get_project_history(employee_data),
+        'skills': employee_data.get('skills', []),
+        'experience_years': get_experience_years(employee_data),
+        'status': 'completed'
+    }
+
+
+def evaluation_record(evaluation_result: Dict[str, Any], submitted_at: str) -> Dict[str, Any]:
+    """
+    평가 결과를 EmployeeEvaluations 항목으로 변환
+    
+    평가 목록 화면이 읽는 형식(quantitative_analysis/qualitative_analysis)으로 저장합니다.
+    검토 대기열(pending)에 섞이지 않도록 상태는 batch로 두며, 평가 목록에서 status=batch로 조회합니다.
+    """
+    employee_id = evaluation_result['employee_id']
+    scores = evaluation_result['scores']
+    analysis = evaluation_result['analysis']
+    # 이력 신뢰도 70점 미만은 평가 문구와 같이 추가 검증 대상
+    verification_needed = scores['resume_credibility'] < 70
+    
+    record = {
+        'evaluation_id': evaluation_result['evaluation_id'],
+        'user_id': employee_id,
+        'name': evaluation_result['employee_name'],
+        'type': 'career',
+        'status': EVALUATION_STATUS_BATCH,
+        'overall_score': evaluation_result['overall_score'],
+        'submitted_at': submitted_at,
+        'evaluation_date': evaluation_result['evaluation_date'],
+        'source': 'batch',
+        'quantitative_analysis': {
+            'employee_id': employee_id,
+            'experience_metrics': {
+                'years_of_experience': evaluation_result['experience_years'],
+                'project_count': len(evaluation_result['project_history']),
+                'skill_diversity': len(evaluation_result['skills'])
+            },
+            'tech_stack_evaluation': {'overall_score': scores['technical_skills']},
+            'project_experience_scores': {'overall_score': scores['project_experience']},
+            'relative_scores': scores
+        },
+        'qualitative_analysis': {
+            'employee_id': employee_id,
+            'resume_analysis': {
+                'strengths': evaluation_result['strengths'],
+                'weaknesses': evaluation_result['weaknesses'],
+                'recommendations': [
+                    skill['name'] for skill in evaluation_result['skill_gap_analysis'].get('recommended_skills', [])
+                ]
+            },
+            'suspicious_content': {
+                'flagged_items': [analysis['credibility']] if verification_needed else [],
+                'verification_needed': verification_needed
+            },
+            'overall_evaluation': evaluation_result['ai_recommendation'],
+            'deployable': evaluation_result['deployable'],
+            'recommended_roles': evaluation_result['recommended_roles']
+        }
+    }
+    return json.loads(json.dumps(record, cls=DecimalEncoder), parse_float=Decimal)
+
+
+def evaluate_batch(employee_ids: Any) -> Dict[str, Any]:
+    """
+    여러 직원 일괄 평가
+    
+    직원과 프로젝트를 한 번씩만 조회하고, 전체 직원의 임시 점수를 한 번에 계산해 상대 평가합니다.
+    계산한 임시 점수로 코호트 통계도 갱신하며, 결과는 EmployeeEvaluations에 배치 쓰기로 저장합니다.
+    
+    Args:
+        employee_ids: 평가할 직원 ID 목록 또는 "all"
+    
+    Returns:
+        dict: 평가 수(evaluated), 평가 ID 목록(evaluation_ids), 찾지 못한 직원 ID(not_found)
+    """
+    all_employees = get_all_employees()
+    all_projects = get_all_projects()
+    employees_by_id = {emp['user_id']: emp for emp in all_employees if emp.get('user_id')}
+    
+    if employee_ids == 'all':
+        target_ids = list(employees_by_id)
+    else:
+        target_ids = list(dict.fromkeys(employee_ids))
+    not_found = [employee_id for employee_id in target_ids if employee_id not in employees_by_id]
+    
+    # 전체 직원 임시 점수 (한 번만 계산)
+    raw_by_employee = compute_cohort_raw_scores(all_employees, all_projects)
+    try:
+        summary = rebuild_cohort_stats(all_employees, all_projects, raw_by_employee)
+    except ClientError as e:
+        # 통계 저장에 실패해도 계산한 점수로 평가는 계속
+        print(f"Cohort stats rebuild failed: {str(e)}")
+        summary = summarize_raw_scores(list(raw_by_employee.values()))
+    
+    # 기술 격차 분석용 동료 인덱스 (메모리에서 한 번만 생성)
+    peer_index = PeerCohortIndex.from_employees(all_employees)
+    
+    submitted_at = datetime.now().isoformat()
+    evaluation_ids = []
+    with dynamodb.Table(EVALUATIONS_TABLE).batch_writer() as batch:
+        for employee_id in target_ids:
+            employee_data = employees_by_id.get(employee_id)
+            if employee_data is None:
+                continue
+            
+            scores = relative_scores_from_raw(raw_by_employee[employee_id], summary['max'])
+            ai_analysis = analyze_with_ai(employee_data, all_projects, scores, peer_index)
+            evaluation_result = build_evaluation_result(employee_id, employee_data, scores, ai_analysis)
+            
+            batch.put_item(Item=evaluation_record(evaluation_result, submitted_at))
+            evaluation_ids.append(evaluation_result['evaluation_id'])
+    
+    print(f"Batch evaluation completed: {len(evaluation_ids)} evaluated, {len(not_found)} not found")
+    return {
+        'evaluated': len(evaluation_ids),
+        'evaluation_ids': evaluation_ids,
+        'not_found': not_found
+    }
+
+
+def batch_handler(event, context):
+    """
+    일괄 평가 핸들러 (직접 호출/스케줄 실행용)
+    
+    Event:
+    {
+        "employee_ids": ["EMP_001", "EMP_002"] 또는 "all"
+    }
+    """
+    employee_ids = event.get('employee_ids')
+    if employee_ids != 'all' and (
+        not isinstance(employee_ids, list) or
+        not employee_ids or
+        not all(isinstance(employee_id, str) and employee_id for employee_id in employee_ids)
+    ):
+        return {
+            'statusCode': 400,
+            'body': json.dumps({'error': 'employee_ids must be a non-empty list of IDs or "all"'})
+        }
+    
+    try:
+        result = evaluate_batch(employee_ids)
+        return {
+            'statusCode': 200,
+            'body': json.dumps({'message': 'Batch evaluation completed', **result})
+        }
+    except Exception as e:
+        print(f"Error in batch_handler: {str(e)}")
+        raise
+
+
+_deserializer = TypeDeserializer()
+
+
+def apply_employee_changes(
+    records: List[Dict],
+    all_projects: List[Dict]
+) -> List[Tuple[Optional[Dict[str, float]], Optional[Dict[str, float]]]]:
+    """
+    Employees Stream 레코드를 코호트 통계에 반영
+    
+    바뀐 직원의 임시 점수만 다시 계산해 저장합니다. 동료 코호트 버킷은 변경 전/후 직원이
+    속한 버킷만 갱신합니다.
+    
+    Returns:
+        갱신하거나 삭제한 직원별 (이전에 저장된 임시 점수, 새 임시 점수) 목록 (요약 갱신용)
+    """
+    table = dynamodb.Table(COHORT_STATS_TABLE)
+    changed = {}
+    previous = {}
+    for record in records:
+        stream = record.get('dynamodb', {})
+        keys = {k: _deserializer.deserialize(v) for k, v in stream.get('Keys', {}).items()}
+        user_id = keys.get('user_id')
+        if not user_id:
+            continue
+        old_image = stream.get('OldImage')
+        new_image = stream.get('NewImage')
+        # 같은 배치에서 여러 번 바뀐 직원은 처음 이전 상태와 마지막 상태만 반영
+        if user_id not in previous:
+            previous[user_id] = {k: _deserializer.deserialize(v) for k, v in old_image.items()} if old_image else None
+        changed[user_id] = {k: _deserializer.deserialize(v) for k, v in new_image.items()} if new_image else None
+    
+    update_peer_index([(previous[user_id], employee) for user_id, employee in changed.items()])
+    
+    # 요약에 반영된 이전 점수는 저장된 항목 기준 (ALL_OLD로 쓰기와 함께 조회)
+    raw_changes = []
+    for user_id, employee in changed.items():
+        key = {'cohort': COHORT_ID, 'member_id': user_id}
+        if employee is None:
+            new_raw = None
+            response = table.delete_item(Key=key, ReturnValues='ALL_OLD')
+        else:
+            new_raw = _to_float(_to_decimal(calculate_raw_scores(employee, all_projects)))
+            response = table.put_item(
+                Item={**key, 'raw_scores': _to_decimal(new_raw)},
+                ReturnValues='ALL_OLD'
+            )
+        old_item = response.get('Attributes')
+        old_raw = _to_float(old_item['raw_scores']) if old_item else None
+        if old_raw is not None or new_raw is not None:
+            raw_changes.append((old_raw, new_raw))
+    
+    return raw_changes
+
+
+def stream_handler(event, context):
+    """
+    DynamoDB Streams 핸들러
+    Employees 변경분으로 코호트 통계 갱신 (Records가 없으면 전체 재구성, 빈 Records는 통계가
+    오래됐을 때만 재구성)
+    
+    처리에 실패하면 예외를 다시 발생시켜 Lambda가 같은 배치를 재시도하도록 합니다.
+    """
+    records = event.get('Records')
+    
+    try:
+        all_projects = get_all_projects()
+        signature = projects_signature(all_projects)
+        summary = load_cohort_summary()
+        
+        if records is None or cohort_stats_stale(summary, signature):
+            # 통계가 없거나 프로젝트 구성이 바뀌었으면 모든 임시 점수를 다시 계산
+            rebuild_cohort_stats(get_all_employees(), all_projects)
+            return {
+                'statusCode': 200,
+                'body': json.dumps({
+                    'message': 'Cohort stats rebuilt',
+                    'processed_records': len(records or [])
+                })
+            }
+        
+        raw_changes = apply_employee_changes(records, all_projects)
+        changed = len(raw_changes)
+        if raw_changes:
+            if update_cohort_summary(summary, raw_changes):
+                put_cohort_summary(summary)
+            else:
+                # 최고점이던 직원의 점수가 내려가면 저장된 임시 점수로 다시 집계
+                save_cohort_summary(load_cohort_raw_scores(), signature)
+        
+        print(f"Cohort stats updated: {len(records)} records, {changed} employees")
+        return {
+            'statusCode': 200,
+            'body': json.dumps({
+                'message': 'Cohort stats updated',
+                'processed_records': len(records),
+                'changed_employees': changed
+            })
+        }
+    except Exception as e:
+        print(f"Error in stream_handler: {str(e)}")
+        raise
+
+
 def lambda_handler(event, context):
     """Lambda 핸들러"""
     
@@ -665,57 +1696,24 @@ def lambda_handler(event, context):
         
         employee_data = response['Item']
         
-        # 모든 직원 데이터 조회 (상대 평가를 위해)
-        all_employees = get_all_employees()
-        
         # 모든 프로젝트 데이터 조회 (매칭을 위해)
         all_projects = get_all_projects()
         
-        # 상대 평가 점수 계산
-        scores = calculate_relative_scores(employee_data, all_employees, all_projects)
+        # 상대 평가 점수 계산 (저장된 코호트 통계 사용)
+        scores = evaluate_relative_scores(employee_data, all_projects)
+        
+        # 기술 격차 분석용 동료 버킷 조회 (통계 테이블을 읽을 수 없으면 전체 직원으로 생성)
+        try:
+            peer_index = load_peer_index(employee_data)
+        except ClientError as e:
+            print(f"Peer cohort index unavailable: {str(e)}")
+            peer_index = PeerCohortIndex.from_employees(get_all_employees())
         
         # AI 분석 수행
-        ai_analysis = analyze_with_ai(employee_data, all_projects, scores, all_employees)
+        ai_analysis = analyze_with_ai(employee_data, all_projects, scores, peer_index)
         
         # 평가 결과 구성
-        # 직원 이름 추출 (여러 형식 지원)
-        employee_name = (
-            employee_data.get('basic_info', {}).get('name') or
-            employee_data.get('name') or
-            employee_data.get('user_id') or
-            'Unknown'
-        )
-        
-        evaluation_result = {
-            'evaluation_id': f"eval_{employee_id}_{int(datetime.now().timestamp())}",
-            'employee_id': employee_id,
-            'employee_name': employee_name,
-            'evaluation_date': datetime.now().isoformat(),
-            'scores': {
-                'technical_skills': scores['technical_skills'],
-                'project_experience': scores['project_experience'],
-                'resume_credibility': scores['resume_credibility'],
-                'cultural_fit': scores['cultural_fit']
-            },
-            'overall_score': scores['overall_score'],
-            'strengths': ai_analysis.get('strengths', []),
-            'weaknesses': ai_analysis.get('weaknesses', []),
-            'analysis': {
-                'tech_stack': ai_analysis.get('tech_stack_analysis', ''),
-                'project_similarity': ai_analysis.get('project_similarity', ''),
-                'credibility': ai_analysis.get('credibility_check', ''),
-                'market_comparison': ai_analysis.get('market_comparison', '')
-            },
-            'ai_recommendation': ai_analysis.get('summary_comment', ''),
-            'deployable': ai_analysis.get('deployable', '추가 검토 필요'),
-            'recommended_roles': ai_analysis.get('recommended_roles', []),
-            'recommended_projects': ai_analysis.get('recommended_projects', []),
-            'skill_gap_analysis': ai_analysis.get('skill_gap_analysis', {}),
-            'project_history': get_project_history(employee_data),
-            'skills': employee_data.get('skills', []),
-            'experience_years': get_experience_years(employee_data),
-            'status': 'completed'
-        }
+        evaluation_result = build_evaluation_result(employee_id, employee_data, scores, ai_analysis)
         
         return {
             'statusCode': 200,
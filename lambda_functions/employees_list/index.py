@@ -8,9 +8,19 @@ Requirements: 직원 데이터 조회 및 목록 제공
 import json
 import logging
 import os
-from typing import Dict, Any, List
-from decimal import Decimal
+import sys
+from typing import Dict, Any, List, Optional, Tuple
+from decimal import Decimal, InvalidOperation
 import boto3
+from boto3.dynamodb.conditions import Attr
+
+# Lambda Layer의 common 모듈 경로 추가
+sys.path.insert(0, '/opt/python')
+
+from common.pagination import (
+    decode_next_token, encode_next_token, get_query_params, parse_fields, parse_limit, scan_page
+)
+from common.response_cache import ResponseCache, conditional_response
 
 # 로깅 설정
 logger = logging.getLogger()
@@ -19,6 +29,28 @@ logger.setLevel(logging.INFO)
 # AWS 클라이언트 초기화
 dynamodb = boto3.resource('dynamodb', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
 
+# 직원 목록 응답 캐시 (직원 데이터가 바뀌면 무효화)
+response_cache = ResponseCache('employees_list', depends_on=('employees',))
+
+# 응답 필드별로 읽어야 하는 테이블 최상위 속성 (fields 파라미터의 ProjectionExpression)
+EMPLOYEE_FIELD_ATTRIBUTES = {
+    'user_id': ('user_id',),
+    'basic_info': ('basic_info',),
+    'name': ('basic_info',),
+    'position': ('basic_info',),
+    'role': ('basic_info',),
+    'experienceYears': ('basic_info',),
+    'experience_years': ('basic_info',),
+    'skills': ('skills',),
+    'certifications': ('certifications',),
+    'work_experience': ('work_experience',),
+    'self_introduction': ('self_introduction',),
+    'education': ('education',)
+}
+
+# 지원하는 쿼리 파라미터
+QUERY_PARAMS = ('limit', 'next_token', 'fields', 'role', 'name', 'min_experience')
+
 
 def handler(event, context):
     """
@@ -31,25 +63,42 @@ def handler(event, context):
     Returns:
         dict: API Gateway 응답
     """
+    headers = {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Headers': 'Content-Type,Authorization,If-None-Match',
+        'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
+    }
+    
     try:
         logger.info("직원 목록 조회 요청 수신")
         
-        # 직원 목록 조회
-        employees = fetch_all_employees()
-        
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type,Authorization',
-                'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
-            },
-            'body': json.dumps({
-                'employees': employees,
-                'count': len(employees)
-            }, default=decimal_default)
+        # 쿼리 파라미터 검증 (limit, next_token, fields, 필터)
+        params = {
+            name: value for name, value in get_query_params(event).items()
+            if name in QUERY_PARAMS and value not in (None, '')
         }
+        try:
+            limit = parse_limit(params.get('limit'))
+            start_key = decode_next_token(params.get('next_token'), ('user_id',))
+            fields = parse_fields(params.get('fields'), EMPLOYEE_FIELD_ATTRIBUTES)
+            filter_expression = build_filter_expression(params)
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': headers,
+                'body': json.dumps({'error': 'Invalid query parameters', 'message': str(e)}, ensure_ascii=False)
+            }
+        
+        # 직원 목록 조회 (캐시에 없거나 직원 데이터가 바뀐 경우에만 테이블 조회)
+        cache_key = json.dumps(params, sort_keys=True) if params else 'all'
+        cached, hit = response_cache.get_or_build(
+            cache_key,
+            lambda: build_response_body(limit, start_key, filter_expression, fields)
+        )
+        logger.info(f"직원 목록 캐시 {'적중' if hit else '갱신'}")
+        
+        return conditional_response(event, cached, headers)
         
     except Exception as e:
         logger.error(f"직원 목록 조회 중 오류 발생: {str(e)}", exc_info=True)
@@ -65,6 +114,66 @@ def handler(event, context):
         }
 
 
+def build_filter_expression(params: Dict[str, str]):
+    """
+    필터 쿼리 파라미터를 FilterExpression으로 변환
+    
+    Args:
+        params: 쿼리 파라미터 (role: 직무 일치, name: 이름 포함, min_experience: 최소 경력 연수)
+        
+    Returns:
+        FilterExpression (필터가 없으면 None)
+        
+    Raises:
+        ValueError: min_experience가 숫자가 아닌 경우
+    """
+    conditions = []
+    
+    if params.get('role'):
+        conditions.append(Attr('basic_info.role').eq(params['role']))
+    
+    if params.get('name'):
+        conditions.append(Attr('basic_info.name').contains(params['name']))
+    
+    if params.get('min_experience'):
+        try:
+            min_experience = Decimal(params['min_experience'])
+        except InvalidOperation:
+            raise ValueError(f"min_experience must be a number: {params['min_experience']}")
+        conditions.append(Attr('basic_info.years_of_experience').gte(min_experience))
+    
+    filter_expression = None
+    for condition in conditions:
+        filter_expression = condition if filter_expression is None else filter_expression & condition
+    return filter_expression
+
+
+def build_response_body(
+    limit: Optional[int] = None,
+    start_key: Optional[Dict[str, Any]] = None,
+    filter_expression=None,
+    fields: Optional[List[str]] = None
+) -> str:
+    """
+    직원 목록 응답 본문 생성
+    
+    Args:
+        limit: 페이지 크기 (없으면 전체)
+        start_key: 이어서 읽을 ExclusiveStartKey
+        filter_expression: 필터 표현식
+        fields: 응답에 포함할 필드 (없으면 전체 필드)
+        
+    Returns:
+        str: JSON 응답 본문 (employees, count, next_token)
+    """
+    employees, last_key = fetch_employees(limit, start_key, filter_expression, fields)
+    return json.dumps({
+        'employees': employees,
+        'count': len(employees),
+        'next_token': encode_next_token(last_key)
+    }, default=decimal_default)
+
+
 def fetch_all_employees() -> List[Dict[str, Any]]:
     """
     모든 직원 데이터 조회
@@ -72,12 +181,46 @@ def fetch_all_employees() -> List[Dict[str, Any]]:
     Returns:
         list: 직원 목록
     """
+    employees, _ = fetch_employees()
+    return employees
+
+
+def fetch_employees(
+    limit: Optional[int] = None,
+    start_key: Optional[Dict[str, Any]] = None,
+    filter_expression=None,
+    fields: Optional[List[str]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    직원 데이터 한 페이지 조회
+    
+    Args:
+        limit: 페이지 크기 (없으면 테이블 끝까지)
+        start_key: 이어서 읽을 ExclusiveStartKey
+        filter_expression: 필터 표현식
+        fields: 응답에 포함할 필드 (지정하면 필요한 속성만 읽음)
+        
+    Returns:
+        tuple: (직원 목록, 다음 페이지 LastEvaluatedKey 또는 None)
+    """
     try:
         table = dynamodb.Table('Employees')
-        response = table.scan()
+        attributes = None
+        if fields:
+            attributes = {'user_id'}
+            for field in fields:
+                attributes.update(EMPLOYEE_FIELD_ATTRIBUTES[field])
+        
+        items, last_key = scan_page(
+            table,
+            limit=limit,
+            start_key=start_key,
+            filter_expression=filter_expression,
+            attributes=attributes
+        )
         
         employees = []
-        for item in response.get('Items', []):
+        for item in items:
             # 필요한 정보만 추출
             basic_info = item.get('basic_info', {})
             role = basic_info.get('role', '')
@@ -121,10 +264,13 @@ def fetch_all_employees() -> List[Dict[str, Any]]:
                             'years': float(skill.get('years', 0)) if skill.get('years') else 0
                         })
             
+            if fields:
+                employee = {field: employee[field] for field in fields if field in employee}
+            
             employees.append(employee)
         
         logger.info(f"총 {len(employees)}명의 직원 조회 완료")
-        return employees
+        return employees, last_key
         
     except Exception as e:
         logger.error(f"직원 데이터 조회 실패: {str(e)}")
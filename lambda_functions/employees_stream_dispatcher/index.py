@@ -0,0 +1,117 @@
+"""
+Employees Stream Dispatcher Lambda Function
+Employees 테이블 변경분을 한 번만 읽어 변경분 처리 Lambda들에 전달
+
+DynamoDB Streams는 샤드당 동시에 읽는 Lambda를 2개 이하로 권장합니다. Employees 스트림은
+벡터 임베딩 Lambda와 이 Lambda만 읽고, 나머지 처리 Lambda는 이 Lambda가 같은 레코드
+배치로 STREAM_TARGETS 순서대로 동기 호출합니다.
+
+대상 하나라도 실패하면 예외를 다시 발생시켜 배치 전체를 재시도하므로, 앞선 대상은 같은
+배치를 다시 받습니다. 재적용해도 결과가 같은 대상을 앞에 두고, 변경분을 누적하는
+대시보드 view 갱신은 마지막에 둡니다.
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Dict, Any, List
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+# 로깅 설정
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# 호출할 Lambda 함수 이름 (쉼표로 구분, 호출 순서)
+STREAM_TARGETS = [name.strip() for name in os.environ.get('STREAM_TARGETS', '').split(',') if name.strip()]
+
+# 대상 Lambda 응답 대기 시간(초) (대상 Lambda의 최대 실행 시간보다 길게)
+INVOKE_READ_TIMEOUT_SECONDS = int(os.environ.get('INVOKE_READ_TIMEOUT_SECONDS', '310'))
+
+# 동시 실행 제한으로 호출이 거부된 경우 재시도 횟수
+INVOKE_MAX_RETRIES = 5
+
+# AWS 클라이언트 초기화 (응답 대기 중 시간 초과를 재시도하면 같은 배치가 두 번 처리되므로
+# SDK 재시도는 끄고 호출 거부만 직접 재시도)
+lambda_client = boto3.client(
+    'lambda',
+    region_name=os.environ.get('AWS_REGION', 'us-east-2'),
+    config=Config(read_timeout=INVOKE_READ_TIMEOUT_SECONDS, retries={'total_max_attempts': 1})
+)
+
+
+def invoke_target(function_name: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    대상 Lambda를 Stream 이벤트 형식으로 동기 호출
+
+    Args:
+        function_name: 대상 Lambda 함수 이름
+        records: DynamoDB Stream 레코드 목록
+
+    Returns:
+        dict: 대상 Lambda 응답
+
+    Raises:
+        RuntimeError: 대상 Lambda가 오류로 끝난 경우
+        ClientError: 호출 실패 (재시도 후에도 호출이 거부된 경우 포함)
+    """
+    payload = json.dumps({'Records': records})
+    for attempt in range(INVOKE_MAX_RETRIES):
+        try:
+            response = lambda_client.invoke(
+                FunctionName=function_name,
+                InvocationType='RequestResponse',
+                Payload=payload
+            )
+            break
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') != 'TooManyRequestsException' or attempt == INVOKE_MAX_RETRIES - 1:
+                raise
+            logger.warning(f"{function_name} 호출 제한, 재시도 ({attempt + 1}/{INVOKE_MAX_RETRIES})")
+            time.sleep(2 ** attempt)
+
+    body = response['Payload'].read()
+    if response.get('FunctionError'):
+        raise RuntimeError(f"{function_name} 처리 실패: {body.decode('utf-8', errors='replace')}")
+    return json.loads(body) if body else {}
+
+
+def handler(event, context):
+    """
+    DynamoDB Streams 핸들러
+
+    처리에 실패하면 예외를 다시 발생시켜 Lambda가 같은 배치를 재시도하도록 합니다.
+
+    Args:
+        event: DynamoDB Streams 이벤트
+        context: Lambda 컨텍스트
+
+    Returns:
+        dict: 처리 결과
+    """
+    records = event.get('Records') or []
+    if not records:
+        # 대상 Lambda는 Records가 없으면 전체 재구성하므로 빈 이벤트는 전달하지 않음
+        return {
+            'statusCode': 200,
+            'body': json.dumps({'message': 'No records', 'processed_records': 0})
+        }
+
+    try:
+        for function_name in STREAM_TARGETS:
+            invoke_target(function_name, records)
+
+        logger.info(f"직원 변경분 전달 완료 (레코드: {len(records)}개, 대상: {', '.join(STREAM_TARGETS)})")
+        return {
+            'statusCode': 200,
+            'body': json.dumps({
+                'message': 'Employee changes dispatched',
+                'processed_records': len(records),
+                'targets': STREAM_TARGETS
+            })
+        }
+    except Exception as e:
+        logger.error(f"직원 변경분 전달 실패: {str(e)}", exc_info=True)
+        raise
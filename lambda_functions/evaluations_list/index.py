@@ -2,40 +2,226 @@
 평가 목록 조회 Lambda 함수
 직원 평가 목록을 상태별로 조회합니다.
 
+StatusIndex GSI(status + submitted_at)를 최신순으로 조회해 요청한 페이지만 읽고,
+상태를 지정하지 않으면 상태별 조회 결과를 submitted_at 기준으로 병합합니다.
+직원 상세 정보는 페이지의 직원 ID를 모아 BatchGetItem으로 한 번에 조회합니다.
+
 Requirements: 3.1
 """
 
+import heapq
 import json
+import sys
 import boto3
 import os
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from typing import Dict, List, Any, Optional, Tuple
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+
+# Lambda Layer의 common 모듈 경로 추가
+sys.path.insert(0, '/opt/python')
+
+from common.pagination import decode_next_token, encode_next_token, projection_kwargs
 
 dynamodb = boto3.resource('dynamodb')
 evaluations_table = dynamodb.Table('EmployeeEvaluations')
 employees_table = dynamodb.Table('Employees')
 
+# 평가 상태 (StatusIndex 파티션)
+VALID_STATUSES = ['pending', 'approved', 'rejected', 'review', 'batch']
+
+# 상태를 지정하지 않을 때 조회하는 검토 상태 (일괄 평가 결과는 status=batch로 조회)
+DEFAULT_STATUSES = ['pending', 'approved', 'rejected', 'review']
+
+# StatusIndex 항목 키 (ExclusiveStartKey 구성용)
+INDEX_KEY_ATTRIBUTES = ('evaluation_id', 'status', 'submitted_at')
+
+# 평가에 붙이는 직원 상세 정보 속성
+EMPLOYEE_DETAIL_ATTRIBUTES = ('user_id', 'basic_info', 'skills', 'work_experience')
+
+# BatchGetItem 요청당 최대 키 수
+BATCH_GET_MAX_KEYS = 100
+
+# BatchGetItem UnprocessedKeys 재시도 횟수
+BATCH_GET_MAX_RETRIES = 3
+
+# 상태별 조회를 동시에 실행하는 스레드 풀 (클라이언트는 스레드 안전)
+_query_executor = ThreadPoolExecutor(max_workers=len(VALID_STATUSES))
+
+
 def decimal_default(obj):
     """Decimal 타입을 JSON 직렬화 가능하도록 변환"""
     if isinstance(obj, Decimal):
         return float(obj)
     raise TypeError
 
-def get_employee_details(user_id):
+
+def get_employee_details_batch(user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
     """
-    직원 상세 정보 조회
+    직원 상세 정보 일괄 조회 (BatchGetItem)
     
     Args:
-        user_id: 직원 ID
-        
+        user_ids: 직원 ID 목록 (중복 허용)
+    
     Returns:
-        직원 정보 딕셔너리 또는 None
+        직원 ID별 직원 정보 (조회 실패한 직원은 제외)
     """
-    try:
-        response = employees_table.get_item(Key={'user_id': user_id})
-        return response.get('Item')
-    except Exception as e:
-        print(f"직원 정보 조회 실패 (user_id: {user_id}): {str(e)}")
-        return None
+    unique_ids = list(dict.fromkeys(user_id for user_id in user_ids if user_id))
+    details: Dict[str, Dict[str, Any]] = {}
+    
+    for start in range(0, len(unique_ids), BATCH_GET_MAX_KEYS):
+        request = {
+            employees_table.name: {
+                'Keys': [{'user_id': user_id} for user_id in unique_ids[start:start + BATCH_GET_MAX_KEYS]],
+                **projection_kwargs(EMPLOYEE_DETAIL_ATTRIBUTES)
+            }
+        }
+        try:
+            for _ in range(BATCH_GET_MAX_RETRIES):
+                response = dynamodb.batch_get_item(RequestItems=request)
+                for item in response.get('Responses', {}).get(employees_table.name, []):
+                    details[item['user_id']] = item
+                request = response.get('UnprocessedKeys') or {}
+                if not request:
+                    break
+            if request:
+                print(f"직원 정보 일부 미조회 (UnprocessedKeys: {len(request[employees_table.name]['Keys'])}건)")
+        except Exception as e:
+            print(f"직원 정보 일괄 조회 실패: {str(e)}")
+    
+    return details
+
+
+def _index_key(item: Dict[str, Any]) -> Dict[str, Any]:
+    """평가 항목의 StatusIndex 키 (ExclusiveStartKey)"""
+    return {name: item[name] for name in INDEX_KEY_ATTRIBUTES if name in item}
+
+
+def _query_status(
+    status: str,
+    start_key: Optional[Dict[str, Any]],
+    limit: int,
+    attributes: Optional[Tuple[str, ...]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    한 상태의 평가를 최신순으로 최대 limit개 조회
+    
+    Returns:
+        tuple: (평가 목록, LastEvaluatedKey 또는 None)
+    """
+    query_kwargs = {
+        'TableName': evaluations_table.name,
+        'IndexName': 'StatusIndex',
+        'KeyConditionExpression': Key('status').eq(status),
+        'ScanIndexForward': False,  # 최신순 정렬
+        'Limit': limit,
+        **projection_kwargs(attributes)
+    }
+    if start_key:
+        query_kwargs['ExclusiveStartKey'] = start_key
+    
+    response = evaluations_table.meta.client.query(**query_kwargs)
+    return response.get('Items', []), response.get('LastEvaluatedKey')
+
+
+def fetch_evaluation_page(
+    statuses: List[str],
+    cursor: Dict[str, Optional[Dict[str, Any]]],
+    limit: int,
+    attributes: Optional[Tuple[str, ...]] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, Optional[Dict[str, Any]]]]:
+    """
+    상태별 StatusIndex 조회 결과를 병합해 최신순 한 페이지 조회
+    
+    상태마다 최대 limit개를 동시에 조회하고 submitted_at 내림차순으로 병합해 앞의 limit개를
+    반환합니다. 다음 커서는 상태마다 마지막으로 사용한 항목의 키이며, 사용하지 않은 항목은
+    다음 페이지에서 다시 조회됩니다.
+    
+    Args:
+        statuses: 조회할 상태 목록
+        cursor: 상태별 시작 키 ({}: 처음부터, None: 더 이상 없음)
+        limit: 페이지 크기
+        attributes: 읽을 속성 (없으면 전체)
+    
+    Returns:
+        tuple: (평가 목록, 다음 페이지 커서)
+    """
+    active = [status for status in statuses if cursor.get(status) is not None]
+    futures = {
+        status: _query_executor.submit(_query_status, status, cursor[status], limit, attributes)
+        for status in active
+    }
+    pages = {status: future.result() for status, future in futures.items()}
+    
+    merged = heapq.merge(
+        *[[(status, item) for item in pages[status][0]] for status in active],
+        key=lambda entry: entry[1].get('submitted_at', ''),
+        reverse=True
+    )
+    page = []
+    consumed = {status: 0 for status in active}
+    last_items: Dict[str, Dict[str, Any]] = {}
+    for status, item in merged:
+        if len(page) >= limit:
+            break
+        page.append(item)
+        consumed[status] += 1
+        last_items[status] = item
+    
+    next_cursor = dict(cursor)
+    for status in active:
+        items, last_evaluated_key = pages[status]
+        if consumed[status] == len(items):
+            # 조회한 항목을 모두 사용했으면 DynamoDB 커서를 그대로 이어감
+            next_cursor[status] = last_evaluated_key
+        elif consumed[status]:
+            next_cursor[status] = _index_key(last_items[status])
+    
+    return page, next_cursor
+
+
+def count_evaluations(statuses: List[str]) -> int:
+    """상태별 평가 수 합계 (Select=COUNT, 항목 본문은 전송하지 않음)"""
+    total = 0
+    for status in statuses:
+        query_kwargs = {
+            'IndexName': 'StatusIndex',
+            'KeyConditionExpression': Key('status').eq(status),
+            'Select': 'COUNT'
+        }
+        while True:
+            response = evaluations_table.query(**query_kwargs)
+            total += response.get('Count', 0)
+            if 'LastEvaluatedKey' not in response:
+                break
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    return total
+
+
+def scan_evaluations(statuses: List[str]) -> List[Dict[str, Any]]:
+    """
+    전체 평가 스캔 후 최신순 정렬 (StatusIndex를 사용할 수 없을 때의 대체 경로)
+    
+    Args:
+        statuses: 조회할 상태 목록
+    
+    Returns:
+        평가 목록
+    """
+    scan_kwargs = {'FilterExpression': Attr('status').is_in(statuses)}
+    
+    evaluations = []
+    while True:
+        response = evaluations_table.scan(**scan_kwargs)
+        evaluations.extend(response.get('Items', []))
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    
+    evaluations.sort(key=lambda x: x.get('submitted_at', ''), reverse=True)
+    return evaluations
 
 
 def lambda_handler(event, context):
@@ -43,9 +229,11 @@ def lambda_handler(event, context):
     평가 목록 조회
     
     Query Parameters:
-    - status: pending, approved, rejected, review (선택사항)
-    - page: 페이지 번호 (기본값: 1)
+    - status: pending, approved, rejected, review, batch (선택사항, 없으면 batch 제외)
     - limit: 페이지당 결과 수 (기본값: 20, 최대: 100)
+    - next_token: 이전 응답의 next_token (다음 페이지)
+    - page: 페이지 번호 (기본값: 1, next_token이 없을 때만 사용)
+    - include_total: true면 전체 평가 수(total) 포함
     
     Response:
     {
@@ -55,7 +243,7 @@ def lambda_handler(event, context):
                 "user_id": "...",
                 "name": "...",
                 "type": "career|freelancer",
-                "status": "pending|approved|rejected|review",
+                "status": "pending|approved|rejected|review|batch",
                 "overall_score": 85,
                 "submitted_at": "2024-01-15T10:30:00Z",
                 "quantitative_analysis": {...},
@@ -70,6 +258,7 @@ def lambda_handler(event, context):
         "count": 10,
         "page": 1,
         "limit": 20,
+        "next_token": "...",
         "total": 45
     }
     """
@@ -92,70 +281,73 @@ def lambda_handler(event, context):
         # Query parameters 파싱
         query_params = event.get('queryStringParameters') or {}
         status_filter = query_params.get('status')
-        page = int(query_params.get('page', 1))
-        limit = min(int(query_params.get('limit', 20)), 100)  # 최대 100개
+        page = max(int(query_params.get('page', 1)), 1)
+        limit = min(max(int(query_params.get('limit', 20)), 1), 100)  # 최대 100개
+        include_total = str(query_params.get('include_total', '')).lower() == 'true'
         
         # 상태별 필터링
         if status_filter:
             # 유효한 상태 검증
-            valid_statuses = ['pending', 'approved', 'rejected', 'review']
-            if status_filter not in valid_statuses:
+            if status_filter not in VALID_STATUSES:
                 return {
                     'statusCode': 400,
                     'headers': headers,
                     'body': json.dumps({
                         'error': 'Invalid status',
-                        'message': f'유효한 상태: {", ".join(valid_statuses)}'
+                        'message': f'유효한 상태: {", ".join(VALID_STATUSES)}'
                     })
                 }
-            
-            # StatusIndex GSI 사용
-            try:
-                response = evaluations_table.query(
-                    IndexName='StatusIndex',
-                    KeyConditionExpression='#status = :status',
-                    ExpressionAttributeNames={'#status': 'status'},
-                    ExpressionAttributeValues={':status': status_filter},
-                    ScanIndexForward=False  # 최신순 정렬
-                )
-            except Exception as gsi_error:
-                print(f"StatusIndex GSI 조회 실패, 스캔으로 대체: {str(gsi_error)}")
-                # GSI가 없는 경우 스캔으로 대체
-                response = evaluations_table.scan(
-                    FilterExpression='#status = :status',
-                    ExpressionAttributeNames={'#status': 'status'},
-                    ExpressionAttributeValues={':status': status_filter}
-                )
-        else:
-            # 전체 조회
-            response = evaluations_table.scan()
+        statuses = [status_filter] if status_filter else DEFAULT_STATUSES
         
-        evaluations = response.get('Items', [])
-        
-        # 제출일 기준 정렬 (최신순)
-        evaluations.sort(key=lambda x: x.get('submitted_at', ''), reverse=True)
-        
-        # 총 개수
-        total = len(evaluations)
+        try:
+            cursor = decode_next_token(query_params.get('next_token'), statuses)
+            if cursor is not None and not all(key is None or isinstance(key, dict) for key in cursor.values()):
+                raise ValueError("Invalid next_token: malformed cursor")
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': headers,
+                'body': json.dumps({'error': 'Invalid next_token', 'message': str(e)})
+            }
         
-        # 페이지네이션 적용
-        start_idx = (page - 1) * limit
-        end_idx = start_idx + limit
-        paginated_evaluations = evaluations[start_idx:end_idx]
+        total = None
+        try:
+            # StatusIndex GSI에서 요청한 페이지만 조회
+            if cursor is None:
+                cursor = {status: {} for status in statuses}
+                # next_token 없이 page를 지정하면 앞 페이지는 키만 읽고 건너뜀
+                for _ in range(page - 1):
+                    _, cursor = fetch_evaluation_page(statuses, cursor, limit, INDEX_KEY_ATTRIBUTES)
+            evaluations, next_cursor = fetch_evaluation_page(statuses, cursor, limit)
+            next_token = encode_next_token(next_cursor) if any(
+                key is not None for key in next_cursor.values()
+            ) else None
+            if include_total:
+                total = count_evaluations(statuses)
+        except ClientError as gsi_error:
+            print(f"StatusIndex GSI 조회 실패, 스캔으로 대체: {str(gsi_error)}")
+            # GSI가 없는 경우 스캔으로 대체
+            all_evaluations = scan_evaluations(statuses)
+            start_idx = (page - 1) * limit
+            evaluations = all_evaluations[start_idx:start_idx + limit]
+            next_token = None
+            if include_total:
+                total = len(all_evaluations)
         
-        # 각 평가에 직원 상세 정보 추가
+        # 페이지의 직원 상세 정보를 한 번에 조회해 추가
+        employee_details = get_employee_details_batch(
+            [evaluation.get('user_id') for evaluation in evaluations]
+        )
         enriched_evaluations = []
-        for evaluation in paginated_evaluations:
-            user_id = evaluation.get('user_id')
-            if user_id:
-                employee_details = get_employee_details(user_id)
-                if employee_details:
-                    # 필요한 필드만 추가
-                    evaluation['employee_details'] = {
-                        'basic_info': employee_details.get('basic_info', {}),
-                        'skills': employee_details.get('skills', []),
-                        'work_experience': employee_details.get('work_experience', [])
-                    }
+        for evaluation in evaluations:
+            details = employee_details.get(evaluation.get('user_id'))
+            if details:
+                # 필요한 필드만 추가
+                evaluation['employee_details'] = {
+                    'basic_info': details.get('basic_info', {}),
+                    'skills': details.get('skills', []),
+                    'work_experience': details.get('work_experience', [])
+                }
             enriched_evaluations.append(evaluation)
         
         return {
@@ -166,10 +358,11 @@ def lambda_handler(event, context):
                 'count': len(enriched_evaluations),
                 'page': page,
                 'limit': limit,
+                'next_token': next_token,
                 'total': total
             }, default=decimal_default)
         }
-        
+    
     except Exception as e:
         print(f"Error fetching evaluations: {str(e)}")
         import traceback
@@ -3,12 +3,41 @@
 """
 import json
 import os
+import sys
 import boto3
 from botocore.exceptions import ClientError
 
+# Lambda Layer의 common 모듈 경로 추가
+sys.path.insert(0, '/opt/python')
+
+from common.response_cache import ResponseCache, conditional_response
+
 dynamodb = boto3.resource('dynamodb', region_name='us-east-2')
 pending_candidates_table = dynamodb.Table('PendingCandidates')
 
+# 대기자 목록 응답 캐시 (대기자 데이터가 바뀌면 무효화)
+response_cache = ResponseCache('pending_candidates_list', depends_on=('pending_candidates',))
+
+
+def build_response_body() -> str:
+    """대기자 전체 조회 후 응답 본문 생성"""
+    response = pending_candidates_table.scan()
+    candidates = response['Items']
+    
+    # 추가 페이지가 있으면 계속 조회
+    while 'LastEvaluatedKey' in response:
+        response = pending_candidates_table.scan(
+            ExclusiveStartKey=response['LastEvaluatedKey']
+        )
+        candidates.extend(response['Items'])
+    
+    print(f"대기자 {len(candidates)}명 조회 완료")
+    
+    return json.dumps({
+        'candidates': candidates,
+        'count': len(candidates)
+    }, ensure_ascii=False, default=str)
+
 
 def lambda_handler(event, context):
     """Lambda 핸들러"""
@@ -18,7 +47,7 @@ def lambda_handler(event, context):
         headers = {
             'Content-Type': 'application/json',
             'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type',
+            'Access-Control-Allow-Headers': 'Content-Type,If-None-Match',
             'Access-Control-Allow-Methods': 'GET,OPTIONS'
         }
         
@@ -29,27 +58,11 @@ def lambda_handler(event, context):
                 'body': json.dumps({'message': 'OK'})
             }
         
-        # 전체 대기자 조회
-        response = pending_candidates_table.scan()
-        candidates = response['Items']
-        
-        # 추가 페이지가 있으면 계속 조회
-        while 'LastEvaluatedKey' in response:
-            response = pending_candidates_table.scan(
-                ExclusiveStartKey=response['LastEvaluatedKey']
-            )
-            candidates.extend(response['Items'])
+        # 전체 대기자 조회 (캐시에 없거나 대기자 데이터가 바뀐 경우에만 테이블 조회)
+        cached, hit = response_cache.get_or_build('all', build_response_body)
+        print(f"대기자 목록 캐시 {'적중' if hit else '갱신'}")
         
-        print(f"대기자 {len(candidates)}명 조회 완료")
-        
-        return {
-            'statusCode': 200,
-            'headers': headers,
-            'body': json.dumps({
-                'candidates': candidates,
-                'count': len(candidates)
-            }, ensure_ascii=False, default=str)
-        }
+        return conditional_response(event, cached, headers)
         
     except Exception as e:
         print(f"에러 발생: {str(e)}")
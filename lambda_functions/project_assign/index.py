@@ -8,11 +8,17 @@ Requirements: 2.5 - 프로젝트 배정 및 가용성 확인
 import json
 import logging
 import os
+import sys
 from datetime import datetime
 from typing import Dict, Any, Optional
 import boto3
 from botocore.exceptions import ClientError
 
+# Lambda Layer의 common 모듈 경로 추가
+sys.path.insert(0, '/opt/python')
+
+from common.response_cache import invalidate as invalidate_cache
+
 # 로깅 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -122,6 +128,9 @@ def handler(event, context):
         
         logger.info(f"배정 완료: {employee_id} -> {project_id}")
         
+        # 직원/프로젝트 목록과 대시보드 응답 캐시 무효화
+        invalidate_cache('employees', 'projects')
+        
         return {
             'statusCode': 200,
             'headers': get_cors_headers(),
@@ -19,6 +19,7 @@ import boto3
 from common.dynamodb_client import DynamoDBClient
 from common.repositories import ProjectRepository
 from common.models import Project, ProjectPeriod, TechStack
+from common.response_cache import invalidate as invalidate_cache
 
 # 로거 설정
 logger = logging.getLogger()
@@ -225,6 +226,9 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         created_project = project_repo.create(project)
         logger.info(f"프로젝트 생성 완료: {project_id}")
         
+        # 프로젝트 목록/대시보드 응답 캐시 무효화
+        invalidate_cache('projects')
+        
         # 응답 데이터 생성
         response_data = {
             'project_id': created_project.project_id,
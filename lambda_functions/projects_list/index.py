@@ -8,9 +8,19 @@ Requirements: 프로젝트 데이터 조회 및 목록 제공
 import json
 import logging
 import os
-from typing import Dict, Any, List
+import sys
+from typing import Dict, Any, List, Optional, Tuple
 from decimal import Decimal
 import boto3
+from boto3.dynamodb.conditions import Attr
+
+# Lambda Layer의 common 모듈 경로 추가
+sys.path.insert(0, '/opt/python')
+
+from common.pagination import (
+    decode_next_token, encode_next_token, get_query_params, parse_fields, parse_limit, scan_page
+)
+from common.response_cache import ResponseCache, conditional_response
 
 # 로깅 설정
 logger = logging.getLogger()
@@ -19,6 +29,26 @@ logger.setLevel(logging.INFO)
 # AWS 클라이언트 초기화
 dynamodb = boto3.resource('dynamodb', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
 
+# 프로젝트 목록 응답 캐시 (프로젝트 데이터가 바뀌면 무효화)
+response_cache = ResponseCache('projects_list', depends_on=('projects',))
+
+# 응답 필드별로 읽어야 하는 테이블 최상위 속성 (fields 파라미터의 ProjectionExpression)
+PROJECT_FIELD_ATTRIBUTES = {
+    'project_id': ('project_id',),
+    'project_name': ('project_name',),
+    'status': ('status',),
+    'start_date': ('period',),
+    'end_date': ('period',),
+    'required_skills': ('tech_stack',),
+    'description': ('description',),
+    'client_industry': ('client_industry',),
+    'assigned_members': ('team_members', 'assigned_members'),
+    'required_members': ('required_members',)
+}
+
+# 지원하는 쿼리 파라미터
+QUERY_PARAMS = ('limit', 'next_token', 'fields', 'status', 'client_industry')
+
 
 def handler(event, context):
     """
@@ -37,31 +67,48 @@ def handler(event, context):
             'statusCode': 200,
             'headers': {
                 'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type,Authorization',
+                'Access-Control-Allow-Headers': 'Content-Type,Authorization,If-None-Match',
                 'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
             },
             'body': ''
         }
     
+    headers = {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Headers': 'Content-Type,Authorization,If-None-Match',
+        'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
+    }
+    
     try:
         logger.info("프로젝트 목록 조회 요청 수신")
         
-        # 프로젝트 목록 조회
-        projects = fetch_all_projects()
-        
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type,Authorization',
-                'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
-            },
-            'body': json.dumps({
-                'projects': projects,
-                'count': len(projects)
-            }, default=decimal_default)
+        # 쿼리 파라미터 검증 (limit, next_token, fields, 필터)
+        params = {
+            name: value for name, value in get_query_params(event).items()
+            if name in QUERY_PARAMS and value not in (None, '')
         }
+        try:
+            limit = parse_limit(params.get('limit'))
+            start_key = decode_next_token(params.get('next_token'), ('project_id',))
+            fields = parse_fields(params.get('fields'), PROJECT_FIELD_ATTRIBUTES)
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': headers,
+                'body': json.dumps({'error': 'Invalid query parameters', 'message': str(e)}, ensure_ascii=False)
+            }
+        filter_expression = build_filter_expression(params)
+        
+        # 프로젝트 목록 조회 (캐시에 없거나 프로젝트 데이터가 바뀐 경우에만 테이블 조회)
+        cache_key = json.dumps(params, sort_keys=True) if params else 'all'
+        cached, hit = response_cache.get_or_build(
+            cache_key,
+            lambda: build_response_body(limit, start_key, filter_expression, fields)
+        )
+        logger.info(f"프로젝트 목록 캐시 {'적중' if hit else '갱신'}")
+        
+        return conditional_response(event, cached, headers)
         
     except Exception as e:
         logger.error(f"프로젝트 목록 조회 중 오류 발생: {str(e)}", exc_info=True)
@@ -77,6 +124,60 @@ def handler(event, context):
         }
 
 
+def build_filter_expression(params: Dict[str, str]):
+    """
+    필터 쿼리 파라미터를 FilterExpression으로 변환
+    
+    Args:
+        params: 쿼리 파라미터 (status: 상태 일치, client_industry: 고객사 산업 일치)
+        
+    Returns:
+        FilterExpression (필터가 없으면 None)
+    """
+    conditions = []
+    
+    if params.get('status'):
+        condition = Attr('status').eq(params['status'])
+        if params['status'] == 'active':
+            # status가 없는 프로젝트는 목록에서 active로 표시되므로 함께 포함
+            condition = condition | Attr('status').not_exists()
+        conditions.append(condition)
+    
+    if params.get('client_industry'):
+        conditions.append(Attr('client_industry').eq(params['client_industry']))
+    
+    filter_expression = None
+    for condition in conditions:
+        filter_expression = condition if filter_expression is None else filter_expression & condition
+    return filter_expression
+
+
+def build_response_body(
+    limit: Optional[int] = None,
+    start_key: Optional[Dict[str, Any]] = None,
+    filter_expression=None,
+    fields: Optional[List[str]] = None
+) -> str:
+    """
+    프로젝트 목록 응답 본문 생성
+    
+    Args:
+        limit: 페이지 크기 (없으면 전체)
+        start_key: 이어서 읽을 ExclusiveStartKey
+        filter_expression: 필터 표현식
+        fields: 응답에 포함할 필드 (없으면 전체 필드)
+        
+    Returns:
+        str: JSON 응답 본문 (projects, count, next_token)
+    """
+    projects, last_key = fetch_projects(limit, start_key, filter_expression, fields)
+    return json.dumps({
+        'projects': projects,
+        'count': len(projects),
+        'next_token': encode_next_token(last_key)
+    }, default=decimal_default)
+
+
 def fetch_all_projects() -> List[Dict[str, Any]]:
     """
     모든 프로젝트 데이터 조회
@@ -84,12 +185,46 @@ def fetch_all_projects() -> List[Dict[str, Any]]:
     Returns:
         list: 프로젝트 목록
     """
+    projects, _ = fetch_projects()
+    return projects
+
+
+def fetch_projects(
+    limit: Optional[int] = None,
+    start_key: Optional[Dict[str, Any]] = None,
+    filter_expression=None,
+    fields: Optional[List[str]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    프로젝트 데이터 한 페이지 조회
+    
+    Args:
+        limit: 페이지 크기 (없으면 테이블 끝까지)
+        start_key: 이어서 읽을 ExclusiveStartKey
+        filter_expression: 필터 표현식
+        fields: 응답에 포함할 필드 (지정하면 필요한 속성만 읽음)
+        
+    Returns:
+        tuple: (프로젝트 목록, 다음 페이지 LastEvaluatedKey 또는 None)
+    """
     try:
         table = dynamodb.Table('Projects')
-        response = table.scan()
+        attributes = None
+        if fields:
+            attributes = {'project_id'}
+            for field in fields:
+                attributes.update(PROJECT_FIELD_ATTRIBUTES[field])
+        
+        items, last_key = scan_page(
+            table,
+            limit=limit,
+            start_key=start_key,
+            filter_expression=filter_expression,
+            attributes=attributes
+        )
         
         projects = []
-        for item in response.get('Items', []):
+        for item in items:
             # period 정보 추출
             period = item.get('period', {})
             start_date = ''
@@ -143,10 +278,13 @@ def fetch_all_projects() -> List[Dict[str, Any]]:
                 'required_members': required_members
             }
             
+            if fields:
+                project = {field: project[field] for field in fields}
+            
             projects.append(project)
         
         logger.info(f"총 {len(projects)}개의 프로젝트 조회 완료")
-        return projects
+        return projects, last_key
         
     except Exception as e:
         logger.error(f"프로젝트 데이터 조회 실패: {str(e)}")
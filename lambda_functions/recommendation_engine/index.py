@@ -5,19 +5,30 @@ Project Recommendation Engine Lambda Function
 Requirements: 2.2, 2.4, 2.5, 1.3, 1.4, 11.3, 11.4
 """
 
+import heapq
 import json
 import logging
 import os
-from typing import Dict, Any, List, Optional
+import sys
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
 from decimal import Decimal
 import boto3
 
+# Lambda Layer의 common 모듈 경로 추가
+sys.path.insert(0, '/opt/python')
+
+from common.dynamodb_client import DynamoDBClient, DynamoDBClientError
+from common.repositories import AFFINITY_DEFAULT_SCORE_KEY, DEFAULT_AFFINITY_SCORE, AffinityRepository
+from common.skill_index import get_default_index
+
 # 로깅 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 # AWS 클라이언트 초기화
 dynamodb = boto3.resource('dynamodb', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
+dynamodb_client = DynamoDBClient(region_name=os.environ.get('AWS_REGION', 'us-east-2'))
+affinity_repo = AffinityRepository(dynamodb_client)
 
 # Bedrock 클라이언트 (선택적)
 try:
@@ -26,6 +37,22 @@ except:
     bedrock_runtime = None
     logger.warning("Bedrock 클라이언트 초기화 실패 - 기본 추천 근거 사용")
 
+# 친밀도 저장 방식 (affinity_calculator와 동일하게 설정)
+AFFINITY_STORAGE_MODE = os.environ.get('AFFINITY_STORAGE_MODE', 'dense')
+
+# sparse 기본 점수를 저장하는 친밀도 작업 상태 테이블
+AFFINITY_STATE_TABLE = os.environ.get('AFFINITY_STATE_TABLE', 'AffinityJobState')
+
+# 친밀도 점수 최대값 (Affinity.overall_affinity_score 범위 0~100)
+AFFINITY_SCORE_MAX = 100.0
+
+# 우선순위별 종합 점수 가중치 (기본값: balanced)
+PRIORITY_WEIGHTS = {
+    'skill': {'skill': 0.6, 'similarity': 0.3, 'affinity': 0.1},
+    'affinity': {'skill': 0.3, 'similarity': 0.2, 'affinity': 0.5},
+    'balanced': {'skill': 0.4, 'similarity': 0.3, 'affinity': 0.3}
+}
+
 
 def handler(event, context):
     """
@@ -169,25 +196,19 @@ def generate_recommendations(
     # 3. 친밀도 점수 조회 (Requirements: 2.2)
     affinity_scores = get_affinity_scores()
     
-    # 4. 후보자 통합 및 점수 계산
-    candidates = merge_and_score_candidates(
+    # 4. 후보자 통합 및 상위 후보자 선택 (점수 상한으로 친밀도 조회 생략)
+    top_candidates = select_top_candidates(
         skill_matches=skill_matches,
         vector_matches=vector_matches,
         affinity_scores=affinity_scores,
-        priority=priority
+        priority=priority,
+        top_k=team_size
     )
     
-    # 5. 가용성 확인 (Requirements: 2.5)
-    candidates = check_availability(candidates)
+    # 5. 가용성 확인 (Requirements: 2.5, 선택된 후보자만)
+    top_candidates = check_availability(top_candidates)
     
-    # 6. 상위 후보자 선택
-    top_candidates = sorted(
-        candidates,
-        key=lambda x: x['overall_score'],
-        reverse=True
-    )[:team_size]
-    
-    # 7. 추천 근거 생성 (Requirements: 2.4)
+    # 6. 추천 근거 생성 (Requirements: 2.4)
     for candidate in top_candidates:
         candidate['reasoning'] = generate_reasoning(candidate)
     
@@ -218,14 +239,20 @@ def find_employees_by_skills(required_skills: List[str]) -> List[Dict[str, Any]]
         
         table = dynamodb.Table('Employees')
         
-        # 모든 직원 조회
-        response = table.scan()
-        employees = response.get('Items', [])
-        
-        # 페이지네이션 처리
-        while 'LastEvaluatedKey' in response:
-            response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
-            employees.extend(response.get('Items', []))
+        skill_index = get_default_index()
+        if skill_index is not None:
+            # 기술 역색인으로 요구 기술을 하나 이상 보유한 직원만 조회
+            # (기술이 하나도 일치하지 않는 직원은 아래에서 결과에 포함되지 않음)
+            employees = batch_get_employees(skill_index.find_employee_ids(required_skills, match_all=False))
+        else:
+            # 모든 직원 조회
+            response = table.scan()
+            employees = response.get('Items', [])
+            
+            # 페이지네이션 처리
+            while 'LastEvaluatedKey' in response:
+                response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
+                employees.extend(response.get('Items', []))
         
         # 기술 매칭 점수 계산 (가중치 적용)
         matches = []
@@ -334,11 +361,32 @@ def find_employees_by_skills(required_skills: List[str]) -> List[Dict[str, Any]]
         logger.info(f"기술 매칭 완료: {len(matches)}명 발견")
         return matches
         
+    except DynamoDBClientError:
+        # 후보 일부만 조회된 상태로 추천하지 않도록 요청을 실패시킴
+        logger.error("기술 색인 후보 직원 조회 실패", exc_info=True)
+        raise
     except Exception as e:
         logger.error(f"기술 검색 실패: {str(e)}")
         return []
 
 
+def batch_get_employees(user_ids: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    직원 일괄 조회 (BatchGetItem, 미처리 키는 지수 백오프로 재요청)
+    
+    Args:
+        user_ids: 직원 ID 목록
+        
+    Returns:
+        list: 조회된 직원 목록 (없는 직원은 제외)
+        
+    Raises:
+        DynamoDBClientError: 재시도 후에도 조회하지 못한 직원이 있을 때
+    """
+    keys = [{'user_id': user_id} for user_id in sorted(set(user_ids))]
+    return dynamodb_client.batch_get_items(dynamodb.Table('Employees').name, keys)
+
+
 def search_similar_employees(
     project_id: str,
     required_skills: List[str]
@@ -361,100 +409,252 @@ def search_similar_employees(
     return []
 
 
-def get_affinity_scores() -> Dict[str, float]:
+class AffinityIndex:
     """
-    친밀도 점수 조회
+    직원별 친밀도 인접 인덱스
     
-    Requirements: 2.2 - 친밀도 점수 반영
+    employee → {neighbor: score} 형태로 친밀도 점수를 보관합니다.
+    직원 쌍은 양방향으로 등록되며, 직원별 점수 합계와 개수를 함께 유지하여
+    평균 친밀도를 O(1)로 조회할 수 있습니다.
     
-    Returns:
-        dict: 직원 쌍별 친밀도 점수
+    sparse 저장에서는 저장되지 않은 직원 쌍을 default_score로 간주합니다.
+    population(전체 직원 수)이 있으면 평균도 저장되지 않은 쌍을 포함해 계산합니다.
     """
-    try:
-        table = dynamodb.Table('EmployeeAffinity')
-        response = table.scan()
-        
-        affinity_map = {}
-        for item in response.get('Items', []):
-            employee_pair = item.get('employee_pair', {})
-            emp1 = employee_pair.get('employee_1')
-            emp2 = employee_pair.get('employee_2')
-            score = float(item.get('overall_affinity_score', 0))
+    
+    def __init__(self, default_score: float = 0.0, population: Optional[int] = None):
+        self._adjacency: Dict[str, Dict[str, float]] = {}
+        self._totals: Dict[str, float] = {}
+        self._max_score = default_score
+        self.default_score = default_score
+        self.population = population
+    
+    def add(self, employee_1: str, employee_2: str, score: float) -> None:
+        """
+        직원 쌍의 친밀도 점수 등록 (양방향)
+        
+        Args:
+            employee_1: 첫 번째 직원 ID
+            employee_2: 두 번째 직원 ID
+            score: 친밀도 점수
+        """
+        self._set(employee_1, employee_2, score)
+        self._set(employee_2, employee_1, score)
+    
+    def _set(self, employee_id: str, neighbor_id: str, score: float) -> None:
+        neighbors = self._adjacency.setdefault(employee_id, {})
+        previous = neighbors.get(neighbor_id)
+        if previous is not None:
+            self._totals[employee_id] -= previous
+        neighbors[neighbor_id] = score
+        self._totals[employee_id] = self._totals.get(employee_id, 0.0) + score
+        self._max_score = max(self._max_score, score)
+    
+    def neighbors(self, employee_id: str) -> Dict[str, float]:
+        """
+        특정 직원의 이웃별 친밀도 점수 반환
+        
+        Args:
+            employee_id: 직원 ID
             
-            if emp1 and emp2:
-                key = f"{emp1}_{emp2}"
-                affinity_map[key] = score
-                # 양방향 저장
-                key_reverse = f"{emp2}_{emp1}"
-                affinity_map[key_reverse] = score
-        
-        logger.info(f"친밀도 데이터 {len(affinity_map)}개 로드")
-        return affinity_map
+        Returns:
+            dict: 이웃 직원 ID별 친밀도 점수
+        """
+        return self._adjacency.get(employee_id, {})
+    
+    def score(self, employee_1: str, employee_2: str, default: Optional[float] = None) -> float:
+        """
+        직원 쌍의 친밀도 점수 반환
+        
+        Args:
+            employee_1: 첫 번째 직원 ID
+            employee_2: 두 번째 직원 ID
+            default: 점수가 없을 때 반환할 기본값 (기본값: default_score)
+            
+        Returns:
+            float: 친밀도 점수
+        """
+        if default is None:
+            default = self.default_score
+        return self._adjacency.get(employee_1, {}).get(employee_2, default)
+    
+    def average(self, employee_id: str, default: Optional[float] = None) -> float:
+        """
+        특정 직원의 평균 친밀도 점수 반환
+        
+        Args:
+            employee_id: 직원 ID
+            default: 친밀도 데이터가 없을 때 반환할 기본값 (기본값: default_score)
+            
+        Returns:
+            float: 평균 친밀도 점수
+        """
+        if default is None:
+            default = self.default_score
+        neighbors = self._adjacency.get(employee_id)
+        if not neighbors:
+            return default
+        
+        # 저장되지 않은 직원 쌍은 default_score로 간주
+        if self.population and self.population - 1 > len(neighbors):
+            missing = self.population - 1 - len(neighbors)
+            return (self._totals[employee_id] + missing * self.default_score) / (self.population - 1)
+        return self._totals[employee_id] / len(neighbors)
+    
+    def upper_bound(self) -> float:
+        """
+        평균 친밀도 점수의 상한
+        
+        평균은 등록된 점수와 default_score의 평균이므로 그중 최대값을 넘지 않습니다.
+        점수를 낮춰 덮어써도 상한은 줄이지 않으며, 평균 계산의 부동소수점 반올림 오차만큼
+        여유를 더하므로 항상 유효한 상한입니다.
+        
+        Returns:
+            float: 어떤 직원의 average()보다 크거나 같은 값
+        """
+        return self._max_score + abs(self._max_score) * 1e-9 + 1e-12
+    
+    def __contains__(self, employee_id: str) -> bool:
+        return employee_id in self._adjacency
+    
+    def __len__(self) -> int:
+        """등록된 직원 쌍 수"""
+        return sum(len(neighbors) for neighbors in self._adjacency.values()) // 2
+
+
+class LazyAffinityIndex(AffinityIndex):
+    """
+    필요한 직원의 친밀도만 조회하는 인접 인덱스
+    
+    직원의 평균/이웃/점수를 처음 요청할 때 loader로 그 직원의 친밀도 쌍만 읽습니다.
+    상위 후보자 선택에서 힙에서 꺼낸 후보자만 조회하므로 조회량이 전체 직원 쌍 수가 아니라
+    실제로 점수를 계산한 후보자 수에 비례합니다.
+    
+    아직 읽지 않은 점수는 알 수 없으므로 평균 상한은 점수 최대값(AFFINITY_SCORE_MAX)을 사용합니다.
+    """
+    
+    def __init__(
+        self,
+        loader: Callable[[str], Iterable[Tuple[str, float]]],
+        default_score: float = 0.0,
+        population: Optional[int] = None
+    ):
+        super().__init__(default_score=default_score, population=population)
+        self._loader = loader
+        self._loaded = set()
+        self._max_score = max(AFFINITY_SCORE_MAX, default_score)
+    
+    def _ensure_loaded(self, employee_id: str) -> None:
+        """직원의 친밀도 쌍을 아직 읽지 않았으면 조회 (한 방향만 등록)"""
+        if employee_id in self._loaded:
+            return
+        self._loaded.add(employee_id)
+        for neighbor_id, score in self._loader(employee_id):
+            self._set(employee_id, neighbor_id, score)
+    
+    def neighbors(self, employee_id: str) -> Dict[str, float]:
+        self._ensure_loaded(employee_id)
+        return super().neighbors(employee_id)
+    
+    def score(self, employee_1: str, employee_2: str, default: Optional[float] = None) -> float:
+        self._ensure_loaded(employee_1)
+        return super().score(employee_1, employee_2, default)
+    
+    def average(self, employee_id: str, default: Optional[float] = None) -> float:
+        self._ensure_loaded(employee_id)
+        return super().average(employee_id, default)
+    
+    def __len__(self) -> int:
+        """조회한 직원 수"""
+        return len(self._loaded)
+
+
+def load_employee_affinities(employee_id: str) -> List[Tuple[str, float]]:
+    """
+    직원 한 명의 친밀도 쌍 조회 (employee_1/employee_2 GSI 쿼리)
+    
+    Args:
+        employee_id: 직원 ID
         
+    Returns:
+        list: (상대 직원 ID, 친밀도 점수) 목록 (조회 실패 시 빈 목록 - 기본 점수 사용)
+    """
+    try:
+        pairs = []
+        for affinity in affinity_repo.find_by_employee(employee_id):
+            pair = affinity.employee_pair
+            other_id = pair.employee_2 if pair.employee_1 == employee_id else pair.employee_1
+            pairs.append((other_id, float(affinity.overall_affinity_score)))
+        return pairs
     except Exception as e:
-        logger.warning(f"친밀도 점수 조회 실패 (기본값 사용): {str(e)}")
-        # 친밀도 테이블이 없으면 기본 점수 반환
-        return generate_default_affinity_scores()
+        logger.warning(f"친밀도 조회 실패 (employee_id: {employee_id}, 기본값 사용): {str(e)}")
+        return []
 
 
-def generate_default_affinity_scores() -> Dict[str, float]:
-    """기본 친밀도 점수 생성 (테이블이 없을 때)"""
-    import random
+def get_affinity_scores() -> AffinityIndex:
+    """
+    친밀도 점수 조회
     
-    try:
-        # 모든 직원 조회
-        employees_table = dynamodb.Table('Employees')
-        response = employees_table.scan(
-            ProjectionExpression='user_id'
+    Requirements: 2.2 - 친밀도 점수 반영
+    
+    EmployeeAffinity 테이블 전체를 읽지 않고, 점수를 계산하는 후보자의 친밀도만
+    조회하는 인덱스를 반환합니다.
+    
+    Returns:
+        AffinityIndex: 직원별 친밀도 인접 인덱스
+    """
+    if AFFINITY_STORAGE_MODE == 'sparse':
+        return LazyAffinityIndex(
+            load_employee_affinities,
+            default_score=load_default_affinity_score(),
+            population=count_employees()
         )
-        employee_ids = [item['user_id'] for item in response.get('Items', [])]
-        
-        affinity_map = {}
-        
-        # 각 직원 쌍에 대해 랜덤 친밀도 생성 (50-85점)
-        for i, emp1 in enumerate(employee_ids):
-            # 각 직원당 10-15명과 친밀도 생성
-            num_connections = min(random.randint(10, 15), len(employee_ids) - 1)
-            other_employees = [e for e in employee_ids if e != emp1]
-            selected = random.sample(other_employees, min(num_connections, len(other_employees)))
-            
-            for emp2 in selected:
-                key = f"{emp1}_{emp2}"
-                if key not in affinity_map:
-                    score = random.uniform(50, 85)
-                    affinity_map[key] = score
-                    # 양방향 저장
-                    affinity_map[f"{emp2}_{emp1}"] = score
-        
-        logger.info(f"기본 친밀도 데이터 {len(affinity_map)}개 생성")
-        return affinity_map
-        
+    return LazyAffinityIndex(load_employee_affinities)
+
+
+def load_default_affinity_score() -> float:
+    """
+    sparse 저장에서 저장되지 않은 직원 쌍의 기본 점수 조회
+    
+    affinity_calculator가 sparse 정리 후 저장한 값을 사용합니다.
+    
+    Returns:
+        float: 기본 점수 (저장된 값이 없거나 조회 실패 시 DEFAULT_AFFINITY_SCORE)
+    """
+    try:
+        item = dynamodb.Table(AFFINITY_STATE_TABLE).get_item(
+            Key={'job_name': AFFINITY_DEFAULT_SCORE_KEY}
+        ).get('Item')
+        if item and 'score' in item:
+            return float(item['score'])
     except Exception as e:
-        logger.error(f"기본 친밀도 생성 실패: {str(e)}")
-        return {}
+        logger.warning(f"기본 친밀도 점수 조회 실패 (기본값 사용): {str(e)}")
+    return DEFAULT_AFFINITY_SCORE
 
 
-def merge_and_score_candidates(
-    skill_matches: List[Dict[str, Any]],
-    vector_matches: List[Dict[str, Any]],
-    affinity_scores: Dict[str, float],
-    priority: str
-) -> List[Dict[str, Any]]:
+def count_employees() -> Optional[int]:
     """
-    후보자 통합 및 종합 점수 계산
+    전체 직원 수 조회 (sparse 친밀도 평균 계산용)
     
-    Requirements: 2.2, 2.4 - 다중 요소 점수 계산
+    테이블을 스캔하지 않고 DescribeTable의 ItemCount를 사용합니다. ItemCount는 약 6시간마다
+    갱신되는 근사값이므로, 아직 집계되지 않아 0이면 None을 반환합니다.
     
-    Args:
-        skill_matches: 기술 매칭 결과
-        vector_matches: 벡터 검색 결과
-        affinity_scores: 친밀도 점수
-        priority: 우선순위
-        
     Returns:
-        list: 통합된 후보자 목록
+        int: 직원 수 (조회 실패 또는 미집계 시 None)
     """
-    # 후보자 통합
+    try:
+        table = dynamodb.Table('Employees')
+        count = int(table.item_count)
+        return count or None
+    except Exception as e:
+        logger.warning(f"직원 수 조회 실패: {str(e)}")
+        return None
+
+
+def _merge_candidates(
+    skill_matches: List[Dict[str, Any]],
+    vector_matches: List[Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """기술 매칭/벡터 검색 결과를 직원 ID별 후보자로 통합 (친밀도 점수 제외)"""
     candidates_map = {}
     
     # 기술 매칭 결과 추가
@@ -488,35 +688,115 @@ def merge_and_score_candidates(
                 'years_of_experience': 0
             }
     
-    # 친밀도 점수 추가 (평균)
-    for user_id in candidates_map:
-        related_scores = [
-            score for key, score in affinity_scores.items()
-            if user_id in key
-        ]
-        if related_scores:
-            candidates_map[user_id]['affinity_score'] = sum(related_scores) / len(related_scores)
+    return candidates_map
+
+
+def _base_score(candidate: Dict[str, Any], weights: Dict[str, float]) -> float:
+    """친밀도를 제외한 종합 점수 부분합"""
+    return (
+        candidate['skill_match_score'] * weights['skill'] +
+        candidate['similarity_score'] * weights['similarity']
+    )
+
+
+def merge_and_score_candidates(
+    skill_matches: List[Dict[str, Any]],
+    vector_matches: List[Dict[str, Any]],
+    affinity_scores: AffinityIndex,
+    priority: str
+) -> List[Dict[str, Any]]:
+    """
+    후보자 통합 및 종합 점수 계산
+    
+    Requirements: 2.2, 2.4 - 다중 요소 점수 계산
+    
+    Args:
+        skill_matches: 기술 매칭 결과
+        vector_matches: 벡터 검색 결과
+        affinity_scores: 직원별 친밀도 인접 인덱스
+        priority: 우선순위
+        
+    Returns:
+        list: 통합된 후보자 목록
+    """
+    candidates_map = _merge_candidates(skill_matches, vector_matches)
+    weights = PRIORITY_WEIGHTS.get(priority, PRIORITY_WEIGHTS['balanced'])
     
-    # 종합 점수 계산
     for candidate in candidates_map.values():
-        if priority == 'skill':
-            weights = {'skill': 0.6, 'similarity': 0.3, 'affinity': 0.1}
-        elif priority == 'affinity':
-            weights = {'skill': 0.3, 'similarity': 0.2, 'affinity': 0.5}
-        else:  # balanced
-            weights = {'skill': 0.4, 'similarity': 0.3, 'affinity': 0.3}
-        
-        overall_score = (
-            candidate['skill_match_score'] * weights['skill'] +
-            candidate['similarity_score'] * weights['similarity'] +
+        # 친밀도 점수 추가 (평균, 저장되지 않은 직원 쌍은 기본 점수)
+        candidate['affinity_score'] = affinity_scores.average(candidate['user_id'])
+        
+        # 종합 점수 계산
+        candidate['overall_score'] = (
+            _base_score(candidate, weights) +
             candidate['affinity_score'] * weights['affinity']
         )
-        
-        candidate['overall_score'] = overall_score
     
     return list(candidates_map.values())
 
 
+def select_top_candidates(
+    skill_matches: List[Dict[str, Any]],
+    vector_matches: List[Dict[str, Any]],
+    affinity_scores: AffinityIndex,
+    priority: str,
+    top_k: int
+) -> List[Dict[str, Any]]:
+    """
+    종합 점수 상위 top_k명 선택
+    
+    후보자를 점수 상한(친밀도 외 점수 + 친밀도 상한 × 가중치) 순으로 꺼내 크기 top_k의
+    최소 힙에 유지합니다. 상한이 힙의 최저 점수를 넘지 못하면 남은 후보자도 모두 넘지 못하므로
+    친밀도를 조회하지 않고 종료합니다. 결과는 전체 후보자를 종합 점수로 정렬한 앞 top_k명과
+    같습니다 (동점이면 먼저 통합된 후보자 우선).
+    
+    Args:
+        skill_matches: 기술 매칭 결과
+        vector_matches: 벡터 검색 결과
+        affinity_scores: 직원별 친밀도 인접 인덱스
+        priority: 우선순위
+        top_k: 선택할 인원 수
+        
+    Returns:
+        list: 종합 점수 내림차순 상위 후보자 목록
+    """
+    if top_k <= 0:
+        return []
+    
+    candidates_map = _merge_candidates(skill_matches, vector_matches)
+    weights = PRIORITY_WEIGHTS.get(priority, PRIORITY_WEIGHTS['balanced'])
+    affinity_bound = affinity_scores.upper_bound() * weights['affinity']
+    
+    # (-상한, 통합 순서, 친밀도 외 점수, 후보자): 상한이 높은 후보자부터 꺼냄
+    pending = []
+    for order, candidate in enumerate(candidates_map.values()):
+        base_score = _base_score(candidate, weights)
+        pending.append((-(base_score + affinity_bound), order, base_score, candidate))
+    heapq.heapify(pending)
+    
+    # (종합 점수, -통합 순서, 후보자): 힙 맨 앞이 현재 top_k 중 가장 낮은 후보자
+    selected = []
+    scored = 0
+    while pending:
+        negative_bound, order, base_score, candidate = pending[0]
+        if len(selected) == top_k and (-negative_bound, -order) <= selected[0][:2]:
+            break
+        heapq.heappop(pending)
+        
+        candidate['affinity_score'] = affinity_scores.average(candidate['user_id'])
+        candidate['overall_score'] = base_score + candidate['affinity_score'] * weights['affinity']
+        scored += 1
+        
+        entry = (candidate['overall_score'], -order, candidate)
+        if len(selected) < top_k:
+            heapq.heappush(selected, entry)
+        elif entry[:2] > selected[0][:2]:
+            heapq.heapreplace(selected, entry)
+    
+    logger.info(f"상위 후보자 선택: 후보 {len(candidates_map)}명 중 {scored}명 점수 계산, {len(selected)}명 선택")
+    return [candidate for _, _, candidate in sorted(selected, key=lambda entry: entry[:2], reverse=True)]
+
+
 def check_availability(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     직원 가용성 확인
@@ -530,13 +810,22 @@ def check_availability(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]
         list: 가용성 정보가 추가된 후보자 목록
     """
     try:
-        # 현재 프로젝트 배정 확인
+        # 현재 프로젝트 배정 확인 (배정 정보만 읽고 페이지네이션 처리)
         table = dynamodb.Table('Projects')
-        response = table.scan()
+        scan_kwargs = {
+            'ProjectionExpression': 'project_name, team_composition'
+        }
+        projects = []
+        while True:
+            response = table.scan(**scan_kwargs)
+            projects.extend(response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                break
+            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
         
         # 진행 중인 프로젝트 찾기
         active_projects = {}
-        for project in response.get('Items', []):
+        for project in projects:
             team = project.get('team_composition', {})
             for role, members in team.items():
                 if isinstance(members, list):
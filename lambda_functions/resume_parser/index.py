@@ -261,8 +261,8 @@ def save_to_dynamodb(data: Dict[str, Any]) -> None:
         logger.info("DynamoDB에 데이터 저장 시작")
         
         # 스킬 정규화 (Requirements: 10.4)
-        from common.utils import normalize_skill
-        normalized_skills = [normalize_skill(skill) for skill in data.get('skills', [])]
+        from common.utils import normalize_skills
+        normalized_skills = normalize_skills(data.get('skills', []))
         
         # Employee 데이터 생성
         employee_data = {
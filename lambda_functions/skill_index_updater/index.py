@@ -0,0 +1,107 @@
+"""
+Skill Index Updater Lambda Function
+Employees 테이블 변경분으로 기술 역색인 갱신
+
+DynamoDB Streams(NEW_AND_OLD_IMAGES) 레코드의 OldImage/NewImage를 비교해 바뀐
+posting만 SkillIndex 테이블에 반영합니다. Records가 없는 이벤트(수동 실행)는
+전체 직원을 스캔해 색인을 재구성합니다.
+"""
+
+import json
+import logging
+import os
+import sys
+from typing import Dict, Any, Optional
+import boto3
+from boto3.dynamodb.types import TypeDeserializer
+
+# Lambda Layer의 common 모듈 경로 추가
+sys.path.insert(0, '/opt/python')
+
+from common.skill_index import SkillIndex
+
+# 로깅 설정
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# AWS 클라이언트 초기화
+dynamodb = boto3.resource('dynamodb', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
+
+EMPLOYEES_TABLE = os.environ.get('EMPLOYEES_TABLE', 'Employees')
+SKILL_INDEX_TABLE = os.environ.get('SKILL_INDEX_TABLE', 'SkillIndex')
+
+_deserializer = TypeDeserializer()
+
+
+def _image(record: Dict[str, Any], name: str) -> Optional[Dict[str, Any]]:
+    """Stream 레코드의 이미지를 Python 딕셔너리로 변환"""
+    image = record.get('dynamodb', {}).get(name)
+    if not image:
+        return None
+    return {key: _deserializer.deserialize(value) for key, value in image.items()}
+
+
+def rebuild_skill_index(skill_index: SkillIndex) -> int:
+    """
+    전체 직원으로 기술 역색인 재구성
+
+    Args:
+        skill_index: 기술 역색인
+
+    Returns:
+        저장한 posting 수
+    """
+    table = dynamodb.Table(EMPLOYEES_TABLE)
+    scan_kwargs = {'ProjectionExpression': 'user_id, skills'}
+    employees = []
+    while True:
+        response = table.scan(**scan_kwargs)
+        employees.extend(response.get('Items', []))
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    return skill_index.rebuild(employees)
+
+
+def handler(event, context):
+    """
+    DynamoDB Streams 핸들러
+
+    처리에 실패하면 예외를 다시 발생시켜 Lambda가 같은 배치를 재시도하도록 합니다.
+    posting 쓰기는 멱등이므로 재시도해도 결과가 같습니다.
+
+    Args:
+        event: DynamoDB Streams 이벤트 (Records가 없으면 전체 재구성)
+        context: Lambda 컨텍스트
+
+    Returns:
+        dict: 처리 결과
+    """
+    skill_index = SkillIndex(SKILL_INDEX_TABLE, dynamodb=dynamodb)
+
+    try:
+        records = event.get('Records')
+        if records is None:
+            postings = rebuild_skill_index(skill_index)
+            return {
+                'statusCode': 200,
+                'body': json.dumps({'message': 'Skill index rebuilt', 'postings': postings})
+            }
+
+        changed = 0
+        for record in records:
+            changed += skill_index.index_employee(_image(record, 'OldImage'), _image(record, 'NewImage'))
+
+        logger.info(f"기술 색인 레코드 처리 완료 (레코드: {len(records)}개, posting 변경: {changed}개)")
+        return {
+            'statusCode': 200,
+            'body': json.dumps({
+                'message': 'Skill index updated',
+                'processed_records': len(records),
+                'changed_postings': changed
+            })
+        }
+    except Exception as e:
+        logger.error(f"기술 색인 갱신 실패: {str(e)}", exc_info=True)
+        raise
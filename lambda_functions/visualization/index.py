@@ -57,9 +57,6 @@ def aggregate_skill_distribution() -> Dict[str, Any]:
         기술별 직원 수, 숙련도 분포, 평균 경력 연수를 포함한 딕셔너리
     """
     try:
-        # 모든 직원 조회
-        employees = employee_repo.get_all_employees()
-        
         # 기술별 통계 수집
         skill_stats = defaultdict(lambda: {
             'count': 0,
@@ -67,8 +64,11 @@ def aggregate_skill_distribution() -> Dict[str, Any]:
             'total_years': 0,
             'employees': []
         })
+        total_employees = 0
         
-        for employee in employees:
+        # 모든 직원 순회
+        for employee in employee_repo.iter_all():
+            total_employees += 1
             for skill in employee.skills:
                 skill_name = skill.name
                 skill_stats[skill_name]['count'] += 1
@@ -92,7 +92,7 @@ def aggregate_skill_distribution() -> Dict[str, Any]:
         
         return {
             'total_skills': len(result),
-            'total_employees': len(employees),
+            'total_employees': total_employees,
             'skills': result
         }
         
@@ -109,9 +109,6 @@ def calculate_domain_coverage() -> Dict[str, Any]:
         도메인별 프로젝트 수, 기술 스택, 참여 인력을 포함한 딕셔너리
     """
     try:
-        # 모든 프로젝트 조회
-        projects = project_repo.get_all_projects()
-        
         # 도메인별 통계 수집
         domain_stats = defaultdict(lambda: {
             'project_count': 0,
@@ -119,8 +116,11 @@ def calculate_domain_coverage() -> Dict[str, Any]:
             'tech_stacks': set(),
             'total_budget': 0
         })
+        total_projects = 0
         
-        for project in projects:
+        # 모든 프로젝트 순회
+        for project in project_repo.iter_all():
+            total_projects += 1
             domain = project.client_industry
             domain_stats[domain]['project_count'] += 1
             domain_stats[domain]['projects'].append({
@@ -152,7 +152,7 @@ def calculate_domain_coverage() -> Dict[str, Any]:
         
         return {
             'total_domains': len(result),
-            'total_projects': len(projects),
+            'total_projects': total_projects,
             'domains': result
         }
         
@@ -169,9 +169,6 @@ def summarize_team_composition() -> Dict[str, Any]:
         역할별 인원 수, 경력 분포, 가용성을 포함한 딕셔너리
     """
     try:
-        # 모든 직원 조회
-        employees = employee_repo.get_all_employees()
-        
         # 역할별 통계
         role_stats = Counter()
         experience_distribution = {
@@ -181,7 +178,11 @@ def summarize_team_composition() -> Dict[str, Any]:
             '11년 이상': 0
         }
         
-        for employee in employees:
+        total_employees = 0
+        
+        # 모든 직원 순회
+        for employee in employee_repo.iter_all():
+            total_employees += 1
             role = employee.basic_info.role
             role_stats[role] += 1
             
@@ -196,14 +197,14 @@ def summarize_team_composition() -> Dict[str, Any]:
                 experience_distribution['11년 이상'] += 1
         
         return {
-            'total_employees': len(employees),
+            'total_employees': total_employees,
             'role_distribution': dict(role_stats),
             'experience_distribution': experience_distribution,
             'roles': [
                 {
                     'role': role,
                     'count': count,
-                    'percentage': round(count / len(employees) * 100, 1)
+                    'percentage': round(count / total_employees * 100, 1)
                 }
                 for role, count in role_stats.most_common()
             ]
@@ -222,16 +223,17 @@ def get_dashboard_metrics() -> Dict[str, Any]:
         인력 가용성, 프로젝트 진행 현황, 추천 대기 건수를 포함한 딕셔너리
     """
     try:
-        # 직원 및 프로젝트 조회
-        employees = employee_repo.get_all_employees()
-        projects = project_repo.get_all_projects()
+        # 직원 수 집계 (직원 객체는 보관하지 않음)
+        total_employees = sum(1 for _ in employee_repo.iter_all())
         
         # 현재 날짜
         today = datetime.now()
         
         # 진행 중인 프로젝트 계산
         active_projects = []
-        for project in projects:
+        total_projects = 0
+        for project in project_repo.iter_all():
+            total_projects += 1
             try:
                 start_date = datetime.strptime(project.period.start, '%Y-%m-%d')
                 end_date = datetime.strptime(project.period.end, '%Y-%m-%d')
@@ -248,8 +250,6 @@ def get_dashboard_metrics() -> Dict[str, Any]:
                 continue
         
         # 가용 인력 계산 (간단한 버전 - 실제로는 프로젝트 배정 정보 필요)
-        total_employees = len(employees)
-        
         return {
             'timestamp': today.isoformat(),
             'employee_metrics': {
@@ -258,7 +258,7 @@ def get_dashboard_metrics() -> Dict[str, Any]:
                 'availability_rate': 100.0  # 실제로는 계산 필요
             },
             'project_metrics': {
-                'total_projects': len(projects),
+                'total_projects': total_projects,
                 'active_projects': len(active_projects),
                 'active_project_list': active_projects
             },
@@ -293,10 +293,9 @@ def filter_by_date_range(
         end = datetime.strptime(end_date, '%Y-%m-%d')
         
         if data_type == 'projects':
-            projects = project_repo.get_all_projects()
             filtered = []
             
-            for project in projects:
+            for project in project_repo.iter_all():
                 try:
                     project_start = datetime.strptime(project.period.start, '%Y-%m-%d')
                     project_end = datetime.strptime(project.period.end, '%Y-%m-%d')
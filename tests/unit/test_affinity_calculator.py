@@ -0,0 +1,727 @@
+"""
+친밀도 점수 계산 Lambda 단위 테스트
+
+Requirements: 2-1.1 ~ 2-1.7
+"""
+
+import json
+import pytest
+from datetime import datetime
+from itertools import combinations
+from unittest.mock import MagicMock, patch
+
+from lambda_functions.affinity_calculator.index import (
+    analyze_messenger_communication,
+    calculate_affinity_score,
+    calculate_affinity_scores_batch,
+    calculate_weighted_average,
+    collect_changed_pairs,
+    coordinate_sharded_run,
+    get_messenger_logs_since,
+    get_pending_shards,
+    get_project_history_digest,
+    handler,
+    iter_shard_pairs,
+    load_company_event_dates,
+    load_messenger_index,
+    load_watermark,
+    plan_pair_shards,
+    run_shard_invocation,
+    save_watermark,
+    SparseAffinitySelector
+)
+from common.dynamodb_client import DynamoDBClientError
+from lambda_functions.affinity_calculator.scoring_kernel import (
+    NUMPY_AVAILABLE,
+    score_messenger_index,
+    weighted_average_kernel
+)
+
+
+def _employee(user_id, project_history=None):
+    return {
+        'user_id': user_id,
+        'project_history': project_history or []
+    }
+
+
+def _pair_ids(pairs):
+    return [(pair[0]['user_id'], pair[1]['user_id']) for pair in pairs]
+
+
+class TestIncrementalAffinity:
+    """증분 친밀도 계산 대상 수집 테스트"""
+
+    @pytest.fixture
+    def employees(self):
+        return [_employee(f"U_00{i}") for i in range(1, 5)]
+
+    @pytest.fixture
+    def watermark(self, employees):
+        return {
+            'last_run_at': '2024-11-01T00:00:00Z',
+            'project_history_digests': {
+                employee['user_id']: get_project_history_digest(employee)
+                for employee in employees
+            }
+        }
+
+    @patch('lambda_functions.affinity_calculator.index.get_messenger_logs_since')
+    @patch('lambda_functions.affinity_calculator.index.get_company_events_since')
+    def test_no_changes(self, mock_events, mock_logs, employees, watermark):
+        """변경이 없으면 재계산 대상이 없는지 테스트"""
+        mock_events.return_value = []
+        mock_logs.return_value = []
+
+        assert collect_changed_pairs(employees, watermark) == []
+
+    @patch('lambda_functions.affinity_calculator.index.get_messenger_logs_since')
+    @patch('lambda_functions.affinity_calculator.index.get_company_events_since')
+    def test_new_messages_touch_unordered_pair(self, mock_events, mock_logs, employees, watermark):
+        """새 메시지의 발신/수신 쌍이 순서와 무관하게 한 번만 포함되는지 테스트"""
+        mock_events.return_value = []
+        mock_logs.return_value = [
+            {'sender_id': 'U_003', 'receiver_id': 'U_001'},
+            {'sender_id': 'U_001', 'receiver_id': 'U_003'},
+            {'sender_id': 'U_001', 'receiver_id': 'U_999'}
+        ]
+
+        pairs = collect_changed_pairs(employees, watermark)
+
+        assert _pair_ids(pairs) == [('U_001', 'U_003')]
+
+    @patch('lambda_functions.affinity_calculator.index.get_messenger_logs_since')
+    @patch('lambda_functions.affinity_calculator.index.get_company_events_since')
+    def test_new_event_touches_participants(self, mock_events, mock_logs, employees, watermark):
+        """새 행사 참여자 쌍과 행사 당일 메시지 조회 테스트"""
+        mock_events.return_value = [
+            {'event_date': '2024-11-20', 'participants': ['U_002', 'U_004']}
+        ]
+        mock_logs.return_value = []
+
+        pairs = collect_changed_pairs(employees, watermark)
+
+        assert _pair_ids(pairs) == [('U_002', 'U_004')]
+        mock_logs.assert_called_once_with('2024-11-01T00:00:00Z', {'2024-11-20'})
+
+    @patch('lambda_functions.affinity_calculator.index.get_messenger_logs_since')
+    @patch('lambda_functions.affinity_calculator.index.get_company_events_since')
+    def test_changed_project_history(self, mock_events, mock_logs, employees, watermark):
+        """프로젝트 이력이 바뀐 직원의 모든 쌍이 포함되는지 테스트"""
+        mock_events.return_value = []
+        mock_logs.return_value = []
+        employees[1]['project_history'] = [{'project_name': 'New', 'duration': '2024-01 ~ 2024-06'}]
+
+        pairs = collect_changed_pairs(employees, watermark)
+
+        assert _pair_ids(pairs) == [('U_001', 'U_002'), ('U_002', 'U_003'), ('U_002', 'U_004')]
+
+    @patch('lambda_functions.affinity_calculator.index.get_messenger_logs_since')
+    @patch('lambda_functions.affinity_calculator.index.get_company_events_since')
+    def test_new_employee(self, mock_events, mock_logs, employees, watermark):
+        """워터마크 이후 추가된 직원의 모든 쌍이 포함되는지 테스트"""
+        mock_events.return_value = []
+        mock_logs.return_value = []
+        employees.append(_employee('U_005'))
+
+        pairs = collect_changed_pairs(employees, watermark)
+
+        assert len(pairs) == 4
+        assert all(pair[1]['user_id'] == 'U_005' for pair in pairs)
+
+
+class TestWatermarkStorage:
+    """직원별 워터마크 해시 저장 테스트"""
+
+    @patch('lambda_functions.affinity_calculator.index.dynamodb_client')
+    def test_saves_one_digest_item_per_changed_employee(self, mock_client):
+        """바뀐 직원의 해시만 직원별 항목으로 저장하고 실행 시각은 마지막에 저장하는지 테스트"""
+        employees = [_employee('U_001'), _employee('U_002', [{'project_name': 'A'}])]
+        previous = {'U_001': get_project_history_digest(employees[0]), 'U_002': 'old'}
+
+        save_watermark('2024-11-02T00:00:00Z', employees, previous_digests=previous)
+
+        items = mock_client.batch_put_items.call_args[0][1]
+        assert items == [{
+            'job_name': 'affinity_calculator#digest#U_002',
+            'digest': get_project_history_digest(employees[1])
+        }]
+        mock_client.put_item.assert_called_once_with(
+            'AffinityJobState',
+            {'job_name': 'affinity_calculator', 'last_run_at': '2024-11-02T00:00:00Z'}
+        )
+
+    @patch('lambda_functions.affinity_calculator.index.dynamodb_client')
+    def test_failed_save_raises(self, mock_client):
+        """해시 저장에 실패하면 예외가 발생하고 실행 시각이 갱신되지 않는지 테스트"""
+        mock_client.batch_put_items.side_effect = DynamoDBClientError('throttled')
+
+        with pytest.raises(DynamoDBClientError):
+            save_watermark('2024-11-02T00:00:00Z', [_employee('U_001')])
+
+        mock_client.put_item.assert_not_called()
+
+    @patch('lambda_functions.affinity_calculator.index.dynamodb_client')
+    def test_load_merges_digest_items(self, mock_client):
+        """직원별 해시 항목과 이전 형식 해시 맵을 합쳐 읽는지 테스트"""
+        mock_client.get_item.return_value = {
+            'job_name': 'affinity_calculator',
+            'last_run_at': '2024-11-01T00:00:00Z',
+            'project_history_digests': {'U_001': 'legacy', 'U_002': 'legacy'}
+        }
+        mock_client.batch_get_items.return_value = [
+            {'job_name': 'affinity_calculator#digest#U_002', 'digest': 'new'}
+        ]
+
+        watermark = load_watermark([_employee('U_002'), _employee('U_001')])
+
+        assert watermark == {
+            'last_run_at': '2024-11-01T00:00:00Z',
+            'project_history_digests': {'U_001': 'legacy', 'U_002': 'new'}
+        }
+        assert mock_client.batch_get_items.call_args[0][1] == [
+            {'job_name': 'affinity_calculator#digest#U_001'},
+            {'job_name': 'affinity_calculator#digest#U_002'}
+        ]
+
+    @patch('lambda_functions.affinity_calculator.index.dynamodb_client')
+    def test_messenger_logs_filtered_by_event_dates(self, mock_client):
+        """행사 날짜가 많아도 범위 조건 하나로 스캔하고 행사 당일 메시지만 남기는지 테스트"""
+        mock_client.scan_pages.return_value = iter([[
+            {'sender_id': 'U_001', 'timestamp': '2024-03-15T10:00:00Z'},
+            {'sender_id': 'U_002', 'timestamp': '2024-03-16T10:00:00Z'},
+            {'sender_id': 'U_003', 'timestamp': '2024-11-05T10:00:00Z'}
+        ]])
+        event_dates = {f"2024-03-{day:02d}" for day in range(1, 16)} | {f"2024-{m:02d}-15" for m in range(4, 11)}
+
+        messages = get_messenger_logs_since('2024-11-01T00:00:00Z', event_dates)
+
+        assert [message['sender_id'] for message in messages] == ['U_001', 'U_003']
+        filter_expression = mock_client.scan_pages.call_args[1]['filter_expression']
+        assert filter_expression.get_expression()['operator'] == 'OR'
+
+
+class TestMessengerIndex:
+    """메신저 로그 인덱스 테스트"""
+
+    @patch('lambda_functions.affinity_calculator.index.dynamodb_client')
+    def test_groups_by_unordered_pair(self, mock_client):
+        """메시지가 순서와 무관한 직원 쌍으로 묶이는지 테스트"""
+        mock_client.scan_pages.return_value = iter([
+            [
+                {'sender_id': 'U_001', 'receiver_id': 'U_003', 'timestamp': '2024-11-15T09:23:45Z'},
+                {'sender_id': 'U_003', 'receiver_id': 'U_001', 'timestamp': '2024-11-15T09:26:45Z'}
+            ],
+            [
+                {'sender_id': 'U_002', 'receiver_id': 'U_004', 'timestamp': '2024-11-25T14:30:00Z'},
+                {'sender_id': 'U_002', 'timestamp': '2024-11-25T14:30:00Z'}
+            ]
+        ])
+
+        index = load_messenger_index()
+
+        assert set(index.keys()) == {('U_001', 'U_003'), ('U_002', 'U_004')}
+        assert len(index[('U_001', 'U_003')]) == 2
+        mock_client.scan_pages.assert_called_once_with('MessengerLogs')
+
+    @patch('lambda_functions.affinity_calculator.index.dynamodb_client')
+    def test_event_dates(self, mock_client):
+        """행사 날짜 집합 생성 테스트"""
+        mock_client.scan_pages.return_value = iter([
+            [{'event_id': 'EVT_001', 'event_date': '2024-01-20'}, {'event_id': 'EVT_002'}]
+        ])
+
+        assert load_company_event_dates() == {'2024-01-20'}
+
+    @patch('lambda_functions.affinity_calculator.index.affinity_repo')
+    @patch('lambda_functions.affinity_calculator.index.get_sorted_employees')
+    @patch('lambda_functions.affinity_calculator.index.dynamodb_client')
+    def test_scan_error_aborts_run(self, mock_client, mock_employees, mock_repo):
+        """메신저 로그/행사 조회에 실패하면 점수를 저장하지 않고 실행이 실패하는지 테스트"""
+        mock_client.scan_pages.side_effect = DynamoDBClientError('throttled')
+        mock_employees.return_value = [_employee('U_001'), _employee('U_002')]
+
+        with pytest.raises(DynamoDBClientError):
+            load_messenger_index()
+        with pytest.raises(DynamoDBClientError):
+            load_company_event_dates()
+
+        response = handler({'mode': 'full'}, None)
+
+        assert response['statusCode'] == 500
+        mock_repo.upsert_many.assert_not_called()
+
+    def test_scoring_uses_event_dates(self):
+        """행사 당일 메시지에 행사 가중치가 적용되는지 테스트"""
+        messages = [{'timestamp': '2024-03-15T10:00:00Z'}]
+
+        without_event = analyze_messenger_communication(
+            'U_001', 'U_002', messages=messages, event_dates=set()
+        )
+        with_event = analyze_messenger_communication(
+            'U_001', 'U_002', messages=messages, event_dates={'2024-03-15'}
+        )
+
+        assert with_event.total_messages_exchanged == 1
+        assert with_event.communication_score == pytest.approx(
+            without_event.communication_score * 2.0
+        )
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy 미설치")
+class TestScoringKernelParity:
+    """배치 커널과 스칼라 계산 결과 일치 테스트"""
+
+    NOW = datetime(2024, 12, 1, 12, 0, 0)
+
+    @pytest.fixture
+    def messenger_index(self):
+        return {
+            ('U_001', 'U_002'): [
+                {'timestamp': '2024-11-15T09:23:45Z', 'response_time_minutes': 3.0},
+                {'timestamp': '2024-11-16T20:00:00Z', 'response_time_minutes': 45.0},
+                {'timestamp': '2024-03-15T10:00:00Z', 'is_vacation_period': False},
+                {'timestamp': '2024-07-01T07:59:59+09:00', 'is_vacation_period': True},
+                {'timestamp': '2023-01-01T18:00:00Z', 'response_time_minutes': 0},
+                {'timestamp': 'invalid', 'response_time_minutes': 500.0},
+                {'timestamp': ''}
+            ],
+            ('U_001', 'U_003'): [
+                {'timestamp': '2024-11-30T11:59:59Z'}
+            ],
+            ('U_002', 'U_003'): [
+                {'timestamp': f"2024-11-{day:02d}T{hour:02d}:30:00Z", 'response_time_minutes': float(day)}
+                for day in range(1, 29) for hour in (8, 13, 22)
+            ]
+        }
+
+    def test_messenger_scores_match_scalar(self, messenger_index):
+        """메신저 점수가 스칼라 구현과 일치하는지 테스트"""
+        event_dates = {'2024-03-15', '2024-11-16', 'not-a-date'}
+
+        kernel_scores = score_messenger_index(messenger_index, event_dates, current_time=self.NOW)
+
+        for (employee_1_id, employee_2_id), messages in messenger_index.items():
+            scalar = analyze_messenger_communication(
+                employee_1_id,
+                employee_2_id,
+                messages=messages,
+                event_dates=event_dates,
+                current_time=self.NOW
+            )
+            total_messages, avg_response_time, communication_score = kernel_scores[(employee_1_id, employee_2_id)]
+
+            assert total_messages == scalar.total_messages_exchanged
+            assert avg_response_time == pytest.approx(scalar.avg_response_time_minutes)
+            assert communication_score == pytest.approx(scalar.communication_score)
+
+    def test_empty_index(self):
+        """메시지가 없으면 빈 결과를 반환하는지 테스트"""
+        assert score_messenger_index({}, set()) == {}
+
+    def test_weighted_average_matches_scalar(self):
+        """가중 평균 커널이 스칼라 구현과 일치하는지 테스트 (범위 제한 포함)"""
+        rows = [(0, 0, 0, 0), (80, 55.5, 40, 85), (100, 100, 100, 100), (300, 0, 0, 0), (-50, 0, 0, 0)]
+
+        kernel = weighted_average_kernel(*zip(*rows))
+
+        for row, score in zip(rows, kernel):
+            assert score == pytest.approx(calculate_weighted_average(*row))
+
+    @patch('lambda_functions.affinity_calculator.index.analyze_company_events')
+    @patch('lambda_functions.affinity_calculator.index.analyze_personal_closeness')
+    def test_batch_matches_scalar(self, mock_personal, mock_events, messenger_index):
+        """배치 친밀도 계산이 쌍별 계산과 일치하는지 테스트"""
+        from common.models import CompanyEvents, PersonalCloseness
+        mock_events.return_value = CompanyEvents(shared_events=[], social_score=40.0)
+        mock_personal.return_value = PersonalCloseness(
+            payday_contact_frequency=0,
+            vacation_day_contact_frequency=0,
+            personal_score=85.0
+        )
+        employees = [
+            _employee('U_001', [{'project_name': 'A', 'duration': '2024-01 ~ 2024-06'}]),
+            _employee('U_002', [{'project_name': 'A', 'duration': '2024-03 ~ 2024-12'}]),
+            _employee('U_003'),
+            _employee('U_004')
+        ]
+        pairs = [(employees[i], employees[j]) for i in range(4) for j in range(i + 1, 4)]
+        event_dates = {'2024-11-16'}
+        messenger_scores = score_messenger_index(messenger_index, event_dates)
+
+        batch = calculate_affinity_scores_batch(
+            pairs,
+            messenger_index=messenger_index,
+            event_dates=event_dates,
+            messenger_scores=messenger_scores
+        )
+
+        assert len(batch) == len(pairs)
+        for (employee_1, employee_2), affinity in zip(pairs, batch):
+            scalar = calculate_affinity_score(
+                employee_1,
+                employee_2,
+                messenger_index=messenger_index,
+                event_dates=event_dates
+            )
+            assert affinity.affinity_id == scalar.affinity_id
+            assert affinity.messenger_communication.total_messages_exchanged == \
+                scalar.messenger_communication.total_messages_exchanged
+            assert affinity.overall_affinity_score == pytest.approx(scalar.overall_affinity_score)
+
+
+class TestShardPlanning:
+    """직원 쌍 샤드 분할 테스트"""
+
+    @pytest.mark.parametrize('employee_count', [0, 1, 2, 7, 40])
+    @pytest.mark.parametrize('shard_count', [1, 3, 8, 100])
+    def test_shards_cover_all_pairs_once(self, employee_count, shard_count):
+        """샤드 합집합이 모든 직원 쌍을 정확히 한 번씩 포함하는지 테스트"""
+        employees = [_employee(f"U_{i:03d}") for i in range(employee_count)]
+
+        shards = plan_pair_shards(employees, shard_count)
+        pairs = [pair for shard in shards for pair in _pair_ids(iter_shard_pairs(employees, shard))]
+
+        assert len(shards) <= shard_count
+        assert pairs == _pair_ids(combinations(employees, 2))
+        assert [shard['pair_count'] for shard in shards] == [
+            len(list(iter_shard_pairs(employees, shard))) for shard in shards
+        ]
+
+    def test_shards_are_balanced(self):
+        """샤드별 직원 쌍 수가 비슷한지 테스트"""
+        employees = [_employee(f"U_{i:03d}") for i in range(200)]
+
+        counts = [shard['pair_count'] for shard in plan_pair_shards(employees, 4)]
+
+        assert len(counts) == 4
+        assert max(counts) - min(counts) < 200
+
+    def test_new_employee_is_covered(self):
+        """계획 이후 추가된 직원도 ID 경계 샤드에 포함되는지 테스트"""
+        employees = [_employee(f"U_{i:03d}") for i in range(0, 20, 2)]
+        shards = plan_pair_shards(employees, 3)
+
+        employees = sorted(employees + [_employee('U_005')], key=lambda e: e['user_id'])
+        pairs = [pair for shard in shards for pair in _pair_ids(iter_shard_pairs(employees, shard))]
+
+        assert sorted(pairs) == sorted(_pair_ids(combinations(employees, 2)))
+
+    def test_pending_shards(self):
+        """완료되지 않은 샤드만 반환하는지 테스트"""
+        state = {
+            'run_id': 'R1',
+            'shards': {
+                'shard-0001': {'shard_id': 'shard-0001', 'status': 'failed'},
+                'shard-0000': {'shard_id': 'shard-0000', 'status': 'completed'},
+                'shard-0002': {'shard_id': 'shard-0002', 'status': 'pending'}
+            }
+        }
+
+        assert [shard['shard_id'] for shard in get_pending_shards(state)] == ['shard-0001', 'shard-0002']
+        assert get_pending_shards(None) == []
+
+
+@patch('lambda_functions.affinity_calculator.index.save_watermark')
+@patch('lambda_functions.affinity_calculator.index.update_shard_status')
+@patch('lambda_functions.affinity_calculator.index.save_shard_state')
+@patch('lambda_functions.affinity_calculator.index.load_shard_state')
+class TestShardCoordinator:
+    """샤드 코디네이터 테스트"""
+
+    @pytest.fixture
+    def employees(self):
+        return [_employee(f"U_{i:03d}") for i in range(10)]
+
+    @staticmethod
+    def _final_statuses(mock_update):
+        return {
+            call.args[1]: call.args[2]
+            for call in mock_update.call_args_list
+            if call.args[2] in ('completed', 'failed')
+        }
+
+    @patch('lambda_functions.affinity_calculator.index.load_scoring_inputs', return_value=({}, set(), None))
+    @patch('lambda_functions.affinity_calculator.index.process_employee_pairs')
+    def test_inline_run(self, mock_process, mock_inputs, mock_load, mock_save, mock_update, mock_watermark, employees):
+        """모든 샤드가 완료되면 워터마크가 저장되는지 테스트"""
+        mock_process.side_effect = lambda pairs, *args, **kwargs: len(list(pairs))
+
+        result = coordinate_sharded_run(employees, 'R1', shard_count=3)
+        body = json.loads(result['body'])
+
+        assert result['statusCode'] == 200
+        assert body['processed_pairs'] == 45
+        assert set(self._final_statuses(mock_update).values()) == {'completed'}
+        assert len(mock_save.call_args.args[1]) == 3
+        mock_load.assert_not_called()
+        mock_watermark.assert_called_once_with('R1', employees)
+
+    @patch('lambda_functions.affinity_calculator.index.load_scoring_inputs', return_value=({}, set(), None))
+    @patch('lambda_functions.affinity_calculator.index.run_affinity_shard')
+    def test_failed_shard_blocks_watermark(self, mock_run, mock_inputs, mock_load, mock_save, mock_update, mock_watermark, employees):
+        """실패한 샤드가 있으면 failed로 기록하고 워터마크를 저장하지 않는지 테스트"""
+        def _run(employees, shard, *args, **kwargs):
+            if shard['shard_id'] == 'shard-0001':
+                raise RuntimeError('throttled')
+            return shard['pair_count']
+        mock_run.side_effect = _run
+
+        result = coordinate_sharded_run(employees, 'R1', shard_count=3)
+
+        assert result['statusCode'] == 500
+        assert json.loads(result['body'])['failed_shards'] == ['shard-0001']
+        assert self._final_statuses(mock_update)['shard-0001'] == 'failed'
+        mock_watermark.assert_not_called()
+
+    @patch('lambda_functions.affinity_calculator.index.load_scoring_inputs', return_value=({}, set(), None))
+    @patch('lambda_functions.affinity_calculator.index.run_affinity_shard', return_value=5)
+    def test_resume_runs_pending_shards_only(self, mock_run, mock_inputs, mock_load, mock_save, mock_update, mock_watermark, employees):
+        """재실행 시 미완료 샤드만 같은 실행 ID로 다시 실행하는지 테스트"""
+        mock_load.return_value = {
+            'run_id': 'R0',
+            'shards': {
+                'shard-0000': {'shard_id': 'shard-0000', 'start_id': None, 'end_id': 'U_003', 'status': 'completed'},
+                'shard-0001': {'shard_id': 'shard-0001', 'start_id': 'U_003', 'end_id': None, 'status': 'failed'}
+            }
+        }
+
+        result = coordinate_sharded_run(employees, 'R1', shard_count=2, resume=True)
+
+        assert json.loads(result['body'])['run_id'] == 'R0'
+        assert [call.args[1]['shard_id'] for call in mock_run.call_args_list] == ['shard-0001']
+        mock_save.assert_not_called()
+        mock_watermark.assert_called_once_with('R0', employees)
+
+    @patch('lambda_functions.affinity_calculator.index.lambda_client')
+    def test_lambda_fan_out(self, mock_lambda, mock_load, mock_save, mock_update, mock_watermark, employees):
+        """샤드마다 워커 Lambda를 비동기 호출하는지 테스트"""
+        context = MagicMock(function_name='AffinityScoreCalculator')
+
+        result = coordinate_sharded_run(employees, 'R1', shard_count=3, executor='lambda', context=context)
+
+        assert result['statusCode'] == 202
+        assert mock_lambda.invoke.call_count == 3
+        payload = json.loads(mock_lambda.invoke.call_args.kwargs['Payload'])
+        assert payload['run_id'] == 'R1'
+        assert payload['shard']['shard_id'] == 'shard-0002'
+        assert mock_lambda.invoke.call_args.kwargs['InvocationType'] == 'Event'
+        mock_watermark.assert_not_called()
+
+    @patch('lambda_functions.affinity_calculator.index.lambda_client')
+    def test_resume_skips_shards_with_live_lease(self, mock_lambda, mock_load, mock_save, mock_update, mock_watermark, employees):
+        """재실행 시 리스가 유효한 실행 중 샤드는 다시 호출하지 않고 만료된 샤드만 호출하는지 테스트"""
+        mock_load.return_value = {
+            'run_id': 'R0',
+            'shards': {
+                'shard-0000': {'shard_id': 'shard-0000', 'status': 'running', 'lease_expires_at': '2999-01-01T00:00:00Z'},
+                'shard-0001': {'shard_id': 'shard-0001', 'status': 'running', 'lease_expires_at': '2000-01-01T00:00:00Z'},
+                'shard-0002': {'shard_id': 'shard-0002', 'status': 'completed'}
+            }
+        }
+        context = MagicMock(function_name='AffinityScoreCalculator')
+
+        result = coordinate_sharded_run(employees, 'R1', shard_count=3, executor='lambda', resume=True, context=context)
+        body = json.loads(result['body'])
+
+        assert body['dispatched_shards'] == ['shard-0001']
+        assert body['leased_shards'] == ['shard-0000']
+        assert mock_lambda.invoke.call_count == 1
+        assert mock_update.call_args.args[:3] == ('R0', 'shard-0001', 'running')
+        assert mock_update.call_args.kwargs['lease_expires_at'] > '2000-01-01T00:00:00Z'
+
+    @patch('lambda_functions.affinity_calculator.index.lambda_client')
+    def test_resume_waits_when_all_shards_leased(self, mock_lambda, mock_load, mock_save, mock_update, mock_watermark, employees):
+        """모든 미완료 샤드가 실행 중이면 새 계획 없이 대기 응답을 반환하는지 테스트"""
+        mock_load.return_value = {
+            'run_id': 'R0',
+            'shards': {
+                'shard-0000': {'shard_id': 'shard-0000', 'status': 'running', 'lease_expires_at': '2999-01-01T00:00:00Z'}
+            }
+        }
+
+        result = coordinate_sharded_run(employees, 'R1', shard_count=3, executor='lambda', resume=True)
+
+        assert result['statusCode'] == 202
+        assert json.loads(result['body'])['leased_shards'] == ['shard-0000']
+        mock_lambda.invoke.assert_not_called()
+        mock_save.assert_not_called()
+        mock_update.assert_not_called()
+
+    @patch('lambda_functions.affinity_calculator.index.load_scoring_inputs', return_value=({}, set(), None))
+    @patch('lambda_functions.affinity_calculator.index.run_affinity_shard', return_value=7)
+    @patch('lambda_functions.affinity_calculator.index.get_sorted_employees')
+    def test_last_shard_worker_saves_watermark(self, mock_employees, mock_run, mock_inputs, mock_load, mock_save, mock_update, mock_watermark, employees):
+        """마지막으로 완료된 샤드 워커가 워터마크를 저장하는지 테스트"""
+        mock_employees.return_value = employees
+        mock_update.return_value = {
+            'run_id': 'R1',
+            'shards': {'shard-0000': {'shard_id': 'shard-0000', 'status': 'completed'}}
+        }
+
+        result = run_shard_invocation({'run_id': 'R1', 'shard': {'shard_id': 'shard-0000'}})
+
+        assert json.loads(result['body'])['processed_pairs'] == 7
+        mock_update.assert_called_once_with('R1', 'shard-0000', 'completed', processed_pairs=7)
+        mock_watermark.assert_called_once_with('R1', employees)
+
+
+class TestSparseAffinitySelector:
+    """sparse 친밀도 저장 선택 테스트"""
+
+    @staticmethod
+    def _affinity(employee_1, employee_2, score):
+        from common.models import Affinity
+        return Affinity.default_for_pair(employee_1, employee_2, score)
+
+    def test_threshold_and_top_k(self):
+        """임계값 이상 쌍과 직원별 상위 K개만 선택되는지 테스트"""
+        selector = SparseAffinitySelector(top_k=1, min_score=60.0)
+        affinities = [
+            self._affinity('U_001', 'U_002', 90.0),
+            self._affinity('U_001', 'U_003', 30.0),
+            self._affinity('U_001', 'U_004', 10.0),
+            self._affinity('U_003', 'U_004', 20.0)
+        ]
+
+        selected = [a.affinity_id for a in selector.select(affinities)]
+        flushed = sorted(a.affinity_id for a in selector.flush())
+
+        assert selected == ['AFF_U_001_U_002']
+        # U_001: 30, U_003: 30, U_004: 20 (U_002는 임계값 이상 쌍만 있음)
+        assert flushed == ['AFF_U_001_U_003', 'AFF_U_003_U_004']
+        assert selector.flush() == []
+
+    def test_top_k_zero_keeps_threshold_only(self):
+        """K가 0이면 임계값 이상 쌍만 저장되는지 테스트"""
+        selector = SparseAffinitySelector(top_k=0, min_score=50.0)
+
+        assert selector.select([self._affinity('U_001', 'U_002', 40.0)]) == []
+        assert selector.flush() == []
+
+    @patch('lambda_functions.affinity_calculator.index.affinity_repo')
+    @patch('lambda_functions.affinity_calculator.index.calculate_affinity_scores_batch')
+    def test_process_pairs_stores_selected_only(self, mock_batch, mock_repo):
+        """sparse 선택기로 처리하면 선택된 쌍만 저장되는지 테스트"""
+        from lambda_functions.affinity_calculator.index import process_employee_pairs
+        employees = [_employee(f"U_00{i}") for i in range(1, 5)]
+        scores = {('U_001', 'U_002'): 80.0}
+        mock_batch.side_effect = lambda batch, **kwargs: [
+            self._affinity(e1['user_id'], e2['user_id'], scores.get((e1['user_id'], e2['user_id']), 5.0))
+            for e1, e2 in batch
+        ]
+        mock_repo.upsert_many.side_effect = lambda affinities, max_workers=1: len(affinities)
+
+        processed = process_employee_pairs(
+            combinations(employees, 2), {}, set(),
+            selector=SparseAffinitySelector(top_k=1, min_score=50.0)
+        )
+        stored = [a.affinity_id for call in mock_repo.upsert_many.call_args_list for a in call.args[0]]
+
+        assert processed == 6
+        assert stored[0] == 'AFF_U_001_U_002'
+        assert len(stored) < 6
+
+
+@patch('lambda_functions.affinity_calculator.index.AFFINITY_MIN_SCORE', 60.0)
+@patch('lambda_functions.affinity_calculator.index.AFFINITY_TOP_K', 1)
+class TestSparseCompaction:
+    """sparse 저장 정리 및 샤드 간 상위 K개 병합 테스트"""
+
+    @staticmethod
+    def _item(employee_1, employee_2, score, calculated_at):
+        return {
+            'affinity_id': f"AFF_{employee_1}_{employee_2}",
+            'employee_1': employee_1,
+            'employee_2': employee_2,
+            'overall_affinity_score': score,
+            'calculated_at': calculated_at
+        }
+
+    @pytest.fixture
+    def stored_items(self):
+        return [
+            self._item('U_001', 'U_002', 90.0, 'R1'),
+            self._item('U_001', 'U_003', 30.0, 'R1'),
+            self._item('U_001', 'U_004', 10.0, 'R1'),
+            self._item('U_003', 'U_004', 20.0, 'R1'),
+            # 이전 실행에서 저장된 높은 점수 (이번 실행에서는 선택되지 않음)
+            self._item('U_002', 'U_003', 95.0, 'R0')
+        ]
+
+    @patch('lambda_functions.affinity_calculator.index.affinity_repo')
+    @patch('lambda_functions.affinity_calculator.index.dynamodb_client')
+    def test_full_run_deletes_stale_and_unselected(self, mock_client, mock_repo, stored_items):
+        """전체 계산 후 이전 실행 항목과 상위 K개 밖의 임계값 미만 항목이 삭제되는지 테스트"""
+        from lambda_functions.affinity_calculator.index import compact_sparse_affinities
+        mock_client.scan_pages.side_effect = lambda table_name: iter([stored_items[:3], stored_items[3:]])
+        mock_repo.delete_many.side_effect = lambda ids, max_workers=1: len(ids)
+
+        deleted = compact_sparse_affinities('R1')
+
+        deleted_ids = [i for call in mock_repo.delete_many.call_args_list for i in call.args[0]]
+        assert deleted == 2
+        assert sorted(deleted_ids) == ['AFF_U_001_U_004', 'AFF_U_002_U_003']
+
+        # 삭제된 쌍을 조회할 때 사용할 기본 점수 저장
+        mock_client.put_item.assert_called_once_with(
+            'AffinityJobState', {'job_name': 'affinity_calculator#default_score', 'score': 20.75}
+        )
+
+    def test_baseline_is_lowest_stored_score(self):
+        """협업/메신저 기록이 없는 쌍의 점수가 공통 기본 점수와 같은지 테스트"""
+        from common.repositories import DEFAULT_AFFINITY_SCORE
+        from lambda_functions.affinity_calculator.index import baseline_affinity_score
+
+        assert baseline_affinity_score() == pytest.approx(DEFAULT_AFFINITY_SCORE)
+        assert baseline_affinity_score() == pytest.approx(calculate_weighted_average(0.0, 0.0, 40.0, 85.0))
+
+    @patch('lambda_functions.affinity_calculator.index.affinity_repo')
+    @patch('lambda_functions.affinity_calculator.index.dynamodb_client')
+    def test_incremental_keeps_unchanged_pairs(self, mock_client, mock_repo, stored_items):
+        """증분 계산 정리는 실행 ID와 무관하게 저장된 항목 기준으로 선택하는지 테스트"""
+        from lambda_functions.affinity_calculator.index import compact_sparse_affinities
+        mock_client.scan_pages.side_effect = lambda table_name: iter([stored_items])
+        mock_repo.delete_many.side_effect = lambda ids, max_workers=1: len(ids)
+
+        assert compact_sparse_affinities() == 1
+        assert mock_repo.delete_many.call_args.args[0] == ['AFF_U_001_U_004']
+
+    @patch('lambda_functions.affinity_calculator.index.AFFINITY_STORAGE_MODE', 'sparse')
+    @patch('lambda_functions.affinity_calculator.index.compact_sparse_affinities')
+    @patch('lambda_functions.affinity_calculator.index.save_watermark')
+    @patch('lambda_functions.affinity_calculator.index.update_shard_status')
+    @patch('lambda_functions.affinity_calculator.index.save_shard_state')
+    @patch('lambda_functions.affinity_calculator.index.load_scoring_inputs', return_value=({}, set(), None))
+    @patch('lambda_functions.affinity_calculator.index.affinity_repo')
+    @patch('lambda_functions.affinity_calculator.index.calculate_affinity_scores_batch')
+    def test_inline_shards_merge_top_k_before_writing(
+        self, mock_batch, mock_repo, mock_inputs, mock_save, mock_update, mock_watermark, mock_compact
+    ):
+        """샤드별 상위 K개를 병합해 전체 상위 K개만 저장하는지 테스트"""
+        from common.models import Affinity
+        employees = [_employee(f"U_00{i}") for i in range(1, 7)]
+        scores = {pair: float(10 + index) for index, pair in enumerate(combinations(range(1, 7), 2))}
+        mock_batch.side_effect = lambda batch, **kwargs: [
+            Affinity.default_for_pair(
+                e1['user_id'], e2['user_id'],
+                scores[(int(e1['user_id'][-1]), int(e2['user_id'][-1]))]
+            )
+            for e1, e2 in batch
+        ]
+        mock_repo.upsert_many.side_effect = lambda affinities, max_workers=1: len(affinities)
+
+        result = coordinate_sharded_run(employees, 'R1', shard_count=3)
+
+        expected = SparseAffinitySelector(top_k=1, min_score=60.0)
+        expected.select([
+            Affinity.default_for_pair(e1['user_id'], e2['user_id'], scores[(int(e1['user_id'][-1]), int(e2['user_id'][-1]))])
+            for e1, e2 in combinations(employees, 2)
+        ])
+        stored = [a for call in mock_repo.upsert_many.call_args_list for a in call.args[0]]
+        assert result['statusCode'] == 200
+        assert mock_repo.upsert_many.call_count == 1
+        assert sorted(a.affinity_id for a in stored) == sorted(a.affinity_id for a in expected.flush())
+        assert {a.calculated_at for a in stored} == {'R1'}
+        mock_compact.assert_called_once_with('R1')
+        mock_watermark.assert_called_once_with('R1', employees)
@@ -0,0 +1,742 @@
+"""
+대시보드 메트릭 집계 단위 테스트
+
+Requirements: 8.1, 8.2
+"""
+
+import json
+import sys
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from boto3.dynamodb.types import TypeSerializer
+# 모듈 로드 시 생성되는 boto3 리소스가 이후 테스트의 mock_aws에 연결되도록 moto를 먼저 임포트
+from moto import mock_aws
+
+from lambda_functions.dashboard_metrics import index as dashboard
+from lambda_functions.dashboard_metrics import view as view_module
+from lambda_functions.dashboard_metrics.accumulators import ACCUMULATORS, aggregate_snapshot, required_attributes
+
+
+EMPLOYEES = [
+    {
+        'user_id': 'U_001',
+        'department': '개발',
+        'basic_info': {'role': 'Backend Developer', 'years_of_experience': 12},
+        'skills': [
+            {'name': 'Python', 'level': 'Expert', 'years': 5},
+            {'name': 'AWS', 'level': 'Advanced', 'years': 3}
+        ],
+        'work_experience': [{'project_name': '금융 시스템', 'role': 'Tech Lead', 'performance_result': '응답 속도 40% 개선'}],
+        'education': {'degree': '학사'},
+        'certifications': ['AWS SAA'],
+        'self_introduction': '백엔드 아키텍처 설계 경험이 많습니다.'
+    },
+    {
+        'user_id': 'U_002',
+        'department': '개발',
+        'basic_info': {'role': 'Frontend Developer', 'years_of_experience': 4},
+        'skills': [{'name': 'React', 'level': 'Intermediate', 'years': 2}],
+        'work_experience': []
+    },
+    {
+        'user_id': 'U_003',
+        'department': '데이터',
+        'basic_info': {'role': 'Data Engineer', 'years_of_experience': 1},
+        'skills': [{'name': 'Python', 'level': 'Beginner', 'years': 1}],
+        'work_experience': []
+    }
+]
+
+PROJECTS = [
+    {
+        'project_id': 'P_001',
+        'status': 'in-progress',
+        'team_members': [{'employee_id': 'U_001'}],
+        'tech_stack': {'backend': ['Python', 'Go']},
+        'client_industry': '금융',
+        'budget_scale': '대형'
+    },
+    {
+        'project_id': 'P_002',
+        'status': 'completed',
+        'team_members': [{'employee_id': 'U_002'}],
+        'tech_stack': {'frontend': ['React']}
+    }
+]
+
+EVALUATIONS = [
+    {'evaluation_id': 'E_001', 'status': 'approved', 'type': 'career', 'overall_score': 80},
+    {'evaluation_id': 'E_002', 'status': 'pending', 'overall_score': 60, 'submitted_at': '2024-01-15T10:30:00Z'}
+]
+
+PENDING_CANDIDATES = [
+    {'candidate_id': 'C_001', 'verification_completed': True, 'created_at': '2024-01-10T09:00:00Z'},
+    {'candidate_id': 'C_002'}
+]
+
+
+def _paged_table(items, page_size=2):
+    """LastEvaluatedKey로 페이지를 나눠 반환하는 테이블 Mock"""
+    table = MagicMock()
+
+    def scan(**kwargs):
+        start = kwargs.get('ExclusiveStartKey', {}).get('offset', 0)
+        page = items[start:start + page_size]
+        response = {'Items': page, 'Count': len(page)}
+        if start + page_size < len(items):
+            response['LastEvaluatedKey'] = {'offset': start + page_size}
+        return response
+
+    table.scan.side_effect = scan
+    return table
+
+
+@pytest.fixture
+def tables():
+    """테이블 이름별 페이지네이션 테이블 Mock"""
+    tables = {
+        dashboard.EMPLOYEES_TABLE: _paged_table(EMPLOYEES),
+        dashboard.PROJECTS_TABLE: _paged_table(PROJECTS),
+        dashboard.EVALUATIONS_TABLE: _paged_table(EVALUATIONS),
+        dashboard.PENDING_CANDIDATES_TABLE: _paged_table(PENDING_CANDIDATES)
+    }
+    mock_dynamodb = MagicMock()
+    mock_dynamodb.Table.side_effect = lambda name: tables[name]
+
+    with patch.object(dashboard, 'dynamodb', mock_dynamodb), \
+            patch.object(dashboard, '_worker_dynamodb', return_value=mock_dynamodb):
+        yield tables
+
+
+@pytest.fixture(autouse=True)
+def last_good_results():
+    """테스트마다 마지막 정상 결과 초기화"""
+    with patch.dict(dashboard._last_good_results, clear=True):
+        yield dashboard._last_good_results
+
+
+@pytest.fixture(autouse=True)
+def empty_response_cache():
+    """테스트마다 대시보드 응답 캐시 초기화"""
+    dashboard.response_cache.clear()
+    yield dashboard.response_cache
+    dashboard.response_cache.clear()
+
+
+class TestDashboardSnapshot:
+    """대시보드 스냅샷 로더 테스트"""
+
+    def test_snapshot_reads_all_pages(self, tables):
+        """모든 페이지를 읽어 스냅샷을 만드는지 테스트"""
+        snapshot = dashboard.load_dashboard_snapshot()
+
+        assert snapshot['employees'] == EMPLOYEES
+        assert snapshot['projects'] == PROJECTS
+        assert snapshot['evaluations'] == EVALUATIONS
+        assert snapshot['pending_candidates'] == PENDING_CANDIDATES
+        # 직원 3명 / 페이지 크기 2 = 2페이지
+        assert tables[dashboard.EMPLOYEES_TABLE].scan.call_count == 2
+
+    def test_failed_table_is_empty(self, tables):
+        """조회에 실패한 테이블은 빈 목록으로 처리되는지 테스트"""
+        tables[dashboard.PENDING_CANDIDATES_TABLE].scan.side_effect = Exception('not found')
+
+        snapshot = dashboard.load_dashboard_snapshot()
+
+        assert snapshot['pending_candidates'] == []
+        assert snapshot['employees'] == EMPLOYEES
+
+    def test_handler_scans_each_table_once(self, tables):
+        """lambda_handler가 테이블별로 한 번만 전체 조회하는지 테스트"""
+        response = dashboard.lambda_handler({'httpMethod': 'GET'}, None)
+
+        assert response['statusCode'] == 200
+        # 페이지 수만큼만 scan 호출 (직원 2페이지, 나머지 1페이지)
+        assert tables[dashboard.EMPLOYEES_TABLE].scan.call_count == 2
+        assert tables[dashboard.PROJECTS_TABLE].scan.call_count == 1
+        assert tables[dashboard.EVALUATIONS_TABLE].scan.call_count == 1
+        assert tables[dashboard.PENDING_CANDIDATES_TABLE].scan.call_count == 1
+
+        body = json.loads(response['body'])
+        assert body['total_employees'] == 3
+        assert body['active_projects'] == 1
+        assert body['available_employees'] == 2
+        assert body['pending_candidates'] == 2
+        assert body['action_required']['verification_needed'] == 1
+        assert body['evaluation_stats']['approval_rate'] == 100.0
+
+    def test_standalone_calls_match_snapshot(self, tables):
+        """스냅샷 없이 호출해도 같은 결과를 반환하는지 테스트"""
+        snapshot = dashboard.load_dashboard_snapshot()
+
+        assert dashboard.get_total_employees() == dashboard.get_total_employees(snapshot)
+        assert dashboard.get_pending_candidates() == dashboard.get_pending_candidates(snapshot)
+        assert dashboard.get_utilization_analysis() == dashboard.get_utilization_analysis(snapshot)
+        assert dashboard.get_skill_gap_analysis() == dashboard.get_skill_gap_analysis(snapshot)
+        assert dashboard.get_top_skills() == dashboard.get_top_skills(snapshot)
+
+
+class TestConcurrentSections:
+    """섹션 동시 계산 및 제한 시간 테스트"""
+
+    @staticmethod
+    def _blocking_scan(blocked_table, release):
+        """지정한 테이블 조회만 release 이벤트까지 대기하는 scan_all_items 대체 함수"""
+        original = dashboard.scan_all_items
+
+        def scan(table_name, resource=None, attributes=None):
+            if table_name == blocked_table:
+                release.wait(5)
+            return original(table_name, resource, attributes)
+        return scan
+
+    def test_tables_loaded_concurrently(self, tables):
+        """테이블 조회가 동시에 실행되는지 테스트"""
+        barrier = threading.Barrier(len(dashboard.SNAPSHOT_TABLES))
+        original = dashboard.scan_all_items
+
+        def scan(table_name, resource=None, attributes=None):
+            # 순차 실행이면 첫 조회가 나머지를 기다리다 BrokenBarrierError 발생
+            barrier.wait(timeout=2)
+            return original(table_name, resource, attributes)
+
+        with patch.object(dashboard, 'scan_all_items', side_effect=scan):
+            snapshot, table_status = dashboard.load_snapshot_tables()
+
+        assert set(table_status.values()) == {dashboard.SECTION_OK}
+        assert snapshot['employees'] == EMPLOYEES
+
+    def test_slow_table_times_out_dependent_sections(self, tables):
+        """제한 시간을 넘긴 테이블에 의존하는 섹션만 timed_out으로 응답하는지 테스트"""
+        release = threading.Event()
+        scan = self._blocking_scan(dashboard.PROJECTS_TABLE, release)
+
+        try:
+            with patch.object(dashboard, 'scan_all_items', side_effect=scan), \
+                    patch.object(dashboard, 'DASHBOARD_SECTION_TIMEOUT', 0.2), \
+                    patch.object(dashboard, 'save_view') as mock_save:
+                metrics = dashboard.get_dashboard_metrics()
+        finally:
+            release.set()
+
+        status = metrics['section_status']
+        assert status['active_projects'] == dashboard.SECTION_TIMED_OUT
+        assert status['available_employees'] == dashboard.SECTION_TIMED_OUT
+        assert metrics['active_projects'] == 0
+        assert status['total_employees'] == dashboard.SECTION_OK
+        assert metrics['total_employees'] == 3
+        assert metrics['pending_candidates'] == 2
+        # 일부 테이블이 빠진 결과로 view를 덮어쓰지 않음
+        mock_save.assert_not_called()
+
+    def test_timed_out_section_uses_last_good_result(self, tables):
+        """이전 정상 결과가 있으면 stale로 표시해 대체하는지 테스트"""
+        first = dashboard.get_dashboard_metrics()
+        release = threading.Event()
+        scan = self._blocking_scan(dashboard.PROJECTS_TABLE, release)
+
+        try:
+            with patch.object(dashboard, 'scan_all_items', side_effect=scan), \
+                    patch.object(dashboard, 'DASHBOARD_SECTION_TIMEOUT', 0.2):
+                metrics = dashboard.get_dashboard_metrics()
+        finally:
+            release.set()
+
+        assert metrics['section_status']['active_projects'] == dashboard.SECTION_STALE
+        assert metrics['active_projects'] == first['active_projects'] == 1
+        assert metrics['section_status']['total_employees'] == dashboard.SECTION_OK
+
+    def test_failed_table_marks_sections_failed(self, tables):
+        """조회에 실패한 테이블에 의존하는 섹션이 failed로 응답하는지 테스트"""
+        tables[dashboard.EVALUATIONS_TABLE].scan.side_effect = Exception('throttled')
+
+        metrics = dashboard.get_dashboard_metrics()
+
+        assert metrics['section_status']['evaluation_stats'] == dashboard.SECTION_FAILED
+        assert metrics['evaluation_stats'] == ACCUMULATORS['evaluation_stats']().default()
+        assert metrics['section_status']['total_employees'] == dashboard.SECTION_OK
+
+
+class TestSelectableSections:
+    """섹션 선택 및 프로젝션 조회 테스트"""
+
+    @staticmethod
+    def _project(items, attributes):
+        """속성 목록만 남긴 항목 (DynamoDB ProjectionExpression과 동일)"""
+        if attributes is None:
+            return items
+        return [{name: item[name] for name in attributes if name in item} for item in items]
+
+    def test_declared_attributes_cover_each_section(self):
+        """선언한 속성만 읽어도 섹션 결과가 전체 항목과 같은지 테스트"""
+        snapshot = {
+            'employees': EMPLOYEES,
+            'projects': PROJECTS,
+            'evaluations': EVALUATIONS,
+            'pending_candidates': PENDING_CANDIDATES
+        }
+
+        for key in ACCUMULATORS:
+            projected = {
+                table: self._project(snapshot[table], attributes)
+                for table, attributes in required_attributes([key]).items()
+            }
+            assert aggregate_snapshot(projected, [key]) == aggregate_snapshot(snapshot, [key]), key
+
+    def test_scans_use_projection(self, tables):
+        """직원 문서 전체가 아니라 필요한 속성만 조회하는지 테스트"""
+        dashboard.load_dashboard_snapshot()
+
+        scan_kwargs = tables[dashboard.EMPLOYEES_TABLE].scan.call_args.kwargs
+        projected = set(scan_kwargs['ExpressionAttributeNames'].values())
+        assert scan_kwargs['ProjectionExpression']
+        assert {'user_id', 'skills', 'basic_info'} <= projected
+        assert 'self_introduction' not in projected
+
+    def test_only_required_tables_are_scanned(self, tables):
+        """요청한 섹션이 필요로 하는 테이블만 조회하는지 테스트"""
+        with patch.object(dashboard, 'DASHBOARD_VIEW_ENABLED', False):
+            metrics = dashboard.get_dashboard_metrics(['active_projects', 'pending_candidates'])
+
+        assert metrics == {
+            'active_projects': 1,
+            'pending_candidates': 2,
+            'section_status': {'active_projects': 'ok', 'pending_candidates': 'ok'}
+        }
+        assert tables[dashboard.EMPLOYEES_TABLE].scan.call_count == 0
+        assert tables[dashboard.EVALUATIONS_TABLE].scan.call_count == 0
+        assert tables[dashboard.PROJECTS_TABLE].scan.call_args.kwargs['ExpressionAttributeNames'] == {
+            '#a0': 'project_id', '#a1': 'status'
+        }
+
+    def test_handler_sections_parameter(self, tables):
+        """sections 쿼리 파라미터로 요청한 섹션만 응답하는지 테스트"""
+        event = {'httpMethod': 'GET', 'queryStringParameters': {'sections': 'top_skills, total_employees'}}
+
+        response = dashboard.lambda_handler(event, None)
+
+        body = json.loads(response['body'])
+        assert response['statusCode'] == 200
+        assert list(body) == ['total_employees', 'top_skills', 'section_status']
+        assert body['total_employees'] == 3
+
+    def test_handler_rejects_unknown_section(self, tables):
+        """등록되지 않은 섹션을 요청하면 400을 반환하는지 테스트"""
+        event = {'httpMethod': 'GET', 'queryStringParameters': {'sections': 'total_employees,unknown'}}
+
+        response = dashboard.lambda_handler(event, None)
+
+        assert response['statusCode'] == 400
+        assert json.loads(response['body'])['error'] == 'Invalid sections'
+        assert tables[dashboard.EMPLOYEES_TABLE].scan.call_count == 0
+
+
+class _CountingList(list):
+    """순회 횟수를 기록하는 리스트"""
+
+    def __init__(self, items):
+        super().__init__(items)
+        self.iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        return super().__iter__()
+
+
+class TestAggregateSnapshot:
+    """누적기 단일 순회 집계 테스트"""
+
+    def test_single_pass_over_employees_and_projects(self):
+        """모든 누적기가 직원/프로젝트 목록을 한 번씩만 순회하는지 테스트"""
+        employees = _CountingList(EMPLOYEES)
+        projects = _CountingList(PROJECTS)
+
+        panels = aggregate_snapshot({'employees': employees, 'projects': projects})
+
+        assert set(panels) == set(ACCUMULATORS)
+        assert employees.iterations == 1
+        assert projects.iterations == 1
+
+    def test_results_match_standalone_functions(self, tables):
+        """통합 집계 결과가 개별 지표 함수와 같은지 테스트"""
+        snapshot = dashboard.load_dashboard_snapshot()
+        panels = aggregate_snapshot(snapshot)
+
+        assert panels['top_skills'] == dashboard.get_top_skills()
+        assert panels['skill_gaps'] == dashboard.get_skill_gap_analysis()
+        assert panels['career_growth'] == dashboard.get_career_growth_analysis()
+        assert panels['project_distribution'] == dashboard.get_project_distribution()
+
+    def test_values(self):
+        """누적기 지표 값 테스트"""
+        panels = aggregate_snapshot({'employees': EMPLOYEES, 'projects': PROJECTS})
+
+        assert panels['top_skills'][0] == {'name': 'Python', 'count': 2, 'percentage': 66}
+        assert panels['career_growth']['senior_count'] == 1
+        assert panels['project_experience']['leader_experience_count'] == 1
+        assert panels['domain_expertise']['top_domains'] == [{'name': '금융', 'count': 1}]
+        assert panels['skill_gaps']['top_skill_gaps'] == [
+            {'skill': 'Go', 'gap': 1, 'demand': 1, 'supply': 0}
+        ]
+
+    def test_failing_accumulator_uses_default(self):
+        """한 누적기 오류가 다른 지표에 영향을 주지 않는지 테스트"""
+        employees = EMPLOYEES + [{'user_id': 'U_004', 'skills': None}]
+
+        panels = aggregate_snapshot({'employees': employees, 'projects': PROJECTS})
+
+        assert panels['skill_competency'] == ACCUMULATORS['skill_competency']().default()
+        assert panels['education_certification']['no_certification_count'] == 3
+
+    def test_selected_keys_only(self):
+        """지정한 지표만 계산하는지 테스트"""
+        projects = _CountingList(PROJECTS)
+
+        panels = aggregate_snapshot({'employees': EMPLOYEES, 'projects': projects}, ['top_skills'])
+
+        assert list(panels) == ['top_skills']
+        assert projects.iterations == 0
+
+
+def _stream_record(event_name, table_name, old_image=None, new_image=None):
+    """DynamoDB Stream 레코드 생성"""
+    serializer = TypeSerializer()
+    stream = {}
+    if old_image is not None:
+        stream['OldImage'] = {k: serializer.serialize(v) for k, v in old_image.items()}
+    if new_image is not None:
+        stream['NewImage'] = {k: serializer.serialize(v) for k, v in new_image.items()}
+    return {
+        'eventName': event_name,
+        'eventSourceARN': f"arn:aws:dynamodb:us-east-2:123456789012:table/{table_name}/stream/2024-01-01T00:00:00.000",
+        'dynamodb': stream
+    }
+
+
+@pytest.fixture
+def view_tables(monkeypatch):
+    """원본 테이블과 DashboardSnapshot 테이블이 있는 moto DynamoDB"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+    with mock_aws():
+        resource = boto3.resource('dynamodb', region_name='us-east-2')
+        keys = {
+            dashboard.EMPLOYEES_TABLE: ('user_id', EMPLOYEES),
+            dashboard.PROJECTS_TABLE: ('project_id', PROJECTS),
+            dashboard.EVALUATIONS_TABLE: ('evaluation_id', EVALUATIONS),
+            dashboard.PENDING_CANDIDATES_TABLE: ('candidate_id', PENDING_CANDIDATES),
+            dashboard.DASHBOARD_VIEW_TABLE: ('snapshot_id', [])
+        }
+        tables = {}
+        for table_name, (hash_key, items) in keys.items():
+            table = resource.create_table(
+                TableName=table_name,
+                KeySchema=[{'AttributeName': hash_key, 'KeyType': 'HASH'}],
+                AttributeDefinitions=[{'AttributeName': hash_key, 'AttributeType': 'S'}],
+                BillingMode='PAY_PER_REQUEST'
+            )
+            for item in items:
+                table.put_item(Item=item)
+            tables[table_name] = table
+
+        with patch.object(dashboard, 'dynamodb', resource), \
+                patch.object(dashboard, '_worker_dynamodb', return_value=resource):
+            yield tables
+
+
+def _live_metrics():
+    """원본 테이블 전체 집계 결과 (모든 섹션 정상)"""
+    metrics = dashboard.aggregate_snapshot(dashboard.load_dashboard_snapshot())
+    metrics['section_status'] = {key: dashboard.SECTION_OK for key in ACCUMULATORS}
+    return json.loads(json.dumps(metrics, cls=dashboard.DecimalEncoder))
+
+
+def _unordered(metrics):
+    """{'name', 'count'} 목록을 이름순으로 정렬 (첫 등장 순서는 스캔/변경 순서에 따라 달라짐)"""
+    if isinstance(metrics, dict):
+        return {key: _unordered(value) for key, value in metrics.items()}
+    if isinstance(metrics, list) and all(isinstance(item, dict) and 'name' in item for item in metrics):
+        return sorted((_unordered(item) for item in metrics), key=lambda item: str(item['name']))
+    return metrics
+
+
+class TestDashboardView:
+    """대시보드 materialized view 테스트"""
+
+    def test_first_request_builds_view(self, view_tables):
+        """view가 없으면 전체 집계 후 view를 저장하는지 테스트"""
+        response = dashboard.lambda_handler({'httpMethod': 'GET'}, None)
+
+        assert response['statusCode'] == 200
+        assert json.loads(response['body']) == _live_metrics()
+        assert 'Item' in view_tables[dashboard.DASHBOARD_VIEW_TABLE].get_item(Key={'snapshot_id': 'dashboard'})
+
+    def test_request_reads_only_view(self, view_tables):
+        """view가 있으면 원본 테이블을 조회하지 않는지 테스트"""
+        dashboard.rebuild_dashboard_view()
+
+        with patch.object(dashboard, 'scan_all_items') as mock_scan:
+            response = dashboard.lambda_handler({'httpMethod': 'GET'}, None)
+
+        mock_scan.assert_not_called()
+        assert json.loads(response['body']) == _live_metrics()
+
+    def test_stream_deltas_match_full_recompute(self, view_tables):
+        """Stream 변경분 반영 결과가 전체 재집계와 같은지 테스트"""
+        dashboard.rebuild_dashboard_view()
+
+        new_employee = {
+            'user_id': 'U_004',
+            'department': '데이터',
+            'basic_info': {'role': 'ML Engineer', 'years_of_experience': 7},
+            'skills': [{'name': 'Go', 'level': 'Advanced', 'years': 4}],
+            'work_experience': []
+        }
+        old_project = PROJECTS[0]
+        new_project = dict(old_project, status='completed')
+        old_evaluation = EVALUATIONS[1]
+        new_evaluation = dict(old_evaluation, status='approved')
+
+        view_tables[dashboard.EMPLOYEES_TABLE].put_item(Item=new_employee)
+        view_tables[dashboard.EMPLOYEES_TABLE].delete_item(Key={'user_id': 'U_003'})
+        view_tables[dashboard.PROJECTS_TABLE].put_item(Item=new_project)
+        view_tables[dashboard.EVALUATIONS_TABLE].put_item(Item=new_evaluation)
+
+        event = {'Records': [
+            _stream_record('INSERT', dashboard.EMPLOYEES_TABLE, new_image=new_employee),
+            _stream_record('REMOVE', dashboard.EMPLOYEES_TABLE, old_image=EMPLOYEES[2]),
+            _stream_record('MODIFY', dashboard.PROJECTS_TABLE, old_image=old_project, new_image=new_project),
+            _stream_record('MODIFY', dashboard.EVALUATIONS_TABLE, old_image=old_evaluation, new_image=new_evaluation)
+        ]}
+        result = dashboard.stream_handler(event, None)
+
+        assert json.loads(result['body'])['rebuilt'] is False
+
+        with patch.object(dashboard, 'scan_all_items') as mock_scan:
+            metrics = dashboard.get_dashboard_metrics()
+        mock_scan.assert_not_called()
+
+        view_metrics = json.loads(json.dumps(metrics, cls=dashboard.DecimalEncoder))
+        assert _unordered(view_metrics) == _unordered(_live_metrics())
+        assert view_metrics['total_employees'] == 3
+        assert view_metrics['active_projects'] == 0
+        assert view_metrics['available_employees'] == 3
+
+    def test_stream_without_view_rebuilds(self, view_tables):
+        """view가 없을 때 Stream 이벤트가 오면 전체 재집계하는지 테스트"""
+        event = {'Records': [_stream_record('INSERT', dashboard.EMPLOYEES_TABLE, new_image=EMPLOYEES[0])]}
+
+        result = dashboard.stream_handler(event, None)
+
+        assert json.loads(result['body'])['rebuilt'] is True
+        assert json.loads(json.dumps(dashboard.get_dashboard_metrics(), cls=dashboard.DecimalEncoder)) == _live_metrics()
+
+    def test_conflicting_update_is_retried(self, view_tables):
+        """다른 갱신이 먼저 저장되면 다시 읽어 재적용하는지 테스트"""
+        dashboard.rebuild_dashboard_view()
+        table = view_tables[dashboard.DASHBOARD_VIEW_TABLE]
+        original_load = view_module.load_view
+        calls = []
+
+        def load_then_conflict(view_table):
+            view = original_load(view_table)
+            if not calls:
+                # 첫 조회 직후 다른 갱신이 저장된 상황
+                dashboard.rebuild_dashboard_view()
+            calls.append(view.version)
+            return view
+
+        new_employee = dict(EMPLOYEES[0], user_id='U_005')
+        view_tables[dashboard.EMPLOYEES_TABLE].put_item(Item=new_employee)
+        event = {'Records': [_stream_record('INSERT', dashboard.EMPLOYEES_TABLE, new_image=new_employee)]}
+
+        with patch.object(view_module, 'load_view', side_effect=load_then_conflict):
+            view_module.apply_stream_records(
+                table,
+                event['Records'],
+                {dashboard.EMPLOYEES_TABLE: 'employees'}
+            )
+
+        assert len(calls) == 2
+        # 재집계(이미 U_005 포함) 위에 변경분이 한 번 더 적용됨
+        assert dashboard.get_dashboard_metrics()['total_employees'] == 5
+
+
+class TestDashboardViewItemSize:
+    """대시보드 view 항목 크기 테스트"""
+
+    def test_state_keeps_only_bounded_counters(self, view_tables):
+        """직원별 배정 건수는 별도 항목에, 시각별 건수는 일 단위로 저장하는지 테스트"""
+        dashboard.rebuild_dashboard_view()
+        table = view_tables[dashboard.DASHBOARD_VIEW_TABLE]
+
+        item = table.get_item(Key={'snapshot_id': 'dashboard'})['Item']
+        states = json.loads(item['state'])
+
+        assert 'assignments' not in states['available_employees']
+        assert states['pending_candidates_detail']['created_at_counts'] == {'2024-01-10': 1}
+        assert list(states['action_required']['pending_submitted_counts']) == ['2024-01-15']
+        assert len(item['assignment_buckets']) == view_module.ASSIGNMENT_BUCKETS
+
+        counts = {}
+        for item_id in item['assignment_buckets'].values():
+            counts.update(json.loads(table.get_item(Key={'snapshot_id': item_id})['Item']['counts']))
+        assert counts == {'U_001': 1}
+
+    def test_stream_update_replaces_touched_assignment_items(self, view_tables):
+        """프로젝트 변경분은 해당 직원의 배정 항목만 새로 쓰고 이전 항목을 지우는지 테스트"""
+        dashboard.rebuild_dashboard_view()
+        table = view_tables[dashboard.DASHBOARD_VIEW_TABLE]
+        before = table.get_item(Key={'snapshot_id': 'dashboard'})['Item']['assignment_buckets']
+
+        old_project = PROJECTS[0]
+        new_project = dict(old_project, status='completed')
+        view_tables[dashboard.PROJECTS_TABLE].put_item(Item=new_project)
+        event = {'Records': [
+            _stream_record('MODIFY', dashboard.PROJECTS_TABLE, old_image=old_project, new_image=new_project)
+        ]}
+        dashboard.stream_handler(event, None)
+
+        after = table.get_item(Key={'snapshot_id': 'dashboard'})['Item']['assignment_buckets']
+        touched = {view_module.assignment_bucket('U_001')}
+        assert {bucket for bucket in after if after[bucket] != before[bucket]} == touched
+        for bucket in touched:
+            assert 'Item' not in table.get_item(Key={'snapshot_id': before[bucket]})
+        assert dashboard.get_dashboard_metrics()['available_employees'] == 3
+
+    def test_oversized_view_is_rejected(self, view_tables):
+        """항목 크기 제한을 넘는 view는 저장하지 않는지 테스트"""
+        accumulators = view_module.ACCUMULATORS
+        view = view_module.DashboardView({key: cls() for key, cls in accumulators.items()})
+        view.accumulators['top_skills'].skill_counts = {f"skill-{i}": 1 for i in range(100)}
+
+        with patch.object(view_module, 'MAX_VIEW_ITEM_BYTES', 1024):
+            with pytest.raises(view_module.ViewTooLargeError):
+                view_module.save_view(view_tables[dashboard.DASHBOARD_VIEW_TABLE], view, overwrite=True)
+
+        assert 'Item' not in view_tables[dashboard.DASHBOARD_VIEW_TABLE].get_item(Key={'snapshot_id': 'dashboard'})
+
+    def test_oversized_stream_update_marks_view_stale(self, view_tables):
+        """변경분 반영 후 view가 크기 제한을 넘으면 재시도하지 않고 원본 집계로 응답하는지 테스트"""
+        dashboard.rebuild_dashboard_view()
+        table = view_tables[dashboard.DASHBOARD_VIEW_TABLE]
+        new_employee = dict(EMPLOYEES[0], user_id='U_005')
+        view_tables[dashboard.EMPLOYEES_TABLE].put_item(Item=new_employee)
+        event = {'Records': [_stream_record('INSERT', dashboard.EMPLOYEES_TABLE, new_image=new_employee)]}
+
+        # index가 Lambda 경로(최상위 view 모듈)로 import된 경우에도 실제 사용하는 모듈을 패치
+        dashboard_view = sys.modules[dashboard.save_view.__module__]
+        with patch.object(dashboard_view, 'MAX_VIEW_ITEM_BYTES', 1024):
+            result = dashboard.stream_handler(event, None)
+            response = dashboard.lambda_handler({'httpMethod': 'GET'}, None)
+
+        body = json.loads(result['body'])
+        assert body['stale'] is True and body['rebuilt'] is False
+        assert table.get_item(Key={'snapshot_id': 'dashboard'})['Item']['stale'] is True
+        assert json.loads(response['body']) == _live_metrics()
+
+        # 재집계로 저장되면 표시가 사라짐
+        dashboard.rebuild_dashboard_view()
+        assert view_module.load_view(table) is not None
+
+    def test_wait_periods_match_per_item_computation(self):
+        """대기 기간 분포와 평가 지연 건수가 항목별 계산과 같은지 테스트 (평균 대기일은 1일 이내 차이)"""
+        now = datetime.now()
+        offsets = [
+            timedelta(days=7, hours=-1), timedelta(days=7, hours=1),
+            timedelta(days=8, minutes=-5), timedelta(days=14, hours=-2), timedelta(days=14, hours=3),
+            timedelta(days=15, hours=2), timedelta(days=16, hours=23), timedelta(days=675, hours=13),
+            timedelta(days=675, hours=20), timedelta(hours=5)
+        ]
+        timestamps = [(now - offset).isoformat() for offset in offsets]
+        wait_days = [(datetime.now() - datetime.fromisoformat(ts)).days for ts in timestamps]
+
+        pending = ACCUMULATORS['pending_candidates_detail']()
+        action = ACCUMULATORS['action_required']()
+        for ts in timestamps:
+            pending.add_pending_candidate({'created_at': ts})
+            action.add_evaluation({'status': 'pending', 'submitted_at': ts})
+        # view 상태로 저장했다가 복원해도 같은 결과
+        pending = type(pending).from_state(json.loads(json.dumps(pending.to_state())))
+        action = type(action).from_state(json.loads(json.dumps(action.to_state())))
+
+        expected = {
+            '1주 이내': sum(1 for days in wait_days if days <= 7),
+            '1-2주': sum(1 for days in wait_days if 7 < days <= 14),
+            '2주 이상': sum(1 for days in wait_days if days > 14)
+        }
+        result = pending.result()
+        assert {entry['name']: entry['count'] for entry in result['by_wait_period']} == expected
+        assert abs(result['average_wait_days'] - sum(wait_days) / len(wait_days)) <= 1
+        assert action.result()['delayed_evaluations'] == sum(1 for days in wait_days if days >= 7)
+        # 경계 근처 항목은 시각 단위로, 오래된 항목만 날짜 단위로 남음
+        assert set(pending.created_at_counts) == set(timestamps[:6] + timestamps[9:]) | {
+            ts[:10] for ts in timestamps[6:9]
+        }
+
+        # 날짜로 합쳐진 항목도 제거할 수 있음
+        for ts in timestamps:
+            pending.add_pending_candidate({'created_at': ts}, sign=-1)
+        assert pending.created_at_counts == {} and pending.total == 0
+
+    def test_previous_state_version_is_rebuilt(self, view_tables):
+        """이전 형식으로 저장된 view는 다시 집계하는지 테스트"""
+        dashboard.rebuild_dashboard_view()
+        table = view_tables[dashboard.DASHBOARD_VIEW_TABLE]
+        table.update_item(
+            Key={'snapshot_id': 'dashboard'},
+            UpdateExpression='REMOVE state_version'
+        )
+
+        assert view_module.load_view(table) is None
+
+
+class TestDashboardResponseCache:
+    """대시보드 응답 캐시 테스트"""
+
+    def test_view_response_is_cached_with_etag(self, view_tables):
+        """view에서 읽은 응답을 캐시하고 If-None-Match가 맞으면 304를 반환하는지 테스트"""
+        dashboard.rebuild_dashboard_view()
+        first = dashboard.lambda_handler({'httpMethod': 'GET'}, None)
+
+        with patch.object(dashboard, 'load_view') as mock_load:
+            second = dashboard.lambda_handler({'httpMethod': 'GET'}, None)
+            not_modified = dashboard.lambda_handler(
+                {'httpMethod': 'GET', 'headers': {'If-None-Match': first['headers']['ETag']}}, None
+            )
+
+        mock_load.assert_not_called()
+        assert second['body'] == first['body']
+        assert not_modified['statusCode'] == 304
+        assert not_modified['body'] == ''
+
+    def test_live_response_is_not_cached(self, tables):
+        """view 없이 원본 테이블에서 집계한 응답은 캐시하지 않는지 테스트"""
+        scan = tables[dashboard.EMPLOYEES_TABLE].scan
+        with patch.object(dashboard, 'DASHBOARD_VIEW_ENABLED', False):
+            dashboard.lambda_handler({'httpMethod': 'GET'}, None)
+            first_calls = scan.call_count
+            dashboard.lambda_handler({'httpMethod': 'GET'}, None)
+
+        assert first_calls > 0
+        assert scan.call_count == first_calls * 2
+
+    def test_stream_update_invalidates_cache(self, view_tables):
+        """Stream 변경분 반영 후 캐시된 응답을 다시 만드는지 테스트"""
+        dashboard.rebuild_dashboard_view()
+        dashboard.lambda_handler({'httpMethod': 'GET'}, None)
+
+        new_employee = {'user_id': 'U_004', 'skills': [], 'work_experience': []}
+        view_tables[dashboard.EMPLOYEES_TABLE].put_item(Item=new_employee)
+        dashboard.stream_handler(
+            {'Records': [_stream_record('INSERT', dashboard.EMPLOYEES_TABLE, new_image=new_employee)]}, None
+        )
+
+        response = dashboard.lambda_handler({'httpMethod': 'GET'}, None)
+        assert json.loads(response['body'])['total_employees'] == 4
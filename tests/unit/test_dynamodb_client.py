@@ -0,0 +1,203 @@
+"""
+DynamoDBClient 유닛 테스트
+
+페이지네이션 및 병렬 세그먼트 스캔 기능을 테스트합니다.
+moto를 사용하여 DynamoDB를 모킹합니다.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from moto import mock_aws
+import boto3
+from boto3.dynamodb.conditions import Attr
+from common.dynamodb_client import DynamoDBClient, DynamoDBClientError
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    """AWS 자격 증명 모킹"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+
+@pytest.fixture
+def dynamodb_client(aws_credentials):
+    """DynamoDB 클라이언트 픽스처"""
+    with mock_aws():
+        client = DynamoDBClient(region_name='us-east-2')
+        yield client
+
+
+@pytest.fixture
+def items_table(dynamodb_client):
+    """50개 아이템이 저장된 테스트 테이블 픽스처"""
+    dynamodb = boto3.resource('dynamodb', region_name='us-east-2')
+
+    table = dynamodb.create_table(
+        TableName='Items',
+        KeySchema=[
+            {'AttributeName': 'item_id', 'KeyType': 'HASH'}
+        ],
+        AttributeDefinitions=[
+            {'AttributeName': 'item_id', 'AttributeType': 'S'}
+        ],
+        BillingMode='PAY_PER_REQUEST'
+    )
+    table.wait_until_exists()
+
+    with table.batch_writer() as batch:
+        for i in range(50):
+            batch.put_item(Item={'item_id': f"I_{i:03d}", 'group': i % 2})
+
+    yield table
+
+
+class TestScan:
+    """DynamoDBClient.scan 테스트"""
+
+    def test_scan_follows_pagination(self, dynamodb_client, items_table):
+        """LastEvaluatedKey를 따라 모든 페이지 조회 테스트"""
+        pages = list(dynamodb_client.scan_pages('Items', page_size=10))
+
+        assert len(pages) >= 5
+        assert sum(len(page) for page in pages) == 50
+
+    def test_scan_returns_all_items(self, dynamodb_client, items_table):
+        """전체 스캔 결과 테스트"""
+        items = dynamodb_client.scan('Items')
+
+        assert len(items) == 50
+        assert all(isinstance(item['group'], float) for item in items)
+
+    def test_scan_with_limit(self, dynamodb_client, items_table):
+        """최대 결과 수 제한 테스트"""
+        items = dynamodb_client.scan('Items', limit=7)
+
+        assert len(items) == 7
+
+    def test_scan_with_filter_expression(self, dynamodb_client, items_table):
+        """필터 표현식이 모든 페이지에 적용되는지 테스트"""
+        items = list(
+            item
+            for page in dynamodb_client.scan_pages(
+                'Items',
+                filter_expression=Attr('group').eq(1),
+                page_size=10
+            )
+            for item in page
+        )
+
+        assert len(items) == 25
+        assert all(item['group'] == 1 for item in items)
+
+    def test_parallel_scan(self, dynamodb_client, items_table):
+        """병렬 세그먼트 스캔 결과가 순차 스캔과 동일한지 테스트"""
+        sequential = {item['item_id'] for item in dynamodb_client.scan('Items')}
+        parallel = dynamodb_client.scan('Items', segments=4)
+
+        assert len(parallel) == 50
+        assert {item['item_id'] for item in parallel} == sequential
+
+    def test_parallel_scan_pages_early_stop(self, dynamodb_client, items_table):
+        """스트리밍 병렬 스캔을 중간에 중단할 수 있는지 테스트"""
+        pages = dynamodb_client.scan_pages('Items', page_size=5, segments=3)
+        first_page = next(pages)
+        pages.close()
+
+        assert 0 < len(first_page) <= 5
+
+    def test_parallel_scan_missing_table(self, dynamodb_client):
+        """존재하지 않는 테이블 병렬 스캔 시 예외 테스트"""
+        with pytest.raises(DynamoDBClientError):
+            dynamodb_client.scan('MissingTable', segments=2)
+
+
+class TestBatchPutItems:
+    """DynamoDBClient.batch_put_items 테스트"""
+
+    def test_batch_put_items(self, dynamodb_client, items_table):
+        """25개 단위 요청으로 모든 아이템이 저장되는지 테스트"""
+        items = [{'item_id': f"N_{i:03d}", 'score': i / 2} for i in range(60)]
+
+        count = dynamodb_client.batch_put_items('Items', items, max_workers=3)
+
+        assert count == 60
+        assert len(dynamodb_client.scan('Items')) == 110
+        assert dynamodb_client.get_item('Items', {'item_id': 'N_005'})['score'] == 2.5
+
+    def test_empty_items(self, dynamodb_client):
+        """빈 목록이면 요청하지 않는지 테스트"""
+        assert dynamodb_client.batch_put_items('Items', []) == 0
+
+    @patch('common.dynamodb_client.time.sleep')
+    def test_retries_unprocessed_items(self, mock_sleep, dynamodb_client):
+        """UnprocessedItems만 백오프 후 다시 요청하는지 테스트"""
+        items = [{'item_id': f"N_{i}"} for i in range(3)]
+        unprocessed = {'Items': [{'PutRequest': {'Item': items[2]}}]}
+        resource = MagicMock()
+        resource.batch_write_item.side_effect = [
+            {'UnprocessedItems': unprocessed},
+            {'UnprocessedItems': {}}
+        ]
+        dynamodb_client.dynamodb = resource
+
+        assert dynamodb_client.batch_put_items('Items', items) == 3
+        assert resource.batch_write_item.call_count == 2
+        assert resource.batch_write_item.call_args_list[1].kwargs['RequestItems'] == unprocessed
+        mock_sleep.assert_called_once_with(dynamodb_client.retry_delay)
+
+    @patch('common.dynamodb_client.time.sleep')
+    def test_unprocessed_items_exhausted(self, mock_sleep, dynamodb_client):
+        """재시도 후에도 미처리 아이템이 남으면 예외가 발생하는지 테스트"""
+        unprocessed = {'Items': [{'PutRequest': {'Item': {'item_id': 'N_0'}}}]}
+        resource = MagicMock()
+        resource.batch_write_item.return_value = {'UnprocessedItems': unprocessed}
+        dynamodb_client.dynamodb = resource
+
+        with pytest.raises(DynamoDBClientError):
+            dynamodb_client.batch_put_items('Items', [{'item_id': 'N_0'}])
+
+        assert resource.batch_write_item.call_count == dynamodb_client.max_retries + 1
+
+
+class TestBatchDeleteItems:
+    """DynamoDBClient.batch_delete_items 테스트"""
+
+    def test_batch_delete_items(self, dynamodb_client, items_table):
+        """25개 단위 요청으로 키가 모두 삭제되고 없는 키는 무시되는지 테스트"""
+        keys = [{'item_id': f"I_{i:03d}"} for i in range(30)] + [{'item_id': 'I_999'}]
+
+        count = dynamodb_client.batch_delete_items('Items', keys, max_workers=2)
+
+        assert count == 31
+        assert len(dynamodb_client.scan('Items')) == 20
+        assert dynamodb_client.get_item('Items', {'item_id': 'I_003'}) is None
+
+
+class TestQueryParallel:
+    """DynamoDBClient.query_parallel 테스트"""
+
+    def test_results_follow_query_order(self, dynamodb_client, items_table):
+        """쿼리 순서대로 결과를 반환하는지 테스트"""
+        from boto3.dynamodb.conditions import Key
+
+        results = dynamodb_client.query_parallel('Items', [
+            {'key_condition_expression': Key('item_id').eq('I_003')},
+            {'key_condition_expression': Key('item_id').eq('I_999')},
+            {'key_condition_expression': Key('item_id').eq('I_007')}
+        ])
+
+        assert [[item['item_id'] for item in items] for items in results] == [['I_003'], [], ['I_007']]
+
+    def test_missing_index(self, dynamodb_client, items_table):
+        """존재하지 않는 인덱스 쿼리 시 예외 테스트"""
+        from boto3.dynamodb.conditions import Key
+
+        with pytest.raises(DynamoDBClientError):
+            dynamodb_client.query_parallel('Items', [
+                {'key_condition_expression': Key('group').eq(1), 'index_name': 'MissingIndex'},
+                {'key_condition_expression': Key('item_id').eq('I_001')}
+            ])
@@ -0,0 +1,612 @@
+"""
+직원 평가 Lambda 유닛 테스트
+
+저장된 코호트 통계(EvaluationCohortStats)를 사용한 상대 평가와
+Streams 변경분에 따른 통계 갱신을 테스트합니다.
+moto를 사용하여 DynamoDB를 모킹합니다.
+"""
+
+import json
+import random
+from unittest.mock import MagicMock, patch
+
+import pytest
+from moto import mock_aws
+import boto3
+from boto3.dynamodb.types import TypeSerializer
+from lambda_functions.employee_evaluation import index as employee_evaluation
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    """AWS 자격 증명 모킹"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+
+@pytest.fixture
+def dynamodb(aws_credentials, monkeypatch):
+    """Employees/Projects/EvaluationCohortStats 테이블이 있는 moto DynamoDB"""
+    with mock_aws():
+        resource = boto3.resource('dynamodb', region_name='us-east-2')
+        for table_name, key in (('Employees', 'user_id'), ('Projects', 'project_id')):
+            resource.create_table(
+                TableName=table_name,
+                KeySchema=[{'AttributeName': key, 'KeyType': 'HASH'}],
+                AttributeDefinitions=[{'AttributeName': key, 'AttributeType': 'S'}],
+                BillingMode='PAY_PER_REQUEST'
+            )
+        resource.create_table(
+            TableName='EvaluationCohortStats',
+            KeySchema=[
+                {'AttributeName': 'cohort', 'KeyType': 'HASH'},
+                {'AttributeName': 'member_id', 'KeyType': 'RANGE'}
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'cohort', 'AttributeType': 'S'},
+                {'AttributeName': 'member_id', 'AttributeType': 'S'}
+            ],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        monkeypatch.setattr(employee_evaluation, 'dynamodb', resource)
+        # 통계 재구성 비동기 요청
+        monkeypatch.setattr(employee_evaluation, 'lambda_client', MagicMock())
+        yield resource
+
+
+def _employee(user_id, role='Backend Developer', years=5, skills=(('Python', 'Advanced', 3),), projects=1):
+    """평가용 직원 항목"""
+    return {
+        'user_id': user_id,
+        'basic_info': {'name': user_id, 'role': role, 'years_of_experience': years},
+        'skills': [{'name': name, 'level': level, 'years': skill_years} for name, level, skill_years in skills],
+        'work_experience': [{'project_name': f'P{i}', 'role': 'Developer', 'period': '2022~2023'} for i in range(projects)],
+        'self_introduction': '협업과 성장을 중시합니다'
+    }
+
+
+EMPLOYEES = [
+    _employee('U_001', role='Senior Backend Developer', years=10,
+              skills=(('Java', 'Expert', 8), ('Spring', 'Expert', 6), ('AWS', 'Advanced', 4)), projects=4),
+    _employee('U_002', years=3),
+    _employee('U_003', role='Frontend Developer', years=2, skills=(('React', 'Intermediate', 2),), projects=0)
+]
+
+PROJECTS = [{'project_id': 'P_001', 'project_name': 'Portal', 'required_skills': ['Java', 'React']}]
+
+
+@pytest.fixture
+def seeded(dynamodb):
+    """직원/프로젝트 데이터 적재"""
+    for employee in EMPLOYEES:
+        dynamodb.Table('Employees').put_item(Item=employee)
+    for project in PROJECTS:
+        dynamodb.Table('Projects').put_item(Item=project)
+    return dynamodb
+
+
+class TestCohortSummary:
+    """코호트 요약 계산 테스트"""
+
+    def test_max_and_percentiles(self):
+        """항목별 최고점과 nearest-rank 백분위 테스트"""
+        raw_scores = [
+            {dimension: float(value) for dimension in employee_evaluation.SCORE_DIMENSIONS}
+            for value in range(1, 11)
+        ]
+
+        summary = employee_evaluation.summarize_raw_scores(raw_scores)
+
+        assert summary['employee_count'] == 10
+        assert summary['max']['tech_skill'] == 10.0
+        assert summary['percentiles']['culture_fit'] == {'p25': 3.0, 'p50': 5.0, 'p75': 8.0, 'p90': 9.0}
+
+    def test_incremental_update_matches_full_summary(self):
+        """변경 전/후 점수로 갱신한 요약이 전체 재집계와 같은지 테스트"""
+        rng = random.Random(7)
+        dimensions = employee_evaluation.SCORE_DIMENSIONS
+        raw_by_employee = {
+            f"U_{i:03d}": {dimension: round(rng.uniform(0, 90), 4) for dimension in dimensions}
+            for i in range(50)
+        }
+        summary = employee_evaluation.summarize_raw_scores(list(raw_by_employee.values()))
+
+        changes = []
+        for user_id in rng.sample(sorted(raw_by_employee), 10):
+            old_raw = raw_by_employee[user_id]
+            new_raw = {dimension: round(rng.uniform(0, 95), 4) for dimension in dimensions}
+            # 최고점 보유자의 점수 하락은 전체 재집계 대상이므로 제외
+            if any(old_raw[d] >= summary['max'][d] > new_raw[d] for d in dimensions):
+                continue
+            raw_by_employee[user_id] = new_raw
+            changes.append((old_raw, new_raw))
+        added = {dimension: 50.0 for dimension in dimensions}
+        raw_by_employee['U_NEW'] = added
+        changes.append((None, added))
+
+        assert employee_evaluation.update_cohort_summary(summary, changes)
+        assert summary == employee_evaluation.summarize_raw_scores(list(raw_by_employee.values()))
+
+    def test_top_score_drop_requires_recount(self):
+        """최고점 보유자가 모두 빠질 때만 다시 집계하도록 False를 반환하는지 테스트"""
+        top = {dimension: 90.0 for dimension in employee_evaluation.SCORE_DIMENSIONS}
+        other = {dimension: 40.0 for dimension in employee_evaluation.SCORE_DIMENSIONS}
+
+        summary = employee_evaluation.summarize_raw_scores([top, dict(top), other])
+        assert employee_evaluation.update_cohort_summary(summary, [(top, None)])
+        assert summary == employee_evaluation.summarize_raw_scores([top, other])
+
+        assert not employee_evaluation.update_cohort_summary(summary, [(top, other)])
+
+    def test_empty_cohort(self):
+        """직원이 없으면 기존과 같이 최고점 1을 사용하는지 테스트"""
+        summary = employee_evaluation.summarize_raw_scores([])
+
+        assert summary['max'] == {dimension: 1 for dimension in employee_evaluation.SCORE_DIMENSIONS}
+
+
+def _project_matching_reference(employee_data, all_projects, limit):
+    """기존 방식 매칭 (프로젝트마다 요구 기술 집합 생성, 비교 기준)"""
+    employee_skills = {
+        s.get('name', '').lower() if isinstance(s, dict) else str(s).lower()
+        for s in employee_data.get('skills', [])
+    }
+    matches = []
+    for project in all_projects[:limit]:
+        required_skills = project.get('required_skills', [])
+        if not isinstance(required_skills, list):
+            continue
+        required_set = {str(s).lower() for s in required_skills}
+        matches.append((project, len(employee_skills & required_set), len(required_set)))
+    return matches
+
+
+class TestProjectFeatureIndex:
+    """프로젝트 요구 기술 비트셋 인덱스 테스트"""
+
+    SKILLS = ['Java', 'python', 'React', 'AWS', 'Docker', 'Kubernetes', 'Spring', 'Go']
+
+    def _random_projects(self, rng, count):
+        projects = []
+        for i in range(count):
+            required = rng.sample(self.SKILLS, rng.randint(0, 4))
+            projects.append({'project_id': f'P_{i:03d}', 'required_skills': required if i % 7 else 'Java'})
+        return projects
+
+    def test_match_counts_same_as_set_intersection(self):
+        """비트셋 매칭 수가 집합 교집합 결과와 같은지 테스트"""
+        rng = random.Random(7)
+        projects = self._random_projects(rng, 30)
+        index = employee_evaluation.ProjectFeatureIndex(projects)
+
+        for _ in range(50):
+            employee = _employee('U_R', skills=[(name, 'Advanced', 2) for name in rng.sample(self.SKILLS, 3)])
+            mask = index.skill_mask(employee_evaluation.get_skill_names(employee))
+            for limit in (employee_evaluation.EXPERIENCE_MATCH_PROJECTS, employee_evaluation.RECOMMENDATION_MATCH_PROJECTS):
+                assert index.match_counts(mask, limit) == _project_matching_reference(employee, projects, limit)
+
+    def test_index_reused_for_same_project_list(self):
+        """같은 프로젝트 목록이면 인덱스를 다시 만들지 않는지 테스트"""
+        projects = [dict(project) for project in PROJECTS]
+
+        with patch.object(employee_evaluation, 'ProjectFeatureIndex',
+                          wraps=employee_evaluation.ProjectFeatureIndex) as mock_index:
+            for employee in EMPLOYEES:
+                employee_evaluation.calculate_project_experience_raw_score(employee, projects)
+                employee_evaluation.generate_project_recommendations(employee, projects, {'overall_score': 80})
+
+        assert mock_index.call_count == 1
+
+    def test_recommendations(self):
+        """요구 기술 매칭 비율로 추천 적합도를 계산하는지 테스트"""
+        projects = [
+            {'project_id': 'P_001', 'project_name': 'Portal', 'required_skills': ['Java', 'React']},
+            {'project_id': 'P_002', 'project_name': 'Infra', 'required_skills': ['Kubernetes']},
+            {'project_id': 'P_003', 'project_name': 'Legacy', 'required_skills': 'Java'}
+        ]
+
+        recommendations = employee_evaluation.generate_project_recommendations(
+            EMPLOYEES[0], projects, {'overall_score': 50}
+        )
+
+        assert [r['project_id'] for r in recommendations] == ['P_001']
+        assert recommendations[0]['fit_score'] == 60.0
+
+
+def _similar_employees_reference(employee_data, all_employees):
+    """기존 방식 동료 선택 (전체 직원 순회, 비교 기준)"""
+    role = employee_data['basic_info']['role'].lower()
+    experience_years = employee_evaluation.get_experience_years(employee_data)
+    similar = []
+    for emp in all_employees:
+        emp_role = emp['basic_info']['role'].lower()
+        role_match = role == emp_role or any(
+            keyword in role and keyword in emp_role for keyword in employee_evaluation.ROLE_KEYWORDS
+        )
+        if role_match and abs(employee_evaluation.get_experience_years(emp) - experience_years) <= 3:
+            similar.append(emp)
+    return similar
+
+
+class TestPeerCohortIndex:
+    """동료 코호트 인덱스 테스트"""
+
+    ROLES = ['Backend Developer', 'Senior Backend Developer', 'Frontend Developer',
+             'DevOps Engineer', 'Data Scientist', 'Product Manager']
+    SKILLS = ['Java', 'Python', 'React', 'AWS', 'Docker', 'Kubernetes', 'SQL', 'Go']
+
+    def _random_employees(self, rng, count):
+        return [
+            _employee(
+                f'U_{i:03d}',
+                role=rng.choice(self.ROLES),
+                years=rng.choice([0, 1, 2.5, 3, 4, 5, 5.5, 6, 8, 9.5, 12]),
+                skills=[(name, 'Advanced', 2) for name in rng.sample(self.SKILLS, rng.randint(0, 4))]
+            )
+            for i in range(count)
+        ]
+
+    def test_peer_stats_same_as_full_scan(self):
+        """버킷 기반 동료 수/기술 빈도가 전체 순회 결과와 같은지 테스트"""
+        rng = random.Random(11)
+        employees = self._random_employees(rng, 120)
+        index = employee_evaluation.PeerCohortIndex.from_employees(employees)
+
+        for employee in employees[:40]:
+            similar = _similar_employees_reference(employee, employees)
+            expected = {}
+            for emp in similar:
+                for skill in emp['skills']:
+                    expected[skill['name'].lower()] = expected.get(skill['name'].lower(), 0) + 1
+
+            assert index.peer_stats(employee) == (len(similar), expected)
+
+    def test_remove_and_move(self):
+        """직원 삭제/이동 시 버킷 빈도가 갱신되는지 테스트"""
+        index = employee_evaluation.PeerCohortIndex.from_employees(EMPLOYEES)
+        moved = _employee('U_002', role='Frontend Developer', years=2, skills=(('Vue', 'Advanced', 2),))
+
+        index.remove(EMPLOYEES[1])
+        index.add(moved)
+        index.add(moved)
+
+        assert index.peer_stats(EMPLOYEES[2]) == (2, {'react': 1, 'vue': 1})
+        assert (3, 'backend developer') not in index.buckets
+
+    def test_loaded_buckets_match_memory(self, seeded):
+        """저장 후 필요한 버킷만 읽어도 같은 결과인지 테스트"""
+        rng = random.Random(3)
+        employees = self._random_employees(rng, 60)
+        employee_evaluation.rebuild_peer_index(employees)
+        index = employee_evaluation.PeerCohortIndex.from_employees(employees)
+
+        for employee in employees[:20]:
+            loaded = employee_evaluation.load_peer_index(employee)
+            assert loaded.peer_stats(employee) == index.peer_stats(employee)
+
+    def test_bucket_items_exclude_members(self, seeded):
+        """버킷 항목에는 요약만 저장하고 구성원은 별도 항목으로 저장하는지 테스트"""
+        employee_evaluation.rebuild_peer_index(EMPLOYEES)
+        table = seeded.Table('EvaluationCohortStats')
+
+        buckets = table.query(KeyConditionExpression='cohort = :c', ExpressionAttributeValues={':c': 'peers'})['Items']
+        members = table.query(KeyConditionExpression='cohort = :c',
+                              ExpressionAttributeValues={':c': 'peer_members'})['Items']
+
+        assert buckets and all('members' not in item and item['version'] for item in buckets)
+        assert sorted(item['user_id'] for item in members) == ['U_001', 'U_002', 'U_003']
+
+    def test_update_is_idempotent(self, seeded):
+        """같은 변경분을 다시 적용해도 버킷 결과가 같은지 테스트"""
+        employee_evaluation.rebuild_peer_index(EMPLOYEES)
+        moved = _employee('U_002', role='Frontend Developer', years=2, skills=(('Vue', 'Advanced', 2),))
+        changes = [(EMPLOYEES[1], moved), (EMPLOYEES[0], None)]
+
+        employee_evaluation.update_peer_index(changes)
+        employee_evaluation.update_peer_index(changes)
+
+        expected = employee_evaluation.PeerCohortIndex.from_employees([moved, EMPLOYEES[2]])
+        assert employee_evaluation.load_peer_index(EMPLOYEES[2]).peer_stats(EMPLOYEES[2]) == \
+            expected.peer_stats(EMPLOYEES[2])
+        assert employee_evaluation.load_peer_index(EMPLOYEES[0]).peer_stats(EMPLOYEES[0])[0] == 0
+
+    def test_concurrent_bucket_update_retries(self, seeded):
+        """버킷 version이 그 사이 바뀌면 다시 읽어 갱신하는지 테스트"""
+        employee_evaluation.rebuild_peer_index(EMPLOYEES)
+        table = seeded.Table('EvaluationCohortStats')
+        query_peer_members = employee_evaluation.query_peer_members
+        calls = []
+
+        def concurrent_update(lower, upper):
+            # 첫 집계 도중 다른 배치가 같은 버킷을 갱신한 상황
+            if not calls:
+                table.update_item(Key={'cohort': 'peers', 'member_id': '002#frontend developer'},
+                                  UpdateExpression='SET version = :v', ExpressionAttributeValues={':v': 'other'})
+            calls.append((lower, upper))
+            return query_peer_members(lower, upper)
+
+        added = _employee('U_004', role='Frontend Developer', years=2, skills=(('Vue', 'Advanced', 2),))
+        with patch.object(employee_evaluation, 'query_peer_members', side_effect=concurrent_update):
+            employee_evaluation.update_peer_index([(None, added)])
+
+        assert len(calls) == 2
+        expected = employee_evaluation.PeerCohortIndex.from_employees(EMPLOYEES + [added])
+        assert employee_evaluation.load_peer_index(added).peer_stats(added) == expected.peer_stats(added)
+
+    def test_bucket_update_retries_exhausted(self, seeded):
+        """충돌이 계속되면 ClientError를 발생시키는지 테스트"""
+        employee_evaluation.rebuild_peer_index(EMPLOYEES)
+        table = seeded.Table('EvaluationCohortStats')
+
+        def always_conflict(lower, upper):
+            table.update_item(Key={'cohort': 'peers', 'member_id': '002#frontend developer'},
+                              UpdateExpression='SET version = :v',
+                              ExpressionAttributeValues={':v': str(random.random())})
+            return {}
+
+        with patch.object(employee_evaluation, 'query_peer_members', side_effect=always_conflict):
+            with pytest.raises(employee_evaluation.ClientError):
+                employee_evaluation.refresh_peer_bucket((2, 'frontend developer'))
+
+    def test_skill_gaps(self):
+        """동료 절반 이상이 가진 기술을 부족 기술로 반환하는지 테스트"""
+        peers = [
+            _employee(f'U_{i}', years=5, skills=(('Python', 'Advanced', 3), ('Docker', 'Advanced', 2)))
+            for i in range(3)
+        ] + [_employee('U_9', years=6, skills=(('Python', 'Advanced', 3), ('Kafka', 'Advanced', 2)))]
+        employee = _employee('U_ME', years=5, skills=(('Python', 'Advanced', 3),))
+
+        result = employee_evaluation.analyze_skill_gaps(
+            employee, employee_evaluation.PeerCohortIndex.from_employees(peers + [employee])
+        )
+
+        assert result['peer_count'] == 5
+        assert [skill['name'] for skill in result['missing_skills']] == ['Docker']
+        assert result['missing_skills'][0]['count'] == 3
+        assert result['recommended_skills'] == []
+
+
+class TestEvaluateRelativeScores:
+    """저장된 통계를 사용한 상대 평가 테스트"""
+
+    def test_matches_full_computation(self, seeded):
+        """통계 기반 점수가 전체 직원 계산 결과와 같은지 테스트"""
+        employee_evaluation.stream_handler({}, None)
+        expected = [
+            employee_evaluation.calculate_relative_scores(employee, EMPLOYEES, PROJECTS)
+            for employee in EMPLOYEES
+        ]
+
+        actual = [employee_evaluation.evaluate_relative_scores(employee, PROJECTS) for employee in EMPLOYEES]
+
+        assert actual == expected
+
+    def test_request_path_reads_summary_only(self, seeded):
+        """통계가 있으면 직원 전체 조회/계산 없이 평가하는지 테스트"""
+        employee_evaluation.stream_handler({}, None)
+
+        with patch.object(employee_evaluation, 'get_all_employees') as mock_scan, \
+                patch.object(employee_evaluation, 'calculate_raw_scores',
+                             wraps=employee_evaluation.calculate_raw_scores) as mock_raw:
+            employee_evaluation.evaluate_relative_scores(EMPLOYEES[1], PROJECTS)
+
+        mock_scan.assert_not_called()
+        assert mock_raw.call_count == 1
+
+    def test_project_change_requests_rebuild(self, seeded):
+        """프로젝트 요구 기술이 바뀌면 요청 안에서 재구성하지 않고 비동기로 요청하는지 테스트"""
+        employee_evaluation.stream_handler({}, None)
+        changed_projects = [{'project_id': 'P_001', 'required_skills': ['Python']}]
+
+        with patch.object(employee_evaluation, 'get_all_employees') as mock_scan:
+            scores = employee_evaluation.evaluate_relative_scores(EMPLOYEES[1], changed_projects)
+
+        mock_scan.assert_not_called()
+        assert 0 < scores['overall_score'] <= 100
+        employee_evaluation.lambda_client.invoke.assert_called_once_with(
+            FunctionName=employee_evaluation.COHORT_STATS_UPDATER_FUNCTION,
+            InvocationType='Event',
+            Payload=json.dumps({'Records': []})
+        )
+        # 통계 갱신 Lambda가 요청을 처리하면 새 프로젝트 구성으로 재구성
+        with patch.object(employee_evaluation, 'get_all_projects', return_value=changed_projects):
+            result = employee_evaluation.stream_handler({'Records': []}, None)
+        assert json.loads(result['body'])['message'] == 'Cohort stats rebuilt'
+        summary = employee_evaluation.load_cohort_summary()
+        assert summary['projects_signature'] == employee_evaluation.projects_signature(changed_projects)
+
+    def test_missing_stats_computed_in_memory(self, seeded):
+        """통계가 없으면 전체 직원으로 계산하고 저장은 통계 갱신 Lambda에 맡기는지 테스트"""
+        scores = employee_evaluation.evaluate_relative_scores(EMPLOYEES[1], PROJECTS)
+
+        assert scores == employee_evaluation.calculate_relative_scores(EMPLOYEES[1], EMPLOYEES, PROJECTS)
+        assert employee_evaluation.load_cohort_summary() is None
+        employee_evaluation.lambda_client.invoke.assert_called_once()
+
+    def test_legacy_format_rebuilds(self, seeded):
+        """요약/동료 코호트 저장 형식이 이전 버전이면 통계를 다시 계산하는지 테스트"""
+        employee_evaluation.stream_handler({}, None)
+        seeded.Table('EvaluationCohortStats').update_item(
+            Key={'cohort': employee_evaluation.COHORT_ID, 'member_id': employee_evaluation.COHORT_SUMMARY_MEMBER},
+            UpdateExpression='REMOVE peer_index_format, summary_format, histogram'
+        )
+
+        employee_evaluation.evaluate_relative_scores(EMPLOYEES[1], PROJECTS)
+        employee_evaluation.lambda_client.invoke.assert_called_once()
+
+        with patch.object(employee_evaluation, 'get_all_employees', return_value=EMPLOYEES) as mock_scan:
+            employee_evaluation.stream_handler({'Records': []}, None)
+
+        mock_scan.assert_called_once()
+        summary = employee_evaluation.load_cohort_summary()
+        assert summary['peer_index_format'] == employee_evaluation.PEER_INDEX_FORMAT
+        assert summary['summary_format'] == employee_evaluation.COHORT_SUMMARY_FORMAT
+
+
+class TestLambdaHandler:
+    """단건 평가 API 테스트"""
+
+    def test_evaluate_employee(self, seeded):
+        """단건 평가 결과 구조와 점수 테스트"""
+        event = {'httpMethod': 'POST', 'body': json.dumps({'employee_id': 'U_002'})}
+
+        result = employee_evaluation.lambda_handler(event, None)
+
+        body = json.loads(result['body'])
+        expected = employee_evaluation.calculate_relative_scores(EMPLOYEES[1], EMPLOYEES, PROJECTS)
+        assert result['statusCode'] == 200
+        assert body['employee_name'] == 'U_002'
+        assert body['overall_score'] == expected['overall_score']
+        assert body['status'] == 'completed'
+
+    def test_no_employee_scan_when_stats_exist(self, seeded):
+        """통계와 동료 버킷이 있으면 Employees 전체 조회 없이 평가하는지 테스트"""
+        employee_evaluation.stream_handler({}, None)
+        event = {'httpMethod': 'POST', 'body': json.dumps({'employee_id': 'U_002'})}
+
+        with patch.object(employee_evaluation, 'get_all_employees') as mock_scan:
+            result = employee_evaluation.lambda_handler(event, None)
+
+        mock_scan.assert_not_called()
+        body = json.loads(result['body'])
+        assert body['skill_gap_analysis'] == employee_evaluation.analyze_skill_gaps(
+            EMPLOYEES[1], employee_evaluation.PeerCohortIndex.from_employees(EMPLOYEES)
+        )
+
+
+class TestStreamHandler:
+    """Streams 변경분 반영 테스트"""
+
+    @staticmethod
+    def _record(user_id, new=None, old=None):
+        serializer = TypeSerializer()
+        stream = {'Keys': {'user_id': serializer.serialize(user_id)}}
+        if old is not None:
+            stream['OldImage'] = {k: serializer.serialize(v) for k, v in old.items()}
+        if new is not None:
+            stream['NewImage'] = {k: serializer.serialize(v) for k, v in new.items()}
+        return {'dynamodb': stream}
+
+    def test_rebuild_without_records(self, seeded):
+        """Records가 없으면 전체 재구성하는지 테스트"""
+        result = employee_evaluation.stream_handler({}, None)
+
+        assert json.loads(result['body'])['message'] == 'Cohort stats rebuilt'
+        assert set(employee_evaluation.load_cohort_raw_scores()) == {'U_001', 'U_002', 'U_003'}
+        assert employee_evaluation.load_cohort_summary()['employee_count'] == 3
+
+    def test_incremental_update(self, seeded):
+        """바뀐 직원만 다시 계산하고 요약을 갱신하는지 테스트"""
+        employee_evaluation.stream_handler({}, None)
+        promoted = _employee('U_003', role='Frontend Architect', years=12,
+                             skills=(('React', 'Expert', 10), ('Kubernetes', 'Expert', 8), ('AWS', 'Expert', 8),
+                                     ('TypeScript', 'Expert', 8), ('Docker', 'Expert', 8)), projects=5)
+        seeded.Table('Employees').put_item(Item=promoted)
+
+        with patch.object(employee_evaluation, 'calculate_raw_scores',
+                          wraps=employee_evaluation.calculate_raw_scores) as mock_raw:
+            result = employee_evaluation.stream_handler({'Records': [
+                self._record('U_003', new=promoted, old=EMPLOYEES[2]),
+                self._record('U_002', old=EMPLOYEES[1])
+            ]}, None)
+
+        assert json.loads(result['body'])['changed_employees'] == 2
+        assert mock_raw.call_count == 1
+        remaining = [EMPLOYEES[0], promoted]
+        summary = employee_evaluation.load_cohort_summary()
+        assert summary['employee_count'] == 2
+        assert summary['max']['tech_skill'] == pytest.approx(max(
+            employee_evaluation.calculate_tech_skill_raw_score(employee) for employee in remaining
+        ), abs=1e-4)
+
+        # 동료 버킷도 변경 전/후 버킷만 갱신
+        expected = employee_evaluation.PeerCohortIndex.from_employees(remaining)
+        for employee in remaining:
+            loaded = employee_evaluation.load_peer_index(employee)
+            assert loaded.peer_stats(employee) == expected.peer_stats(employee)
+        assert employee_evaluation.load_peer_index(EMPLOYEES[1]).peer_stats(EMPLOYEES[1])[0] == 0
+
+
+    def test_summary_updated_without_reload(self, seeded):
+        """최고점 보유자가 남아 있으면 저장된 임시 점수 전체를 다시 읽지 않고 요약을 갱신하는지 테스트"""
+        employee_evaluation.stream_handler({}, None)
+        promoted = _employee('U_003', role='Frontend Architect', years=12,
+                             skills=(('React', 'Expert', 10), ('Kubernetes', 'Expert', 8), ('AWS', 'Expert', 8),
+                                     ('TypeScript', 'Expert', 8), ('Docker', 'Expert', 8)), projects=5)
+        seeded.Table('Employees').put_item(Item=promoted)
+        added = _employee('U_004', years=4)
+
+        with patch.object(employee_evaluation, 'load_cohort_raw_scores',
+                          wraps=employee_evaluation.load_cohort_raw_scores) as mock_reload:
+            employee_evaluation.stream_handler({'Records': [
+                self._record('U_003', new=promoted, old=EMPLOYEES[2]),
+                self._record('U_004', new=added)
+            ]}, None)
+
+        mock_reload.assert_not_called()
+        summary = employee_evaluation.load_cohort_summary()
+        expected = employee_evaluation.summarize_raw_scores(
+            list(employee_evaluation.load_cohort_raw_scores().values())
+        )
+        assert summary['employee_count'] == 4
+        for field in ('max', 'max_count', 'histogram', 'percentiles'):
+            assert summary[field] == expected[field]
+
+
+class TestBatchEvaluation:
+    """일괄 평가 테스트"""
+
+    @pytest.fixture
+    def evaluations_table(self, seeded):
+        """EmployeeEvaluations 테이블"""
+        return seeded.create_table(
+            TableName='EmployeeEvaluations',
+            KeySchema=[{'AttributeName': 'evaluation_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'evaluation_id', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+
+    def test_evaluate_all_scans_once(self, evaluations_table):
+        """직원/프로젝트를 한 번씩만 조회하고 모든 직원 결과를 저장하는지 테스트"""
+        with patch.object(employee_evaluation, 'get_all_employees',
+                          wraps=employee_evaluation.get_all_employees) as mock_employees, \
+                patch.object(employee_evaluation, 'get_all_projects',
+                             wraps=employee_evaluation.get_all_projects) as mock_projects:
+            result = employee_evaluation.batch_handler({'employee_ids': 'all'}, None)
+
+        body = json.loads(result['body'])
+        assert result['statusCode'] == 200
+        assert body['evaluated'] == 3
+        assert mock_employees.call_count == 1
+        assert mock_projects.call_count == 1
+
+        items = evaluations_table.scan()['Items']
+        assert {item['user_id'] for item in items} == {'U_001', 'U_002', 'U_003'}
+        assert all(item['status'] == 'batch' and item['submitted_at'] for item in items)
+        assert employee_evaluation.load_cohort_summary()['employee_count'] == 3
+
+    def test_scores_match_single_evaluation(self, evaluations_table):
+        """일괄 평가 점수가 단건 평가 점수와 같은지 테스트"""
+        employee_evaluation.batch_handler({'employee_ids': ['U_002', 'U_404']}, None)
+
+        item = evaluations_table.scan()['Items'][0]
+        expected = employee_evaluation.calculate_relative_scores(EMPLOYEES[1], EMPLOYEES, PROJECTS)
+        assert float(item['overall_score']) == expected['overall_score']
+        assert float(item['quantitative_analysis']['relative_scores']['technical_skills']) == expected['technical_skills']
+
+    def test_reports_not_found(self, evaluations_table):
+        """없는 직원 ID를 결과에 표시하는지 테스트"""
+        result = employee_evaluation.batch_handler({'employee_ids': ['U_001', 'U_404']}, None)
+
+        body = json.loads(result['body'])
+        assert body['evaluated'] == 1
+        assert body['not_found'] == ['U_404']
+
+    def test_invalid_employee_ids(self, evaluations_table):
+        """employee_ids가 없거나 잘못되면 400을 반환하는지 테스트"""
+        assert employee_evaluation.batch_handler({}, None)['statusCode'] == 400
+        assert employee_evaluation.batch_handler({'employee_ids': 'U_001'}, None)['statusCode'] == 400
+        assert employee_evaluation.batch_handler({'employee_ids': []}, None)['statusCode'] == 400
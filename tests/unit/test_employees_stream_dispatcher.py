@@ -0,0 +1,79 @@
+"""
+Employees Stream Dispatcher 유닛 테스트
+
+Employees 스트림 레코드를 대상 Lambda들에 순서대로 동기 전달하고,
+대상 실패 시 배치를 재시도하도록 예외를 발생시키는지 테스트합니다.
+"""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from lambda_functions.employees_stream_dispatcher import index as dispatcher
+
+
+RECORDS = [{'eventName': 'INSERT', 'dynamodb': {'NewImage': {'user_id': {'S': 'U_001'}}}}]
+
+
+def _response(body, function_error=None):
+    """Lambda invoke 응답"""
+    response = {'StatusCode': 200, 'Payload': io.BytesIO(json.dumps(body).encode('utf-8'))}
+    if function_error:
+        response['FunctionError'] = function_error
+    return response
+
+
+@pytest.fixture
+def targets(monkeypatch):
+    """대상 Lambda 목록"""
+    monkeypatch.setattr(dispatcher, 'STREAM_TARGETS', ['SkillIndexUpdater', 'DashboardViewUpdater'])
+    return dispatcher.STREAM_TARGETS
+
+
+class TestEmployeesStreamDispatcher:
+    """Employees 스트림 dispatcher 테스트"""
+
+    def test_records_forwarded_in_order(self, targets):
+        """모든 대상에 같은 레코드를 순서대로 동기 호출하는지 테스트"""
+        with patch.object(dispatcher, 'lambda_client') as mock_client:
+            mock_client.invoke.side_effect = lambda **kwargs: _response({'statusCode': 200})
+            result = dispatcher.handler({'Records': RECORDS}, None)
+
+        assert result['statusCode'] == 200
+        calls = mock_client.invoke.call_args_list
+        assert [call.kwargs['FunctionName'] for call in calls] == targets
+        for call in calls:
+            assert call.kwargs['InvocationType'] == 'RequestResponse'
+            assert json.loads(call.kwargs['Payload']) == {'Records': RECORDS}
+
+    def test_target_failure_stops_and_raises(self, targets):
+        """대상이 실패하면 이후 대상을 호출하지 않고 예외를 발생시키는지 테스트"""
+        with patch.object(dispatcher, 'lambda_client') as mock_client:
+            mock_client.invoke.return_value = _response({'errorMessage': 'boom'}, function_error='Unhandled')
+            with pytest.raises(RuntimeError):
+                dispatcher.handler({'Records': RECORDS}, None)
+
+        assert mock_client.invoke.call_count == 1
+
+    def test_throttled_invoke_is_retried(self, targets):
+        """동시 실행 제한으로 거부된 호출을 다시 시도하는지 테스트"""
+        throttled = ClientError({'Error': {'Code': 'TooManyRequestsException', 'Message': 'Rate exceeded'}}, 'Invoke')
+
+        with patch.object(dispatcher, 'lambda_client') as mock_client, \
+                patch.object(dispatcher.time, 'sleep') as mock_sleep:
+            mock_client.invoke.side_effect = [throttled, _response({}), _response({})]
+            dispatcher.handler({'Records': RECORDS}, None)
+
+        assert mock_client.invoke.call_count == 3
+        mock_sleep.assert_called_once()
+
+    def test_empty_event_is_not_forwarded(self, targets):
+        """레코드가 없으면 대상(전체 재구성)을 호출하지 않는지 테스트"""
+        with patch.object(dispatcher, 'lambda_client') as mock_client:
+            result = dispatcher.handler({}, None)
+
+        assert json.loads(result['body'])['processed_records'] == 0
+        mock_client.invoke.assert_not_called()
@@ -0,0 +1,258 @@
+"""
+evaluations_list 유닛 테스트
+
+StatusIndex 페이지 조회(상태별 병합, next_token, page 호환)와
+BatchGetItem 직원 정보 일괄 조회를 테스트합니다.
+moto를 사용하여 DynamoDB를 모킹합니다.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from moto import mock_aws
+import boto3
+from lambda_functions.employee_evaluation import index as employee_evaluation
+from lambda_functions.evaluations_list import index as evaluations_list
+
+
+STATUSES = ['pending', 'approved', 'rejected', 'review']
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    """AWS 자격 증명 모킹"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+
+@pytest.fixture
+def tables(aws_credentials, monkeypatch):
+    """평가 23건과 직원 5명이 저장된 moto DynamoDB"""
+    with mock_aws():
+        dynamodb = boto3.resource('dynamodb', region_name='us-east-2')
+        employees = dynamodb.create_table(
+            TableName='Employees',
+            KeySchema=[{'AttributeName': 'user_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'user_id', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        evaluations = dynamodb.create_table(
+            TableName='EmployeeEvaluations',
+            KeySchema=[{'AttributeName': 'evaluation_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[
+                {'AttributeName': 'evaluation_id', 'AttributeType': 'S'},
+                {'AttributeName': 'status', 'AttributeType': 'S'},
+                {'AttributeName': 'submitted_at', 'AttributeType': 'S'}
+            ],
+            GlobalSecondaryIndexes=[{
+                'IndexName': 'StatusIndex',
+                'KeySchema': [
+                    {'AttributeName': 'status', 'KeyType': 'HASH'},
+                    {'AttributeName': 'submitted_at', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'}
+            }],
+            BillingMode='PAY_PER_REQUEST'
+        )
+
+        for i in range(5):
+            employees.put_item(Item={
+                'user_id': f"U_{i:03d}",
+                'basic_info': {'name': f"직원{i}", 'role': 'Developer'},
+                'skills': [{'name': 'Python', 'level': 'Advanced'}],
+                'work_experience': [],
+                'self_introduction': '상세 정보에 포함되지 않는 속성'
+            })
+
+        for i in range(23):
+            evaluations.put_item(Item={
+                'evaluation_id': f"EVAL_{i:03d}",
+                'user_id': f"U_{i % 6:03d}",  # U_005는 Employees에 없음
+                'status': STATUSES[(i * 7) % 4],
+                'submitted_at': f"2024-01-{i + 1:02d}T09:00:00Z",
+                'overall_score': i
+            })
+
+        monkeypatch.setattr(evaluations_list, 'dynamodb', dynamodb)
+        monkeypatch.setattr(evaluations_list, 'evaluations_table', evaluations)
+        monkeypatch.setattr(evaluations_list, 'employees_table', employees)
+        yield {'employees': employees, 'evaluations': evaluations}
+
+
+def _list(**params):
+    """쿼리 파라미터로 평가 목록 조회"""
+    response = evaluations_list.lambda_handler(
+        {'httpMethod': 'GET', 'queryStringParameters': params or None}, None
+    )
+    return response['statusCode'], json.loads(response['body'])
+
+
+def _all_pages(**params):
+    """next_token을 따라 모든 페이지의 평가 ID 수집"""
+    evaluation_ids = []
+    token = None
+    while True:
+        page_params = dict(params)
+        if token:
+            page_params['next_token'] = token
+        status, body = _list(**page_params)
+        assert status == 200
+        evaluation_ids.extend(evaluation['evaluation_id'] for evaluation in body['evaluations'])
+        token = body['next_token']
+        if not token:
+            return evaluation_ids
+
+
+class TestEvaluationPages:
+    """StatusIndex 페이지 조회 테스트"""
+
+    def test_all_statuses_merged_newest_first(self, tables):
+        """상태별 조회를 병합한 페이지가 전체 최신순과 같은지 테스트"""
+        evaluation_ids = _all_pages(limit='5')
+
+        assert evaluation_ids == [f"EVAL_{i:03d}" for i in reversed(range(23))]
+
+    def test_status_filter_pages(self, tables):
+        """상태 필터와 페이지 조회 테스트"""
+        evaluation_ids = _all_pages(status='approved', limit='2')
+
+        expected = [f"EVAL_{i:03d}" for i in reversed(range(23)) if STATUSES[(i * 7) % 4] == 'approved']
+        assert evaluation_ids == expected
+
+    def test_page_number_matches_next_token(self, tables):
+        """next_token 없이 page를 지정해도 같은 페이지를 반환하는지 테스트"""
+        _, first = _list(limit='4')
+        _, second_by_token = _list(limit='4', next_token=first['next_token'])
+        _, second_by_page = _list(limit='4', page='2')
+
+        assert [e['evaluation_id'] for e in second_by_page['evaluations']] == \
+            [e['evaluation_id'] for e in second_by_token['evaluations']]
+
+    def test_page_reads_only_requested_items(self, tables):
+        """상태마다 limit개만 조회하는지 테스트"""
+        client = tables['evaluations'].meta.client
+        with patch.object(client, 'query', wraps=client.query) as mock_query:
+            _list(limit='3')
+
+        assert mock_query.call_count == len(STATUSES)
+        assert all(call.kwargs['Limit'] == 3 for call in mock_query.call_args_list)
+
+    def test_total_is_optional(self, tables):
+        """include_total을 지정한 경우에만 전체 수를 계산하는지 테스트"""
+        _, without_total = _list(limit='3')
+        _, with_total = _list(limit='3', include_total='true', status='pending')
+
+        assert without_total['total'] is None
+        assert with_total['total'] == sum(1 for i in range(23) if STATUSES[(i * 7) % 4] == 'pending')
+
+    def test_invalid_next_token(self, tables):
+        """다른 상태 필터의 토큰이나 잘못된 토큰은 400을 반환하는지 테스트"""
+        _, first = _list(limit='2')
+
+        assert _list(status='pending', next_token=first['next_token'])[0] == 400
+        assert _list(next_token='garbage')[0] == 400
+
+
+class TestEmployeeEnrichment:
+    """직원 상세 정보 일괄 조회 테스트"""
+
+    def test_single_batch_get(self, tables):
+        """페이지의 직원 정보를 BatchGetItem 한 번으로 조회하는지 테스트"""
+        with patch.object(evaluations_list.dynamodb, 'batch_get_item',
+                          wraps=evaluations_list.dynamodb.batch_get_item) as mock_batch, \
+                patch.object(tables['employees'], 'get_item') as mock_get:
+            _, body = _list(limit='12')
+
+        assert mock_batch.call_count == 1
+        mock_get.assert_not_called()
+
+        requested = mock_batch.call_args.kwargs['RequestItems']['Employees']['Keys']
+        assert len(requested) == len({e['user_id'] for e in body['evaluations']})
+
+        for evaluation in body['evaluations']:
+            if evaluation['user_id'] == 'U_005':
+                assert 'employee_details' not in evaluation
+            else:
+                assert evaluation['employee_details']['basic_info']['name'].startswith('직원')
+                assert set(evaluation['employee_details']) == {'basic_info', 'skills', 'work_experience'}
+
+    def test_unprocessed_keys_retried(self, tables):
+        """UnprocessedKeys를 다시 요청하는지 테스트"""
+        real_batch_get = evaluations_list.dynamodb.batch_get_item
+        calls = []
+
+        def partial_batch_get(RequestItems):
+            calls.append(RequestItems)
+            if len(calls) == 1:
+                keys = RequestItems['Employees']['Keys']
+                response = real_batch_get(RequestItems={
+                    'Employees': dict(RequestItems['Employees'], Keys=keys[:1])
+                })
+                response['UnprocessedKeys'] = {'Employees': dict(RequestItems['Employees'], Keys=keys[1:])}
+                return response
+            return real_batch_get(RequestItems=RequestItems)
+
+        with patch.object(evaluations_list.dynamodb, 'batch_get_item', side_effect=partial_batch_get):
+            details = evaluations_list.get_employee_details_batch(['U_000', 'U_001', 'U_000', 'U_002'])
+
+        assert len(calls) == 2
+        assert sorted(details) == ['U_000', 'U_001', 'U_002']
+
+
+class TestBatchEvaluationRecords:
+    """일괄 평가 결과 항목 조회 테스트"""
+
+    @staticmethod
+    def _batch_record(user_id, submitted_at):
+        """employee_evaluation 일괄 평가가 저장하는 항목"""
+        employee = {
+            'user_id': user_id,
+            'basic_info': {'name': user_id, 'role': 'Backend Developer', 'years_of_experience': 4},
+            'skills': [{'name': 'Python', 'level': 'Advanced', 'years': 3}],
+            'work_experience': [{'project_name': 'P0', 'role': 'Developer', 'period': '2022~2023'}]
+        }
+        raw = employee_evaluation.calculate_raw_scores(employee, [])
+        scores = employee_evaluation.relative_scores_from_raw(raw, raw)
+        peer_index = employee_evaluation.PeerCohortIndex.from_employees([employee])
+        ai_analysis = employee_evaluation.analyze_with_ai(employee, [], scores, peer_index)
+        result = employee_evaluation.build_evaluation_result(user_id, employee, scores, ai_analysis)
+        return employee_evaluation.evaluation_record(result, submitted_at)
+
+    def test_batch_records_rendered_with_list_schema(self, tables):
+        """일괄 평가 항목이 status=batch 목록에서 목록 형식으로 조회되는지 테스트"""
+        record = self._batch_record('U_001', '2024-02-01T09:00:00')
+        tables['evaluations'].put_item(Item=record)
+
+        status, body = _list(status='batch')
+
+        assert status == 200
+        assert [e['evaluation_id'] for e in body['evaluations']] == [record['evaluation_id']]
+        evaluation = body['evaluations'][0]
+        assert evaluation['status'] == 'batch' and evaluation['type'] == 'career'
+        assert evaluation['name'] == 'U_001'
+        assert evaluation['overall_score'] == float(record['overall_score'])
+        quantitative = evaluation['quantitative_analysis']
+        assert set(quantitative['experience_metrics']) == {'years_of_experience', 'project_count', 'skill_diversity'}
+        assert quantitative['tech_stack_evaluation']['overall_score'] == \
+            quantitative['relative_scores']['technical_skills']
+        qualitative = evaluation['qualitative_analysis']
+        assert set(qualitative['resume_analysis']) == {'strengths', 'weaknesses', 'recommendations'}
+        assert isinstance(qualitative['suspicious_content']['verification_needed'], bool)
+        assert qualitative['overall_evaluation']
+        assert evaluation['employee_details']['basic_info']['name'] == '직원1'
+
+    def test_batch_records_not_in_review_queue(self, tables):
+        """일괄 평가 항목이 pending 목록과 기본 목록에 섞이지 않는지 테스트"""
+        record = self._batch_record('U_002', '2024-02-01T09:00:00')
+        tables['evaluations'].put_item(Item=record)
+
+        pending_ids = _all_pages(status='pending', limit='5')
+        default_ids = _all_pages(limit='5')
+
+        assert record['evaluation_id'] not in pending_ids
+        assert record['evaluation_id'] not in default_ids
+        assert len(default_ids) == 23
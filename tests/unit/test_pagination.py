@@ -0,0 +1,231 @@
+"""
+Pagination 유닛 테스트
+
+next_token 인코딩, 쿼리 파라미터 검증, 필터/프로젝션 페이지 스캔과
+employees_list/projects_list 커서 페이지네이션을 테스트합니다.
+moto를 사용하여 DynamoDB를 모킹합니다.
+"""
+
+import json
+from decimal import Decimal
+
+import pytest
+from moto import mock_aws
+import boto3
+from boto3.dynamodb.conditions import Attr
+from common.pagination import (
+    decode_next_token,
+    encode_next_token,
+    parse_fields,
+    parse_limit,
+    scan_page,
+)
+from lambda_functions.employees_list import index as employees_list
+from lambda_functions.projects_list import index as projects_list
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    """AWS 자격 증명 모킹"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+
+@pytest.fixture
+def dynamodb(aws_credentials, monkeypatch):
+    """Employees/Projects 테이블이 있는 moto DynamoDB"""
+    with mock_aws():
+        resource = boto3.resource('dynamodb', region_name='us-east-2')
+        for table_name, hash_key in (('Employees', 'user_id'), ('Projects', 'project_id')):
+            resource.create_table(
+                TableName=table_name,
+                KeySchema=[{'AttributeName': hash_key, 'KeyType': 'HASH'}],
+                AttributeDefinitions=[{'AttributeName': hash_key, 'AttributeType': 'S'}],
+                BillingMode='PAY_PER_REQUEST'
+            )
+
+        employees = resource.Table('Employees')
+        for i in range(10):
+            employees.put_item(Item={
+                'user_id': f"U_{i:03d}",
+                'basic_info': {
+                    'name': f"직원{i}",
+                    'role': 'Backend Developer' if i % 2 == 0 else 'Frontend Developer',
+                    'email': f"user{i}@example.com",
+                    'years_of_experience': i
+                },
+                'skills': [{'name': 'Python', 'level': 'Advanced', 'years': 3}],
+                'certifications': [],
+                'work_experience': []
+            })
+
+        projects = resource.Table('Projects')
+        for i, status in enumerate(['active', 'planning', None, 'completed', 'active']):
+            item = {
+                'project_id': f"P_{i:03d}",
+                'project_name': f"프로젝트{i}",
+                'client_industry': 'Finance' if i < 3 else 'Retail',
+                'period': {'start': '2024-01-01', 'end': '2024-12-31'},
+                'tech_stack': {'backend': ['Python']}
+            }
+            if status:
+                item['status'] = status
+            projects.put_item(Item=item)
+
+        monkeypatch.setattr(employees_list, 'dynamodb', resource)
+        monkeypatch.setattr(projects_list, 'dynamodb', resource)
+        employees_list.response_cache.clear()
+        projects_list.response_cache.clear()
+        yield resource
+        employees_list.response_cache.clear()
+        projects_list.response_cache.clear()
+
+
+def _list(handler, **params):
+    """쿼리 파라미터로 목록 핸들러 호출"""
+    response = handler({'httpMethod': 'GET', 'queryStringParameters': params or None}, None)
+    return response['statusCode'], json.loads(response['body'])
+
+
+class TestNextToken:
+    """next_token 인코딩 테스트"""
+
+    def test_round_trip(self):
+        """문자열/숫자 키가 그대로 복원되는지 테스트"""
+        key = {'user_id': 'U_001', 'seq': Decimal('12345678901234567890')}
+        token = encode_next_token(key)
+
+        assert decode_next_token(token, ('user_id', 'seq')) == key
+        assert '=' not in token
+
+    def test_empty_key(self):
+        """마지막 페이지면 토큰이 없는지 테스트"""
+        assert encode_next_token(None) is None
+        assert encode_next_token({}) is None
+        assert decode_next_token(None, ('user_id',)) is None
+
+    def test_invalid_token(self):
+        """잘못된 토큰과 다른 테이블 키 토큰을 거부하는지 테스트"""
+        with pytest.raises(ValueError):
+            decode_next_token('not-a-token!', ('user_id',))
+        with pytest.raises(ValueError):
+            decode_next_token(encode_next_token({'project_id': 'P_001'}), ('user_id',))
+
+
+class TestQueryParams:
+    """쿼리 파라미터 검증 테스트"""
+
+    def test_parse_limit(self):
+        """limit 범위 검증 테스트"""
+        assert parse_limit(None) is None
+        assert parse_limit('20') == 20
+        for value in ('0', '101', 'abc'):
+            with pytest.raises(ValueError):
+                parse_limit(value)
+
+    def test_parse_fields(self):
+        """fields 중복 제거와 알 수 없는 필드 거부 테스트"""
+        assert parse_fields('user_id, name,name', ('user_id', 'name')) == ['user_id', 'name']
+        assert parse_fields('', ('user_id',)) is None
+        with pytest.raises(ValueError):
+            parse_fields('user_id,salary', ('user_id', 'name'))
+
+
+class TestScanPage:
+    """scan_page 테스트"""
+
+    def test_filtered_pages_cover_table_once(self, dynamodb):
+        """필터가 있어도 페이지마다 limit개씩, 중복/누락 없이 읽는지 테스트"""
+        table = dynamodb.Table('Employees')
+        condition = Attr('basic_info.role').eq('Backend Developer')
+
+        collected = []
+        start_key = None
+        while True:
+            items, start_key = scan_page(table, limit=2, start_key=start_key, filter_expression=condition)
+            assert len(items) <= 2
+            collected.extend(item['user_id'] for item in items)
+            if not start_key:
+                break
+
+        assert sorted(collected) == [f"U_{i:03d}" for i in range(0, 10, 2)]
+
+    def test_projection(self, dynamodb):
+        """지정한 속성만 읽는지 테스트"""
+        items, last_key = scan_page(dynamodb.Table('Projects'), attributes=['project_id', 'status'])
+
+        assert last_key is None
+        assert len(items) == 5
+        assert all(set(item) <= {'project_id', 'status'} for item in items)
+
+
+class TestListPagination:
+    """목록 API 커서 페이지네이션 테스트"""
+
+    def test_employees_pages(self, dynamodb):
+        """next_token을 따라가면 전체 직원을 한 번씩 받는지 테스트"""
+        status, first = _list(employees_list.handler, limit='4')
+        assert status == 200
+        assert first['count'] == 4
+        assert first['next_token']
+
+        user_ids = [employee['user_id'] for employee in first['employees']]
+        token = first['next_token']
+        while token:
+            _, page = _list(employees_list.handler, limit='4', next_token=token)
+            user_ids.extend(employee['user_id'] for employee in page['employees'])
+            token = page['next_token']
+
+        assert sorted(user_ids) == [f"U_{i:03d}" for i in range(10)]
+
+    def test_employees_unpaged_returns_all(self, dynamodb):
+        """limit이 없으면 전체 직원을 반환하는지 테스트"""
+        _, body = _list(employees_list.handler)
+
+        assert body['count'] == 10
+        assert body['next_token'] is None
+
+    def test_employees_fields_and_filters(self, dynamodb):
+        """필드 선택과 필터 조건 테스트"""
+        _, body = _list(
+            employees_list.handler,
+            fields='user_id,name,role',
+            role='Frontend Developer',
+            min_experience='5'
+        )
+
+        assert sorted(employee['user_id'] for employee in body['employees']) == ['U_005', 'U_007', 'U_009']
+        assert all(set(employee) == {'user_id', 'name', 'role'} for employee in body['employees'])
+
+    def test_employees_invalid_params(self, dynamodb):
+        """잘못된 파라미터는 400을 반환하는지 테스트"""
+        for params in ({'limit': '0'}, {'next_token': 'bad'}, {'fields': 'salary'}, {'min_experience': 'x'}):
+            status, body = _list(employees_list.handler, **params)
+            assert status == 400
+            assert body['error'] == 'Invalid query parameters'
+
+    def test_projects_status_filter(self, dynamodb):
+        """status=active에 상태가 없는 프로젝트도 포함하는지 테스트"""
+        _, body = _list(projects_list.handler, status='active', fields='project_id,status')
+
+        assert sorted(project['project_id'] for project in body['projects']) == ['P_000', 'P_002', 'P_004']
+        assert all(project['status'] == 'active' for project in body['projects'])
+
+    def test_projects_pages_with_filter(self, dynamodb):
+        """필터와 페이지네이션을 함께 쓰는 경우 테스트"""
+        project_ids = []
+        token = None
+        while True:
+            params = {'limit': '1', 'client_industry': 'Finance'}
+            if token:
+                params['next_token'] = token
+            _, page = _list(projects_list.handler, **params)
+            project_ids.extend(project['project_id'] for project in page['projects'])
+            token = page['next_token']
+            if not token:
+                break
+
+        assert sorted(project_ids) == ['P_000', 'P_001', 'P_002']
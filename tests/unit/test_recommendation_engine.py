@@ -0,0 +1,308 @@
+"""
+추천 엔진 단위 테스트
+
+Requirements: 2.2, 2.4
+"""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from lambda_functions.recommendation_engine import index as recommendation_engine
+from lambda_functions.recommendation_engine.index import (
+    AffinityIndex,
+    LazyAffinityIndex,
+    merge_and_score_candidates,
+    select_top_candidates
+)
+
+
+class TestAffinityIndex:
+    """친밀도 인접 인덱스 테스트"""
+
+    def test_add_is_bidirectional(self):
+        """직원 쌍이 양방향으로 등록되는지 테스트"""
+        index = AffinityIndex()
+        index.add('U_001', 'U_002', 80.0)
+
+        assert index.score('U_001', 'U_002') == 80.0
+        assert index.score('U_002', 'U_001') == 80.0
+        assert index.neighbors('U_001') == {'U_002': 80.0}
+        assert len(index) == 1
+
+    def test_average(self):
+        """직원별 평균 친밀도 테스트"""
+        index = AffinityIndex()
+        index.add('U_001', 'U_002', 80.0)
+        index.add('U_001', 'U_003', 60.0)
+
+        assert index.average('U_001') == pytest.approx(70.0)
+        assert index.average('U_002') == pytest.approx(80.0)
+        assert index.average('U_999') == 0.0
+
+    def test_overwrite_updates_average(self):
+        """같은 쌍을 다시 등록하면 점수가 교체되는지 테스트"""
+        index = AffinityIndex()
+        index.add('U_001', 'U_002', 80.0)
+        index.add('U_002', 'U_001', 40.0)
+
+        assert index.average('U_001') == pytest.approx(40.0)
+        assert len(index) == 1
+
+    def test_upper_bound(self):
+        """평균 친밀도 상한이 모든 직원의 평균 이상인지 테스트"""
+        index = AffinityIndex(default_score=10.0, population=4)
+        assert index.upper_bound() >= 10.0
+
+        index.add('U_001', 'U_002', 0.1)
+        index.add('U_001', 'U_003', 0.1)
+        index.add('U_002', 'U_003', 0.1)
+        index.add('U_003', 'U_004', 95.0)
+
+        assert index.upper_bound() == pytest.approx(95.0)
+        for user_id in ('U_001', 'U_002', 'U_003', 'U_004', 'U_999'):
+            assert index.average(user_id) <= index.upper_bound()
+
+    def test_prefix_ids_are_not_confused(self):
+        """한 ID가 다른 ID의 접두사인 경우에도 정확히 구분되는지 테스트"""
+        index = AffinityIndex()
+        index.add('U_1', 'U_2', 90.0)
+        index.add('U_10', 'U_20', 10.0)
+
+        assert index.average('U_1') == pytest.approx(90.0)
+        assert index.average('U_10') == pytest.approx(10.0)
+
+
+class TestMergeAndScoreCandidates:
+    """후보자 통합 및 점수 계산 테스트"""
+
+    def test_affinity_average_applied(self):
+        """후보자별 평균 친밀도가 반영되는지 테스트"""
+        index = AffinityIndex()
+        index.add('U_1', 'U_2', 90.0)
+        index.add('U_10', 'U_2', 30.0)
+
+        skill_matches = [
+            {'user_id': 'U_1', 'name': 'A', 'skill_match_score': 50.0},
+            {'user_id': 'U_10', 'name': 'B', 'skill_match_score': 50.0},
+            {'user_id': 'U_3', 'name': 'C', 'skill_match_score': 50.0}
+        ]
+
+        candidates = merge_and_score_candidates(
+            skill_matches=skill_matches,
+            vector_matches=[],
+            affinity_scores=index,
+            priority='balanced'
+        )
+        by_id = {candidate['user_id']: candidate for candidate in candidates}
+
+        assert by_id['U_1']['affinity_score'] == pytest.approx(90.0)
+        assert by_id['U_10']['affinity_score'] == pytest.approx(30.0)
+        assert by_id['U_3']['affinity_score'] == 0
+        assert by_id['U_1']['overall_score'] == pytest.approx(50.0 * 0.4 + 90.0 * 0.3)
+
+
+class TestSparseAffinityIndex:
+    """sparse 저장 친밀도 인덱스 테스트"""
+
+    def test_missing_pair_uses_default_score(self):
+        """저장되지 않은 직원 쌍이 기본 점수로 간주되는지 테스트"""
+        index = AffinityIndex(default_score=10.0)
+        index.add('U_001', 'U_002', 80.0)
+
+        assert index.score('U_001', 'U_003') == 10.0
+        assert index.score('U_001', 'U_003', default=0.0) == 0.0
+        assert index.average('U_999') == 10.0
+
+    def test_average_includes_missing_pairs(self):
+        """전체 직원 수가 있으면 평균에 저장되지 않은 쌍이 포함되는지 테스트"""
+        index = AffinityIndex(default_score=10.0, population=5)
+        index.add('U_001', 'U_002', 90.0)
+        index.add('U_001', 'U_003', 70.0)
+
+        assert index.average('U_001') == pytest.approx((90.0 + 70.0 + 10.0 * 2) / 4)
+        assert index.average('U_002') == pytest.approx((90.0 + 10.0 * 3) / 4)
+
+
+def _pair_loader(pairs, calls):
+    """(직원1, 직원2, 점수) 목록에서 직원별 친밀도 쌍을 반환하는 loader"""
+    def loader(employee_id):
+        calls.append(employee_id)
+        return [
+            (b if a == employee_id else a, score)
+            for a, b, score in pairs
+            if employee_id in (a, b)
+        ]
+    return loader
+
+
+class TestLazyAffinityIndex:
+    """후보자별 친밀도 조회 인덱스 테스트"""
+
+    def test_average_same_as_full_index(self):
+        """직원별로 읽은 평균이 전체 인덱스 평균과 같은지 테스트"""
+        rng = random.Random(5)
+        pairs = []
+        seen = set()
+        for _ in range(80):
+            a, b = sorted(rng.sample(range(20), 2))
+            if (a, b) not in seen:
+                seen.add((a, b))
+                pairs.append((f'U_{a:03d}', f'U_{b:03d}', float(rng.randint(0, 100))))
+
+        for default_score, population in ((0.0, None), (20.0, 25)):
+            full = AffinityIndex(default_score=default_score, population=population)
+            for a, b, score in pairs:
+                full.add(a, b, score)
+            calls = []
+            lazy = LazyAffinityIndex(_pair_loader(pairs, calls), default_score=default_score, population=population)
+
+            for i in range(22):
+                user_id = f'U_{i:03d}'
+                assert lazy.average(user_id) == pytest.approx(full.average(user_id))
+                assert lazy.average(user_id) <= lazy.upper_bound()
+            assert len(calls) == 22
+
+    def test_loads_only_scored_candidates(self):
+        """힙에서 꺼내 점수를 계산한 후보자의 친밀도만 조회하는지 테스트"""
+        calls = []
+        index = LazyAffinityIndex(_pair_loader([('U_000', 'U_050', 90.0)], calls))
+        skill_matches = [
+            {'user_id': f'U_{i:03d}', 'name': f'E{i}', 'skill_match_score': 100.0 if i < 3 else 10.0}
+            for i in range(100)
+        ]
+
+        selected = select_top_candidates(skill_matches, [], index, 'skill', 3)
+
+        assert [c['user_id'] for c in selected] == ['U_000', 'U_001', 'U_002']
+        assert sorted(calls) == ['U_000', 'U_001', 'U_002']
+        assert selected[0]['affinity_score'] == pytest.approx(90.0)
+
+    def test_get_affinity_scores_does_not_scan(self):
+        """친밀도 인덱스를 만들 때 테이블을 조회하지 않는지 테스트"""
+        with patch.object(recommendation_engine, 'dynamodb') as mock_dynamodb, \
+                patch.object(recommendation_engine, 'affinity_repo') as mock_repo:
+            index = recommendation_engine.get_affinity_scores()
+
+        assert isinstance(index, LazyAffinityIndex)
+        mock_dynamodb.Table.return_value.scan.assert_not_called()
+        mock_repo.find_by_employee.assert_not_called()
+
+
+class TestSparseDefaultScore:
+    """sparse 저장 기본 점수 테스트"""
+
+    def test_sparse_average_matches_dense(self):
+        """임계값 미만 쌍을 지운 sparse 평균이 dense 평균과 같은지 테스트"""
+        from common.repositories import DEFAULT_AFFINITY_SCORE
+
+        rng = random.Random(9)
+        employees = [f'U_{i:03d}' for i in range(12)]
+        pairs = [
+            (a, b, float(rng.choice([60, 75, 90])) if rng.random() < 0.2 else DEFAULT_AFFINITY_SCORE)
+            for i, a in enumerate(employees)
+            for b in employees[i + 1:]
+        ]
+        dense = LazyAffinityIndex(_pair_loader(pairs, []))
+        stored = [pair for pair in pairs if pair[2] >= 50]
+        sparse = LazyAffinityIndex(
+            _pair_loader(stored, []), default_score=DEFAULT_AFFINITY_SCORE, population=len(employees)
+        )
+
+        for user_id in employees:
+            assert sparse.average(user_id) == pytest.approx(dense.average(user_id))
+
+    def test_stored_default_score_is_used(self):
+        """affinity_calculator가 저장한 기본 점수를 사용하는지 테스트"""
+        with patch.object(recommendation_engine, 'dynamodb') as mock_dynamodb:
+            mock_dynamodb.Table.return_value.get_item.return_value = {
+                'Item': {'job_name': 'affinity_calculator#default_score', 'score': 18.5}
+            }
+            assert recommendation_engine.load_default_affinity_score() == 18.5
+
+            mock_dynamodb.Table.return_value.get_item.return_value = {}
+            assert recommendation_engine.load_default_affinity_score() == 20.75
+
+
+def _random_matches(rng, count):
+    """무작위 기술 매칭/벡터 검색 결과 생성 (동점 포함)"""
+    skill_matches = [
+        {'user_id': f'U_{i:03d}', 'name': f'E{i}', 'skill_match_score': float(rng.choice([0, 25, 50, 75, 100]))}
+        for i in range(count)
+        if rng.random() < 0.8
+    ]
+    vector_matches = [
+        {'user_id': f'U_{i:03d}', 'name': f'E{i}', 'similarity_score': round(rng.random(), 1)}
+        for i in range(count)
+        if rng.random() < 0.5
+    ]
+    return skill_matches, vector_matches
+
+
+class TestSelectTopCandidates:
+    """상위 후보자 선택 테스트"""
+
+    @pytest.mark.parametrize('priority', ['skill', 'affinity', 'balanced'])
+    def test_matches_full_sort(self, priority):
+        """전체 점수 계산 후 정렬한 결과와 같은지 테스트 (동점 순서 포함)"""
+        rng = random.Random(42)
+        for _ in range(30):
+            skill_matches, vector_matches = _random_matches(rng, 40)
+            index = AffinityIndex(default_score=rng.choice([0.0, 10.0]))
+            for _ in range(60):
+                a, b = rng.sample(range(40), 2)
+                index.add(f'U_{a:03d}', f'U_{b:03d}', float(rng.choice([0, 30, 60, 90])))
+
+            expected = sorted(
+                merge_and_score_candidates(skill_matches, vector_matches, index, priority),
+                key=lambda x: x['overall_score'],
+                reverse=True
+            )
+            for top_k in (1, 5, 100):
+                selected = select_top_candidates(skill_matches, vector_matches, index, priority, top_k)
+                assert [c['user_id'] for c in selected] == [c['user_id'] for c in expected[:top_k]]
+                assert [c['overall_score'] for c in selected] == [c['overall_score'] for c in expected[:top_k]]
+
+    def test_prunes_affinity_lookups(self):
+        """상한이 K번째 점수를 넘지 못하는 후보자는 친밀도를 조회하지 않는지 테스트"""
+        index = AffinityIndex()
+        index.add('U_000', 'U_001', 10.0)
+        skill_matches = [
+            {'user_id': f'U_{i:03d}', 'name': f'E{i}', 'skill_match_score': 100.0 if i < 3 else 10.0}
+            for i in range(100)
+        ]
+
+        with patch.object(index, 'average', wraps=index.average) as average:
+            selected = select_top_candidates(skill_matches, [], index, 'skill', 3)
+
+        assert [c['user_id'] for c in selected] == ['U_000', 'U_001', 'U_002']
+        assert average.call_count == 3
+
+    def test_non_positive_top_k(self):
+        """선택 인원이 0 이하이면 빈 목록을 반환하는지 테스트"""
+        skill_matches = [{'user_id': 'U_001', 'skill_match_score': 50.0}]
+        assert select_top_candidates(skill_matches, [], AffinityIndex(), 'balanced', 0) == []
+
+    def test_availability_checked_for_selected_only(self):
+        """가용성 확인이 선택된 후보자에게만 수행되는지 테스트"""
+        skill_matches = [
+            {'user_id': f'U_{i:03d}', 'name': f'E{i}', 'skill_match_score': float(i)}
+            for i in range(50)
+        ]
+
+        with patch.object(recommendation_engine, 'find_employees_by_skills', return_value=skill_matches), \
+                patch.object(recommendation_engine, 'search_similar_employees', return_value=[]), \
+                patch.object(recommendation_engine, 'get_affinity_scores', return_value=AffinityIndex()), \
+                patch.object(recommendation_engine, 'check_availability', side_effect=lambda c: c) as availability:
+            result = recommendation_engine.generate_recommendations(
+                project_id='P_001',
+                required_skills=['Python'],
+                team_size=4,
+                priority='skill'
+            )
+
+        availability.assert_called_once()
+        assert [c['user_id'] for c in availability.call_args[0][0]] == ['U_049', 'U_048', 'U_047', 'U_046']
+        assert len(result) == 4
+        assert all('reasoning' in candidate for candidate in result)
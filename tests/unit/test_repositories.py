@@ -6,6 +6,7 @@ moto를 사용하여 DynamoDB를 모킹합니다.
 """
 
 import pytest
+from unittest.mock import patch
 from moto import mock_aws
 import boto3
 from common.dynamodb_client import DynamoDBClient, DynamoDBClientError
@@ -88,7 +89,21 @@ def affinity_table(dynamodb_client):
             {'AttributeName': 'affinity_id', 'KeyType': 'HASH'}
         ],
         AttributeDefinitions=[
-            {'AttributeName': 'affinity_id', 'AttributeType': 'S'}
+            {'AttributeName': 'affinity_id', 'AttributeType': 'S'},
+            {'AttributeName': 'employee_1', 'AttributeType': 'S'},
+            {'AttributeName': 'employee_2', 'AttributeType': 'S'}
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                'IndexName': 'Employee1Index',
+                'KeySchema': [{'AttributeName': 'employee_1', 'KeyType': 'HASH'}],
+                'Projection': {'ProjectionType': 'ALL'}
+            },
+            {
+                'IndexName': 'Employee2Index',
+                'KeySchema': [{'AttributeName': 'employee_2', 'KeyType': 'HASH'}],
+                'Projection': {'ProjectionType': 'ALL'}
+            }
         ],
         BillingMode='PAY_PER_REQUEST'
     )
@@ -225,6 +240,29 @@ class TestEmployeeRepository:
         
         assert len(all_employees) == 3
 
+    def test_iter_all_employees(self, dynamodb_client, employees_table):
+        """전체 직원 순회 테스트"""
+        repo = EmployeeRepository(dynamodb_client)
+        
+        for i in range(5):
+            employee = Employee(
+                user_id=f"U_{i:03d}",
+                basic_info=BasicInfo(
+                    name=f"직원{i}",
+                    role="Developer",
+                    years_of_experience=i + 1,
+                    email=f"emp{i}@example.com"
+                )
+            )
+            repo.create(employee)
+        
+        # 작은 페이지 크기로 순회
+        iterator = repo.iter_all(page_size=2)
+        
+        assert not isinstance(iterator, list)
+        user_ids = {employee.user_id for employee in iterator}
+        assert user_ids == {f"U_{i:03d}" for i in range(5)}
+
     def test_find_by_skills(self, dynamodb_client, employees_table):
         """기술 기반 직원 조회 테스트"""
         repo = EmployeeRepository(dynamodb_client)
@@ -418,6 +456,29 @@ class TestProjectRepository:
         
         assert len(all_projects) == 3
 
+    def test_iter_all_projects(self, dynamodb_client, projects_table):
+        """전체 프로젝트 순회 테스트"""
+        repo = ProjectRepository(dynamodb_client)
+        
+        for i in range(3):
+            project = Project(
+                project_id=f"P_{i:03d}",
+                project_name=f"프로젝트{i}",
+                client_industry="IT",
+                period=ProjectPeriod(
+                    start="2024-01-01",
+                    end="2024-12-31",
+                    duration_months=12
+                ),
+                tech_stack=TechStack(backend=["Python"])
+            )
+            repo.create(project)
+        
+        projects = list(repo.iter_all(page_size=1))
+        
+        assert len(projects) == 3
+        assert all(isinstance(project, Project) for project in projects)
+
 
 class TestAffinityRepository:
     """AffinityRepository 테스트"""
@@ -618,3 +679,124 @@ class TestAffinityRepository:
         all_affinities = repo.list_all()
         
         assert len(all_affinities) == 3
+
+    def test_upsert_many_affinities(self, dynamodb_client, affinity_table):
+        """친밀도 일괄 저장 테스트 (25개 단위 분할 및 중복 ID 처리)"""
+        repo = AffinityRepository(dynamodb_client)
+        
+        def _affinity(i, score):
+            return Affinity(
+                affinity_id=f"AFF_{i:03d}",
+                employee_pair=EmployeePair(
+                    employee_1=f"U_{i:03d}",
+                    employee_2=f"U_{i+1:03d}"
+                ),
+                project_collaboration=ProjectCollaboration(
+                    shared_projects=[],
+                    collaboration_score=score
+                ),
+                messenger_communication=MessengerCommunication(
+                    total_messages_exchanged=10,
+                    avg_response_time_minutes=15.0,
+                    communication_score=score
+                ),
+                company_events=CompanyEvents(
+                    shared_events=[],
+                    social_score=score
+                ),
+                personal_closeness=PersonalCloseness(
+                    payday_contact_frequency=1,
+                    vacation_day_contact_frequency=1,
+                    personal_score=score
+                ),
+                overall_affinity_score=score
+            )
+        
+        affinities = [_affinity(i, 50.0) for i in range(60)]
+        affinities.append(_affinity(0, 90.0))
+        
+        count = repo.upsert_many(affinities, max_workers=3)
+        
+        assert count == 60
+        assert len(repo.list_all()) == 60
+        assert repo.get("AFF_000").overall_affinity_score == 90.0
+        
+        # 기존 항목 덮어쓰기
+        assert repo.create_many([_affinity(1, 10.0)]) == 1
+        assert repo.get("AFF_001").overall_affinity_score == 10.0
+
+    def test_find_by_employee_fills_default_score(self, dynamodb_client, affinity_table):
+        """sparse 저장에서 저장되지 않은 상대 직원이 기본 점수로 채워지는지 테스트"""
+        repo = AffinityRepository(dynamodb_client)
+        stored = Affinity.default_for_pair("U_002", "U_001", 75.0)
+        
+        with patch.object(dynamodb_client, 'query_parallel', return_value=[[stored.to_dynamodb()], []]):
+            affinities = repo.find_by_employee(
+                "U_001",
+                other_employee_ids=["U_001", "U_002", "U_003"],
+                default_score=5.0
+            )
+        
+        assert [a.overall_affinity_score for a in affinities] == [75.0, 5.0]
+        assert affinities[1].employee_pair.employee_2 == "U_003"
+
+    def test_find_by_employee_pair_default_score(self, dynamodb_client, affinity_table):
+        """저장되지 않은 직원 쌍 조회 시 기본 점수 반환 테스트"""
+        repo = AffinityRepository(dynamodb_client)
+        
+        assert repo.find_by_employee_pair("U_001", "U_009") is None
+        
+        affinity = repo.find_by_employee_pair("U_001", "U_009", default_score=0.0)
+        assert affinity.affinity_id == "AFF_U_001_U_009"
+        assert affinity.overall_affinity_score == 0.0
+
+    def test_find_by_employee_uses_both_indexes(self, dynamodb_client, affinity_table):
+        """employee_1/employee_2 양쪽 GSI로 직원 관련 친밀도를 스캔 없이 조회하는지 테스트"""
+        repo = AffinityRepository(dynamodb_client)
+        repo.create_many([
+            Affinity.default_for_pair("U_001", "U_002", 10.0),
+            Affinity.default_for_pair("U_000", "U_001", 20.0),
+            Affinity.default_for_pair("U_002", "U_003", 30.0)
+        ])
+        
+        with patch.object(dynamodb_client, 'scan_pages') as mock_scan_pages, \
+                patch.object(dynamodb_client, 'scan') as mock_scan:
+            affinities = repo.find_by_employee("U_001")
+        
+        assert sorted(a.overall_affinity_score for a in affinities) == [10.0, 20.0]
+        mock_scan_pages.assert_not_called()
+        mock_scan.assert_not_called()
+
+    def test_iter_by_employee_streams_pages(self, dynamodb_client, affinity_table):
+        """직원 관련 친밀도를 GSI 쿼리 페이지 단위로 지연 순회하는지 테스트"""
+        repo = AffinityRepository(dynamodb_client)
+        repo.create_many([
+            Affinity.default_for_pair("U_001", "U_002", 10.0),
+            Affinity.default_for_pair("U_000", "U_001", 20.0),
+            Affinity.default_for_pair("U_002", "U_003", 30.0)
+        ])
+        
+        with patch.object(dynamodb_client, 'query_pages', wraps=dynamodb_client.query_pages) as mock_query_pages, \
+                patch.object(dynamodb_client, 'query_parallel') as mock_query_parallel:
+            iterator = repo.iter_by_employee("U_001")
+            first = next(iterator)
+            # 첫 번째 GSI 결과를 소비하는 동안 두 번째 쿼리는 시작하지 않음
+            assert mock_query_pages.call_count == 1
+            rest = list(iterator)
+        
+        assert first.overall_affinity_score == 10.0
+        assert [a.overall_affinity_score for a in rest] == [20.0]
+        assert mock_query_pages.call_count == 2
+        mock_query_parallel.assert_not_called()
+
+    def test_find_by_employee_pair_uses_index(self, dynamodb_client, affinity_table):
+        """affinity_id 규칙과 다른 항목도 GSI로 찾는지 테스트"""
+        repo = AffinityRepository(dynamodb_client)
+        affinity = Affinity.default_for_pair("U_005", "U_004", 40.0)
+        affinity.affinity_id = "AFF_LEGACY_1"
+        repo.create(affinity)
+        
+        found = repo.find_by_employee_pair("U_004", "U_005")
+        
+        assert found.affinity_id == "AFF_LEGACY_1"
+        assert found.overall_affinity_score == 40.0
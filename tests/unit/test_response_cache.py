@@ -0,0 +1,271 @@
+"""
+ResponseCache 유닛 테스트
+
+TTL/LRU 컨테이너 캐시, 세대 번호 기반 무효화, ETag 조건부 응답을 테스트합니다.
+moto를 사용하여 DynamoDB 공유 계층을 모킹합니다.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from moto import mock_aws
+import boto3
+from common.response_cache import (
+    DynamoDBCacheBackend,
+    FileCacheBackend,
+    ResponseCache,
+    compute_etag,
+    conditional_response,
+    etag_matches,
+    invalidate,
+)
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    """AWS 자격 증명 모킹"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+
+@pytest.fixture
+def dynamodb_backend(aws_credentials):
+    """ResponseCache 테이블을 쓰는 DynamoDB 공유 계층 픽스처"""
+    with mock_aws():
+        dynamodb = boto3.resource('dynamodb', region_name='us-east-2')
+        dynamodb.create_table(
+            TableName='ResponseCache',
+            KeySchema=[{'AttributeName': 'cache_key', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'cache_key', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        yield DynamoDBCacheBackend('ResponseCache', region_name='us-east-2')
+
+
+def _counting_builder(prefix='body'):
+    """호출 횟수를 본문에 담는 build 함수"""
+    calls = []
+
+    def build():
+        calls.append(1)
+        return f'{{"{prefix}": {len(calls)}}}'
+
+    return build, calls
+
+
+class TestContainerCache:
+    """컨테이너(로컬) 캐시 테스트"""
+
+    def test_hit_after_first_build(self):
+        """두 번째 요청은 다시 만들지 않는지 테스트"""
+        cache = ResponseCache('test', depends_on=('employees',), backend=None)
+        build, calls = _counting_builder()
+
+        with patch('common.response_cache.get_default_backend', return_value=None):
+            first, first_hit = cache.get_or_build('all', build)
+            second, second_hit = cache.get_or_build('all', build)
+
+        assert (first_hit, second_hit) == (False, True)
+        assert second.body == first.body
+        assert len(calls) == 1
+
+    def test_ttl_expiry(self):
+        """TTL이 지나면 다시 만드는지 테스트"""
+        cache = ResponseCache('test', depends_on=('employees',), ttl_seconds=10)
+        build, calls = _counting_builder()
+
+        with patch('common.response_cache.get_default_backend', return_value=None), \
+                patch('common.response_cache.time.time', side_effect=[100.0, 105.0, 111.0]):
+            cache.get_or_build('all', build)
+            cache.get_or_build('all', build)
+            _, hit = cache.get_or_build('all', build)
+
+        assert hit is False
+        assert len(calls) == 2
+
+    def test_lru_eviction(self):
+        """최대 항목 수를 넘으면 가장 오래 쓰지 않은 항목을 버리는지 테스트"""
+        cache = ResponseCache('test', depends_on=('employees',), max_entries=2)
+        build, calls = _counting_builder()
+
+        with patch('common.response_cache.get_default_backend', return_value=None):
+            cache.get_or_build('a', build)
+            cache.get_or_build('b', build)
+            cache.get_or_build('a', build)
+            cache.get_or_build('c', build)
+            _, a_hit = cache.get_or_build('a', build)
+            _, b_hit = cache.get_or_build('b', build)
+
+        assert a_hit is True
+        assert b_hit is False
+        assert len(calls) == 4
+
+    def test_uncacheable_body_is_not_stored(self):
+        """cacheable이 False를 반환하면 저장하지 않는지 테스트"""
+        cache = ResponseCache('test', depends_on=('employees',))
+        build, calls = _counting_builder()
+
+        with patch('common.response_cache.get_default_backend', return_value=None):
+            cache.get_or_build('all', build, cacheable=lambda body: False)
+            _, hit = cache.get_or_build('all', build)
+
+        assert hit is False
+        assert len(calls) == 2
+
+    def test_invalidate_clears_dependent_caches(self):
+        """invalidate가 같은 컨테이너의 의존 캐시만 비우는지 테스트"""
+        employees = ResponseCache('employees', depends_on=('employees',))
+        projects = ResponseCache('projects', depends_on=('projects',))
+        build, _ = _counting_builder()
+
+        with patch('common.response_cache.get_default_backend', return_value=None):
+            employees.get_or_build('all', build)
+            projects.get_or_build('all', build)
+            invalidate('employees')
+            _, employees_hit = employees.get_or_build('all', build)
+            _, projects_hit = projects.get_or_build('all', build)
+
+        assert employees_hit is False
+        assert projects_hit is True
+
+
+class TestSharedBackend:
+    """공유 계층 테스트"""
+
+    def test_dynamodb_generation_invalidates_other_containers(self, dynamodb_backend):
+        """다른 컨테이너의 무효화가 세대 번호로 전파되는지 테스트"""
+        reader = ResponseCache('employees_list', depends_on=('employees',), backend=dynamodb_backend)
+        build, calls = _counting_builder()
+
+        reader.get_or_build('all', build)
+        assert dynamodb_backend.get_generations(['employees']) == {'employees': 0}
+
+        # 쓰기 Lambda는 별도 컨테이너이므로 공유 계층만 갱신됨
+        dynamodb_backend.bump_generations(['employees'])
+        _, hit = reader.get_or_build('all', build)
+
+        assert hit is False
+        assert len(calls) == 2
+        assert dynamodb_backend.get_generations(['employees']) == {'employees': 1}
+
+    def test_dynamodb_body_shared_between_containers(self, dynamodb_backend):
+        """한 컨테이너가 만든 본문을 다른 컨테이너가 재사용하는지 테스트"""
+        first = ResponseCache('projects_list', depends_on=('projects',), backend=dynamodb_backend)
+        second = ResponseCache('projects_list', depends_on=('projects',), backend=dynamodb_backend)
+        build, calls = _counting_builder()
+
+        built, _ = first.get_or_build('all', build)
+        shared, hit = second.get_or_build('all', build)
+
+        assert hit is True
+        assert shared.body == built.body
+        assert shared.etag == built.etag
+        assert len(calls) == 1
+
+    def test_file_backend(self, tmp_path):
+        """파일 공유 계층의 본문 공유와 세대 무효화 테스트"""
+        backend = FileCacheBackend(str(tmp_path))
+        first = ResponseCache('employees_list', depends_on=('employees',), backend=backend)
+        second = ResponseCache('employees_list', depends_on=('employees',), backend=backend)
+        build, calls = _counting_builder()
+
+        first.get_or_build('all', build)
+        _, shared_hit = second.get_or_build('all', build)
+        invalidate('employees', backend=backend)
+        _, invalidated_hit = second.get_or_build('all', build)
+
+        assert shared_hit is True
+        assert invalidated_hit is False
+        assert backend.get_generations(['employees']) == {'employees': 1}
+        assert len(calls) == 2
+
+    def test_unprocessed_generation_keys_retried(self, dynamodb_backend):
+        """세대 번호 UnprocessedKeys를 다시 요청하는지 테스트"""
+        dynamodb_backend.bump_generations(['employees', 'projects'])
+        real_batch_get = dynamodb_backend.dynamodb.batch_get_item
+        calls = []
+
+        def partial_batch_get(RequestItems):
+            calls.append(RequestItems)
+            request = RequestItems[dynamodb_backend.table_name]
+            if len(calls) == 1:
+                response = real_batch_get(RequestItems={
+                    dynamodb_backend.table_name: dict(request, Keys=request['Keys'][:1])
+                })
+                response['UnprocessedKeys'] = {
+                    dynamodb_backend.table_name: dict(request, Keys=request['Keys'][1:])
+                }
+                return response
+            return real_batch_get(RequestItems=RequestItems)
+
+        with patch.object(dynamodb_backend.dynamodb, 'batch_get_item', side_effect=partial_batch_get), \
+                patch('common.response_cache.time.sleep'):
+            generations = dynamodb_backend.get_generations(['employees', 'projects'])
+
+        assert len(calls) == 2
+        assert generations == {'employees': 1, 'projects': 1}
+
+    def test_unprocessed_generation_keys_bypass_cache(self, dynamodb_backend):
+        """재시도 후에도 세대 번호를 읽지 못하면 세대 0으로 간주하지 않고 캐시를 건너뛰는지 테스트"""
+        cache = ResponseCache('employees_list', depends_on=('employees',), backend=dynamodb_backend)
+        build, calls = _counting_builder()
+        cache.get_or_build('all', build)
+        dynamodb_backend.bump_generations(['employees'])
+
+        def unprocessed_batch_get(RequestItems):
+            return {'Responses': {}, 'UnprocessedKeys': RequestItems}
+
+        with patch.object(dynamodb_backend.dynamodb, 'batch_get_item', side_effect=unprocessed_batch_get), \
+                patch('common.response_cache.time.sleep'):
+            assert dynamodb_backend.get_generations(['employees']) is None
+            _, hit = cache.get_or_build('all', build)
+
+        assert hit is False
+        assert len(calls) == 2
+
+    def test_backend_failure_bypasses_cache(self):
+        """세대 번호를 조회할 수 없으면 캐시를 쓰지 않는지 테스트"""
+        backend = MagicMock()
+        backend.get_generations.side_effect = Exception('DynamoDB unavailable')
+        cache = ResponseCache('test', depends_on=('employees',), backend=backend)
+        build, calls = _counting_builder()
+
+        cache.get_or_build('all', build)
+        _, hit = cache.get_or_build('all', build)
+
+        assert hit is False
+        assert len(calls) == 2
+        backend.put_entry.assert_not_called()
+
+
+class TestConditionalResponse:
+    """ETag 조건부 응답 테스트"""
+
+    def test_etag_matching(self):
+        """If-None-Match 비교 규칙 테스트"""
+        etag = compute_etag('{"a": 1}')
+
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches('*', etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches(compute_etag('{"a": 2}'), etag)
+
+    def test_not_modified(self):
+        """ETag가 일치하면 본문 없이 304를 반환하는지 테스트"""
+        cache = ResponseCache('test', depends_on=('employees',))
+        with patch('common.response_cache.get_default_backend', return_value=None):
+            cached, _ = cache.get_or_build('all', lambda: '{"employees": []}')
+
+        headers = {'Content-Type': 'application/json'}
+        full = conditional_response({'headers': None}, cached, headers)
+        not_modified = conditional_response({'headers': {'if-none-match': cached.etag}}, cached, headers)
+
+        assert full['statusCode'] == 200
+        assert full['body'] == '{"employees": []}'
+        assert full['headers']['ETag'] == cached.etag
+        assert not_modified['statusCode'] == 304
+        assert not_modified['body'] == ''
+        assert 'ETag' not in headers
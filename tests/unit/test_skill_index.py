@@ -0,0 +1,278 @@
+"""
+SkillIndex 유닛 테스트
+
+기술 역색인의 posting 갱신(생성/수정/삭제), 교집합/합집합 조회, 캐시,
+EmployeeRepository·Streams 갱신 Lambda·추천 엔진 연동을 테스트합니다.
+moto를 사용하여 DynamoDB를 모킹합니다.
+"""
+
+import json
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from moto import mock_aws
+import boto3
+from boto3.dynamodb.types import TypeSerializer
+from common.dynamodb_client import DynamoDBClient, DynamoDBClientError
+from common.models import BasicInfo, Employee, Skill, SkillLevel
+from common.repositories import EmployeeRepository
+from common.skill_index import SkillIndex, employee_postings
+from lambda_functions.recommendation_engine import index as recommendation_engine
+from lambda_functions.skill_index_updater import index as skill_index_updater
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    """AWS 자격 증명 모킹"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+
+@pytest.fixture
+def dynamodb(aws_credentials):
+    """Employees/SkillIndex 테이블이 있는 moto DynamoDB"""
+    with mock_aws():
+        resource = boto3.resource('dynamodb', region_name='us-east-2')
+        resource.create_table(
+            TableName='Employees',
+            KeySchema=[{'AttributeName': 'user_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'user_id', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        resource.create_table(
+            TableName='SkillIndex',
+            KeySchema=[
+                {'AttributeName': 'skill', 'KeyType': 'HASH'},
+                {'AttributeName': 'user_id', 'KeyType': 'RANGE'}
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'skill', 'AttributeType': 'S'},
+                {'AttributeName': 'user_id', 'AttributeType': 'S'}
+            ],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        yield resource
+
+
+@pytest.fixture
+def skill_index(dynamodb):
+    """기술 역색인 픽스처"""
+    return SkillIndex('SkillIndex', dynamodb=dynamodb, cache_ttl_seconds=300)
+
+
+def _employee(user_id, *skills):
+    """(이름, 숙련도, 연수) 기술을 가진 직원 항목"""
+    return {
+        'user_id': user_id,
+        'basic_info': {'name': user_id, 'role': 'Developer', 'years_of_experience': 5, 'email': 'a@b.com'},
+        'skills': [{'name': name, 'level': level, 'years': years} for name, level, years in skills],
+        'work_experience': []
+    }
+
+
+def _postings_in_table(dynamodb):
+    """SkillIndex 테이블의 (기술, 직원 ID) 집합"""
+    items = dynamodb.Table('SkillIndex').scan()['Items']
+    return {(item['skill'], item['user_id']) for item in items}
+
+
+class TestEmployeePostings:
+    """직원 항목 → posting 변환 테스트"""
+
+    def test_normalized_names(self):
+        """기술 이름이 정규화되고 잘못된 항목은 무시되는지 테스트"""
+        postings = employee_postings(_employee('U_001', ('python', 'Expert', 5), ('JS', 'Advanced', 2.5)))
+        postings_with_noise = employee_postings({'user_id': 'U_002', 'skills': ['Python', {'name': ''}]})
+
+        assert postings == {
+            'Python': {'level': 'Expert', 'years': Decimal('5')},
+            'JavaScript': {'level': 'Advanced', 'years': Decimal('2.5')}
+        }
+        assert postings_with_noise == {}
+        assert employee_postings(None) == {}
+
+    def test_invalid_years_are_zero(self):
+        """숫자가 아닌 경력 연수는 0으로 처리하는지 테스트"""
+        postings = employee_postings(_employee(
+            'U_001', ('Python', 'Expert', 'five'), ('Go', 'Advanced', 'NaN'), ('Rust', 'Beginner', ' 1.5 ')
+        ))
+
+        assert postings['Python']['years'] == Decimal('0')
+        assert postings['Go']['years'] == Decimal('0')
+        assert postings['Rust']['years'] == Decimal('1.5')
+
+
+class TestSkillIndex:
+    """SkillIndex 테스트"""
+
+    def test_index_employee_writes_only_changes(self, dynamodb, skill_index):
+        """생성/수정/삭제 시 바뀐 posting만 쓰는지 테스트"""
+        created = _employee('U_001', ('Python', 'Expert', 5), ('Django', 'Advanced', 3))
+        assert skill_index.index_employee(None, created) == 2
+
+        updated = _employee('U_001', ('Python', 'Expert', 5), ('AWS', 'Intermediate', 1))
+        assert skill_index.index_employee(created, updated) == 2
+        assert _postings_in_table(dynamodb) == {('Python', 'U_001'), ('AWS', 'U_001')}
+
+        assert skill_index.index_employee(updated, updated) == 0
+        assert skill_index.index_employee(updated, None) == 2
+        assert _postings_in_table(dynamodb) == set()
+
+    def test_intersection_and_union(self, skill_index):
+        """교집합(모두 보유)과 합집합(하나 이상 보유) 조회 테스트"""
+        skill_index.index_employee(None, _employee('U_001', ('Python', 'Expert', 5), ('Django', 'Advanced', 3)))
+        skill_index.index_employee(None, _employee('U_002', ('Python', 'Advanced', 2)))
+        skill_index.index_employee(None, _employee('U_003', ('Java', 'Expert', 8)))
+
+        assert skill_index.find_employee_ids(['python', 'DJANGO']) == {'U_001'}
+        assert skill_index.find_employee_ids(['Python', 'Rust']) == set()
+        assert skill_index.find_employee_ids(['Python', 'Java'], match_all=False) == {'U_001', 'U_002', 'U_003'}
+        assert skill_index.match_counts(['Python', 'Django']) == {'U_001': 2, 'U_002': 1}
+        assert skill_index.postings('Python')['U_001'] == {'level': 'Expert', 'years': Decimal('5')}
+
+    def test_cached_postings_reflect_own_writes(self, dynamodb, skill_index):
+        """캐시된 posting list를 다시 조회하지 않고, 같은 인스턴스의 변경은 바로 반영하는지 테스트"""
+        skill_index.index_employee(None, _employee('U_001', ('Python', 'Expert', 5)))
+        skill_index.postings('Python')
+
+        with patch.object(skill_index.table, 'query', wraps=skill_index.table.query) as mock_query:
+            skill_index.index_employee(None, _employee('U_002', ('Python', 'Beginner', 1)))
+            assert set(skill_index.postings('Python')) == {'U_001', 'U_002'}
+
+        mock_query.assert_not_called()
+
+    def test_rebuild_removes_stale_postings(self, dynamodb, skill_index):
+        """재구성 시 현재 직원에게 없는 posting을 삭제하는지 테스트"""
+        skill_index.index_employee(None, _employee('U_OLD', ('Go', 'Expert', 5)))
+
+        count = skill_index.rebuild([
+            _employee('U_001', ('Python', 'Expert', 5)),
+            _employee('U_002', ('Python', 'Advanced', 2), ('React', 'Expert', 4))
+        ])
+
+        assert count == 3
+        assert _postings_in_table(dynamodb) == {('Python', 'U_001'), ('Python', 'U_002'), ('React', 'U_002')}
+
+
+class TestEmployeeRepositoryIndex:
+    """EmployeeRepository 기술 역색인 연동 테스트"""
+
+    def test_find_by_skills_uses_index(self, dynamodb, skill_index):
+        """색인이 있으면 전체 직원을 순회하지 않고 조회하는지 테스트"""
+        repo = EmployeeRepository(DynamoDBClient(region_name='us-east-2'), skill_index=skill_index)
+        for user_id, skills in (('U_010', ['Python', 'Django']), ('U_011', ['Python']), ('U_012', ['Java'])):
+            employee = Employee(
+                user_id=user_id,
+                basic_info=BasicInfo(name=user_id, role='Developer', years_of_experience=5, email='a@b.com'),
+                skills=[Skill(name=name, level=SkillLevel.ADVANCED, years=3) for name in skills]
+            )
+            repo.create(employee)
+            # Streams 갱신 Lambda가 반영한 상태
+            skill_index.index_employee(None, employee.to_dynamodb())
+
+        with patch.object(repo, 'iter_all') as mock_iter:
+            results = repo.find_by_skills(['python', 'django'])
+
+        mock_iter.assert_not_called()
+        assert [employee.user_id for employee in results] == ['U_010']
+
+    def test_writes_do_not_touch_index(self, dynamodb, skill_index):
+        """생성/수정/삭제는 직원 항목만 쓰고 색인은 Streams 갱신 Lambda에 맡기는지 테스트"""
+        repo = EmployeeRepository(DynamoDBClient(region_name='us-east-2'), skill_index=skill_index)
+        employee = Employee(
+            user_id='U_020',
+            basic_info=BasicInfo(name='U_020', role='Developer', years_of_experience=5, email='a@b.com'),
+            skills=[Skill(name='Python', level=SkillLevel.ADVANCED, years=3)]
+        )
+
+        with patch.object(skill_index, 'index_employee') as mock_index:
+            repo.create(employee)
+            employee.skills = [Skill(name='Kotlin', level=SkillLevel.BEGINNER, years=1)]
+            repo.update(employee)
+            repo.delete('U_020')
+
+        mock_index.assert_not_called()
+        assert _postings_in_table(dynamodb) == set()
+
+
+class TestSkillIndexUpdater:
+    """Streams 갱신 Lambda 테스트"""
+
+    def test_stream_records(self, dynamodb, monkeypatch):
+        """INSERT/MODIFY/REMOVE 레코드를 색인에 반영하는지 테스트"""
+        monkeypatch.setattr(skill_index_updater, 'dynamodb', dynamodb)
+        serializer = TypeSerializer()
+
+        def record(old=None, new=None):
+            stream = {}
+            if old:
+                stream['OldImage'] = {k: serializer.serialize(v) for k, v in old.items()}
+            if new:
+                stream['NewImage'] = {k: serializer.serialize(v) for k, v in new.items()}
+            return {'dynamodb': stream}
+
+        first = _employee('U_001', ('Python', 'Expert', 5))
+        second = _employee('U_001', ('Go', 'Advanced', 2))
+        other = _employee('U_002', ('React', 'Expert', 4))
+        result = skill_index_updater.handler({'Records': [
+            record(new=first),
+            record(new=other),
+            record(old=first, new=second),
+            record(old=other)
+        ]}, None)
+
+        assert json.loads(result['body'])['processed_records'] == 4
+        assert _postings_in_table(dynamodb) == {('Go', 'U_001')}
+
+    def test_rebuild_without_records(self, dynamodb, monkeypatch):
+        """Records가 없으면 Employees 전체로 재구성하는지 테스트"""
+        monkeypatch.setattr(skill_index_updater, 'dynamodb', dynamodb)
+        dynamodb.Table('Employees').put_item(Item=_employee('U_001', ('Python', 'Expert', 5)))
+
+        result = skill_index_updater.handler({}, None)
+
+        assert json.loads(result['body'])['postings'] == 1
+        assert _postings_in_table(dynamodb) == {('Python', 'U_001')}
+
+
+class TestRecommendationCandidates:
+    """추천 엔진 기술 검색의 색인 사용 테스트"""
+
+    def test_index_candidates_without_scan(self, dynamodb, skill_index, monkeypatch):
+        """색인이 설정되면 Employees를 스캔하지 않고 후보만 조회하는지 테스트"""
+        employees = dynamodb.Table('Employees')
+        for employee in (
+            _employee('U_001', ('Python', 'Expert', 5)),
+            _employee('U_002', ('Java', 'Expert', 5)),
+            _employee('U_003', ('Python', 'Beginner', 1), ('AWS', 'Advanced', 3))
+        ):
+            employees.put_item(Item=employee)
+            skill_index.index_employee(None, employee)
+
+        monkeypatch.setattr(recommendation_engine, 'dynamodb', dynamodb)
+        monkeypatch.setattr(recommendation_engine, 'dynamodb_client', DynamoDBClient(region_name='us-east-2'))
+        monkeypatch.setattr(recommendation_engine, 'get_default_index', lambda: skill_index)
+
+        with patch.object(dynamodb.Table('Employees').__class__, 'scan') as mock_scan:
+            matches = recommendation_engine.find_employees_by_skills(['Python', 'AWS'])
+
+        mock_scan.assert_not_called()
+        assert sorted(match['user_id'] for match in matches) == ['U_001', 'U_003']
+
+    def test_unprocessed_candidates_fail_request(self, skill_index, monkeypatch):
+        """재시도 후에도 조회하지 못한 후보가 있으면 일부 후보로 추천하지 않는지 테스트"""
+        skill_index.index_employee(None, _employee('U_001', ('Python', 'Expert', 5)))
+        client = DynamoDBClient(region_name='us-east-2', retry_delay=0)
+        monkeypatch.setattr(recommendation_engine, 'dynamodb_client', client)
+        monkeypatch.setattr(recommendation_engine, 'get_default_index', lambda: skill_index)
+        unprocessed = {'Responses': {}, 'UnprocessedKeys': {'Employees': {'Keys': [{'user_id': 'U_001'}]}}}
+
+        with patch.object(client.dynamodb, 'batch_get_item', return_value=unprocessed) as mock_get:
+            with pytest.raises(DynamoDBClientError):
+                recommendation_engine.find_employees_by_skills(['Python'])
+
+        assert mock_get.call_count == client.max_retries + 1
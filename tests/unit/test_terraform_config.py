@@ -6,6 +6,7 @@ Terraform 파일들이 올바르게 구성되어 있는지 검증합니다.
 
 import os
 import json
+import re
 import pytest
 from pathlib import Path
 
@@ -93,6 +94,26 @@ class TestDynamoDBConfiguration:
         assert "stream_enabled   = true" in employees_section, \
             "Employees 테이블에 스트림이 활성화되지 않았습니다"
     
+    def test_employees_stream_has_at_most_two_readers(self):
+        """Employees 스트림을 읽는 Lambda가 샤드당 권장 reader 수(2개) 이하인지 테스트"""
+        lambda_config = Path("deployment/terraform/lambda.tf").read_text(encoding='utf-8')
+        readers = lambda_config.count("event_source_arn  = aws_dynamodb_table.employees.stream_arn")
+        
+        assert 0 < readers <= 2, f"Employees 스트림 reader가 {readers}개입니다"
+    
+    def test_stream_mappings_limit_retries(self):
+        """모든 스트림 mapping이 재시도 제한, 배치 분할, 실패 destination을 설정하는지 테스트"""
+        lambda_config = Path("deployment/terraform/lambda.tf").read_text(encoding='utf-8')
+        mappings = re.findall(
+            r'resource "aws_lambda_event_source_mapping" "(\w+)" \{(.*?)\n\}', lambda_config, re.S
+        )
+        
+        assert mappings
+        for name, body in mappings:
+            assert "maximum_retry_attempts" in body, f"{name}에 재시도 제한이 없습니다"
+            assert "bisect_batch_on_function_error = true" in body, f"{name}에 배치 분할이 없습니다"
+            assert "aws_sqs_queue.stream_failures.arn" in body, f"{name}에 실패 destination이 없습니다"
+    
     def test_gsi_defined_for_tables(self, dynamodb_config):
         """필요한 테이블에 GSI가 정의되어 있는지 테스트"""
         # Employees 테이블에 RoleIndex GSI
@@ -197,6 +218,11 @@ class TestIAMConfiguration:
             assert f'resource "aws_iam_role_policy" "{policy}"' in iam_config, \
                 f"{policy} 정책이 정의되지 않았습니다"
     
+    def test_dynamodb_batch_actions_allowed(self, iam_config):
+        """배치 조회/쓰기 권한이 있는지 테스트 (BatchGetItem/BatchWriteItem 사용 Lambda)"""
+        assert '"dynamodb:BatchGetItem"' in iam_config
+        assert '"dynamodb:BatchWriteItem"' in iam_config
+    
     def test_bedrock_model_access(self, iam_config):
         """Bedrock 모델 접근 권한이 있는지 테스트"""
         assert "anthropic.claude-v2" in iam_config
@@ -9,7 +9,9 @@ from common.utils import (
     normalize_skill,
     normalize_skills,
     get_unique_skills,
-    SKILL_NORMALIZATION_MAP
+    clear_skill_cache,
+    SKILL_NORMALIZATION_MAP,
+    _normalize_skill_cached
 )
 
 
@@ -240,3 +242,74 @@ class TestSkillNormalizationIntegration:
         assert "Python" in matches
         assert "React" in matches
         assert "AWS" in matches
+
+
+def _normalize_skill_linear(skill_name):
+    """기존 방식 정규화 (매핑 값 선형 탐색, 벤치마크 기준선)"""
+    if not skill_name:
+        return ""
+    cleaned = skill_name.strip()
+    normalized_key = cleaned.lower()
+    if normalized_key in SKILL_NORMALIZATION_MAP:
+        return SKILL_NORMALIZATION_MAP[normalized_key]
+    for normalized_value in SKILL_NORMALIZATION_MAP.values():
+        if cleaned == normalized_value:
+            return normalized_value
+    return cleaned.title()
+
+
+class TestNormalizeSkillCache:
+    """정규화 캐시/역방향 조회 테스트"""
+
+    # 매핑 키, 이미 정규화된 값, 매핑에 없는 기술이 섞인 입력
+    SAMPLE_SKILLS = (
+        list(SKILL_NORMALIZATION_MAP.keys())
+        + list(SKILL_NORMALIZATION_MAP.values())
+        + ["  Vue.js ", "machine learning", "Terraform Cloud", "", "k8s", "REST API"]
+    )
+
+    def test_same_result_as_linear_lookup(self):
+        """캐시된 정규화가 기존 선형 탐색과 같은 결과를 내는지 테스트"""
+        for skill in self.SAMPLE_SKILLS:
+            assert normalize_skill(skill) == _normalize_skill_linear(skill)
+        assert normalize_skills(self.SAMPLE_SKILLS) == [
+            _normalize_skill_linear(skill) for skill in self.SAMPLE_SKILLS
+        ]
+
+    def test_normalize_skills_accepts_iterables(self):
+        """제너레이터와 None 항목도 처리하는지 테스트"""
+        assert normalize_skills(skill for skill in ["python", None, "python"]) == ["Python", "", "Python"]
+
+    def test_clear_skill_cache_picks_up_map_changes(self, monkeypatch):
+        """매핑 변경 후 캐시를 비우면 새 매핑이 반영되는지 테스트"""
+        assert normalize_skill("htmx") == "Htmx"
+
+        monkeypatch.setitem(SKILL_NORMALIZATION_MAP, "htmx", "htmx")
+        clear_skill_cache()
+        try:
+            assert normalize_skill("HTMX") == "htmx"
+            assert normalize_skill("htmx") == "htmx"
+        finally:
+            monkeypatch.undo()
+            clear_skill_cache()
+
+        assert normalize_skill("htmx") == "Htmx"
+
+    def test_repeated_names_hit_cache(self):
+        """반복되는 기술 이름은 캐시에서 반환하고 선형 탐색과 같은 결과를 내는지 테스트"""
+        # 검색 시 직원마다 같은 기술 이름이 반복되는 상황 (매핑 밖 이름 위주)
+        distinct = ["Vue.js", "Ruby on Rails", "Terraform Cloud", "machine learning", "Python"]
+        workload = distinct * 200
+
+        clear_skill_cache()
+        expected = [_normalize_skill_linear(skill) for skill in workload]
+
+        # 일괄 정규화는 서로 다른 이름만 한 번씩 계산
+        assert normalize_skills(workload) == expected
+        assert _normalize_skill_cached.cache_info().misses == len(distinct)
+
+        # 이후 개별 정규화는 모두 캐시에서 반환
+        assert [normalize_skill(skill) for skill in workload] == expected
+        cache_info = _normalize_skill_cached.cache_info()
+        assert cache_info.misses == len(distinct)
+        assert cache_info.hits == len(workload)
@@ -66,7 +66,7 @@ class TestDataAggregation:
             )
         ]
         
-        mock_repo.get_all_employees.return_value = mock_employees
+        mock_repo.iter_all.return_value = mock_employees
         
         # 실행
         result = aggregate_skill_distribution()
@@ -113,7 +113,7 @@ class TestDataAggregation:
             )
         ]
         
-        mock_repo.get_all_projects.return_value = mock_projects
+        mock_repo.iter_all.return_value = mock_projects
         
         # 실행
         result = calculate_domain_coverage()
@@ -165,7 +165,7 @@ class TestDataAggregation:
             )
         ]
         
-        mock_repo.get_all_employees.return_value = mock_employees
+        mock_repo.iter_all.return_value = mock_employees
         
         # 실행
         result = summarize_team_composition()
@@ -193,7 +193,7 @@ class TestDashboardMetrics:
         from common.models import Employee, BasicInfo, Project, ProjectPeriod, TechStack
         
         # Mock 데이터
-        mock_emp_repo.get_all_employees.return_value = [
+        mock_emp_repo.iter_all.return_value = [
             Employee(
                 user_id='U_001',
                 basic_info=BasicInfo(
@@ -207,7 +207,7 @@ class TestDashboardMetrics:
         ]
         
         today = datetime.now()
-        mock_proj_repo.get_all_projects.return_value = [
+        mock_proj_repo.iter_all.return_value = [
             Project(
                 project_id='P_001',
                 project_name='진행중 프로젝트',
@@ -266,7 +266,7 @@ class TestDateRangeFiltering:
             )
         ]
         
-        mock_repo.get_all_projects.return_value = mock_projects
+        mock_repo.iter_all.return_value = mock_projects
         
         # 2024년 프로젝트만 필터링
         result = filter_by_date_range('2024-01-01', '2024-12-31', 'projects')